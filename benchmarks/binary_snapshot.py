@@ -0,0 +1,68 @@
+"""Benchmark of binary snapshots against OntoUML JSON documents for saving and loading projects.
+
+Run from the repository root with `python -m benchmarks.binary_snapshot [number_of_classes ...]` (default: 1,000,
+5,000 and 20,000). The project of benchmarks.json_export is saved to a temporary file and loaded back in each format,
+reporting the time of each operation, the size of the file, and how many times faster loading is than from JSON:
+
+- json: export_json and import_json, which validates elements as it creates them;
+- snapshot: save_binary and load_binary, which rebuilds elements without validating them again.
+
+Pickle is not compared, as pickling large projects overflows the C stack when following references between elements.
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.json_export import build_project
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.binary_snapshot import load_binary
+from ontouml_py.serialization.binary_snapshot import save_binary
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_importer import import_json
+
+
+def save_json(project: Project, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        export_json(project, output)
+
+
+def load_json(path: str) -> Project:
+    with open(path, encoding="utf-8") as source:
+        return import_json(source)
+
+
+def timed(function: Callable[..., Any], *arguments: Any) -> tuple[float, Any]:
+    gc.collect()
+    start = time.perf_counter()
+    result = function(*arguments)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    numbers = [int(argument) for argument in sys.argv[1:]] or [1_000, 5_000, 20_000]
+    formats = {
+        "json": (save_json, load_json),
+        "snapshot": (save_binary, load_binary),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for number in numbers:
+            project = build_project(number)
+            print(f"{number} classes")
+            load_times = {}
+            for name, (save, load) in formats.items():
+                path = os.path.join(directory, name)
+                save_time, _ = timed(save, project, path)
+                load_times[name], _ = timed(load, path)
+                print(
+                    f"{name:>10}: save {save_time:.3f}s, load {load_times[name]:.3f}s "
+                    f"({load_times['json'] / load_times[name]:.1f}x faster than JSON), "
+                    f"{os.path.getsize(path) / 2**20:.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
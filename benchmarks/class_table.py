@@ -0,0 +1,56 @@
+"""Benchmark of the table-driven check of class stereotypes, natures and orders against ClassNatureRule.
+
+Run from the repository root with `python -m benchmarks.class_table [number_of_classes]` (default: 1,000,000). To
+isolate the cost of the checks, classes are represented by lightweight objects with the attributes read by both checks
+instead of Class instances, whose creation would dominate the running time.
+"""
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.verification.class_table import find_inconsistent_classes
+from ontouml_py.verification.rules.class_nature import ClassNatureRule
+from ontouml_py.verification.stereotype_groups import ALLOWED_NATURES
+
+
+def create_classes(number: int) -> list[SimpleNamespace]:
+    """Create random classes, about 1% of them inconsistent with their stereotypes."""
+    random.seed(0)
+    stereotypes = list(ClassStereotype)
+    natures = list(OntologicalNature)
+    classes = []
+    for index in range(number):
+        stereotype = random.choice(stereotypes)
+        order = 2 if stereotype == ClassStereotype.TYPE else 1
+        restricted_to = {random.choice(sorted(ALLOWED_NATURES[stereotype], key=natures.index))}
+        if random.random() < 0.01:
+            restricted_to.add(random.choice(natures))
+        classes.append(SimpleNamespace(id=str(index), stereotype=stereotype, order=order, restricted_to=restricted_to))
+    return classes
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    classes = create_classes(number)
+    find_inconsistent_classes(classes[:1])  # Builds the table
+
+    start = time.perf_counter()
+    inconsistent = find_inconsistent_classes(classes)
+    table_time = time.perf_counter() - start
+
+    rule = ClassNatureRule()
+    start = time.perf_counter()
+    reported = [class_ for class_ in classes if any(True for _ in rule.check(class_))]
+    rule_time = time.perf_counter() - start
+
+    assert [id(class_) for class_ in inconsistent] == [id(class_) for class_ in reported]
+    print(f"{number} classes, {len(inconsistent)} inconsistent")
+    print(f"find_inconsistent_classes: {table_time:.3f}s")
+    print(f"ClassNatureRule.check:     {rule_time:.3f}s ({rule_time / table_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark of exporting and importing OntoUML JSON documents with each available compression.
+
+Run from the repository root with `python -m benchmarks.compressed_io [number_of_classes]` (default: 5,000). The
+project of benchmarks.json_export is exported to a temporary file through open_compressed and imported back from the
+file opened in binary mode, which import_json decompresses after detecting its compression. For each compression
+('none' for plain files), the time of each operation, the size of the file, its ratio to the uncompressed size and
+the peak memory of the import (measured with tracemalloc in a separate run) are reported.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Optional
+
+from benchmarks.json_export import build_project
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.compressed_io import COMPRESSIONS
+from ontouml_py.serialization.compressed_io import open_compressed
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_importer import import_json
+
+
+def save(project: Project, path: str, compression: Optional[str]) -> None:
+    with open_compressed(path, "wt", compression) as output:
+        export_json(project, output)
+
+
+def load(path: str) -> Project:
+    with open(path, "rb") as source:
+        return import_json(source)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    project = build_project(number)
+    print(f"{number} classes")
+    with tempfile.TemporaryDirectory() as directory:
+        plain_size = None
+        for compression in (None, *COMPRESSIONS):
+            path = os.path.join(directory, f"project.json.{compression}")
+            start = time.perf_counter()
+            save(project, path, compression)
+            save_time = time.perf_counter() - start
+            start = time.perf_counter()
+            load(path)
+            load_time = time.perf_counter() - start
+            tracemalloc.start()
+            load(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            size = os.path.getsize(path)
+            plain_size = plain_size or size
+            print(
+                f"{compression or 'none':>6}: export {save_time:.3f}s, import {load_time:.3f}s, "
+                f"{size / 2**20:.2f} MiB ({size / plain_size:.1%}), import peak {peak / 2**20:.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark of delta exports against exporting whole projects after small edits.
+
+Run from the repository root with `python -m benchmarks.delta_export [number_of_classes] [number_of_edits]` (default:
+20,000 classes and 10 edits). After a first delta export of the project of benchmarks.json_export, the given number of
+classes is renamed and each way of exporting the changes to downstream systems is timed:
+
+- full: export_json, writing the whole project again;
+- delta: export_delta since the checkpoint of the first export, writing the changes recorded by the project;
+- delta (older checkpoint): export_delta since a checkpoint that is not the project's last one, which selects the
+  changed elements by their 'modified' timestamps.
+"""
+import io
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from langstring import LangString
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.delta_exporter import export_delta
+from ontouml_py.serialization.json_exporter import export_json
+
+
+def timed(name: str, function: Callable[..., Any], *arguments: Any) -> Any:
+    output = io.StringIO()
+    start = time.perf_counter()
+    result = function(arguments[0], output, *arguments[1:])
+    elapsed = time.perf_counter() - start
+    print(f"{name:>25}: {elapsed * 1000:.1f}ms, {len(output.getvalue()) / 1024:,.1f} KiB")
+    return result
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    project = build_project(number)
+    print(f"{number} classes, {edits} edits")
+    older_checkpoint = timed("first delta", export_delta, project)
+    checkpoint = timed("second delta", export_delta, project, older_checkpoint)
+    for index, class_ in zip(range(edits), project.get_classes()):
+        class_.names = {LangString(f"Renamed {index}")}
+    timed("full", export_json, project)
+    timed("delta", export_delta, project, checkpoint)
+    for index, class_ in zip(range(edits), project.get_classes()):
+        class_.names = {LangString(f"Renamed again {index}")}
+    timed("delta (older checkpoint)", export_delta, project, older_checkpoint)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark of the streaming gUFO exporter, writing to a file against building the whole ontology in memory.
+
+Run from the repository root with `python -m benchmarks.gufo_export [number_of_classes]` (default: 20,000, about
+300,000 triples). The project of benchmarks.json_export, with a name for each class, is exported in Turtle and in
+N-Triples, reporting throughput and peak memory (measured with tracemalloc, which also slows both down):
+
+- stream: export_gufo to a temporary file, which keeps only the IRIs of the elements;
+- string: export_gufo_string, which holds the whole ontology in memory, as ad-hoc scripts building graphs do.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from langstring import LangString
+
+from benchmarks.json_export import build_project
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.gufo_exporter import export_gufo
+from ontouml_py.serialization.gufo_exporter import export_gufo_string
+
+
+def measure(name: str, export: Callable[[], int]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    triples = export()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:>18}: {elapsed:.3f}s, {triples / elapsed:,.0f} triples/s, peak {peak / 2**20:.1f} MiB")
+
+
+def count_triples(project: Project) -> int:
+    output = io.StringIO()
+    export_gufo(project, output, rdf_format="ntriples")
+    return output.getvalue().count("\n")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    project = build_project(number)
+    for index, class_ in enumerate(project.get_classes()):
+        class_.names = {LangString(f"Class {index}", "en")}
+    triples = count_triples(project)
+    print(f"{number} classes, {triples:,} triples")
+    with tempfile.TemporaryDirectory() as directory:
+        for rdf_format in ("turtle", "ntriples"):
+            path = os.path.join(directory, f"ontology.{rdf_format}")
+
+            def stream() -> int:
+                with open(path, "w", encoding="utf-8") as output:
+                    export_gufo(project, output, rdf_format=rdf_format)
+                return triples
+
+            def string() -> int:
+                export_gufo_string(project, rdf_format=rdf_format)
+                return triples
+
+            measure(f"{rdf_format} stream", stream)
+            measure(f"{rdf_format} string", string)
+            print(f"{'':>18}  {os.path.getsize(path) / 2**20:.1f} MiB file")
+
+
+if __name__ == "__main__":
+    main()
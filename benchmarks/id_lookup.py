@@ -0,0 +1,61 @@
+"""Benchmark of looking up elements by ID through the index of their project against scanning their sets.
+
+Run from the repository root with `python -m benchmarks.id_lookup [number_of_classes] [number_of_lookups]` (default:
+20,000 classes and 1,000 lookups). The project of benchmarks.json_export is built, and the following are measured:
+
+- scan: the mean time of finding a random class or property by comparing the IDs of the elements of its type, as
+  get_element_by_id did before projects indexed their elements;
+- index: the time of the first lookups of classes and properties, which index them, the mean time of later lookups,
+  and the memory held by the indexes, measured with tracemalloc;
+- hash/eq: the mean time of hashing an element and of comparing two elements.
+"""
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.json_export import build_project
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    project = build_project(number)
+    elements = project.get_elements()
+    sample = random.Random(0).choices(
+        [("Class", element.id) for element in elements["Class"]]
+        + [("Property", element.id) for element in elements["Property"]],
+        k=lookups,
+    )
+    print(f"{number} classes, {lookups} lookups")
+
+    start = time.perf_counter()
+    for element_type, element_id in sample[:100]:
+        next(element for element in elements[element_type] if element.id == element_id)
+    print(f"       scan: {(time.perf_counter() - start) / 100 * 1e3:.2f}ms per lookup")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    project.get_class_by_id("")
+    project.get_property_by_id("")
+    index_time = time.perf_counter() - start
+    index_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for element_type, element_id in sample:
+        project.get_element_by_id(element_type, element_id)
+    lookup_time = (time.perf_counter() - start) / lookups
+    print(
+        f"      index: built in {index_time * 1e3:.1f}ms, {index_memory / 2**20:.1f} MiB, "
+        f"{lookup_time * 1e6:.2f}us per lookup"
+    )
+
+    first, second = list(elements["Class"])[:2]
+    hash_time = min(timeit.repeat(lambda: hash(first), number=100_000, repeat=5)) / 100_000
+    eq_time = min(timeit.repeat(lambda: first == second, number=100_000, repeat=5)) / 100_000
+    print(f"    hash/eq: hash {hash_time * 1e9:.0f}ns, eq {eq_time * 1e9:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
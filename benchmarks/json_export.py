@@ -0,0 +1,101 @@
+"""Benchmark of the streaming JSON exporter against encoding whole documents in memory.
+
+Run from the repository root with `python -m benchmarks.json_export [number_of_classes]` (default: 20,000). The
+project has packages of 100 classes, each class with two attributes, a generalization per class and a relation per
+pair of classes. Three ways of writing it to a temporary file are compared, reporting throughput and peak memory
+(measured with tracemalloc, which also slows all of them down):
+
+- stream: export_json, which writes element by element;
+- document: the same document built as nested dictionaries and written with a single json.dump;
+- model_dump: json.dumps(project.model_dump()), the pydantic dump of the project's own fields. It is not an OntoUML
+  document (e.g., packages do not include their contents) and is shown only as a reference.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from typing import TextIO
+
+from ontouml_py.model.package import Package
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import element_to_dict
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.ontouml_schema import PACKAGE_CONTENT_TYPES
+
+
+def build_project(number: int) -> Project:
+    """Build a project with the given number of classes."""
+    project = Project()
+    project.root_package = project.create_package()
+    package = None
+    previous = None
+    for index in range(number):
+        if index % 100 == 0:
+            package = project.create_package()
+            project.root_package.add_package(package)
+        class_ = project.create_class_kind()
+        class_.create_property()
+        class_.create_property()
+        package.add_class(class_)
+        if previous is not None:
+            package.add_generalization(project.create_generalization(general=previous, specific=class_))
+            relation = project.create_binary_relation()
+            relation.create_property(property_type=previous)
+            relation.create_property(property_type=class_)
+            package.add_binary_relation(relation)
+        previous = class_
+    return project
+
+
+def package_to_dict(package: Package) -> dict[str, Any]:
+    """Convert a package and its contents into nested dictionaries."""
+    contents = []
+    for content_type in PACKAGE_CONTENT_TYPES:
+        for content in sorted(package.get_contents()[content_type], key=lambda element: element.id):
+            contents.append(package_to_dict(content) if isinstance(content, Package) else element_to_dict(content))
+    return {"id": package.id, "name": None, "description": None, "type": "Package", "contents": contents or None}
+
+
+def write_document(project: Project, output: TextIO) -> None:
+    document = {"id": project.id, "type": "Project", "model": package_to_dict(project.root_package)}
+    json.dump(document, output, ensure_ascii=False)
+
+
+def write_model_dump(project: Project, output: TextIO) -> None:
+    output.write(json.dumps(project.model_dump(), default=str))
+
+
+def measure(name: str, write: Callable[[Project, TextIO], None], project: Project, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        start = time.perf_counter()
+        write(project, output)
+        elapsed = time.perf_counter() - start
+    with open(path, "w", encoding="utf-8") as output:
+        tracemalloc.start()
+        write(project, output)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    size = os.path.getsize(path)
+    print(
+        f"{name:>10}: {elapsed:.3f}s, {size / elapsed / 2**20:.1f} MiB/s, {size / 2**20:.1f} MiB, "
+        f"peak memory {peak / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    project = build_project(number)
+    print(f"{number} classes")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.json")
+        measure("stream", export_json, project, path)
+        measure("document", write_document, project, path)
+        measure("model_dump", write_model_dump, project, path)
+
+
+if __name__ == "__main__":
+    main()
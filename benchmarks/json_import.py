@@ -0,0 +1,53 @@
+"""Benchmark of the streaming JSON importer against decoding whole documents before creating their elements.
+
+Run from the repository root with `python -m benchmarks.json_import [number_of_classes]` (default: 20,000). The
+project of benchmarks.json_export is exported to a temporary file and read back in two ways, reporting time and peak
+memory (measured with tracemalloc, which also slows both down) against the memory held by the imported project:
+
+- stream: import_json, which creates elements as the document is read;
+- json.load: the document decoded whole with json.load, as a loader creating elements from the decoded tree would
+  first do. Only the decoding is measured, so its peak is a lower bound of such a loader's.
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_importer import import_json
+
+
+def measure(name: str, load: Callable[[Any], Any], path: str) -> None:
+    with open(path, encoding="utf-8") as source:
+        start = time.perf_counter()
+        load(source)
+        elapsed = time.perf_counter() - start
+    gc.collect()
+    with open(path, encoding="utf-8") as source:
+        tracemalloc.start()
+        result = load(source)
+        held, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del result
+    print(f"{name:>9}: {elapsed:.3f}s, held {held / 2**20:.1f} MiB, peak memory {peak / 2**20:.1f} MiB")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.json")
+        with open(path, "w", encoding="utf-8") as output:
+            export_json(build_project(number), output)
+        print(f"{number} classes, {os.path.getsize(path) / 2**20:.1f} MiB document")
+        measure("stream", import_json, path)
+        measure("json.load", json.load, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of point lookups in indexed OntoUML JSON documents against parsing whole documents.
+
+Run from the repository root with `python -m benchmarks.json_index [number_of_classes] [number_of_lookups]` (default:
+20,000 classes and 1,000 lookups). The project of benchmarks.json_export is exported to a temporary file, without and
+with its index, and the following are timed:
+
+- export: export_json without and with the index, and the size of both files;
+- parse: json.load of the whole document, the least any lookup without an index costs;
+- lookup: opening the document with IndexedDocument, then the mean time of get and of get_related (an element and the
+  elements it refers to) for random classes and properties.
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_index import IndexedDocument
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    project = build_project(number)
+    element_ids = [element.id for element in (*project.get_classes(), *project.get_properties())]
+    sample = random.Random(0).choices(element_ids, k=lookups)
+    print(f"{number} classes, {lookups} lookups")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.json")
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as output:
+            export_json(project, output)
+        plain_time = time.perf_counter() - start
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as output, open(path + ".idx", "w", encoding="utf-8") as index:
+            export_json(project, output, index)
+        indexed_time = time.perf_counter() - start
+        print(
+            f"    export: {plain_time:.3f}s, with index {indexed_time:.3f}s, "
+            f"document {os.path.getsize(path) / 2**20:.1f} MiB, index {os.path.getsize(path + '.idx') / 2**20:.1f} MiB"
+        )
+
+        start = time.perf_counter()
+        with open(path, encoding="utf-8") as source:
+            json.load(source)
+        print(f"     parse: {time.perf_counter() - start:.3f}s")
+
+        start = time.perf_counter()
+        with IndexedDocument(path) as document:
+            open_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for element_id in sample:
+                document.get(element_id)
+            get_time = (time.perf_counter() - start) / lookups
+            start = time.perf_counter()
+            for element_id in sample:
+                document.get_related(element_id)
+            related_time = (time.perf_counter() - start) / lookups
+        print(
+            f"    lookup: open {open_time * 1e3:.2f}ms, get {get_time * 1e6:.0f}us, "
+            f"get_related {related_time * 1e6:.0f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
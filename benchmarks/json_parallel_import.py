@@ -0,0 +1,45 @@
+"""Benchmark of the parallel JSON importer against the streaming one, for growing numbers of worker processes.
+
+Run from the repository root with `python -m benchmarks.json_parallel_import [number_of_classes]` (default: 20,000).
+The project of benchmarks.json_export is exported to a temporary file and read back with import_json and with
+import_json_parallel using 1, 2, 4, ... worker processes, up to the number of CPUs. Time includes starting the workers.
+With a single worker, the parallel importer only overlaps the work of the parent and of the worker, so its time shows
+the cost of shipping elements between processes.
+"""
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_importer import import_json
+from ontouml_py.serialization.parallel_json_importer import import_json_parallel
+
+
+def measure(name: str, load: Callable[[Any], Any], path: str) -> None:
+    with open(path, encoding="utf-8") as source:
+        start = time.perf_counter()
+        load(source)
+        elapsed = time.perf_counter() - start
+    print(f"{name:>12}: {elapsed:.3f}s")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.json")
+        with open(path, "w", encoding="utf-8") as output:
+            export_json(build_project(number), output)
+        print(f"{number} classes, {os.path.getsize(path) / 2**20:.1f} MiB document, {os.cpu_count()} CPUs")
+        measure("stream", import_json, path)
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            measure(f"{workers} workers", lambda source: import_json_parallel(source, max_workers=workers), path)
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
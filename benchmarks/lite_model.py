@@ -0,0 +1,58 @@
+"""Benchmark of the memory held by lite elements against that of the elements of a project.
+
+Run from the repository root with `python -m benchmarks.lite_model [number_of_classes]` (default: 20,000 classes). The
+project of benchmarks.json_export is built under tracemalloc, and the following are measured:
+
+- project: the memory held by the project and its elements, and the mean per element;
+- lite: the memory allocated by to_lite, i.e., by the lite elements themselves, and the memory still held once the
+  project is deleted, which includes the values shared by both (e.g., language strings and timestamps);
+- time: to_lite and LiteProject.to_project.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.lite_model import to_lite
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tracemalloc.start()
+    project = build_project(number)
+    gc.collect()
+    project_memory = tracemalloc.get_traced_memory()[0]
+    count = 1 + sum(len(elements) for elements in project.get_elements().values())
+    print(f"{number} classes, {count} elements")
+    print(f"    project: {project_memory / 2**20:.1f} MiB, {project_memory / count:.0f} B per element")
+
+    lite_project = to_lite(project)
+    gc.collect()
+    lite_memory = tracemalloc.get_traced_memory()[0] - project_memory
+    del project
+    gc.collect()
+    held_memory = tracemalloc.get_traced_memory()[0]
+    print(
+        f"       lite: {lite_memory / 2**20:.1f} MiB, {lite_memory / count:.0f} B per element "
+        f"({project_memory / lite_memory:.1f}x less), {held_memory / 2**20:.1f} MiB held with the shared values "
+        f"({project_memory / held_memory:.1f}x less)"
+    )
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    to_lite(lite_project.to_project())
+    round_trip_time = time.perf_counter() - start
+    start = time.perf_counter()
+    project = lite_project.to_project()
+    to_project_time = time.perf_counter() - start
+    start = time.perf_counter()
+    to_lite(project)
+    print(
+        f"       time: to_lite {time.perf_counter() - start:.3f}s, to_project {to_project_time:.3f}s, "
+        f"round trip {round_trip_time:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark of memory-mapped model stores against binary snapshots for reading a few elements of large projects.
+
+Run from the repository root with `python -m benchmarks.model_store [number_of_classes ...]` (default: 1,000, 5,000
+and 20,000). The project of benchmarks.json_export is saved to a temporary file in each format, then opened, and the
+names and stereotypes of 100 of its classes are read. The time of opening the file, the time of the lookups, and the
+peak memory allocated meanwhile (as traced by tracemalloc) are reported:
+
+- snapshot: load_binary, which builds every element, and lookups among the built elements;
+- store: open_store, which maps the file and builds nothing, and lookups through proxies decoded on demand.
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.binary_snapshot import load_binary
+from ontouml_py.serialization.binary_snapshot import save_binary
+from ontouml_py.serialization.model_store import open_store
+from ontouml_py.serialization.model_store import save_store
+
+
+def look_up(project: Any, class_ids: list[str]) -> None:
+    for class_id in class_ids:
+        class_ = project.get_class_by_id(class_id)
+        class_.names, class_.stereotype
+
+
+def measure(name: str, open_project: Callable[[str], Any], path: str, class_ids: list[str]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    project = open_project(path)
+    opened = time.perf_counter()
+    look_up(project, class_ids)
+    end = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if hasattr(project, "close"):
+        project.close()
+    print(
+        f"{name:>10}: open {opened - start:.4f}s, lookups {end - opened:.4f}s, peak {peak / 2**20:.1f} MiB, "
+        f"file {os.path.getsize(path) / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    numbers = [int(argument) for argument in sys.argv[1:]] or [1_000, 5_000, 20_000]
+    with tempfile.TemporaryDirectory() as directory:
+        for number in numbers:
+            project = build_project(number)
+            class_ids = sorted(class_.id for class_ in project.get_classes())[:: max(1, number // 100)][:100]
+            snapshot_path = os.path.join(directory, "snapshot")
+            store_path = os.path.join(directory, "store")
+            save_binary(project, snapshot_path)
+            save_store(project, store_path)
+            del project
+            print(f"{number} classes")
+            measure("snapshot", load_binary, snapshot_path, class_ids)
+            measure("store", open_store, store_path, class_ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark of the memory saved by sharing EMPTY_SET among the empty set fields of elements.
+
+Run from the repository root with `python -m benchmarks.shared_empty_sets [number_of_classes]` (default: 20,000). The
+project of benchmarks.json_export is built, timed, and measured with tracemalloc, and the following are reported:
+
+- shared: the memory held by the project, whose empty set fields hold EMPTY_SET;
+- unshared: the memory held once each of these fields holds a set of its own, as when they were created by
+  default_factory=set, and the number of such sets;
+- read: the mean time of reading a set field holding EMPTY_SET, which gives a new copy-on-write set, and one holding a
+  set of its own.
+"""
+import gc
+import sys
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.json_export import build_project
+from ontouml_py.model.ontoumlelement import _get_shared_empty_sets
+from ontouml_py.model.sharedemptyset import EMPTY_SET
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tracemalloc.start()
+    start = time.perf_counter()
+    project = build_project(number)
+    build_time = time.perf_counter() - start
+    gc.collect()
+    shared_memory = tracemalloc.get_traced_memory()[0]
+    elements = [project, *(element for elements in project.get_elements().values() for element in elements)]
+    print(f"{number} classes, {len(elements)} elements, built in {build_time:.2f}s under tracemalloc")
+    print(f"      shared: {shared_memory / 2**20:.1f} MiB, {shared_memory / len(elements):.0f} B per element")
+
+    count = 0
+    for element in elements:
+        values = element.__dict__
+        for name in _get_shared_empty_sets(type(element)):
+            if values[name] is EMPTY_SET:
+                values[name] = set()
+                count += 1
+    gc.collect()
+    unshared_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        f"    unshared: {unshared_memory / 2**20:.1f} MiB, {unshared_memory / len(elements):.0f} B per element, "
+        f"{count} empty sets ({(unshared_memory - shared_memory) / 2**20:.1f} MiB, "
+        f"{1 - shared_memory / unshared_memory:.0%} saved by sharing)"
+    )
+
+    element = elements[1]
+    element.__dict__["names"] = EMPTY_SET
+    element.alt_names.add("x")
+    shared_time = min(timeit.repeat(lambda: element.names, number=100_000, repeat=5)) / 100_000
+    unshared_time = min(timeit.repeat(lambda: element.alt_names, number=100_000, repeat=5)) / 100_000
+    print(f"        read: shared {shared_time * 1e9:.0f}ns, own set {unshared_time * 1e9:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of queries on a SQLite repository of projects against loading each project to query it.
+
+Run from the repository root with `python -m benchmarks.sqlite_repository [number_of_projects] [number_of_classes]`
+(default: 10 projects of 2,000 classes). Each project is the project of benchmarks.json_export, with one class named
+"Target". The projects are saved to a repository in a temporary file, and the following times are reported:
+
+- save: saving all projects to the empty repository, and saving one of them again after changing one class, which
+  writes only the row of that class;
+- query: finding the classes named "Target" in all projects with SqliteRepository.find, which runs in SQL, and loading
+  the project of one of them;
+- scan: loading each project from a binary snapshot and looking for the classes named "Target" in it.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from langstring import LangString
+
+from benchmarks.json_export import build_project
+from ontouml_py.serialization.binary_snapshot import load_binary
+from ontouml_py.serialization.binary_snapshot import save_binary
+from ontouml_py.serialization.sqlite_repository import SqliteRepository
+
+
+def main() -> None:
+    project_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    number = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    projects = []
+    for _ in range(project_count):
+        project = build_project(number)
+        next(iter(project.get_classes())).names = {LangString("Target", "en")}
+        projects.append(project)
+    print(f"{project_count} projects of {number} classes")
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_paths = []
+        for index, project in enumerate(projects):
+            snapshot_paths.append(os.path.join(directory, f"project{index}.snapshot"))
+            save_binary(project, snapshot_paths[-1])
+
+        path = os.path.join(directory, "repository.db")
+        with SqliteRepository(path) as repository:
+            start = time.perf_counter()
+            for project in projects:
+                repository.save_project(project)
+            saved = time.perf_counter()
+            next(iter(projects[0].get_classes())).is_abstract = True
+            written = repository.save_project(projects[0])
+            resaved = time.perf_counter()
+        print(f"      save: {saved - start:.3f}s, again after one change {resaved - saved:.3f}s ({written} rows)")
+
+        with SqliteRepository(path) as repository:
+            start = time.perf_counter()
+            found = repository.find("Class", name="Target")
+            queried = time.perf_counter()
+            found[0].load()
+            loaded = time.perf_counter()
+        print(f"     query: {queried - start:.4f}s ({len(found)} classes), loading one {loaded - queried:.3f}s")
+
+        start = time.perf_counter()
+        count = 0
+        for snapshot_path in snapshot_paths:
+            project = load_binary(snapshot_path)
+            count += sum(1 for class_ in project.get_classes() if LangString("Target", "en") in class_.names)
+        print(f"      scan: {time.perf_counter() - start:.3f}s ({count} classes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark of creating elements inside a shared_timestamp block against reading the clock for each of them.
+
+Run from the repository root with `python -m benchmarks.timestamps [number_of_classes]` (default: 20,000). Classes
+are created in a project, each with an attribute whose name is then assigned, which stamps its 'modified' timestamp,
+first outside of any block and then inside one. For each, the best time of three runs and the memory held by the
+created elements, measured with tracemalloc in a separate run, are reported.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+from langstring import LangString
+
+from ontouml_py.model.ontoumlelement import shared_timestamp
+from ontouml_py.model.project import Project
+
+
+def create(number: int, shared: bool) -> Project:
+    """Create the given number of classes and attributes, inside a shared_timestamp block if shared."""
+    project = Project()
+    name = LangString("name")
+    with shared_timestamp() if shared else nullcontext():
+        for _ in range(number):
+            attribute = project.create_class_kind().create_property()
+            attribute.names = {name}
+    return project
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{number} classes and attributes")
+    for label, shared in (("clock", False), ("shared", True)):
+        best = float("inf")
+        for _ in range(3):
+            gc.collect()
+            start = time.perf_counter()
+            create(number, shared)
+            best = min(best, time.perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        project = create(number, shared)
+        gc.collect()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del project
+        print(f"    {label:>6}: {best:.3f}s, {best / number * 1e6:.1f}us per class, {memory / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark of the validation policies of a project on a typical edit script.
+
+Run from the repository root with `python -m benchmarks.validation_policy [number_of_classes]` (default: 20,000). The
+script assigns several attributes of every class of a project, in one or more passes over the classes (e.g., scripts
+that fix values set by earlier passes), and then validates the pending assignments, if any.
+"""
+import sys
+import time
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
+from ontouml_py.model.project import Project
+
+
+def edit(project: Project, passes: int) -> None:
+    """Run the edit script over all classes of the project."""
+    classes = list(project.get_classes())
+    for _ in range(passes):
+        for class_ in classes:
+            class_.stereotype = ClassStereotype.KIND
+            class_.restricted_to = {OntologicalNature.FUNCTIONAL_COMPLEX_NATURE}
+            class_.is_abstract = False
+        for class_ in classes:
+            class_.order = 1
+            class_.is_abstract = True
+            class_.is_powertype = False
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for passes in (1, 3):
+        print(f"{number} classes, {passes} passes of 6 assignments per class")
+        for policy in ValidationPolicy:
+            project = Project()
+            for _ in range(number):
+                project.create_class()
+            project.set_validation_policy(policy)
+
+            start = time.perf_counter()
+            edit(project, passes)
+            edit_time = time.perf_counter() - start
+            start = time.perf_counter()
+            project.validate_pending()
+            validation_time = time.perf_counter() - start
+            print(
+                f"{policy.value:>11}: edits {edit_time:.3f}s, validate_pending {validation_time:.3f}s, "
+                f"total {edit_time + validation_time:.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
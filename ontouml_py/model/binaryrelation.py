@@ -1,7 +1,13 @@
 from typing import Any
+from typing import cast
+from typing import Optional
+from typing import TYPE_CHECKING
 
 from ontouml_py.model.relation import Relation
 
+if TYPE_CHECKING:
+    from ontouml_py.model.classifier import Classifier
+
 
 class BinaryRelation(Relation):
     model_config = {
@@ -14,3 +20,21 @@ class BinaryRelation(Relation):
 
     def __init__(self, project: "Project", **data: dict[str, Any]) -> None:
         super().__init__(project=project, pe_type=self.__class__.__name__, **data)
+
+    @property
+    def source(self) -> Optional["Classifier"]:
+        """Get the type of the source end of the relation, defined by its first property.
+
+        :return: The property type of the first property, or None if it is not defined.
+        :rtype: Optional[Classifier]
+        """
+        return cast(Optional["Classifier"], self._properties[0].property_type) if self._properties else None
+
+    @property
+    def target(self) -> Optional["Classifier"]:
+        """Get the type of the target end of the relation, defined by its second property.
+
+        :return: The property type of the second property, or None if it is not defined.
+        :rtype: Optional[Classifier]
+        """
+        return cast(Optional["Classifier"], self._properties[1].property_type) if len(self._properties) > 1 else None
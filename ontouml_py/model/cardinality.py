@@ -1,11 +1,40 @@
+import sys
+from functools import lru_cache
+from typing import Any
 from typing import Optional
 from typing import Union
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
+
+# Normalized value of the unbounded upper bound '*'. It compares greater than any other bound.
+UNBOUNDED: int = sys.maxsize
 
 
 class Cardinality(BaseModel):
+    """Immutable multiplicity of a property.
+
+    Bounds are kept as provided (e.g., 1, "1", or "*") and also normalized once, at creation, into integers, with
+    UNBOUNDED standing for '*'. Bounds that cannot be normalized (e.g., negative numbers or arbitrary strings) have a
+    normalized value of None. As instances are immutable, they are shared instead of copied: copying returns the same
+    instance and cardinalities are interned through the `of` factory, which all readers of the library (e.g., the
+    importers and loaders) use. Instances created by calling the type are equal to, but distinct from, the interned
+    ones.
+
+    :ivar lower_bound: The lower bound of the cardinality, as provided.
+    :vartype lower_bound: Optional[Union[str, int]]
+    :ivar upper_bound: The upper bound of the cardinality, as provided.
+    :vartype upper_bound: Optional[Union[str, int]]
+    :ivar is_ordered: Whether the values of the property are ordered.
+    :vartype is_ordered: bool
+    :ivar is_unique: Whether the values of the property are unique.
+    :vartype is_unique: bool
+    """
+
+    _lower: Optional[int] = PrivateAttr(default=None)
+    _upper: Optional[int] = PrivateAttr(default=None)
+
     lower_bound: Optional[Union[str, int]] = Field(default=1)
     upper_bound: Optional[Union[str, int]] = Field(default=1)
     is_ordered: bool = Field(default=False)
@@ -14,7 +43,140 @@ class Cardinality(BaseModel):
     model_config = {
         "arbitrary_types_allowed": True,
         "extra": "forbid",
+        "frozen": True,
         "str_strip_whitespace": True,
         "validate_assignment": True,
         "validate_default": True,
     }
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize the bounds once the instance is validated.
+
+        :param __context: The validation context, unused.
+        :type __context: Any
+        """
+        self._lower = _normalize_bound(self.lower_bound)
+        self._upper = _normalize_bound(self.upper_bound)
+
+    def __copy__(self) -> "Cardinality":
+        return self
+
+    def __deepcopy__(self, _memo: Optional[dict[int, Any]] = None) -> "Cardinality":
+        return self
+
+    @classmethod
+    def of(
+        cls,
+        lower_bound: Optional[Union[str, int]] = 1,
+        upper_bound: Optional[Union[str, int]] = 1,
+        is_ordered: bool = False,
+        is_unique: bool = True,
+    ) -> "Cardinality":
+        """Get the shared instance of a cardinality, creating it on first request.
+
+        The most recently requested cardinalities, up to _INTERNED_MAXSIZE, are kept, so that arbitrary bounds (e.g.,
+        read from documents) do not accumulate in memory.
+
+        :param lower_bound: The lower bound of the cardinality.
+        :type lower_bound: Optional[Union[str, int]]
+        :param upper_bound: The upper bound of the cardinality.
+        :type upper_bound: Optional[Union[str, int]]
+        :param is_ordered: Whether the values of the property are ordered.
+        :type is_ordered: bool
+        :param is_unique: Whether the values of the property are unique.
+        :type is_unique: bool
+        :return: The interned Cardinality instance with the given attributes.
+        :rtype: Cardinality
+        """
+        # Subclasses are not interned, as the shared instances are of Cardinality itself
+        if cls is not Cardinality:
+            return cls(lower_bound=lower_bound, upper_bound=upper_bound, is_ordered=is_ordered, is_unique=is_unique)
+        return _intern(lower_bound, upper_bound, is_ordered, is_unique)
+
+    @property
+    def lower(self) -> Optional[int]:
+        """Get the normalized lower bound.
+
+        :return: The lower bound as an integer, or None if it could not be normalized.
+        :rtype: Optional[int]
+        """
+        return self._lower
+
+    @property
+    def upper(self) -> Optional[int]:
+        """Get the normalized upper bound.
+
+        :return: The upper bound as an integer (UNBOUNDED for '*'), or None if it could not be normalized.
+        :rtype: Optional[int]
+        """
+        return self._upper
+
+    @property
+    def is_optional(self) -> bool:
+        """Check whether the cardinality admits no values at all.
+
+        :return: True if the normalized lower bound is zero.
+        :rtype: bool
+        """
+        return self._lower == 0
+
+    @property
+    def is_many(self) -> bool:
+        """Check whether the cardinality admits more than one value.
+
+        :return: True if the normalized upper bound is greater than one, including unbounded.
+        :rtype: bool
+        """
+        return self._upper is not None and self._upper > 1
+
+    @property
+    def is_unbounded(self) -> bool:
+        """Check whether the upper bound of the cardinality is '*'.
+
+        :return: True if the normalized upper bound is UNBOUNDED.
+        :rtype: bool
+        """
+        return self._upper == UNBOUNDED
+
+    def contains(self, other: "Cardinality") -> bool:
+        """Check whether the range of another cardinality is within the range of this one.
+
+        :param other: The cardinality to be compared.
+        :type other: Cardinality
+        :return: True if both cardinalities are normalized and other's bounds are within this one's bounds.
+        :rtype: bool
+        """
+        if None in (self._lower, self._upper, other._lower, other._upper):
+            return False
+        return self._lower <= other._lower and other._upper <= self._upper
+
+
+def _normalize_bound(bound: Optional[Union[str, int]]) -> Optional[int]:
+    """Convert a bound as provided by the user into an integer.
+
+    :param bound: The bound to be normalized.
+    :type bound: Optional[Union[str, int]]
+    :return: The bound as a non-negative integer, UNBOUNDED for '*', or None if it cannot be normalized.
+    :rtype: Optional[int]
+    """
+    if isinstance(bound, str):
+        if bound == "*":
+            return UNBOUNDED
+        if not bound.isdecimal():
+            return None
+        bound = int(bound)
+    if bound is None or bound < 0:
+        return None
+    return bound
+
+
+# Number of shared instances kept by Cardinality.of
+_INTERNED_MAXSIZE = 1024
+
+
+# Typed, so that, e.g., 1 and True, which are equal, are kept apart
+@lru_cache(maxsize=_INTERNED_MAXSIZE, typed=True)
+def _intern(
+    lower_bound: Optional[Union[str, int]], upper_bound: Optional[Union[str, int]], is_ordered: bool, is_unique: bool
+) -> Cardinality:
+    return Cardinality(lower_bound=lower_bound, upper_bound=upper_bound, is_ordered=is_ordered, is_unique=is_unique)
@@ -9,7 +9,7 @@ from ontouml_py.model.classifier import Classifier
 from ontouml_py.model.enumerations.classstereotype import ClassStereotype
 from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
 from ontouml_py.model.literal import Literal
-from ontouml_py.utils.error_message import format_error_message
+from ontouml_py.utils.errors import OntoumlValueError
 
 
 class Class(Classifier):
@@ -30,9 +30,9 @@ class Class(Classifier):
     def __init__(self, project: "Project", **data: dict[str, Any]) -> None:
         super().__init__(project=project, pe_type=self.__class__.__name__, **data)
 
-    def create_literal(self) -> Literal:
+    def create_literal(self, **data: dict[str, Any]) -> Literal:
         """Add a literal to the class."""
-        new_literal = Literal(enumeration=self)
+        new_literal = Literal(enumeration=self, **data)
         self._literals.add(new_literal)
         return new_literal
 
@@ -43,13 +43,15 @@ class Class(Classifier):
         :type old_literal: Literal
         """
         if old_literal not in self._literals:
-            error_message = format_error_message(
-                description=f"Literal not found in Class with ID {self.id}.",
-                cause=f"The literal {old_literal} to be removed does not exist in the class. "
-                f"Existing ones are {self._literals}.",
+            raise OntoumlValueError(
+                "literal_not_found",
+                description="Literal not found in Class with ID {element.id}.",
+                cause="The literal {literal} to be removed does not exist in the class. Existing ones are {literals}.",
                 solution="Ensure the literal exists in the class before attempting to remove it.",
+                element=self,
+                literal=old_literal,
+                literals=frozenset(self._literals),
             )
-            raise ValueError(error_message)
         self._literals.remove(old_literal)
         del old_literal
 
@@ -1,10 +1,12 @@
 from abc import abstractmethod
 from typing import Any
+from typing import Optional
 
 from pydantic import Field
 from pydantic import PrivateAttr
 
 from ontouml_py.model.decoratable import Decoratable
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
 from ontouml_py.model.packageable import Packageable
 from ontouml_py.model.property import Property
 
@@ -12,6 +14,7 @@ from ontouml_py.model.property import Property
 class Classifier(Decoratable, Packageable):
     # Private attributes
     _properties: list[Property] = PrivateAttr(default_factory=list)  # It is a list because is_Unique = true
+    _relations: set["Relation"] = PrivateAttr(default_factory=set)  # noqa:F821 # Relations that have it as an end
     # Public attributes
     is_abstract: bool = Field(default=False)
 
@@ -26,12 +29,29 @@ class Classifier(Decoratable, Packageable):
     @abstractmethod
     def __init__(self, project: "Project", pe_type: str, **data: dict[str, Any]) -> None:
         Decoratable.__init__(self, project=project, pe_type=pe_type, **data)
+        project._add_classifier_to_taxonomy(self)
 
     def create_property(self, **data: dict[str, Any]) -> Property:
         new_property = Property(classifier=self, **data)
         self._properties.append(new_property)
+        self._update_relation_ends()
         return new_property
 
+    def relations(self, stereotype: Optional[RelationStereotype] = None) -> set["Relation"]:  # noqa:F821
+        """Get the relations that have this classifier as the type of one of their ends.
+
+        :param stereotype: If provided, only relations with this stereotype are returned.
+        :type stereotype: Optional[RelationStereotype]
+        :return: The relations connected to the classifier.
+        :rtype: set[Relation]
+        """
+        if stereotype is None:
+            return set(self._relations)
+        return {relation for relation in self._relations if relation.stereotype == stereotype}
+
+    def _update_relation_ends(self) -> None:
+        """Update the relation ends derived from the classifier's properties. Only relations have ends."""
+
     @property
     def properties(self) -> list[Property]:
         """Get the list of properties associated with the classifier.
@@ -0,0 +1,19 @@
+"""This module defines the ValidationPolicy enumeration, a subclass of OntoumlEnum, representing when the assignments \
+to the attributes of a project's elements are validated."""
+from ontouml_py.model.enumerations.ontouml_enum import OntoumlEnum
+
+
+class ValidationPolicy(OntoumlEnum):
+    """An enumeration representing when the assignments to the attributes of a project's elements are validated.
+
+    This enum defines the validation policies a project can apply to its elements. It extends OntoumlEnum.
+
+    Members:
+        IMMEDIATE: Each assignment is validated when it is made.
+        DEFERRED: Assignments are recorded and validated together when the project's pending assignments are validated.
+        OFF: Assignments are not validated.
+    """
+
+    IMMEDIATE = "immediate"
+    DEFERRED = "deferred"
+    OFF = "off"
@@ -5,6 +5,7 @@ a hierarchy where one (classifier) is a generalization of the other. This module
 ensure the integrity of the generalization relationship, such as preventing a classifier from being a generalization
 of itself.
 """
+
 from typing import Any
 
 from pydantic import Field
@@ -41,3 +42,16 @@ class Generalization(ModelElement, Packageable):
 
     def __init__(self, project: "Project", **data: dict[str, Any]) -> None:
         ModelElement.__init__(self, project=project, pe_type=self.__class__.__name__, **data)
+        project._add_generalization_to_taxonomy(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the project's taxonomy index when an end of the generalization changes.
+
+        :param name: The name of the attribute to be set.
+        :type name: str
+        :param value: The new value of the attribute.
+        :type value: Any
+        """
+        super().__setattr__(name, value)
+        if name in ("general", "specific"):
+            self._project._invalidate_taxonomy()
@@ -2,13 +2,16 @@ from abc import abstractmethod
 from typing import Any
 
 from pydantic import Field
+from pydantic import field_validator
 
 from ontouml_py.model.namedelement import NamedElement
 from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.sharedemptyset import EMPTY_SET
+from ontouml_py.model.sharedemptyset import share_empty_sets
 
 
 class ModelElement(NamedElement, ProjectElement):
-    custom_properties: set[tuple[str, Any]] = Field(default_factory=set)
+    custom_properties: set[tuple[str, Any]] = Field(default=EMPTY_SET, validate_default=False)
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -22,3 +25,11 @@ class ModelElement(NamedElement, ProjectElement):
     def __init__(self, project: "Project", pe_type: str, **data: dict[str, Any]) -> None:
         NamedElement.__init__(self, **data)
         ProjectElement.__init__(self, project=project, pe_type=pe_type)
+
+    @field_validator("custom_properties", mode="after")
+    @classmethod
+    def __share_empty_set(cls, checked_value: set) -> set:
+        return checked_value or EMPTY_SET
+
+
+share_empty_sets(ModelElement, ("custom_properties",))
@@ -11,17 +11,25 @@ from typing import Optional
 
 from langstring import LangString
 from pydantic import Field
+from pydantic import field_validator
 
 from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.sharedemptyset import EMPTY_SET
+from ontouml_py.model.sharedemptyset import share_empty_sets
+
+# Set fields that hold EMPTY_SET while they are empty (see sharedemptyset)
+_SHARED_EMPTY_SETS = ("names", "alt_names", "editorial_notes", "creators", "contributors")
 
 
 class NamedElement(OntoumlElement):
-    names: set[LangString] = Field(default_factory=set)
-    alt_names: set[LangString] = Field(default_factory=set)
+    names: set[LangString] = Field(default=EMPTY_SET, validate_default=False)
+    alt_names: set[LangString] = Field(default=EMPTY_SET, validate_default=False)
     description: Optional[LangString] = Field(default=None)
-    editorial_notes: set[LangString] = Field(default_factory=set)
-    creators: set[str] = Field(default_factory=set)  # Empty strings are not allowed in the set
-    contributors: set[str] = Field(default_factory=set)  # Empty strings are not allowed in the set
+    editorial_notes: set[LangString] = Field(default=EMPTY_SET, validate_default=False)
+    creators: set[str] = Field(default=EMPTY_SET, validate_default=False)  # Empty strings are not allowed in the set
+    contributors: set[str] = Field(
+        default=EMPTY_SET, validate_default=False
+    )  # Empty strings are not allowed in the set
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -35,3 +43,11 @@ class NamedElement(OntoumlElement):
     def __init__(self, **data: dict[str, Any]) -> None:
         # Sets attributes
         super().__init__(**data)
+
+    @field_validator(*_SHARED_EMPTY_SETS, mode="after")
+    @classmethod
+    def __share_empty_set(cls, checked_value: set) -> set:
+        return checked_value or EMPTY_SET
+
+
+share_empty_sets(NamedElement, _SHARED_EMPTY_SETS)
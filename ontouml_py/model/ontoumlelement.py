@@ -9,12 +9,89 @@ and modification timestamps, and validation logic to ensure the integrity of the
 import uuid
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from functools import partial
 from typing import Any
 from typing import Optional
+from typing import TypeVar
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic_core import PydanticUndefined
+
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
+from ontouml_py.model.sharedemptyset import EMPTY_SET
+from ontouml_py.model.sharedemptyset import SharedEmptySetField
+
+# Timestamp of the elements created and modified inside the current shared_timestamp block, if any
+_shared_timestamp: ContextVar[Optional[datetime]] = ContextVar("shared_timestamp", default=None)
+# Set inside _untracked_changes blocks, whose assignments neither stamp 'modified' nor are recorded as changes
+_untracked: ContextVar[bool] = ContextVar("untracked", default=False)
+
+
+def get_timestamp() -> datetime:
+    """
+    Get the timestamp of an element created or modified now, which is shared inside shared_timestamp blocks.
+
+    :return: The timestamp of the current shared_timestamp block, if any, or else the current time.
+    :rtype: datetime
+    """
+    timestamp = _shared_timestamp.get()
+    return datetime.now() if timestamp is None else timestamp
+
+
+@contextmanager
+def shared_timestamp(timestamp: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Give the same 'created' and 'modified' timestamps to all elements created or modified inside a block.
+
+    Bulk operations (e.g., importing a document) create and change many elements at once, and reading the clock for
+    each of them takes a noticeable part of their time. The timestamp is held in a context variable, so that it only
+    applies to the current thread or asynchronous task. Nested blocks use their own timestamp.
+
+    Example:
+        with shared_timestamp():
+            for name in names:
+                project.create_class_kind(names={LangString(name)})
+
+    :param timestamp: The shared timestamp. Defaults to the time the block is entered.
+    :type timestamp: Optional[datetime]
+    :return: A context manager giving the shared timestamp.
+    :rtype: Iterator[datetime]
+    """
+    if timestamp is None:
+        timestamp = datetime.now()
+    token = _shared_timestamp.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _shared_timestamp.reset(token)
+
+
+@contextmanager
+def _untracked_changes() -> Iterator[None]:
+    """
+    Neither stamp 'modified' nor record changes in projects for the assignments made inside a block.
+
+    Used by loaders that build elements through their fields (e.g., the JSON importer), as loading a project does not
+    change it, like loaders that construct elements directly.
+
+    :return: A context manager.
+    :rtype: Iterator[None]
+    """
+    token = _untracked.set(True)
+    try:
+        yield
+    finally:
+        _untracked.reset(token)
 
 
 class OntoumlElement(ABC, BaseModel):
@@ -27,16 +104,19 @@ class OntoumlElement(ABC, BaseModel):
 
     :ivar id: A unique identifier for the element, automatically generated upon instantiation.
     :vartype id: str
-    :ivar created: Timestamp when the element was created, defaults to the current time.
+    :ivar created: Timestamp when the element was created, defaults to the current time, or to the timestamp of the
+                   enclosing shared_timestamp block.
     :vartype created: datetime
-    :ivar modified: Timestamp when the element was last modified, can be None if not modified.
+    :ivar modified: Timestamp when the element was last modified, set on each assignment to its other fields as
+                    'created' is, or None if it was not modified since it was created.
     :vartype modified: Optional[datetime]
     :cvar model_config: Configuration settings for the Pydantic model.
     :vartype model_config: Dict[str, Any]
     """
 
     id: str = Field(min_length=1, default_factory=lambda: str(uuid.uuid4()))
-    created: datetime = Field(default_factory=datetime.now)
+    # Not validated by default, as get_timestamp always gives a datetime
+    created: datetime = Field(default_factory=get_timestamp, validate_default=False)
     modified: Optional[datetime] = Field(default=None)
 
     model_config = {
@@ -59,6 +139,79 @@ class OntoumlElement(ABC, BaseModel):
         """
         super().__init__(**data)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Assign a value to an attribute, validating it according to the validation policy of the element's project.
+
+        Assignments to the fields of elements inside a project whose policy is not ValidationPolicy.IMMEDIATE are
+        stored without validation. Under ValidationPolicy.DEFERRED, they are also recorded in the project, to be
+        validated later by its validate_pending method. All other assignments are validated as configured in
+        model_config.
+
+        Once a field is assigned (and validated, if it is), the element's 'modified' timestamp is set to the current
+        time (see get_timestamp) and the element is recorded among the changes of its project, if the project records
+        them (see Project.get_changed). Neither is done inside _untracked_changes blocks.
+
+        :param name: The name of the attribute.
+        :type name: str
+        :param value: The value to be assigned.
+        :type value: Any
+        """
+        if name not in type(self).__pydantic_fields__:
+            super().__setattr__(name, value)
+            return
+
+        # Set by ProjectElement, which is not a pydantic model, so it is kept in the instance's dictionary
+        project = self.__dict__.get("_project")
+        if project is None:
+            super().__setattr__(name, value)
+            if _untracked.get():
+                return
+        else:
+            # The project's private attributes are read from their storage, bypassing the slower BaseModel.__getattr__
+            project_private = project.__pydantic_private__
+            policy = project_private["_validation_policy"]
+            if policy == ValidationPolicy.IMMEDIATE:
+                super().__setattr__(name, value)
+            else:
+                self.__dict__[name] = value
+                self.__pydantic_fields_set__.add(name)
+                if policy == ValidationPolicy.DEFERRED:
+                    # Fields are recorded as bits of an integer, which, unlike containers, is not tracked by the
+                    # garbage collector. Allocating a container for each assignment would trigger collections over the
+                    # whole project.
+                    pending = project_private["_pending"]
+                    pending[self] = pending.get(self, 0) | _get_field_bits(type(self))[name]
+            if name == "id":
+                # Reindexed on the next lookup
+                project_private["_element_ids"].pop(type(self).__name__, None)
+            if _untracked.get():
+                return
+            changed = project_private["_changed"]
+            if changed is not None:
+                changed.add(self)
+
+        # Explicit assignments to 'modified' are kept as they are
+        if name != "modified":
+            self.__dict__["modified"] = get_timestamp()
+            self.__pydantic_fields_set__.add("modified")
+
+    def _record_change(self) -> None:
+        """
+        Record a change to the element that is not an assignment to one of its fields (e.g., moving it to a package).
+
+        As for assignments, the element's 'modified' timestamp is set and the element is recorded in its project.
+        """
+        if _untracked.get():
+            return
+        self.__dict__["modified"] = get_timestamp()
+        self.__pydantic_fields_set__.add("modified")
+        project = self.__dict__.get("_project")
+        if project is not None:
+            changed = project.__pydantic_private__["_changed"]
+            if changed is not None:
+                changed.add(self)
+
     def __eq__(self, other: object) -> bool:
         """
         Determine if two OntoumlElement instances are equal based on their unique identifiers.
@@ -76,7 +229,8 @@ class OntoumlElement(ABC, BaseModel):
         """
         if not isinstance(other, OntoumlElement):
             return NotImplemented
-        return self.id == other.id
+        # Read from the instances' dictionaries, bypassing the lookup of the attribute in the type's hierarchy
+        return self.__dict__["id"] == other.__dict__["id"]
 
     def __hash__(self) -> int:
         """
@@ -89,7 +243,164 @@ class OntoumlElement(ABC, BaseModel):
         :return: The hash value of the instance, computed using its 'id'.
         :rtype: int
         """
-        return hash(self.id)
+        return hash(self.__dict__["id"])
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Provide the pickling protocol of an OntoumlElement instance.
+
+        Elements are recreated with their 'id' already set and only then receive the rest of their state. Elements
+        reference each other cyclically (e.g., a classifier is in the set of ends of a relation that is in the set of
+        relations of the classifier), so they may need to be hashed before their state has been completely unpickled.
+
+        :return: The function that recreates the element, its arguments, and the element's state.
+        :rtype: tuple[Any, ...]
+        """
+        return _restore_element, (type(self), self.id), self.__getstate__()
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(element_type: type[OntoumlElement]) -> tuple[str, ...]:
+    """
+    Get the names of the fields of an element type, where the index of each name is the position of the field's bit.
+
+    :param element_type: The concrete type of an element.
+    :type element_type: type[OntoumlElement]
+    :return: The names of the fields, in the order they are declared.
+    :rtype: tuple[str, ...]
+    """
+    return tuple(element_type.__pydantic_fields__)
+
+
+@lru_cache(maxsize=None)
+def _get_field_bits(element_type: type[OntoumlElement]) -> dict[str, int]:
+    """
+    Assign a distinct bit to each field of an element type, so that sets of fields can be kept as integers.
+
+    :param element_type: The concrete type of an element.
+    :type element_type: type[OntoumlElement]
+    :return: The bit of each field.
+    :rtype: dict[str, int]
+    """
+    return {name: 1 << index for index, name in enumerate(_get_field_names(element_type))}
+
+
+# Concrete element type built by _construct_elements
+_Element = TypeVar("_Element", bound=OntoumlElement)
+
+
+def _restore_element(element_type: type[OntoumlElement], element_id: str) -> OntoumlElement:
+    """
+    Create an empty element of the given type that only has its 'id' set, so that it can already be hashed.
+
+    :param element_type: The concrete type of the element being unpickled.
+    :type element_type: type[OntoumlElement]
+    :param element_id: The unique identifier of the element.
+    :type element_id: str
+    :return: The partially restored element, whose state is set afterwards by the pickling protocol.
+    :rtype: OntoumlElement
+    """
+    element = element_type.__new__(element_type)
+    object.__setattr__(element, "__dict__", {"id": element_id})
+    return element
+
+
+def _construct_element(element_type: type[_Element], values: tuple[Any, ...], fields_set: Iterable[str]) -> _Element:
+    """
+    Create an element from the values of its fields, which must have been validated, e.g., in another process.
+
+    The element is created as BaseModel.model_construct does, but without processing each field, and without running
+    the __init__ methods of its type, so the caller must register it in its project and in its owner, if any.
+
+    :param element_type: The concrete type of the element.
+    :type element_type: type[OntoumlElement]
+    :param values: The values of all fields, in the order given by _get_field_names.
+    :type values: tuple[Any, ...]
+    :param fields_set: The names of the fields explicitly set when the element was validated.
+    :type fields_set: Iterable[str]
+    :return: The element, with its private attributes set to their defaults, except those without a default.
+    :rtype: _Element
+    """
+    return _construct_elements(element_type, (values,), (fields_set,))[0]
+
+
+def _construct_elements(
+    element_type: type[_Element], rows: Iterable[Sequence[Any]], fields_sets: Iterable[Iterable[str]]
+) -> list[_Element]:
+    """
+    Create elements of the same type from the values of their fields, as _construct_element does for a single one.
+
+    Empty values of the set fields that share EMPTY_SET (see sharedemptyset) are replaced by it.
+
+    :param element_type: The concrete type of the elements.
+    :type element_type: type[OntoumlElement]
+    :param rows: The values of all fields of each element, in the order given by _get_field_names.
+    :type rows: Iterable[Sequence[Any]]
+    :param fields_sets: The names of the fields explicitly set when each element was validated.
+    :type fields_sets: Iterable[Iterable[str]]
+    :return: The elements, in the order of their rows.
+    :rtype: list[_Element]
+    """
+    names = _get_field_names(element_type)
+    shared_empty_sets = _get_shared_empty_sets(element_type)
+    private_factories = _get_private_factories(element_type)
+    # As in BaseModel, private attributes are held in a dictionary as soon as the type has any, even without defaults
+    has_private = bool(element_type.__private_attributes__)
+    new = element_type.__new__
+    set_attribute = object.__setattr__
+    elements: list[_Element] = []
+    for values, fields_set in zip(rows, fields_sets):
+        element = new(element_type)
+        element_values = dict(zip(names, values))
+        for name in shared_empty_sets:
+            if not element_values[name]:
+                element_values[name] = EMPTY_SET
+        set_attribute(element, "__dict__", element_values)
+        set_attribute(element, "__pydantic_fields_set__", set(fields_set))
+        set_attribute(element, "__pydantic_extra__", None)
+        private = {name: factory() for name, factory in private_factories} if has_private else None
+        set_attribute(element, "__pydantic_private__", private)
+        elements.append(element)
+    return elements
+
+
+@lru_cache(maxsize=None)
+def _get_shared_empty_sets(element_type: type[OntoumlElement]) -> tuple[str, ...]:
+    """
+    Get the names of the set fields of an element type that hold EMPTY_SET while they are empty.
+
+    :param element_type: The concrete type of an element.
+    :type element_type: type[OntoumlElement]
+    :return: The names of the fields read through a SharedEmptySetField.
+    :rtype: tuple[str, ...]
+    """
+    return tuple(
+        name
+        for name in _get_field_names(element_type)
+        if any(isinstance(vars(base).get(name), SharedEmptySetField) for base in element_type.__mro__)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_private_factories(element_type: type[OntoumlElement]) -> tuple[tuple[str, Callable[[], Any]], ...]:
+    """
+    Get functions creating the default values of the private attributes of an element type.
+
+    They give the same values as the private attributes' get_default method, which is considerably slower.
+
+    :param element_type: The concrete type of an element.
+    :type element_type: type[OntoumlElement]
+    :return: Pairs of private attribute name and function creating its default value, for the private attributes
+             that have a default.
+    :rtype: tuple[tuple[str, Callable[[], Any]], ...]
+    """
+    factories = []
+    for name, private_attribute in element_type.__private_attributes__.items():
+        if private_attribute.default_factory is not None:
+            factories.append((name, private_attribute.default_factory))
+        elif private_attribute.default is not PydanticUndefined:
+            factories.append((name, partial(deepcopy, private_attribute.default)))
+    return tuple(factories)
 
 
 # TODO (@pedropaulofb): Check all classes and verify whether 'arbitrary_types_allowed' is necessary.
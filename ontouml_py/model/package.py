@@ -6,7 +6,7 @@ from pydantic import PrivateAttr
 from ontouml_py.model.modelelement import ModelElement
 from ontouml_py.model.package_methods import PackageMethodsMixin
 from ontouml_py.model.packageable import Packageable
-from ontouml_py.utils.error_message import format_error_message
+from ontouml_py.utils.errors import OntoumlValueError
 
 
 class Package(ModelElement, Packageable, PackageMethodsMixin):
@@ -39,7 +39,12 @@ class Package(ModelElement, Packageable, PackageMethodsMixin):
         return self._contents
 
     def get_content_by_id(self, content_type: str, content_id: Packageable) -> Optional[Packageable]:
-        for internal_content in self._contents[content_type]:
+        contents = self._contents[content_type]
+        # Found through the index of the project, scanning the contents only for those no longer in the project
+        content = self.project.get_element_by_id(content_type, content_id)
+        if content is not None and content in contents:
+            return content
+        for internal_content in contents:
             if internal_content.id == content_id:
                 return internal_content
         return None
@@ -47,13 +52,17 @@ class Package(ModelElement, Packageable, PackageMethodsMixin):
     def remove_content(self, old_content: Packageable) -> None:
         old_content_type = type(old_content).__name__
         if old_content not in self._contents[old_content_type]:
-            raise ValueError(self._removal_error_message(old_content, old_content_type))
+            raise self._removal_error(old_content, old_content_type)
         self._contents[old_content_type].remove(old_content)
 
-    def _removal_error_message(self, old_content: Packageable, old_content_type: str) -> str:
-        return format_error_message(
-            description=f"Invalid {old_content_type} content for removal.",
-            cause=f"The content {old_content} is not found in the {old_content_type} contents of the "
-            f"package with ID {self.id}.",
-            solution=f"Ensure the content to be removed is a valid {old_content_type} content in the package.",
+    def _removal_error(self, old_content: Packageable, old_content_type: str) -> OntoumlValueError:
+        return OntoumlValueError(
+            "content_not_found",
+            description="Invalid {content_type} content for removal.",
+            cause="The content {content} is not found in the {content_type} contents of the package with ID "
+            "{element.id}.",
+            solution="Ensure the content to be removed is a valid {content_type} content in the package.",
+            element=self,
+            content=old_content,
+            content_type=old_content_type,
         )
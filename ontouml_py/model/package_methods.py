@@ -97,48 +97,48 @@ class PackageMethodsMixin:
 
         def remove_anchor(self, old_content: Anchor) -> None:
             if old_content not in self._contents["Anchor"]:
-                raise ValueError(self._removal_error_message(old_content, "Anchor"))
+                raise self._removal_error(old_content, "Anchor")
             self._contents["Anchor"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_binary_relation(self, old_content: BinaryRelation) -> None:
             if old_content not in self._contents["BinaryRelation"]:
-                raise ValueError(self._removal_error_message(old_content, "BinaryRelation"))
+                raise self._removal_error(old_content, "BinaryRelation")
             self._contents["BinaryRelation"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_class(self, old_content: Class) -> None:
             if old_content not in self._contents["Class"]:
-                raise ValueError(self._removal_error_message(old_content, "Class"))
+                raise self._removal_error(old_content, "Class")
             self._contents["Class"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_generalization(self, old_content: Generalization) -> None:
             if old_content not in self._contents["Generalization"]:
-                raise ValueError(self._removal_error_message(old_content, "Generalization"))
+                raise self._removal_error(old_content, "Generalization")
             self._contents["Generalization"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_generalization_set(self, old_content: GeneralizationSet) -> None:
             if old_content not in self._contents["GeneralizationSet"]:
-                raise ValueError(self._removal_error_message(old_content, "GeneralizationSet"))
+                raise self._removal_error(old_content, "GeneralizationSet")
             self._contents["GeneralizationSet"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_nary_relation(self, old_content: NaryRelation) -> None:
             if old_content not in self._contents["NaryRelation"]:
-                raise ValueError(self._removal_error_message(old_content, "NaryRelation"))
+                raise self._removal_error(old_content, "NaryRelation")
             self._contents["NaryRelation"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_note(self, old_content: Note) -> None:
             if old_content not in self._contents["Note"]:
-                raise ValueError(self._removal_error_message(old_content, "Note"))
+                raise self._removal_error(old_content, "Note")
             self._contents["Note"].remove(old_content)
             old_content._Packageable__set_package(None)
 
         def remove_package(self, old_content) -> None:
             if old_content not in self._contents["Package"]:
-                raise ValueError(self._removal_error_message(old_content, "Package"))
+                raise self._removal_error(old_content, "Package")
             self._contents["Package"].remove(old_content)
             old_content._Packageable__set_package(None)
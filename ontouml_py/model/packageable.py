@@ -20,10 +20,12 @@ class Packageable:
 
     @property
     def package(self) -> Optional["Package"]:  # noqa:F821
-        return self._package
+        # Packageable is not a pydantic model, so _package is kept in the instance's dictionary once set
+        return self.__dict__.get("_package")
 
     def __set_package(self, owner_package: Optional["Package"]) -> None:  # noqa:F821
         self._package = owner_package
+        self._record_change()
 
     def _remove_from_package(self):
         owner = self._package
@@ -1,14 +1,24 @@
+from itertools import chain
+from os import PathLike
 from typing import Any
 from typing import Optional
+from typing import Union
 
 from pydantic import Field
 from pydantic import PrivateAttr
+from pydantic import ValidationError
 
+from ontouml_py.model.classifier import Classifier
 from ontouml_py.model.enumerations.ontologyrepresentationstyle import OntologyRepresentationStyle
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
 from ontouml_py.model.namedelement import NamedElement
+from ontouml_py.model.ontoumlelement import _get_field_names
 from ontouml_py.model.package import Package
 from ontouml_py.model.project_methods import ProjectMethodsMixin
 from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.taxonomy import Taxonomy
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
 
 
 class Project(NamedElement, ProjectMethodsMixin):
@@ -29,6 +39,23 @@ class Project(NamedElement, ProjectMethodsMixin):
             "Property": set(),
         }
     )
+    # Index over the generalizations of the project, discarded by taxonomy changes it cannot absorb incrementally
+    _taxonomy: Optional[Taxonomy] = PrivateAttr(default=None)
+    # Memoized transitive closures of property subsetting and redefinition, keyed by (relation name, property)
+    _property_closures: dict[tuple[str, ProjectElement], frozenset[ProjectElement]] = PrivateAttr(default_factory=dict)
+    # When assignments to the fields of the project's elements are validated
+    _validation_policy: ValidationPolicy = PrivateAttr(default=ValidationPolicy.IMMEDIATE)
+    # Fields assigned under the deferred validation policy and not yet validated, for each element, as a bitmask of the
+    # field bits given by _get_field_bits
+    _pending: dict[ProjectElement, int] = PrivateAttr(default_factory=dict)
+    # Elements created, assigned or moved to another package since the last delta export, or None before the first one,
+    # as changes are only recorded once they can be exported
+    _changed: Optional[set[ProjectElement]] = PrivateAttr(default=None)
+    # Number of delta exports of the project, identifying the checkpoint that _changed is relative to, if any
+    _delta_generation: int = PrivateAttr(default=0)
+    # Elements by ID, for each concrete type whose elements were looked up by ID, kept up to date by
+    # ProjectElement.__init__. Entries of elements removed from _elements are discarded when they are looked up.
+    _element_ids: dict[str, dict[str, ProjectElement]] = PrivateAttr(default_factory=dict)
 
     # Public attributes
     acronyms: set[str] = Field(default_factory=set)
@@ -59,11 +86,213 @@ class Project(NamedElement, ProjectMethodsMixin):
     def __init__(self, **data: dict[str, Any]) -> None:
         NamedElement.__init__(self, **data)
 
+    def save_binary(self, path: Union[str, PathLike]) -> None:
+        """Save the project to a file as a binary snapshot, which is loaded much faster than OntoUML JSON.
+
+        The snapshot is compressed if the suffix of the path is that of a compression (e.g., '.gz' or '.xz').
+
+        :param path: The path of the file, which is overwritten if it exists.
+        :type path: Union[str, PathLike]
+        :raises OntoumlTypeError: If a field holds a value that snapshots cannot store.
+        :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments
+                                   are pending validation under the deferred validation policy.
+        """
+        # Imported here, as the serialization modules depend on this one
+        from ontouml_py.serialization.binary_snapshot import save_binary
+
+        save_binary(self, path)
+
+    @classmethod
+    def load_binary(cls, path: Union[str, PathLike]) -> "Project":
+        """Load a project from a file holding a binary snapshot saved by save_binary, compressed or not.
+
+        :param path: The path of the file.
+        :type path: Union[str, PathLike]
+        :return: The project, in the state it was saved.
+        :rtype: Project
+        :raises OntoumlValueError: If the file is not a valid snapshot or was saved with another version of the format.
+        """
+        from ontouml_py.serialization.binary_snapshot import load_binary
+
+        return load_binary(path)
+
+    def save_store(self, path: Union[str, PathLike]) -> None:
+        """Save the project to a file as a model store, which open_store maps into memory for read-only access.
+
+        :param path: The path of the file, which is overwritten if it exists.
+        :type path: Union[str, PathLike]
+        :raises OntoumlTypeError: If a field holds a value that stores cannot hold.
+        :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments
+                                   are pending validation under the deferred validation policy.
+        """
+        from ontouml_py.serialization.model_store import save_store
+
+        save_store(self, path)
+
     def get_elements(self) -> dict[str, set[ProjectElement]]:
         return self._elements
 
     def get_element_by_id(self, element_type: str, element_id: str) -> Optional[ProjectElement]:
-        for internal_element in self._elements[element_type]:
-            if internal_element.id == element_id:
-                return internal_element
-        return None
+        """Get an element of the project by its concrete type and ID.
+
+        The elements of each type are indexed by ID on the first lookup of the type, so that later lookups take
+        constant time.
+
+        :param element_type: The name of the concrete type of the element (e.g., 'Class').
+        :type element_type: str
+        :param element_id: The ID of the element.
+        :type element_id: str
+        :return: The element, or None if the project has no element of the type with the ID.
+        :rtype: Optional[ProjectElement]
+        """
+        # Private attributes are read from their storage, bypassing the slower BaseModel.__getattr__
+        private = self.__pydantic_private__
+        elements = private["_elements"][element_type]
+        element_ids = private["_element_ids"].get(element_type)
+        if element_ids is None:
+            element_ids = private["_element_ids"][element_type] = {element.id: element for element in elements}
+        element = element_ids.get(element_id)
+        if element is not None and element not in elements:
+            # Removed from the project since it was indexed
+            del element_ids[element_id]
+            return None
+        return element
+
+    @property
+    def validation_policy(self) -> ValidationPolicy:
+        """Get the policy applied to assignments to the fields of the project's elements.
+
+        :return: The project's validation policy.
+        :rtype: ValidationPolicy
+        """
+        return self._validation_policy
+
+    def set_validation_policy(self, policy: ValidationPolicy) -> None:
+        """Set the policy applied to assignments to the fields of the project's elements.
+
+        Elements are always validated when created; the policy only applies to later assignments. Leaving the deferred
+        policy for the immediate one validates the pending assignments, while leaving it for the off policy discards
+        them.
+
+        :param policy: The new validation policy.
+        :type policy: ValidationPolicy
+        :raises TypeError: If policy is not a ValidationPolicy.
+        :raises ValueError: If switching to the immediate policy and a pending assignment is invalid.
+        """
+        if not isinstance(policy, ValidationPolicy):
+            raise OntoumlTypeError(
+                "invalid_validation_policy",
+                description="Invalid validation policy.",
+                cause="Expected a ValidationPolicy, got {policy_type}.",
+                solution="Use one of the members of ValidationPolicy.",
+                policy_type=type(policy).__name__,
+            )
+
+        if policy == ValidationPolicy.IMMEDIATE:
+            self.validate_pending()
+        elif policy == ValidationPolicy.OFF:
+            self._pending.clear()
+        self._validation_policy = policy
+
+    def validate_pending(self) -> None:
+        """Validate, in a single batch, the assignments recorded under the deferred validation policy.
+
+        Each assigned field is validated once, with its current value, regardless of how many times it was assigned.
+        Valid values are coerced as in immediate validation. Invalid assignments remain pending, so that they can be
+        fixed and validated again.
+
+        :raises OntoumlValueError: If any pending assignment is invalid, with all of them as (element, field name,
+                                   validation error) tuples in the 'errors' argument.
+        """
+        pending, self._pending = self._pending, {}
+        errors = _PendingErrors()
+        for element, fields in pending.items():
+            validator = element.__pydantic_validator__
+            names = _get_field_names(type(element))
+            while fields:
+                bit = fields & -fields
+                fields ^= bit
+                name = names[bit.bit_length() - 1]
+                try:
+                    validator.validate_assignment(element, name, element.__dict__[name])
+                except ValidationError as error:
+                    self._pending[element] = self._pending.get(element, 0) | bit
+                    errors.append((element, name, error))
+
+        if errors:
+            raise OntoumlValueError(
+                "invalid_deferred_assignments",
+                description="Invalid deferred assignments.",
+                cause="{count} pending assignments are invalid: {errors}.",
+                solution="Assign valid values to the listed fields and validate the pending assignments again.",
+                element=self,
+                count=len(errors),
+                errors=errors,
+            )
+
+    def get_pending(self) -> dict[ProjectElement, set[str]]:
+        """Get the assignments recorded under the deferred validation policy that were not validated yet.
+
+        :return: The names of the assigned fields, for each element.
+        :rtype: dict[ProjectElement, set[str]]
+        """
+        return {
+            element: {name for index, name in enumerate(_get_field_names(type(element))) if fields >> index & 1}
+            for element, fields in self._pending.items()
+        }
+
+    def get_changed(self) -> set[ProjectElement]:
+        """Get the elements created, assigned or moved to another package since the project's last delta export.
+
+        Changes are recorded from the project's first delta export (see delta_exporter.export_delta) on, so projects
+        that were never exported have none. Loading a project (e.g., importing a JSON document) does not change it.
+
+        :return: The changed elements, including those that were removed from the project afterwards.
+        :rtype: set[ProjectElement]
+        """
+        changed = self._changed
+        return set() if changed is None else set(changed)
+
+    def get_taxonomy(self) -> Taxonomy:
+        """Get the index over the generalization DAG formed by the project's classifiers.
+
+        The index is built on first access. It is then updated incrementally when classifiers and generalizations are
+        created, and rebuilt on next access after changes it cannot absorb (e.g., reassigned generalization ends).
+
+        :return: The project's taxonomy index.
+        :rtype: Taxonomy
+        :raises ValueError: If the project's generalizations form a cycle.
+        """
+        if self._taxonomy is None:
+            classifiers = chain(
+                self._elements["Class"], self._elements["BinaryRelation"], self._elements["NaryRelation"]
+            )
+            # Ends assigned without validation (see ValidationPolicy) are only indexed once they are classifiers
+            generalizations = [
+                generalization
+                for generalization in self._elements["Generalization"]
+                if isinstance(generalization.general, Classifier) and isinstance(generalization.specific, Classifier)
+            ]
+            self._taxonomy = Taxonomy(classifiers, generalizations)
+        return self._taxonomy
+
+    def _invalidate_taxonomy(self) -> None:
+        self._taxonomy = None
+
+    def _add_classifier_to_taxonomy(self, classifier: "Classifier") -> None:  # noqa:F821
+        if self._taxonomy is not None:
+            self._taxonomy.add_classifier(classifier)
+
+    def _add_generalization_to_taxonomy(self, generalization: "Generalization") -> None:  # noqa:F821
+        if self._taxonomy is not None and not self._taxonomy.add_generalization(generalization):
+            self._taxonomy = None
+
+
+class _PendingErrors(list):
+    """Invalid pending assignments, as (element, field name, validation error) tuples, summarized when formatted."""
+
+    def __str__(self) -> str:
+        return "; ".join(
+            f"{type(element).__name__} {element.id}, field '{name}': {error.errors()[0]['msg']}"
+            for element, name, error in self
+        )
@@ -1,9 +1,11 @@
+from collections.abc import Iterable
 from typing import Any
 from typing import Optional
 
 from ontouml_py.model.anchor import Anchor
 from ontouml_py.model.binaryrelation import BinaryRelation
 from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.classifier import Classifier
 from ontouml_py.model.enumerations.classstereotype import ClassStereotype
 from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
 from ontouml_py.model.generalization import Generalization
@@ -263,3 +265,23 @@ class ProjectMethodsMixin:
         order = 2
         restricted_to = {OntologicalNature.TYPE_NATURE}
         return self.create_class(stereotype=stereotype, order=order, restricted_to=restricted_to, **data)
+
+    # TAXONOMY QUERY METHODS
+
+    def common_supertypes(self, classifiers: Iterable[Classifier]) -> set[Classifier]:
+        """Get the most specific common supertypes of the given classifiers.
+
+        :param classifiers: The classifiers whose lowest common supertypes are requested.
+        :type classifiers: Iterable[Classifier]
+        :return: The common supertypes that do not generalize any other common supertype.
+        :rtype: set[Classifier]
+        """
+        return self.get_taxonomy().common_supertypes(classifiers)
+
+    def taxonomy_order(self) -> tuple[tuple[Classifier, int], ...]:
+        """Get the project's classifiers in generalization order (supertypes first), together with their layers.
+
+        :return: Pairs of classifier and layer, sorted by layer and then by ID.
+        :rtype: tuple[tuple[Classifier, int], ...]
+        """
+        return self.get_taxonomy().get_order()
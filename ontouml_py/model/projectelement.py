@@ -1,5 +1,14 @@
+from collections.abc import Iterable
+from typing import Any
+from typing import TYPE_CHECKING
+
 from pydantic import PrivateAttr
 
+from ontouml_py.model.ontoumlelement import _untracked
+
+if TYPE_CHECKING:
+    from ontouml_py.model.project import Project
+
 
 class ProjectElement:
     _project: "Project" = PrivateAttr()  # noqa:F821
@@ -13,8 +22,7 @@ class ProjectElement:
     }
 
     def __init__(self, project: "Project", pe_type: str) -> None:
-        project._elements[pe_type].add(self)
-        self._project = project
+        _register_elements(project, pe_type, (self,))
 
         # Ensures abstract
         if type(self) is ProjectElement:
@@ -23,3 +31,39 @@ class ProjectElement:
     @property
     def project(self) -> "Project":  # noqa:F821
         return self._project
+
+
+def _register_elements(project: "Project", pe_type: str, elements: Iterable[Any]) -> None:  # noqa:F821
+    """Add elements of the same concrete type to a project and set it as their project.
+
+    The elements are added to the project's elements, to its index of elements by ID, and to its changes, if it records
+    them outside an _untracked_changes block. Elements with the ID of one already in the project are not added to it,
+    which keeps the other. Used by ProjectElement.__init__ and by loaders creating elements without running their
+    constructors (e.g., _construct_elements).
+
+    :param project: The project of the elements.
+    :type project: Project
+    :param pe_type: The name of the concrete type of the elements (e.g., 'Class').
+    :type pe_type: str
+    :param elements: The elements, which are project elements (typed as Any, as ProjectElement is a mixin of the
+                     element types, which type checkers see as unrelated to the OntoumlElement type they are built as).
+    :type elements: Iterable[Any]
+    """
+    type_elements = project._elements[pe_type]
+    element_ids = project._element_ids.get(pe_type)
+    changed = None if _untracked.get() else project._changed
+    if element_ids is None and changed is None:
+        for element in elements:
+            type_elements.add(element)
+            element.__dict__["_project"] = project
+        return
+    for element in elements:
+        count = len(type_elements)
+        type_elements.add(element)
+        # Indexed and recorded only if added, as an element with the same ID is kept in its place otherwise
+        if len(type_elements) > count:
+            if element_ids is not None:
+                element_ids[element.__dict__["id"]] = element
+            if changed is not None:
+                changed.add(element)
+        element.__dict__["_project"] = project
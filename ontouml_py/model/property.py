@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from itertools import chain
 from typing import Any
 from typing import Optional
 
@@ -9,17 +11,19 @@ from ontouml_py.model.cardinality import Cardinality
 from ontouml_py.model.decoratable import Decoratable
 from ontouml_py.model.enumerations.aggregationkind import AggregationKind
 from ontouml_py.model.enumerations.propertystereotype import PropertyStereotype
-from ontouml_py.utils.error_message import format_error_message
+from ontouml_py.utils.errors import OntoumlTypeError
 
 
 class Property(Decoratable):
     # Private attributes
     _classifier: "Classifier" = PrivateAttr()  # noqa:F821
+    _subsets: set["Property"] = PrivateAttr(default_factory=set)  # Inverse of subsetted_by
+    _redefines: set["Property"] = PrivateAttr(default_factory=set)  # Inverse of redefined_by
     # Public attributes
     is_read_only: bool = Field(default=False)
     aggregation_kind: AggregationKind = Field(default=AggregationKind.NONE)
     stereotype: Optional[PropertyStereotype] = Field(default=None)
-    cardinality: Cardinality = Field(default=Cardinality())
+    cardinality: Cardinality = Field(default=Cardinality.of())
     property_type: Optional[object] = Field(default=None)
     subsetted_by: set["Property"] = Field(default_factory=set)
     redefined_by: set["Property"] = Field(default_factory=set)
@@ -35,17 +39,55 @@ class Property(Decoratable):
     def __init__(self, classifier: "Classifier", **data: dict[str, Any]) -> None:
         super().__init__(project=classifier.project, pe_type=self.__class__.__name__, **data)
         self._classifier = classifier
+        for subsetting_property in self.subsetted_by:
+            subsetting_property._subsets.add(self)
+        for redefining_property in self.redefined_by:
+            redefining_property._redefines.add(self)
+        # No property subsets or redefines the new one yet, so only closures reaching the properties it refers to change
+        self._discard_closures("subsetted_by", (), self.subsetted_by)
+        self._discard_closures("redefined_by", (), self.redefined_by)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, keeping the derived indexes that depend on it up to date.
+
+        Changing the property type updates the ends of the owning relation. Assigning subsetted_by or redefined_by
+        updates the inverse sets of the added and removed properties and discards the memoized closures reaching them
+        or this property. Note that in-place mutations of these sets are not tracked; they must be reassigned.
+
+        Values assigned without validation (see ValidationPolicy) are stored as given, but only the properties they
+        hold update the inverse sets, as the validated value would once coerced.
+
+        :param name: The name of the attribute to be set.
+        :type name: str
+        :param value: The new value of the attribute.
+        :type value: Any
+        """
+        if name not in _INVERSE_ATTRIBUTES:
+            super().__setattr__(name, value)
+            if name == "property_type":
+                self._classifier._update_relation_ends()
+            return
+
+        old_value = _get_properties(getattr(self, name))
+        super().__setattr__(name, value)
+        new_value = _get_properties(getattr(self, name))
+        for removed_property in old_value - new_value:
+            getattr(removed_property, _INVERSE_ATTRIBUTES[name]).discard(self)
+        for added_property in new_value - old_value:
+            getattr(added_property, _INVERSE_ATTRIBUTES[name]).add(self)
+        self._discard_closures(name, (self,), old_value ^ new_value)
 
     @field_validator("cardinality", mode="after")
     @classmethod
     def __validate_cardinality_type(cls, checked_value: object) -> Cardinality:
         if not isinstance(checked_value, Cardinality):
-            error_message = format_error_message(
+            raise OntoumlTypeError(
+                "invalid_cardinality_type",
                 description="Invalid cardinality type.",
-                cause=f"Expected Cardinality instance, got {type(checked_value).__name__} instance.",
+                cause="Expected Cardinality instance, got {value_type} instance.",
                 solution="Ensure the cardinality is set with an instance of the Cardinality class.",
+                value_type=type(checked_value).__name__,
             )
-            raise TypeError(error_message)
         return checked_value
 
     @property
@@ -56,3 +98,158 @@ class Property(Decoratable):
         :rtype: Optional[Classifier]
         """
         return self._classifier
+
+    @property
+    def subsets(self) -> set["Property"]:
+        """Get the properties this property subsets, i.e., those that have it in their subsetted_by set.
+
+        :return: The properties directly subsetted by this property.
+        :rtype: set[Property]
+        """
+        return self._subsets
+
+    @property
+    def redefines(self) -> set["Property"]:
+        """Get the properties this property redefines, i.e., those that have it in their redefined_by set.
+
+        :return: The properties directly redefined by this property.
+        :rtype: set[Property]
+        """
+        return self._redefines
+
+    def get_all_subsetted_by(self) -> frozenset["Property"]:
+        """Get the properties that directly or indirectly subset this property.
+
+        :return: The transitive closure of subsetted_by.
+        :rtype: frozenset[Property]
+        """
+        return self._get_closure("subsetted_by")
+
+    def get_all_subsets(self) -> frozenset["Property"]:
+        """Get the properties that this property directly or indirectly subsets.
+
+        :return: The transitive closure of subsets.
+        :rtype: frozenset[Property]
+        """
+        return self._get_closure("subsets")
+
+    def get_all_redefined_by(self) -> frozenset["Property"]:
+        """Get the properties that directly or indirectly redefine this property.
+
+        :return: The transitive closure of redefined_by.
+        :rtype: frozenset[Property]
+        """
+        return self._get_closure("redefined_by")
+
+    def get_all_redefines(self) -> frozenset["Property"]:
+        """Get the properties that this property directly or indirectly redefines.
+
+        :return: The transitive closure of redefines.
+        :rtype: frozenset[Property]
+        """
+        return self._get_closure("redefines")
+
+    def _get_closure(self, relation: str) -> frozenset["Property"]:
+        """Compute the transitive closure of a property relation, memoized in the project.
+
+        Closures already memoized for reached properties are reused instead of traversed again, so computing the
+        closures of all properties of a model is linear in the size of the subsetting/redefinition graph. Assigning
+        subsetted_by or redefined_by discards the memoized closures that reach the properties whose relations changed.
+
+        :param relation: Name of the attribute or property giving the direct neighbours of a property.
+        :type relation: str
+        :return: All properties reachable from this one through the relation, excluding itself unless in a cycle.
+        :rtype: frozenset[Property]
+        """
+        memo = self._project._property_closures
+        closure = memo.get((relation, self))
+        if closure is not None:
+            return closure
+
+        reached: set["Property"] = set()
+        to_visit = list(getattr(self, relation))
+        while to_visit:
+            current = to_visit.pop()
+            if current in reached:
+                continue
+            reached.add(current)
+            known_closure = memo.get((relation, current))
+            if known_closure is not None:
+                reached |= known_closure
+            else:
+                to_visit.extend(getattr(current, relation))
+
+        closure = frozenset(reached)
+        memo[(relation, self)] = closure
+        return closure
+
+    def _discard_closures(self, name: str, sources: Iterable["Property"], targets: Iterable["Property"]) -> None:
+        """Discard the memoized closures changed by adding or removing targets in an assignable relation of sources.
+
+        The closures of the relation change for the sources and the properties reaching them through it, and those of
+        its inverse for the targets and the properties reaching them through the inverse. These are found walking the
+        graph backwards, which the change does not affect.
+
+        :param name: The assigned relation, subsetted_by or redefined_by.
+        :type name: str
+        :param sources: The properties whose relation was assigned.
+        :type sources: Iterable[Property]
+        :param targets: The properties added to or removed from the relation.
+        :type targets: Iterable[Property]
+        """
+        memo = self._project._property_closures
+        if not memo:
+            return
+        inverse = _INVERSE_ATTRIBUTES[name][1:]
+        for relation, start, backwards in ((name, sources, inverse), (inverse, targets, name)):
+            reached: set["Property"] = set()
+            to_visit = list(start)
+            while to_visit:
+                current = to_visit.pop()
+                if current in reached:
+                    continue
+                reached.add(current)
+                memo.pop((relation, current), None)
+                to_visit.extend(getattr(current, backwards))
+
+    def is_subsetting_consistent(self) -> bool:
+        """Check whether the property is consistent with the properties it subsets and redefines.
+
+        A property is consistent if it does not directly or indirectly subset or redefine itself and its upper bound
+        does not exceed that of any property it directly subsets or redefines, and so of any it indirectly does. Bounds
+        that cannot be normalized are not compared. As closures are memoized, checking all properties of a model is
+        linear in the size of the subsetting/redefinition graph.
+
+        :return: True if the property is consistent.
+        :rtype: bool
+        """
+        if self in self.get_all_subsets() or self in self.get_all_redefines():
+            return False
+        upper = self.cardinality.upper
+        if upper is None:
+            return True
+        for other in chain(self._subsets, self._redefines):
+            other_upper = other.cardinality.upper
+            if other_upper is not None and upper > other_upper:
+                return False
+        return True
+
+
+# Maps the assignable relations between properties to the private attributes holding their inverses
+_INVERSE_ATTRIBUTES = {"subsetted_by": "_subsets", "redefined_by": "_redefines"}
+
+
+def _get_properties(value: Any) -> set[Property]:
+    """Get the properties held by a value of subsetted_by or redefined_by.
+
+    :param value: The value, which is any object if it was assigned without validation (e.g., a list of properties).
+    :type value: Any
+    :return: The properties in the value, if it is a collection.
+    :rtype: set[Property]
+    """
+    if isinstance(value, (str, bytes)):
+        return set()
+    try:
+        return {item for item in value if isinstance(item, Property)}
+    except TypeError:
+        return set()
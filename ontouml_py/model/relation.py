@@ -1,14 +1,18 @@
 from abc import abstractmethod
 from typing import Any
+from typing import cast
 from typing import Optional
 
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from ontouml_py.model.classifier import Classifier
 from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
 
 
 class Relation(Classifier):
+    # Classifiers whose adjacency index currently contains this relation
+    _linked_classifiers: set[Classifier] = PrivateAttr(default_factory=set)
     stereotype: Optional[RelationStereotype] = Field(default=None)
 
     model_config = {
@@ -23,8 +27,27 @@ class Relation(Classifier):
     def __init__(self, project: "Project", pe_type: str, **data: dict[str, Any]) -> None:
         Classifier.__init__(self, project=project, pe_type=pe_type, **data)
 
-
-# TODO (pedropaulofb): Create methods for set relation ends.
-# Relation ends are derived from the properties that a relation has, as follows: a relation r between the classes \
-# (source) c1 and (target) c2 occurs because it has two properties p1 and p2, with p1 having propertyType c1 and p2 c2.
-# Only binary relations have source and target ends, n-ary have numerated ends.
+    @property
+    def members(self) -> list[Optional[Classifier]]:
+        """Get the types of the relation's ends, in the order of the properties that define them.
+
+        A relation between the classes c1 and c2 occurs because it has two properties p1 and p2, with p1 having
+        property_type c1 and p2 having property_type c2. Ends whose property has no type are returned as None.
+
+        :return: The property types of the relation's properties.
+        :rtype: list[Optional[Classifier]]
+        """
+        return [cast(Optional[Classifier], relation_end.property_type) for relation_end in self._properties]
+
+    def _update_relation_ends(self) -> None:
+        """Update the adjacency index of the classifiers at the ends of the relation.
+
+        The relation is registered in the classifiers that are now the type of one of its ends and unregistered from
+        those that are no longer. The cost is proportional to the number of ends of the relation.
+        """
+        current = {member for member in self.members if isinstance(member, Classifier)}
+        for old_member in self._linked_classifiers - current:
+            old_member._relations.discard(self)
+        for new_member in current - self._linked_classifiers:
+            new_member._relations.add(self)
+        self._linked_classifiers = current
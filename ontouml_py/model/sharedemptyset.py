@@ -0,0 +1,160 @@
+"""Module for the set fields of OntoUML elements that share a single empty set until they are first added to.
+
+Most elements leave most of their set fields (e.g., their alternative names and custom properties) empty, yet a set
+created for each of them takes over 200 bytes. The values of these fields are therefore held as EMPTY_SET, a single
+immutable empty set, until items are added to them. SharedEmptySetField, the descriptor through which the fields are
+read, gives a copy-on-write set in place of EMPTY_SET, which replaces it as the element's value once items are added to
+it, so that callers read and change the fields as ordinary sets:
+
+    person = project.create_class_kind()
+    person.__dict__["alt_names"] is EMPTY_SET  # True
+    person.alt_names.add(LangString("Person"))
+    person.__dict__["alt_names"]  # {LangString("Person")}
+
+Code reading the fields from the instance dictionaries of elements (e.g., serializers) gets EMPTY_SET, which is an
+empty set, and must not add to it. Validated values that are empty are stored as EMPTY_SET as well.
+"""
+from collections.abc import Iterable
+from typing import Any
+from typing import NoReturn
+from typing import Optional
+
+
+class _EmptySet(set):
+    """Immutable empty set, of which EMPTY_SET is the only instance."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        # Hashable, so that pydantic uses it as a default value without copying it, and hashed as the empty frozenset,
+        # which it is equal to
+        return hash(frozenset())
+
+    def __repr__(self) -> str:
+        return "set()"
+
+    def __reduce__(self) -> str:
+        return "EMPTY_SET"
+
+    def _raise_immutable(self, *_others: Any) -> NoReturn:
+        raise TypeError("EMPTY_SET is immutable. Read the field through its element to get a set that can be changed.")
+
+    add = update = symmetric_difference_update = __ior__ = __ixor__ = _raise_immutable
+
+
+# Value of all empty set fields shared by elements
+EMPTY_SET: set = _EmptySet()
+
+_new_set = set.__new__
+
+
+class _CopyOnWriteSet(set):
+    """Set read from a field holding EMPTY_SET, which becomes the value of the field once items are added to it."""
+
+    # Set by SharedEmptySetField, which creates the set without running __init__
+    __slots__ = ("_element", "_name")
+
+    def _install(self) -> set:
+        """Set the set as the value of its field, unless the field holds items added through another set read from it or
+        was assigned since the set was read.
+
+        :return: The set to change, which is the value of the field unless the field was assigned.
+        :rtype: set
+        """
+        element = self._element
+        if element is None:
+            return self
+        value = element.__dict__.get(self._name)
+        if value is EMPTY_SET:
+            element.__dict__[self._name] = self
+        elif isinstance(value, _CopyOnWriteSet):
+            # Installed by another set read from the field while it was empty, which the change is handed to
+            return value
+        self._element = None
+        return self
+
+    def _synchronize(self, target: set) -> None:
+        """Give the set the items of the set changed in its place, if any."""
+        if target is not self:
+            set.clear(self)
+            set.update(self, target)
+
+    def add(self, item: Any) -> None:
+        target = self._install()
+        set.add(target, item)
+        self._synchronize(target)
+
+    def update(self, *others: Iterable[Any]) -> None:
+        target = self._install()
+        set.update(target, *others)
+        self._synchronize(target)
+
+    def symmetric_difference_update(self, other: Iterable[Any]) -> None:
+        target = self._install()
+        set.symmetric_difference_update(target, other)
+        self._synchronize(target)
+
+    def __ior__(self, other: Any) -> set:
+        target = self._install()
+        set.__ior__(target, other)
+        self._synchronize(target)
+        return target
+
+    def __ixor__(self, other: Any) -> set:
+        target = self._install()
+        set.__ixor__(target, other)
+        self._synchronize(target)
+        return target
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies and unpickled values are ordinary sets
+        return set, (list(self),)
+
+
+class SharedEmptySetField:
+    """Data descriptor reading a set field of a pydantic model, whose empty values are EMPTY_SET, as a set that can be
+    changed.
+
+    The descriptor is installed on a model type once it is created (see share_empty_sets), taking precedence over the
+    instance dictionary. Assignments are still validated by the model, which stores their values in the dictionary.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, element: Optional[Any], _owner: Optional[type] = None) -> set:
+        if element is None:
+            # As for other fields, so that pydantic copies the field to subtypes instead of taking the descriptor as
+            # its default value
+            raise AttributeError(self._name)
+        try:
+            value = element.__dict__[self._name]
+        except KeyError:
+            raise AttributeError(f"'{type(element).__name__}' object has no attribute '{self._name}'") from None
+        if value is EMPTY_SET:
+            # Created by set.__new__ alone, which takes half the time of calling the type, as this is done on each read
+            copy_on_write = _new_set(_CopyOnWriteSet)
+            copy_on_write._element = element
+            copy_on_write._name = self._name
+            return copy_on_write
+        return value
+
+    def __set__(self, element: Any, value: set) -> None:
+        element.__dict__[self._name] = value
+
+
+def share_empty_sets(model_type: type, names: Iterable[str]) -> None:
+    """Install the descriptors of set fields of a pydantic model type, whose default must be EMPTY_SET.
+
+    :param model_type: The model type declaring the fields.
+    :type model_type: type
+    :param names: The names of the fields.
+    :type names: Iterable[str]
+    """
+    for name in names:
+        setattr(model_type, name, SharedEmptySetField(name))
@@ -0,0 +1,257 @@
+"""Module for the Taxonomy index built over the generalizations of an OntoUML project.
+
+This module defines the Taxonomy class, a preprocessed, read-only view of the generalization DAG of a project. Each
+classifier receives a position in a topological order of the taxonomy (supertypes before subtypes) and the set of its
+ancestors (itself included) is stored as an integer bitset indexed by these positions. Queries over supertypes are thus
+answered with a few bitwise operations instead of graph traversals. Each classifier also receives a layer, the length
+of the longest generalization chain from a root of the taxonomy to it.
+
+The index is kept by the owning project. Creating classifiers and generalizations updates it incrementally when the
+existing positions remain a valid topological order; any other change to the taxonomy (e.g., reassigning the ends of a
+generalization) makes the project discard the index and rebuild it on next access.
+"""
+from collections.abc import Iterable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ontouml_py.utils.errors import OntoumlValueError
+
+if TYPE_CHECKING:
+    from ontouml_py.model.classifier import Classifier
+    from ontouml_py.model.generalization import Generalization
+
+
+class Taxonomy:
+    """Read-only index over the generalization DAG formed by the classifiers of a project.
+
+    :ivar _nodes: Classifiers in topological order, i.e., every classifier appears after all of its supertypes.
+    :vartype _nodes: list[Classifier]
+    :ivar _positions: Position of each classifier in _nodes.
+    :vartype _positions: dict[Classifier, int]
+    :ivar _parents: For each position, the positions of the classifier's direct supertypes.
+    :vartype _parents: list[set[int]]
+    :ivar _ancestors: For each position, a bitset with the positions of the classifier's supertypes (self included).
+    :vartype _ancestors: list[int]
+    :ivar _layers: For each position, the length of the longest generalization chain from a root to the classifier.
+    :vartype _layers: list[int]
+    :ivar _order: Cached layered order of the classifiers, discarded whenever a layer changes.
+    :vartype _order: Optional[tuple[tuple[Classifier, int], ...]]
+    """
+
+    def __init__(self, classifiers: Iterable["Classifier"], generalizations: Iterable["Generalization"]) -> None:
+        """Build the taxonomy index.
+
+        :param classifiers: Classifiers that compose the taxonomy.
+        :type classifiers: Iterable[Classifier]
+        :param generalizations: Generalizations that relate the classifiers of the taxonomy.
+        :type generalizations: Iterable[Generalization]
+        :raises ValueError: If the generalizations form a cycle.
+        """
+        parents: dict["Classifier", set["Classifier"]] = {classifier: set() for classifier in classifiers}
+        children: dict["Classifier", set["Classifier"]] = {classifier: set() for classifier in parents}
+
+        for generalization in generalizations:
+            for classifier in (generalization.general, generalization.specific):
+                parents.setdefault(classifier, set())
+                children.setdefault(classifier, set())
+            parents[generalization.specific].add(generalization.general)
+            children[generalization.general].add(generalization.specific)
+
+        # Kahn's algorithm: a classifier is placed only after all of its supertypes have been placed.
+        pending = {classifier: len(supertypes) for classifier, supertypes in parents.items()}
+        ready = [classifier for classifier, count in pending.items() if count == 0]
+        self._nodes: list["Classifier"] = []
+        while ready:
+            classifier = ready.pop()
+            self._nodes.append(classifier)
+            for child in children[classifier]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+
+        if len(self._nodes) != len(parents):
+            cyclic = sorted(classifier.id for classifier, count in pending.items() if count > 0)
+            raise OntoumlValueError(
+                "cyclic_taxonomy",
+                description="Invalid taxonomy.",
+                cause="The generalizations among the classifiers with IDs {cyclic} form a cycle.",
+                solution="Remove or reassign the generalizations so that no classifier is its own supertype.",
+                cyclic=cyclic,
+            )
+
+        self._positions: dict["Classifier", int] = {classifier: pos for pos, classifier in enumerate(self._nodes)}
+        self._parents: list[set[int]] = []
+        self._ancestors: list[int] = []
+        self._layers: list[int] = []
+        self._order: Optional[tuple[tuple["Classifier", int], ...]] = None
+        for pos, classifier in enumerate(self._nodes):
+            parent_positions = {self._positions[parent] for parent in parents[classifier]}
+            bitset = 1 << pos
+            for parent in parent_positions:
+                bitset |= self._ancestors[parent]
+            self._parents.append(parent_positions)
+            self._ancestors.append(bitset)
+            self._layers.append(max((self._layers[parent] + 1 for parent in parent_positions), default=0))
+
+    def add_classifier(self, classifier: "Classifier") -> None:
+        """Add a classifier without supertypes to the taxonomy.
+
+        The classifier is placed after all existing ones, which keeps the positions in topological order.
+
+        :param classifier: The new classifier.
+        :type classifier: Classifier
+        """
+        if classifier in self._positions:
+            return
+        self._positions[classifier] = len(self._nodes)
+        self._nodes.append(classifier)
+        self._parents.append(set())
+        self._ancestors.append(1 << self._positions[classifier])
+        self._layers.append(0)
+        self._order = None
+
+    def add_generalization(self, generalization: "Generalization") -> bool:
+        """Incrementally add a generalization to the taxonomy.
+
+        The update is only possible when both ends are known and the general classifier already precedes the specific
+        one, as the existing positions then remain a topological order. Only the specific classifier and its subtypes
+        have their ancestors and layers updated.
+
+        :param generalization: The new generalization.
+        :type generalization: Generalization
+        :return: True if the taxonomy was updated, False if it must be rebuilt to account for the generalization.
+        :rtype: bool
+        """
+        general = self._positions.get(generalization.general)
+        specific = self._positions.get(generalization.specific)
+        if general is None or specific is None or general >= specific:
+            return False
+
+        self._parents[specific].add(general)
+        specific_bit = 1 << specific
+        layers_changed = False
+        # Subtypes of the specific classifier can only be found at later positions, already in topological order.
+        for pos in range(specific, len(self._nodes)):
+            if not self._ancestors[pos] & specific_bit:
+                continue
+            self._ancestors[pos] |= self._ancestors[general]
+            new_layer = max(self._layers[parent] + 1 for parent in self._parents[pos]) if self._parents[pos] else 0
+            if new_layer != self._layers[pos]:
+                self._layers[pos] = new_layer
+                layers_changed = True
+        if layers_changed:
+            self._order = None
+        return True
+
+    def _get_position(self, classifier: "Classifier") -> int:
+        """Return the position of a classifier in the taxonomy.
+
+        :param classifier: The classifier to be located.
+        :type classifier: Classifier
+        :return: The position of the classifier in the topological order.
+        :rtype: int
+        :raises ValueError: If the classifier is not part of the taxonomy.
+        """
+        try:
+            return self._positions[classifier]
+        except KeyError:
+            raise OntoumlValueError(
+                "classifier_not_in_taxonomy",
+                description="Classifier not found in taxonomy.",
+                cause="The classifier with ID {element.id} is not part of the project's taxonomy.",
+                solution="Ensure the classifier was created in the same project as the taxonomy.",
+                element=classifier,
+            ) from None
+
+    def _get_classifiers(self, bitset: int) -> set["Classifier"]:
+        """Return the classifiers whose positions are set in the given bitset.
+
+        :param bitset: A bitset of taxonomy positions.
+        :type bitset: int
+        :return: The classifiers at the given positions.
+        :rtype: set[Classifier]
+        """
+        classifiers = set()
+        while bitset:
+            lowest = bitset & -bitset
+            classifiers.add(self._nodes[lowest.bit_length() - 1])
+            bitset ^= lowest
+        return classifiers
+
+    def get_supertypes(self, classifier: "Classifier") -> set["Classifier"]:
+        """Return all direct and indirect supertypes of a classifier, the classifier itself excluded.
+
+        :param classifier: The classifier whose supertypes are requested.
+        :type classifier: Classifier
+        :return: The supertypes of the classifier.
+        :rtype: set[Classifier]
+        """
+        position = self._get_position(classifier)
+        return self._get_classifiers(self._ancestors[position] ^ (1 << position))
+
+    def is_supertype_of(self, general: "Classifier", specific: "Classifier") -> bool:
+        """Check whether a classifier is a direct or indirect supertype of another one.
+
+        :param general: The candidate supertype.
+        :type general: Classifier
+        :param specific: The candidate subtype.
+        :type specific: Classifier
+        :return: True if general is a proper supertype of specific, False otherwise.
+        :rtype: bool
+        """
+        general_position = self._get_position(general)
+        specific_position = self._get_position(specific)
+        return general_position != specific_position and bool(
+            self._ancestors[specific_position] >> general_position & 1
+        )
+
+    def common_supertypes(self, classifiers: Iterable["Classifier"]) -> set["Classifier"]:
+        """Return the most specific common supertypes (lowest common ancestors) of the given classifiers.
+
+        A classifier is considered a supertype of itself, so the common supertype of a single classifier is the
+        classifier itself. As generalizations form a DAG, there may be more than one most specific common supertype.
+
+        :param classifiers: The classifiers whose common supertypes are requested.
+        :type classifiers: Iterable[Classifier]
+        :return: The common supertypes that do not generalize any other common supertype. Empty if there is none.
+        :rtype: set[Classifier]
+        """
+        common = -1
+        for classifier in classifiers:
+            common &= self._ancestors[self._get_position(classifier)]
+        if common == -1:
+            return set()
+
+        # Positions follow a topological order, so visiting from the highest position guarantees that every visited
+        # position is not a supertype of any other remaining one. Its strict ancestors are then discarded.
+        lowest_common = 0
+        remaining = common
+        while remaining:
+            position = remaining.bit_length() - 1
+            lowest_common |= 1 << position
+            remaining &= ~self._ancestors[position]
+        return self._get_classifiers(lowest_common)
+
+    def get_layer(self, classifier: "Classifier") -> int:
+        """Return the layer of a classifier, i.e., the length of the longest generalization chain from a root to it.
+
+        :param classifier: The classifier whose layer is requested.
+        :type classifier: Classifier
+        :return: The layer of the classifier (0 for classifiers without supertypes).
+        :rtype: int
+        """
+        return self._layers[self._get_position(classifier)]
+
+    def get_order(self) -> tuple[tuple["Classifier", int], ...]:
+        """Return all classifiers of the taxonomy in generalization order, together with their layers.
+
+        Classifiers are sorted by layer and, within the same layer, by ID, so the result is deterministic for a given
+        model and every classifier appears after all of its supertypes. The order is cached until a layer changes.
+
+        :return: Pairs of classifier and layer, supertypes first.
+        :rtype: tuple[tuple[Classifier, int], ...]
+        """
+        if self._order is None:
+            positions = sorted(range(len(self._nodes)), key=lambda pos: (self._layers[pos], self._nodes[pos].id))
+            self._order = tuple((self._nodes[pos], self._layers[pos]) for pos in positions)
+        return self._order
@@ -0,0 +1,5 @@
+"""This subpackage reads and writes OntoUML projects in external formats.
+
+Serializers work in a streaming fashion: they write (or read) the elements of a project one at a time, so that memory
+use does not grow with the size of the serialized document.
+"""
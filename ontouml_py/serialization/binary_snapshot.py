@@ -0,0 +1,932 @@
+"""This module saves OntoUML projects as compact binary snapshots and loads them back.
+
+Snapshots hold the complete state of a project: every field of the project and of its elements, the packages of its
+elements, the owners of its properties and literals, and which fields were explicitly set. They are meant for saving
+and loading large projects fast (e.g., caching them between runs), not for interchange, for which the OntoUML JSON
+schema is used. Loading is fast because elements are rebuilt from values that were already validated when saved,
+without validating them again, and because values are stored once and referred to by integer codes.
+
+A snapshot is laid out as follows, with all integers in little-endian order:
+
+- header: the magic bytes b"OUMLSNAP", the format version and the number of sections;
+- string table: all strings of the snapshot (e.g., IDs, names and enumeration member names), each stored once;
+- value table: the distinct values of the fields (e.g., IDs, stereotypes, cardinalities and timestamps), each stored
+  once as a tag followed by integers, which refer to strings by their position in the string table and to other values
+  by their code, i.e., their position in the value table, starting at 1. Code 0 stands for None;
+- one section per element type, the project's first, each with the number of elements and one column per field.
+  Columns hold the codes of the values of a field, or, for references between elements, the positions of the
+  referred elements in the snapshot, starting at 1 with 0 standing for None. Sets are stored as the number of items of
+  each element followed by the items of all elements.
+
+The format version is increased whenever the layout changes, and snapshots of other versions are rejected. Columns are
+identified by field names, so that fields added to an element type after a snapshot was saved get their defaults.
+"""
+import gc
+import struct
+import sys
+from array import array
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from enum import Enum
+from itertools import accumulate
+from itertools import chain
+from operator import attrgetter
+from operator import itemgetter
+from os import PathLike
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from langstring import LangString
+
+from ontouml_py.model.anchor import Anchor
+from ontouml_py.model.binaryrelation import BinaryRelation
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.classifier import Classifier
+from ontouml_py.model.enumerations.ontouml_enum import OntoumlEnum
+from ontouml_py.model.generalization import Generalization
+from ontouml_py.model.generalizationset import GeneralizationSet
+from ontouml_py.model.literal import Literal
+from ontouml_py.model.naryrelation import NaryRelation
+from ontouml_py.model.note import Note
+from ontouml_py.model.ontoumlelement import _construct_elements
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.package import Package
+from ontouml_py.model.packageable import Packageable
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import _register_elements
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.property import Property
+from ontouml_py.representation.diagram import Diagram
+from ontouml_py.serialization.compressed_io import open_compressed
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+
+MAGIC: bytes = b"OUMLSNAP"
+FORMAT_VERSION: int = 1
+
+# Element types, in the order of their sections. Classifiers precede properties and classes precede literals, so that
+# owners are built before what they own.
+_SECTION_TYPES: tuple[type[OntoumlElement], ...] = (
+    Project,
+    Package,
+    Class,
+    BinaryRelation,
+    NaryRelation,
+    Property,
+    Literal,
+    Generalization,
+    GeneralizationSet,
+    Note,
+    Anchor,
+    Diagram,
+)
+_TYPES_BY_NAME: dict[str, type[OntoumlElement]] = {
+    element_type.__name__: element_type for element_type in _SECTION_TYPES
+}
+
+# Kinds of columns
+_VALUES, _REFERENCES, _VALUE_SETS, _REFERENCE_SETS, _LANGSTRINGS, _LANGSTRING_SETS = range(6)
+
+# Columns other than fields: the owners of elements and the names of the fields explicitly set. Field names never
+# start with an underscore, so they cannot clash.
+_PACKAGE_COLUMN = "_package"
+_OWNER_COLUMNS = {"Property": "_classifier", "Literal": "_enumeration"}
+_FIELDS_SET_COLUMN = "_fields_set"
+_OWNER_COLUMN_NAMES = frozenset((_PACKAGE_COLUMN, *_OWNER_COLUMNS.values()))
+_SPECIAL_COLUMNS = _OWNER_COLUMN_NAMES | {_FIELDS_SET_COLUMN}
+
+# Tags of the entries of the value table
+_FALSE, _TRUE, _INT, _BIG_INT, _FLOAT, _STR, _TUPLE, _ENUM, _DATETIME, _AWARE_DATETIME, _CARDINALITY = range(11)
+
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+# Type of the arrays of snapshots, which all hold integers, and which are only generic for type checkers
+if TYPE_CHECKING:
+    _IntArray = array[int]
+else:
+    _IntArray = array
+_INT64 = "q"
+_HEADER = struct.Struct("<8sHI")
+_MIN_DATETIME = datetime.min
+_MICROSECOND = timedelta(microseconds=1)
+_INT64_RANGE = range(-(2**63), 2**63)
+_FLOAT_BITS = struct.Struct("<d")
+_INT_BITS = struct.Struct("<q")
+
+
+def save_binary(project: Project, path: Union[str, PathLike[str]]) -> None:
+    """Save a project to a file as a binary snapshot, compressed if the suffix of the path is that of a compression.
+
+    :param project: The project to be saved.
+    :type project: Project
+    :param path: The path of the file, which is overwritten if it exists (e.g., 'project.snap' or 'project.snap.xz').
+    :type path: Union[str, PathLike]
+    :raises OntoumlTypeError: If a field holds a value that snapshots cannot store.
+    :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                               pending validation under the deferred validation policy.
+    """
+    with open_compressed(path, "wb") as output:
+        write_binary(project, output)
+
+
+def load_binary(path: Union[str, PathLike[str]]) -> Project:
+    """Load a project from a file holding a binary snapshot, which is decompressed if it is compressed.
+
+    :param path: The path of the file.
+    :type path: Union[str, PathLike]
+    :return: The project, in the state it was saved.
+    :rtype: Project
+    :raises OntoumlValueError: If the file is not a valid snapshot or was saved with another version of the format.
+    """
+    with open_compressed(path, "rb") as source:
+        return read_binary(source)
+
+
+def write_binary(project: Project, output: BinaryIO) -> None:
+    """Write a project to a binary stream as a snapshot.
+
+    Elements are written sorted by type and ID, except properties, which are written in the order of their
+    classifiers' properties, and literals, which are written after their classes'.
+
+    :param project: The project to be written.
+    :type project: Project
+    :param output: The binary stream the snapshot is written to (e.g., a file opened in binary mode).
+    :type output: BinaryIO
+    :raises OntoumlTypeError: If a field holds a value that snapshots cannot store.
+    :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                               pending validation under the deferred validation policy.
+    """
+    _check_no_pending(project)
+    sections = _get_sections(project)
+    positions = {id(element): position for position, element in enumerate(chain.from_iterable(sections.values()), 1)}
+    table = _ValueTable()
+    encoded_sections = [
+        _encode_section(element_type, sections[element_type.__name__], positions, table)
+        for element_type in _SECTION_TYPES
+    ]
+
+    output.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded_sections)))
+    strings = table.strings
+    text = "".join(strings).encode("utf-8", "surrogatepass")
+    _write_array(output, array(_UINT32, map(len, strings)))
+    _write_array(output, array("B", text))
+    _write_array(output, table.entries)
+    for encoded_section in encoded_sections:
+        for encoded_array in encoded_section:
+            _write_array(output, encoded_array)
+
+
+def read_binary(source: BinaryIO) -> Project:
+    """Read a project from a binary stream holding a snapshot.
+
+    Elements are rebuilt without validating their fields again. The garbage collector is paused meanwhile, as none of
+    the objects created are garbage.
+
+    :param source: The binary stream the snapshot is read from (e.g., a file opened in binary mode).
+    :type source: BinaryIO
+    :return: The project, in the state it was saved.
+    :rtype: Project
+    :raises OntoumlValueError: If the stream does not hold a valid snapshot or holds one saved with another version of
+                               the format.
+    """
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _SnapshotReader(source.read()).read()
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _check_no_pending(project: Project) -> None:
+    """Check that a project has no assignments pending validation, which would be loaded as valid.
+
+    :param project: The project.
+    :type project: Project
+    :raises OntoumlValueError: If assignments are pending validation under the deferred validation policy.
+    """
+    pending = _get_private(project)["_pending"]
+    if pending:
+        raise OntoumlValueError(
+            "pending_assignments",
+            description="Invalid project for saving.",
+            cause="{count} elements have assignments pending validation, which would be loaded as valid.",
+            solution="Validate the pending assignments with validate_pending before saving the project.",
+            element=project,
+            count=len(pending),
+        )
+
+
+def _get_sections(project: Project) -> dict[str, list[Any]]:
+    """Get the elements of each section of a project's snapshot, in the order they are written.
+
+    :param project: The project.
+    :type project: Project
+    :return: The elements of each type of _SECTION_TYPES, by type name, in the order of _SECTION_TYPES.
+    :rtype: dict[str, list[Any]]
+    """
+    by_id = attrgetter("id")
+    elements = project.get_elements()
+    sections: dict[str, list[Any]] = {"Project": [project]}
+    for element_type in _SECTION_TYPES[1:]:
+        type_name = element_type.__name__
+        if type_name == "Property":
+            classifiers = chain(sections["Class"], sections["BinaryRelation"], sections["NaryRelation"])
+            sections[type_name] = [owned for classifier in classifiers for owned in classifier.properties]
+        elif type_name == "Literal":
+            sections[type_name] = [
+                owned for class_ in sections["Class"] for owned in sorted(class_.literals, key=by_id)
+            ]
+        else:
+            sections[type_name] = sorted(elements[type_name], key=by_id)
+    return sections
+
+
+def _encode_section(
+    element_type: type[OntoumlElement],
+    elements: list[OntoumlElement],
+    positions: dict[int, int],
+    table: "_ValueTable",
+) -> list[_IntArray]:
+    """Encode the columns of the elements of a section.
+
+    :param element_type: The type of the elements of the section.
+    :type element_type: type[OntoumlElement]
+    :param elements: The elements of the section, all of the same type.
+    :type elements: list[OntoumlElement]
+    :param positions: Positions of the elements in the snapshot, by their identity.
+    :type positions: dict[int, int]
+    :param table: The value table, to which the values of the elements are added.
+    :type table: _ValueTable
+    :return: The arrays of the section: its header (type name, number of elements and number of columns), and then
+             the header (name and kind) and data arrays of each column.
+    :rtype: list[array]
+    """
+    columns = _get_columns(element_type, elements)
+    fields_set = [tuple(sorted(element.__pydantic_fields_set__)) for element in elements]
+    columns.append((_FIELDS_SET_COLUMN, fields_set))
+
+    encoded = [array(_UINT32, (table.add_string(element_type.__name__), len(elements), len(columns)))]
+    for name, values in columns:
+        kind = _get_column_kind(values)
+        encoded.append(array(_UINT32, (table.add_string(name), kind)))
+        encoded.extend(_encode_column(elements, name, kind, values, positions, table))
+    return encoded
+
+
+def _get_columns(element_type: type[OntoumlElement], elements: list[OntoumlElement]) -> list[tuple[str, Sequence[Any]]]:
+    """Get the columns of the fields and of the owners of elements of the same type.
+
+    :param element_type: The type of the elements.
+    :type element_type: type[OntoumlElement]
+    :param elements: The elements.
+    :type elements: list[OntoumlElement]
+    :return: Pairs of column name and values of the elements.
+    :rtype: list[tuple[str, Sequence[Any]]]
+    """
+    field_names = _get_field_names(element_type)
+    get_fields = itemgetter(*field_names)
+    field_columns = (
+        zip(*(get_fields(element.__dict__) for element in elements)) if elements else ((),) * len(field_names)
+    )
+    columns: list[tuple[str, Sequence[Any]]] = list(zip(field_names, field_columns))
+    if issubclass(element_type, Packageable):
+        columns.append((_PACKAGE_COLUMN, [element.__dict__.get(_PACKAGE_COLUMN) for element in elements]))
+    owner_column = _OWNER_COLUMNS.get(element_type.__name__)
+    if owner_column is not None:
+        columns.append((owner_column, [_get_private(element)[owner_column] for element in elements]))
+    return columns
+
+
+def _get_column_kind(values: Sequence[Any]) -> int:
+    """Get how a column is encoded, from the type of its first value that is not None nor an empty set.
+
+    :param values: The values of the column.
+    :type values: Sequence[Any]
+    :return: The kind of the column.
+    :rtype: int
+    """
+    for value in values:
+        if isinstance(value, set):
+            if value:
+                item = next(iter(value))
+                if isinstance(item, ProjectElement):
+                    return _REFERENCE_SETS
+                return _LANGSTRING_SETS if isinstance(item, LangString) else _VALUE_SETS
+        elif value is not None:
+            if isinstance(value, ProjectElement):
+                return _REFERENCES
+            return _LANGSTRINGS if isinstance(value, LangString) else _VALUES
+    return _VALUE_SETS if values and isinstance(values[0], set) else _VALUES
+
+
+def _encode_column(
+    elements: list[OntoumlElement],
+    name: str,
+    kind: int,
+    values: Sequence[Any],
+    positions: dict[int, int],
+    table: "_ValueTable",
+) -> list[_IntArray]:
+    """Encode the values of a column.
+
+    :param elements: The elements the values belong to, for error messages.
+    :type elements: list[OntoumlElement]
+    :param name: The name of the column.
+    :type name: str
+    :param kind: The kind of the column.
+    :type kind: int
+    :param values: The values of the column.
+    :type values: Sequence[Any]
+    :param positions: Positions of the elements in the snapshot, by their identity.
+    :type positions: dict[int, int]
+    :param table: The value table, to which the values are added.
+    :type table: _ValueTable
+    :return: The data arrays of the column.
+    :rtype: list[array]
+    :raises OntoumlTypeError: If a value does not match the kind of the column or cannot be stored.
+    :raises OntoumlValueError: If a value refers to an element that is not in the project.
+    """
+    is_set_kind = kind in (_VALUE_SETS, _REFERENCE_SETS, _LANGSTRING_SETS)
+    try:
+        if is_set_kind:
+            columns = [
+                array(_UINT32, map(len, values)),
+                _encode_items(kind, chain.from_iterable(values), positions, table),
+            ]
+        else:
+            columns = [_encode_items(kind, values, positions, table)]
+    except (KeyError, TypeError, AttributeError):
+        pass
+    else:
+        return columns
+
+    # Find the first value that cannot be stored, to report it
+    for element, value in zip(elements, values):
+        try:
+            _encode_items(kind, value if is_set_kind else (value,), positions, _ValueTable())
+        except KeyError:
+            raise OntoumlValueError(
+                "unknown_snapshot_reference",
+                description="Invalid reference in field '{name}' of {element_type} with ID {element.id}.",
+                cause="The field refers to an element that is not in the project: {value!r}.",
+                solution="Add the referred element to the project, or remove the reference.",
+                element=element,
+                element_type=type(element).__name__,
+                name=name,
+                value=value,
+            ) from None
+        except (TypeError, AttributeError) as error:
+            raise OntoumlTypeError(
+                "unsupported_snapshot_value",
+                description="Invalid value of field '{name}' of {element_type} with ID {element.id} for a binary "
+                "snapshot.",
+                cause="Snapshots store elements, language strings, sets of them, and None, booleans, numbers, strings, "
+                "enumeration members, timestamps, cardinalities and tuples of them, got {value!r}.",
+                solution="Replace the value with one that can be stored.",
+                element=element,
+                element_type=type(element).__name__,
+                name=name,
+                value=value,
+            ) from error
+    raise AssertionError("A column failed to be encoded, but each of its values can be encoded.")
+
+
+def _encode_items(kind: int, items: Iterable[Any], positions: dict[int, int], table: "_ValueTable") -> _IntArray:
+    """Encode the values of a column, or the items of its sets.
+
+    :param kind: The kind of the column.
+    :type kind: int
+    :param items: The values or items.
+    :type items: Iterable[Any]
+    :param positions: Positions of the elements in the snapshot, by their identity.
+    :type positions: dict[int, int]
+    :param table: The value table, to which the values are added.
+    :type table: _ValueTable
+    :return: The codes of the values or items, or the positions of the elements they refer to.
+    :rtype: array
+    :raises KeyError: If an item refers to an element that is not in the project.
+    :raises TypeError: If an item cannot be stored in the column (e.g., a set in a column of values), as an
+        OntoumlTypeError if its type is not supported.
+    :raises AttributeError: If an item that is not a language string is found in a column of language strings.
+    """
+    if kind in (_VALUES, _VALUE_SETS):
+        return array(_UINT32, map(table.add, items))
+    if kind in (_REFERENCES, _REFERENCE_SETS):
+        return array(_UINT32, (0 if item is None else positions[id(_check_element(item))] for item in items))
+    return array(_UINT32, chain.from_iterable(map(table.add_langstring, items)))
+
+
+def _check_element(item: Any) -> ProjectElement:
+    if not isinstance(item, ProjectElement):
+        raise OntoumlTypeError(
+            "unsupported_snapshot_reference",
+            description="Invalid reference for a binary snapshot.",
+            cause="Expected an element, got {item_type}.",
+            solution="Refer to elements of the project only.",
+            item_type=type(item).__name__,
+        )
+    return item
+
+
+class _ValueTable:
+    """Table of the distinct values of a snapshot being written, and of the strings in them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.strings: list[str] = []
+        self.entries = array(_INT64)
+        # Position of the entry of each value in entries, in the order of their codes
+        self.offsets = array(_INT64)
+        self._string_positions: dict[str, int] = {}
+        # Codes of the values added, by the keys given by _get_value_key
+        self._codes: dict[Any, int] = {}
+
+    def add_string(self, string: str) -> int:
+        """Add a string to the string table.
+
+        :param string: The string.
+        :type string: str
+        :return: The position of the string in the string table.
+        :rtype: int
+        """
+        position = self._string_positions.get(string)
+        if position is not None:
+            return position
+        self._string_positions[string] = len(self.strings)
+        self.strings.append(string)
+        return len(self.strings) - 1
+
+    def add(self, value: Any) -> int:
+        """Add a value to the table, unless it is already there.
+
+        :param value: The value.
+        :type value: Any
+        :return: The code of the value.
+        :rtype: int
+        :raises OntoumlTypeError: If the value cannot be stored.
+        """
+        if value is None:
+            return 0
+        key = value if type(value) is str else _get_value_key(value)
+        code = self._codes.get(key)
+        if code is not None:
+            return code
+        # The entry is got first, as it may add the values it refers to
+        entry = self._get_entry(value)
+        self.offsets.append(len(self.entries))
+        self.entries.extend(entry)
+        self._codes[key] = len(self._codes) + 1
+        return len(self._codes)
+
+    def add_langstring(self, langstring: LangString) -> tuple[int, int]:
+        """Add the text and language of a language string to the table.
+
+        :param langstring: The language string, or None.
+        :type langstring: LangString
+        :return: The codes of the text and of the language, or zeros if the language string is None.
+        :rtype: tuple[int, int]
+        :raises OntoumlTypeError: If the value is not a language string.
+        """
+        if langstring is None:
+            return 0, 0
+        if type(langstring) is not LangString:
+            raise OntoumlTypeError(
+                "unsupported_snapshot_langstring",
+                description="Invalid language string for a binary snapshot.",
+                cause="Expected a language string, got {value_type}.",
+                solution="Store language strings only in fields of language strings.",
+                value_type=type(langstring).__name__,
+            )
+        return self.add(langstring.text), self.add(langstring.lang)
+
+    def _get_entry(self, value: Any) -> tuple[int, ...]:
+        """Get the entry of a value, adding the strings and values it refers to first.
+
+        :param value: The value, which is not None.
+        :type value: Any
+        :return: The tag and the integers of the entry.
+        :rtype: tuple[int, ...]
+        :raises OntoumlTypeError: If the value cannot be stored.
+        """
+        value_type = type(value)
+        if value_type is str:
+            return _STR, self.add_string(value)
+        if value_type is bool:
+            return (_TRUE,) if value else (_FALSE,)
+        if value_type is int:
+            return (_INT, value) if value in _INT64_RANGE else (_BIG_INT, self.add_string(str(value)))
+        if value_type is float:
+            return _FLOAT, _INT_BITS.unpack(_FLOAT_BITS.pack(value))[0]
+        if value_type is datetime:
+            micros = (value.replace(tzinfo=None) - _MIN_DATETIME) // _MICROSECOND
+            offset = value.utcoffset()
+            return (_DATETIME, micros) if offset is None else (_AWARE_DATETIME, micros, offset // _MICROSECOND)
+        if value_type is tuple:
+            codes = [self.add(item) for item in value]
+            return _TUPLE, len(codes), *codes
+        if isinstance(value, OntoumlEnum):
+            return _ENUM, self.add_string(value_type.__name__), self.add_string(value.name)
+        if value_type is Cardinality:
+            lower, upper = self.add(value.lower_bound), self.add(value.upper_bound)
+            return _CARDINALITY, lower, upper, value.is_ordered, value.is_unique
+        raise OntoumlTypeError(
+            "unsupported_snapshot_type",
+            description="Invalid value for a binary snapshot.",
+            cause="Values of type {value_type} cannot be stored.",
+            solution="Replace the value with one that can be stored.",
+            value_type=value_type.__name__,
+        )
+
+
+def _get_value_key(value: Any) -> Any:
+    """Get the key of a value in a value table, which tells apart values that are equal but stored differently.
+
+    For instance, 1, 1.0 and True are equal, as are timestamps of the same instant in different time zones.
+
+    :param value: The value.
+    :type value: Any
+    :return: A hashable key, equal to the keys of values stored the same way.
+    :rtype: Any
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return tuple, *map(_get_value_key, value)
+    if value_type is datetime:
+        return datetime, value, value.utcoffset()
+    if value_type is Cardinality:
+        lower, upper = _get_value_key(value.lower_bound), _get_value_key(value.upper_bound)
+        return Cardinality, lower, upper, value.is_ordered, value.is_unique
+    return value_type, value
+
+
+def _write_array(output: BinaryIO, data: _IntArray) -> None:
+    """Write an array, preceded by its length, in little-endian order.
+
+    :param output: The binary stream.
+    :type output: BinaryIO
+    :param data: The array.
+    :type data: array
+    """
+    if sys.byteorder == "big":
+        data = array(data.typecode, data)
+        data.byteswap()
+    output.write(len(data).to_bytes(4, "little"))
+    output.write(data.tobytes())
+
+
+class _SnapshotReader:
+    """Reader of the content of a snapshot."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize a new reader.
+
+        :param data: The content of the snapshot.
+        :type data: bytes
+        """
+        self._data = memoryview(data)
+        self._position = 0
+        self._strings: list[str] = []
+        self._values: list[Any] = [None]
+        # Elements in the order they are stored, after None, so that references index them by their position
+        self._elements: list[Any] = [None]
+        # Reference columns to be resolved once all elements are built, as (elements, column name, kind, data arrays)
+        self._references: list[tuple[list[OntoumlElement], str, int, list[_IntArray]]] = []
+
+    def read(self) -> Project:
+        """Read the project.
+
+        :return: The project.
+        :rtype: Project
+        :raises OntoumlValueError: If the snapshot is invalid or was saved with another version of the format.
+        """
+        magic, version, section_count = self._read_header()
+        if magic != MAGIC:
+            raise self._invalid_snapshot("It does not start with the magic bytes {magic!r}.", magic=MAGIC)
+        if version != FORMAT_VERSION:
+            raise OntoumlValueError(
+                "unsupported_snapshot_version",
+                description="Unsupported binary snapshot version.",
+                cause="The snapshot was saved with version {version} of the format, expected {expected}.",
+                solution="Load the snapshot with the version of the library that saved it, and save it again with "
+                "this one, e.g., by exporting it to OntoUML JSON.",
+                version=version,
+                expected=FORMAT_VERSION,
+            )
+        lengths = self._read_array(_UINT32)
+        text = self._read_array("B").tobytes().decode("utf-8", "surrogatepass")
+        self._strings = [text[end - length : end] for length, end in zip(lengths, accumulate(lengths))]
+        self._read_values(self._read_array(_INT64))
+        for _ in range(section_count):
+            self._read_section()
+        project = self._elements[1] if len(self._elements) > 1 else None
+        if self._position != len(self._data) or not isinstance(project, Project):
+            raise self._invalid_snapshot("It does not hold exactly a project and its elements.")
+        self._link(project)
+        return project
+
+    def _read_header(self) -> tuple[bytes, int, int]:
+        if len(self._data) < _HEADER.size:
+            raise self._invalid_snapshot("It is too short.")
+        self._position = _HEADER.size
+        return _HEADER.unpack_from(self._data)
+
+    def _read_array(self, typecode: str) -> _IntArray:
+        """Read an array, preceded by its length.
+
+        :param typecode: The type code of the array.
+        :type typecode: str
+        :return: The array.
+        :rtype: array
+        :raises OntoumlValueError: If the snapshot ends before the end of the array.
+        """
+        data = array(typecode)
+        start = self._position + 4
+        end = start + int.from_bytes(self._data[self._position : start], "little") * data.itemsize
+        if end > len(self._data):
+            raise self._invalid_snapshot("It ends unexpectedly.")
+        data.frombytes(self._data[start:end])
+        if sys.byteorder == "big":
+            data.byteswap()
+        self._position = end
+        return data
+
+    def _read_values(self, entries: _IntArray) -> None:
+        """Decode the entries of the value table.
+
+        :param entries: The entries, as integers.
+        :type entries: array
+        :raises OntoumlValueError: If an entry is invalid.
+        """
+        strings = self._strings
+        values = self._values
+        append = values.append
+        enum_types = _get_enum_types()
+        index = 0
+        try:
+            while index < len(entries):
+                tag = entries[index]
+                if tag == _STR:
+                    append(strings[entries[index + 1]])
+                    index += 2
+                elif tag == _DATETIME:
+                    append(_MIN_DATETIME + _MICROSECOND * entries[index + 1])
+                    index += 2
+                elif tag == _ENUM:
+                    append(enum_types[strings[entries[index + 1]]][strings[entries[index + 2]]])
+                    index += 3
+                elif tag == _CARDINALITY:
+                    lower, upper, is_ordered, is_unique = entries[index + 1 : index + 5]
+                    append(Cardinality.of(values[lower], values[upper], bool(is_ordered), bool(is_unique)))
+                    index += 5
+                elif tag == _FALSE or tag == _TRUE:
+                    append(tag == _TRUE)
+                    index += 1
+                elif tag == _INT:
+                    append(entries[index + 1])
+                    index += 2
+                elif tag == _TUPLE:
+                    end = index + 2 + entries[index + 1]
+                    append(tuple([values[code] for code in entries[index + 2 : end]]))
+                    index = end
+                elif tag == _AWARE_DATETIME:
+                    offset = timezone(_MICROSECOND * entries[index + 2])
+                    append((_MIN_DATETIME + _MICROSECOND * entries[index + 1]).replace(tzinfo=offset))
+                    index += 3
+                elif tag == _FLOAT:
+                    append(_FLOAT_BITS.unpack(_INT_BITS.pack(entries[index + 1]))[0])
+                    index += 2
+                elif tag == _BIG_INT:
+                    append(int(strings[entries[index + 1]]))
+                    index += 2
+                else:
+                    raise self._invalid_snapshot("Its value table has an entry with the unknown tag {tag}.", tag=tag)
+        except (IndexError, KeyError, ValueError, OverflowError) as error:
+            if isinstance(error, OntoumlValueError):
+                raise
+            raise self._invalid_snapshot("Its value table has an invalid entry.") from error
+
+    def _read_section(self) -> None:
+        """Read a section, building its elements and registering them in the project.
+
+        :raises OntoumlValueError: If the section is invalid.
+        """
+        type_name_position, count, column_count = self._read_array(_UINT32)
+        type_name = self._get_string(type_name_position)
+        element_type = _TYPES_BY_NAME.get(type_name)
+        if element_type is None:
+            raise self._invalid_snapshot("It has a section of the unknown type '{name}'.", name=type_name)
+        if (element_type is Project) != (len(self._elements) == 1) or element_type is Project and count != 1:
+            raise self._invalid_snapshot("It does not start with a section holding its project alone.")
+        field_names = _get_field_names(element_type)
+        columns: dict[str, list[Any]] = {}
+        references: list[tuple[str, int, list[_IntArray]]] = []
+        for _ in range(column_count):
+            name_position, kind = self._read_array(_UINT32)
+            name = self._get_string(name_position)
+            data = [self._read_array(_UINT32)]
+            if kind in (_VALUE_SETS, _REFERENCE_SETS, _LANGSTRING_SETS):
+                data.append(self._read_array(_UINT32))
+            if name not in field_names and name not in _SPECIAL_COLUMNS:
+                raise self._invalid_snapshot("It has a column of the unknown field '{name}'.", name=name)
+            if kind in (_REFERENCES, _REFERENCE_SETS) or name in _OWNER_COLUMN_NAMES:
+                references.append((name, kind, data))
+            else:
+                columns[name] = self._decode_column(kind, data, count)
+
+        fields_set = columns.pop(_FIELDS_SET_COLUMN, None) or [()] * count
+        # References are resolved once all elements are built, and fields missing in the snapshot get their defaults
+        for name, _, _ in references:
+            columns[name] = [None] * count
+        rows = zip(
+            *(columns[name] if name in columns else _get_defaults(element_type, name, count) for name in field_names)
+        )
+        elements = _construct_elements(element_type, rows, fields_set)
+        if element_type is not Project:
+            # Checked above to be the project
+            project: Any = self._elements[1]
+            _register_elements(project, type_name, elements)
+        self._elements.extend(elements)
+        for name, kind, data in references:
+            self._references.append((elements, name, kind, data))
+
+    def _decode_column(self, kind: int, data: list[_IntArray], count: int) -> list[Any]:
+        """Decode a column that does not hold references.
+
+        :param kind: The kind of the column.
+        :type kind: int
+        :param data: The data arrays of the column.
+        :type data: list[_IntArray]
+        :param count: The number of elements of the section.
+        :type count: int
+        :return: The values of the column.
+        :rtype: list[Any]
+        :raises OntoumlValueError: If the column is invalid.
+        """
+        values = self._values
+        try:
+            if kind == _VALUES:
+                decoded = [values[code] for code in data[0]]
+            elif kind == _LANGSTRINGS:
+                codes = data[0]
+                decoded = [_new_langstring(values, codes[index], codes[index + 1]) for index in range(0, len(codes), 2)]
+            elif kind == _VALUE_SETS:
+                items = [values[code] for code in data[1]]
+                decoded = _split_sets(items, data[0])
+            elif kind == _LANGSTRING_SETS:
+                codes = data[1]
+                items = [_new_langstring(values, codes[index], codes[index + 1]) for index in range(0, len(codes), 2)]
+                decoded = _split_sets(items, data[0])
+            else:
+                raise self._invalid_snapshot("It has a column of the unknown kind {kind}.", kind=kind)
+        except IndexError as error:
+            raise self._invalid_snapshot("It has a column referring to unknown values.") from error
+        if len(decoded) != count:
+            raise self._invalid_snapshot(
+                "It has a column with {length} values for {count} elements.", length=len(decoded), count=count
+            )
+        return decoded
+
+    def _link(self, project: Project) -> None:
+        """Resolve references between elements, set the owners of elements, and rebuild the indexes derived from them.
+
+        :param project: The project.
+        :type project: Project
+        :raises OntoumlValueError: If a reference refers to a position out of the snapshot.
+        """
+        positions = self._elements
+        try:
+            for elements, name, kind, data in self._references:
+                if kind == _REFERENCES:
+                    targets = [positions[position] for position in data[0]]
+                elif kind == _REFERENCE_SETS:
+                    items = [positions[position] for position in data[1]]
+                    targets = _split_sets(items, data[0])
+                else:
+                    targets = [None] * len(elements)
+                if len(targets) != len(elements):
+                    raise self._invalid_snapshot("It has a reference column of the wrong length.")
+                if name == _PACKAGE_COLUMN:
+                    for element, package in zip(elements, targets):
+                        if package is not None:
+                            element.__dict__[_PACKAGE_COLUMN] = package
+                            _get_private(package)["_contents"][type(element).__name__].add(element)
+                elif name == "_classifier":
+                    for element, classifier in zip(elements, targets):
+                        _get_private(element)[name] = classifier
+                        _get_private(classifier)["_properties"].append(element)
+                elif name == "_enumeration":
+                    for element, enumeration in zip(elements, targets):
+                        _get_private(element)[name] = enumeration
+                        _get_private(enumeration)["_literals"].add(element)
+                else:
+                    for element, target in zip(elements, targets):
+                        element.__dict__[name] = target
+        except (IndexError, AttributeError, KeyError, TypeError) as error:
+            raise self._invalid_snapshot("It has a reference to an element of another type or out of it.") from error
+
+        _rebuild_indexes(project)
+
+    def _get_string(self, position: int) -> str:
+        if position >= len(self._strings):
+            raise self._invalid_snapshot("It refers to an unknown string.")
+        return self._strings[position]
+
+    def _invalid_snapshot(self, cause: str, **arguments: Any) -> OntoumlValueError:
+        return OntoumlValueError(
+            "invalid_snapshot",
+            description="Invalid binary snapshot.",
+            cause=cause,
+            solution="Ensure the snapshot was written by write_binary or save_binary and is complete.",
+            **arguments,
+        )
+
+
+def _rebuild_indexes(project: Project) -> None:
+    """Rebuild the indexes derived from the fields of the elements of a project built without their constructors.
+
+    :param project: The project, whose references and owners are already set.
+    :type project: Project
+    """
+    # As in Property.__init__ and Relation._update_relation_ends
+    for subsetted in project.get_properties():
+        subsetted_values = subsetted.__dict__
+        for subsetting in subsetted_values["subsetted_by"]:
+            _get_private(subsetting)["_subsets"].add(subsetted)
+        for redefining in subsetted_values["redefined_by"]:
+            _get_private(redefining)["_redefines"].add(subsetted)
+    for relation in chain(project.get_binary_relations(), project.get_nary_relations()):
+        relation_private = _get_private(relation)
+        ends = {owned.__dict__["property_type"] for owned in relation_private["_properties"]}
+        linked = {end for end in ends if isinstance(end, Classifier)}
+        for end in linked:
+            _get_private(end)["_relations"].add(relation)
+        relation_private["_linked_classifiers"] = linked
+
+
+def _get_defaults(element_type: type[OntoumlElement], name: str, count: int) -> list[Any]:
+    field = element_type.__pydantic_fields__[name]
+    return [field.get_default(call_default_factory=True) for _ in range(count)]
+
+
+def _split_sets(items: list[Any], lengths: _IntArray) -> list[set[Any]]:
+    """Split the items of the sets of a column into the sets of each element.
+
+    :param items: The items of all sets.
+    :type items: list[Any]
+    :param lengths: The number of items of each set.
+    :type lengths: array
+    :return: The sets.
+    :rtype: list[set[Any]]
+    """
+    if not items:
+        return [set() for _ in lengths]
+    return [set(items[end - length : end]) if length else set() for length, end in zip(lengths, accumulate(lengths))]
+
+
+def _new_langstring(values: list[Any], text: int, lang: int) -> Optional[LangString]:
+    """Create a language string from the codes of its text and language, which were validated when saved.
+
+    :param values: The value table.
+    :type values: list[Any]
+    :param text: The code of the text, zero if the language string is None.
+    :type text: int
+    :param lang: The code of the language.
+    :type lang: int
+    :return: A new language string, or None.
+    :rtype: Optional[LangString]
+    """
+    if not text:
+        return None
+    langstring: LangString = _new(LangString)
+    langstring.text = values[text]
+    langstring.lang = values[lang]
+    return langstring
+
+
+_new: Callable[[type], Any] = object.__new__
+# Private attributes of a model, whose storage is accessed directly, bypassing the slower BaseModel.__getattr__
+_get_private: Callable[[Any], dict[str, Any]] = attrgetter("__pydantic_private__")
+
+
+def _get_enum_types() -> dict[str, type[Enum]]:
+    """Get the enumerations whose members can be stored in snapshots, by name.
+
+    :return: The subclasses of OntoumlEnum.
+    :rtype: dict[str, type[Enum]]
+    """
+    enum_types: dict[str, type[Enum]] = {}
+    to_visit: list[type[Enum]] = [OntoumlEnum]
+    while to_visit:
+        enum_type = to_visit.pop()
+        enum_types[enum_type.__name__] = enum_type
+        to_visit.extend(enum_type.__subclasses__())
+    return enum_types
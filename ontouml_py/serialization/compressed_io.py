@@ -0,0 +1,192 @@
+"""This module opens files and streams that may be compressed, so that serializers read and write them transparently.
+
+Compressed data is read and written through the stream interfaces of the codecs, a block at a time, so that documents
+are never decompressed whole into memory. When reading, the compression is detected from the first bytes of the data
+(its magic number), and uncompressed data is read as it is. When writing, it is given explicitly or inferred from the
+suffix of the path (e.g., '.json.gz'), with uncompressed output by default.
+
+The codecs of the standard library (gzip, bz2 and lzma, as xz) are always available. Zstandard is available if the
+compression.zstd module of Python 3.14 or the zstandard package is installed.
+
+Example:
+    with open_compressed("model.json.xz", "wt") as output:
+        export_json(project, output)
+    with open("model.json.xz", "rb") as source:
+        project = import_json(source)
+"""
+import bz2
+import gzip
+import io
+import lzma
+from os import PathLike
+from os import fspath
+from typing import IO
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+from typing import Union
+
+from ontouml_py.utils.errors import OntoumlValueError
+
+try:
+    from compression import zstd as _zstd  # Python 3.14 and later
+except ImportError:
+    try:
+        import zstandard as _zstd
+    except ImportError:
+        _zstd = None
+
+# Modules of the available codecs, all of which have an open function accepting paths and binary streams
+_CODECS: dict[str, Any] = {"gzip": gzip, "bz2": bz2, "lzma": lzma}
+if _zstd is not None:
+    _CODECS["zstd"] = _zstd
+
+# Names of the available compressions, in order of preference
+COMPRESSIONS: tuple[str, ...] = tuple(_CODECS)
+
+# Magic numbers of the compressed formats, all of them at most as long as _HEADER_SIZE
+_MAGIC_NUMBERS: dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "lzma",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+_HEADER_SIZE = 6
+
+_SUFFIXES: dict[str, str] = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".zst": "zstd"}
+_MODES = ("r", "rb", "rt", "w", "wb", "wt")
+
+
+def detect_compression(header: bytes) -> Optional[str]:
+    """Detect the compression of data from its first bytes.
+
+    :param header: The first bytes of the data, at least six for all formats to be detected.
+    :type header: bytes
+    :return: The name of the compression, which may not be available, or None if the data is not compressed.
+    :rtype: Optional[str]
+    """
+    for magic_number, compression in _MAGIC_NUMBERS.items():
+        if header.startswith(magic_number):
+            return compression
+    return None
+
+
+def open_compressed(
+    file: Union[str, PathLike, BinaryIO],
+    mode: str = "rb",
+    compression: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> IO:
+    """Open a file or a binary stream for reading or writing, decompressing or compressing its data on the fly.
+
+    Given streams are not closed when the returned file is closed, so that callers keep control over them.
+
+    :param file: The path of the file, or the binary stream to be read or written.
+    :type file: Union[str, PathLike, BinaryIO]
+    :param mode: 'r', 'rb' or 'w', 'wb' for binary data, or 'rt' or 'wt' for text.
+    :type mode: str
+    :param compression: When writing, the name of the compression, one of COMPRESSIONS. If None, it is inferred from
+                        the suffix of the path, and streams are written uncompressed. When reading, the compression
+                        is always detected.
+    :type compression: Optional[str]
+    :param encoding: The encoding of text.
+    :type encoding: str
+    :return: A binary or text file, according to the mode.
+    :rtype: IO
+    :raises OntoumlValueError: If the mode is invalid or the compression is unknown or not available.
+    """
+    if mode not in _MODES:
+        raise OntoumlValueError(
+            "invalid_open_mode",
+            description="Invalid mode for opening a compressed file.",
+            cause="Expected one of {modes}, got '{mode}'.",
+            solution="Open files in binary or text mode, for either reading or writing.",
+            modes=", ".join(_MODES),
+            mode=mode,
+        )
+
+    is_path = isinstance(file, (str, PathLike))
+    if mode[0] == "r":
+        if is_path:
+            with open(file, "rb") as source:
+                compression = detect_compression(source.read(_HEADER_SIZE))
+        else:
+            header = file.read(_HEADER_SIZE)
+            compression = detect_compression(header)
+            file = _StreamView(file, header)
+    else:
+        if compression is None and is_path:
+            compression = _SUFFIXES.get(_get_suffix(fspath(file)))
+        if not is_path:
+            file = _StreamView(file)
+
+    mode = mode[0] + ("t" if mode.endswith("t") else "b")
+    if compression is None:
+        return _open_uncompressed(file, mode, encoding)
+    codec = _CODECS.get(compression)
+    if codec is None:
+        raise OntoumlValueError(
+            "unsupported_compression",
+            description="Unsupported compression '{compression}'.",
+            cause="The available compressions are {compressions}.",
+            solution="Use one of the available compressions, installing the zstandard package for 'zstd'.",
+            compression=compression,
+            compressions=", ".join(COMPRESSIONS),
+        )
+    return codec.open(file, mode, encoding=encoding) if mode[1] == "t" else codec.open(file, mode)
+
+
+def _open_uncompressed(file: Union[str, PathLike, "_StreamView"], mode: str, encoding: str) -> IO:
+    """Open a file or a view of a stream without compression.
+
+    :param file: The path of the file or the view of the stream.
+    :type file: Union[str, PathLike, _StreamView]
+    :param mode: The binary or text mode, 'rb', 'rt', 'wb' or 'wt'.
+    :type mode: str
+    :param encoding: The encoding of text.
+    :type encoding: str
+    :return: The opened file.
+    :rtype: IO
+    """
+    if isinstance(file, (str, PathLike)):
+        return open(file, mode) if mode[1] == "b" else open(file, mode, encoding=encoding)
+    buffered = io.BufferedReader(file) if mode[0] == "r" else io.BufferedWriter(file)
+    return buffered if mode[1] == "b" else io.TextIOWrapper(buffered, encoding=encoding)
+
+
+def _get_suffix(path: Union[str, bytes]) -> str:
+    path = path.decode() if isinstance(path, bytes) else path
+    dot = path.rfind(".")
+    return "" if dot == -1 else path[dot:].lower()
+
+
+class _StreamView(io.RawIOBase):
+    """Raw stream reading and writing through another stream, which it does not close.
+
+    Bytes already read from the underlying stream to detect its compression are read again first.
+    """
+
+    def __init__(self, stream: BinaryIO, prefix: bytes = b"") -> None:
+        super().__init__()
+        self._stream = stream
+        self._prefix = prefix
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def write(self, data: Any) -> int:
+        self._stream.write(data)
+        return len(data)
@@ -0,0 +1,258 @@
+"""This module exports the changes made to OntoUML projects since a checkpoint, so that copies of a project kept by
+other systems can be updated without exporting the whole project again.
+
+Each export writes a JSON document with the elements created, modified and deleted since the given checkpoint, and
+returns a new checkpoint for the next export. Elements are written as in OntoUML JSON documents (see json_exporter),
+with the reference to their package added, but packages do not include their contents. Properties and literals are
+written inside their classifiers, so that a changed property makes its classifier be written as modified. Elements
+without a counterpart in the schema (e.g., notes and diagrams) are written with their 'id' and 'type' only.
+
+From their first export on, projects record their changed elements (see Project.get_changed), which are cleared by
+each export. Exporting since the project's last checkpoint thus writes the recorded elements without visiting the
+others. Exporting since an older
+checkpoint, or to another system, visits all elements, selecting them by their 'modified' timestamps. Deleted elements
+are found by comparing the elements of the project with those of the checkpoint, a set difference that is fast even for
+large projects.
+"""
+import io
+from collections.abc import Callable
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import chain
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+from ontouml_py.model.literal import Literal
+from ontouml_py.model.ontoumlelement import get_timestamp
+from ontouml_py.model.package import Package
+from ontouml_py.model.packageable import Packageable
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.property import Property
+from ontouml_py.serialization.json_exporter import _encode
+from ontouml_py.serialization.json_exporter import _named_element_fields
+from ontouml_py.serialization.json_exporter import _reference
+from ontouml_py.serialization.json_exporter import element_to_dict
+from ontouml_py.serialization.ontouml_schema import format_property_assignments
+from ontouml_py.serialization.ontouml_schema import SCHEMA_TYPES
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+class DeltaCheckpoint:
+    """State of a project at a delta export, which the changes of the next export are relative to.
+
+    :ivar project_id: The ID of the exported project.
+    :vartype project_id: str
+    :ivar time: When the export started. Changes made afterwards are written by the next export.
+    :vartype time: datetime
+    :ivar generation: The number of delta exports of the project, up to this one.
+    :vartype generation: int
+    :ivar elements: The elements of the project, for each concrete type.
+    :vartype elements: dict[str, frozenset[ProjectElement]]
+    """
+
+    __slots__ = ("project_id", "time", "generation", "elements")
+
+    def __init__(
+        self, project_id: str, time: datetime, generation: int, elements: dict[str, frozenset[ProjectElement]]
+    ) -> None:
+        self.project_id = project_id
+        self.time = time
+        self.generation = generation
+        self.elements = elements
+
+
+def export_delta(project: Project, output: TextIO, checkpoint: Optional[DeltaCheckpoint] = None) -> DeltaCheckpoint:
+    """Write the changes made to a project since a checkpoint to a text stream, as a JSON document.
+
+    The document has the project's 'id', the 'since' and 'until' times of the changes, and the 'created' and
+    'modified' elements and 'deleted' element references, sorted by type and ID.
+
+    :param project: The changed project.
+    :type project: Project
+    :param output: The text stream the document is written to (e.g., a file opened in text mode, or by open_compressed).
+    :type output: TextIO
+    :param checkpoint: The checkpoint returned by a previous export of the project. If None, all elements are written
+                       as created.
+    :type checkpoint: Optional[DeltaCheckpoint]
+    :return: The checkpoint for the next export.
+    :rtype: DeltaCheckpoint
+    :raises OntoumlValueError: If the checkpoint was returned by an export of another project.
+    """
+    if checkpoint is not None and checkpoint.project_id != project.id:
+        raise OntoumlValueError(
+            "invalid_delta_checkpoint",
+            description="Invalid checkpoint for the delta export of the project with ID {element.id}.",
+            cause="The checkpoint was returned by an export of the project with ID {checkpoint_id}.",
+            solution="Use a checkpoint returned by an export of the same project, or None to export all elements.",
+            element=project,
+            checkpoint_id=checkpoint.project_id,
+        )
+
+    project_private = project.__pydantic_private__
+    elements = project_private["_elements"]
+    generation = project_private["_delta_generation"]
+    # As for changes, so that those made later inside the same shared_timestamp block are not missed
+    time = get_timestamp()
+    previous = {} if checkpoint is None else checkpoint.elements
+    if checkpoint is None:
+        changed = chain.from_iterable(elements.values())
+    elif checkpoint.generation == generation:
+        # Elements changed since the project's last checkpoint were recorded by the project itself
+        changed = project_private["_changed"]
+    else:
+        changed = _get_modified_since(elements, previous, checkpoint.time)
+
+    created = []
+    modified = []
+    deleted = []
+    written = set()
+    for element_type, old_elements in previous.items():
+        for element in old_elements - elements[element_type]:
+            deleted.append(element)
+            # Removing properties and literals changes their owners
+            owner = _get_owner(element)
+            if owner is not element:
+                changed = chain(changed, (owner,))
+    for element in changed:
+        element = _get_owner(element)
+        element_type = type(element).__name__
+        if element in written or element not in elements[element_type]:
+            continue
+        written.add(element)
+        (modified if element in previous.get(element_type, ()) else created).append(element)
+
+    write = output.write
+    since = None if checkpoint is None else checkpoint.time.isoformat()
+    write(_encode({"id": project.id, "type": "ProjectDelta", "since": since, "until": time.isoformat()})[:-1])
+    _write_elements(write, "created", (_delta_to_dict(element) for element in _sorted(created)))
+    _write_elements(write, "modified", (_delta_to_dict(element) for element in _sorted(modified)))
+    _write_elements(write, "deleted", (_delta_reference(element) for element in _sorted(deleted)))
+    write("}")
+
+    project_private["_changed"] = set()
+    project_private["_delta_generation"] = generation + 1
+    return DeltaCheckpoint(
+        project.id, time, generation + 1, {element_type: frozenset(values) for element_type, values in elements.items()}
+    )
+
+
+def export_delta_string(project: Project, checkpoint: Optional[DeltaCheckpoint] = None) -> tuple[str, DeltaCheckpoint]:
+    """Export the changes made to a project since a checkpoint as a JSON document held in a string.
+
+    :param project: The changed project.
+    :type project: Project
+    :param checkpoint: The checkpoint returned by a previous export of the project, or None to export all elements.
+    :type checkpoint: Optional[DeltaCheckpoint]
+    :return: The JSON document and the checkpoint for the next export.
+    :rtype: tuple[str, DeltaCheckpoint]
+    """
+    output = io.StringIO()
+    new_checkpoint = export_delta(project, output, checkpoint)
+    return output.getvalue(), new_checkpoint
+
+
+def _get_modified_since(
+    elements: dict[str, set[ProjectElement]], previous: dict[str, frozenset[ProjectElement]], time: datetime
+) -> Iterable[ProjectElement]:
+    """Get the elements created after a checkpoint or modified at or after its time.
+
+    Elements modified at the same time as the checkpoint was taken are included, as they may have been modified
+    after it.
+
+    :param elements: The elements of the project, for each concrete type.
+    :type elements: dict[str, set[ProjectElement]]
+    :param previous: The elements of the project at the checkpoint, for each concrete type.
+    :type previous: dict[str, frozenset[ProjectElement]]
+    :param time: The time of the checkpoint.
+    :type time: datetime
+    :return: The changed elements.
+    :rtype: Iterable[ProjectElement]
+    """
+    for element_type, current in elements.items():
+        old_elements = previous.get(element_type, frozenset())
+        yield from current - old_elements
+        for element in current:
+            element_modified = element.__dict__["modified"]
+            if element_modified is not None and element_modified >= time and element in old_elements:
+                yield element
+
+
+def _get_owner(element: ProjectElement) -> ProjectElement:
+    """Get the element a changed element is written as, i.e., the owner of a property or literal.
+
+    :param element: The changed element.
+    :type element: ProjectElement
+    :return: The classifier owning the property or the enumeration owning the literal, if any, or else the element.
+    :rtype: ProjectElement
+    """
+    if isinstance(element, Property):
+        owner = element.classifier
+    elif isinstance(element, Literal):
+        owner = element.enumeration
+    else:
+        return element
+    return element if owner is None else owner
+
+
+def _delta_to_dict(element: ProjectElement) -> dict[str, Any]:
+    """Convert a created or modified element into its JSON object.
+
+    :param element: The element, which is not a property or literal owned by another element.
+    :type element: ProjectElement
+    :return: The element's object, as in OntoUML JSON documents, with its 'package'.
+    :rtype: dict[str, Any]
+    """
+    element_type = type(element).__name__
+    if isinstance(element, Package):
+        fields = _named_element_fields(element, "Package")
+        fields["propertyAssignments"] = format_property_assignments(element.custom_properties)
+    elif element_type in SCHEMA_TYPES:
+        fields = element_to_dict(element)
+    else:
+        fields = _delta_reference(element)
+    if isinstance(element, Packageable):
+        fields["package"] = _reference(element.package)
+    return fields
+
+
+def _delta_reference(element: ProjectElement) -> dict[str, str]:
+    """Get the reference to an element, which, unlike schema references, may be of any type.
+
+    :param element: The referenced element.
+    :type element: ProjectElement
+    :return: The 'id' and 'type' of the element.
+    :rtype: dict[str, str]
+    """
+    element_type = type(element).__name__
+    return {"id": element.id, "type": SCHEMA_TYPES.get(element_type, element_type)}
+
+
+def _write_elements(write: Callable[[str], Any], name: str, objects: Iterable[dict[str, Any]]) -> None:
+    """Write a field holding an array of objects, encoding one object at a time.
+
+    :param write: The write method of the output stream.
+    :type write: Callable[[str], Any]
+    :param name: The name of the field.
+    :type name: str
+    :param objects: The objects in the array.
+    :type objects: Iterable[dict[str, Any]]
+    """
+    separator = f',"{name}":['
+    for json_object in objects:
+        write(separator)
+        separator = ","
+        write(_encode(json_object))
+    write(f',"{name}":[]' if separator == f',"{name}":[' else "]")
+
+
+def _sorted(elements: Iterable[ProjectElement]) -> list[ProjectElement]:
+    """Sort elements by type and ID, so that exported documents are deterministic.
+
+    :param elements: The elements to be sorted.
+    :type elements: Iterable[ProjectElement]
+    :return: The sorted elements.
+    :rtype: list[ProjectElement]
+    """
+    return sorted(elements, key=lambda element: (type(element).__name__, element.id))
@@ -0,0 +1,411 @@
+"""This module exports OntoUML projects as gUFO-based OWL ontologies in RDF, writing Turtle or N-Triples to a stream.
+
+The ontology follows the mapping of OntoUML to gUFO (http://purl.org/nemo/gufo#), the lightweight implementation of
+the Unified Foundational Ontology:
+
+- classes are OWL classes typed by the gUFO type of their stereotype (e.g., gufo:Kind or gufo:Role), ultimate sortals
+  (e.g., kinds and relators) and other classes of a single nature also being subclasses of the gUFO class of their
+  nature (e.g., gufo:FunctionalComplex or gufo:Relator). Datatypes are RDFS datatypes, and the literals of
+  enumerations are individuals of their classes;
+- generalizations are rdfs:subClassOf statements, or rdfs:subPropertyOf statements between relations;
+- binary relations are object properties from the type of their source end to the type of their target end, which
+  specialize the gUFO property of their stereotype, if any (e.g., gufo:mediates for mediations);
+- attributes are datatype properties, or object properties if their type is a class that is not a datatype;
+- names are rdfs:label and descriptions rdfs:comment annotations.
+
+N-ary relations, derivations, cardinalities, and the other elements of projects (e.g., packages, generalization sets
+and diagrams) have no counterpart in the ontology and are not written.
+
+Triples are written as they are produced, grouped by subject, so that memory use does not grow with the number of
+triples. Only the IRI minted for each element is kept, to refer to it from other elements. IRIs are minted from the
+names of elements (e.g., Person for a class named "Person" or hasPart for a relation named "has part"), or from their
+IDs if they have no name or if their names clash, in the namespace of the project. Turtle output abbreviates the IRIs
+of the namespace of the project and of the vocabularies used with prefixes.
+"""
+import io
+import re
+from operator import attrgetter
+from typing import Optional
+from typing import TextIO
+from urllib.parse import quote
+
+from langstring import LangString
+
+from ontouml_py.model.binaryrelation import BinaryRelation
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.namedelement import NamedElement
+from ontouml_py.model.project import Project
+from ontouml_py.model.property import Property
+from ontouml_py.utils.errors import OntoumlValueError
+
+GUFO: str = "http://purl.org/nemo/gufo#"
+RDF_FORMATS: tuple[str, ...] = ("turtle", "ntriples")
+
+_RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+_RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+_OWL = "http://www.w3.org/2002/07/owl#"
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+
+# Prefixes of the vocabularies used, the namespace of the project taking the empty prefix
+_PREFIXES: dict[str, str] = {"rdf": _RDF, "rdfs": _RDFS, "owl": _OWL, "xsd": _XSD, "gufo": GUFO}
+
+# gUFO types of the classes of each stereotype. Datatypes and enumerations are typed apart.
+_CLASS_TYPES: dict[ClassStereotype, str] = {
+    ClassStereotype.CATEGORY: "Category",
+    ClassStereotype.COLLECTIVE: "Kind",
+    ClassStereotype.HISTORICAL_ROLE: "HistoricalRole",
+    ClassStereotype.HISTORICAL_ROLE_MIXIN: "HistoricalRoleMixin",
+    ClassStereotype.KIND: "Kind",
+    ClassStereotype.MIXIN: "Mixin",
+    ClassStereotype.MODE: "Kind",
+    ClassStereotype.PHASE: "Phase",
+    ClassStereotype.PHASE_MIXIN: "PhaseMixin",
+    ClassStereotype.QUALITY: "Kind",
+    ClassStereotype.QUANTITY: "Kind",
+    ClassStereotype.RELATOR: "Kind",
+    ClassStereotype.ROLE: "Role",
+    ClassStereotype.ROLE_MIXIN: "RoleMixin",
+    ClassStereotype.SUBKIND: "SubKind",
+}
+
+# gUFO classes of the instances of the classes of each stereotype that determines their nature, used when classes are
+# not restricted to a single nature
+_STEREOTYPE_SUPERCLASSES: dict[ClassStereotype, str] = {
+    ClassStereotype.ABSTRACT: "AbstractIndividual",
+    ClassStereotype.COLLECTIVE: "Collection",
+    ClassStereotype.EVENT: "Event",
+    ClassStereotype.KIND: "FunctionalComplex",
+    ClassStereotype.MODE: "IntrinsicMode",
+    ClassStereotype.QUALITY: "Quality",
+    ClassStereotype.QUANTITY: "Quantity",
+    ClassStereotype.RELATOR: "Relator",
+    ClassStereotype.SITUATION: "Situation",
+    ClassStereotype.TYPE: "Type",
+}
+
+_NATURE_SUPERCLASSES: dict[OntologicalNature, str] = {
+    OntologicalNature.ABSTRACT_NATURE: "AbstractIndividual",
+    OntologicalNature.COLLECTIVE_NATURE: "Collection",
+    OntologicalNature.EVENT_NATURE: "Event",
+    OntologicalNature.EXTRINSIC_MODE_NATURE: "ExtrinsicMode",
+    OntologicalNature.FUNCTIONAL_COMPLEX_NATURE: "FunctionalComplex",
+    OntologicalNature.INTRINSIC_MODE_NATURE: "IntrinsicMode",
+    OntologicalNature.QUALITY_NATURE: "Quality",
+    OntologicalNature.QUANTITY_NATURE: "Quantity",
+    OntologicalNature.RELATOR_NATURE: "Relator",
+    OntologicalNature.SITUATION_NATURE: "Situation",
+    OntologicalNature.TYPE_NATURE: "Type",
+}
+
+# gUFO properties specialized by the relations of each stereotype
+_RELATION_SUPERPROPERTIES: dict[RelationStereotype, str] = {
+    RelationStereotype.BRINGS_ABOUT: "broughtAbout",
+    RelationStereotype.CHARACTERIZATION: "inheresIn",
+    RelationStereotype.COMPONENT_OF: "isComponentOf",
+    RelationStereotype.CREATION: "wasCreatedIn",
+    RelationStereotype.EXTERNAL_DEPENDENCE: "externallyDependsOn",
+    RelationStereotype.HISTORICAL_DEPENDENCE: "historicallyDependsOn",
+    RelationStereotype.MANIFESTATION: "manifestedIn",
+    RelationStereotype.MEDIATION: "mediates",
+    RelationStereotype.MEMBER_OF: "isCollectionMemberOf",
+    RelationStereotype.PARTICIPATION: "participatedIn",
+    RelationStereotype.PARTICIPATIONAL: "isEventProperPartOf",
+    RelationStereotype.SUB_COLLECTION_OF: "isSubCollectionOf",
+    RelationStereotype.SUB_QUANTITY_OF: "isSubQuantityOf",
+    RelationStereotype.TERMINATION: "wasTerminatedIn",
+    RelationStereotype.TRIGGERS: "contributedToTrigger",
+}
+
+_DATATYPE_STEREOTYPES = frozenset((ClassStereotype.DATATYPE, ClassStereotype.ENUMERATION))
+
+# Characters of prefixed names that need no escaping, and escapes of the characters of string literals
+_LOCAL_NAME = re.compile(r"[A-Za-z0-9_]([A-Za-z0-9_.\-]*[A-Za-z0-9_\-])?")
+_WORD = re.compile(r"[^\W_]+")
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+_by_id = attrgetter("id")
+
+
+def export_gufo(project: Project, output: TextIO, base_iri: Optional[str] = None, rdf_format: str = "turtle") -> None:
+    """Write a project to a text stream as a gUFO-based OWL ontology.
+
+    :param project: The project to be exported.
+    :type project: Project
+    :param output: The text stream the ontology is written to (e.g., a file opened in text mode, or by open_compressed).
+    :type output: TextIO
+    :param base_iri: The namespace of the IRIs of the ontology and of its classes and properties. Defaults to the
+                     namespace of the project, followed by '#' unless it ends with '#' or '/', or to a URN made of the
+                     project's ID if it has no namespace.
+    :type base_iri: Optional[str]
+    :param rdf_format: The RDF syntax, "turtle" or "ntriples".
+    :type rdf_format: str
+    :raises OntoumlValueError: If the RDF syntax is not supported.
+    """
+    if rdf_format not in RDF_FORMATS:
+        raise OntoumlValueError(
+            "unsupported_rdf_format",
+            description="Invalid RDF format.",
+            cause="Expected one of {formats}, got {rdf_format!r}.",
+            solution="Use one of the supported RDF formats.",
+            formats=", ".join(RDF_FORMATS),
+            rdf_format=rdf_format,
+        )
+    if base_iri is None:
+        namespace = project.namespace
+        if namespace is None:
+            base_iri = f"urn:ontouml:{quote(project.id, safe='')}#"
+        else:
+            base_iri = namespace if namespace.endswith(("#", "/")) else f"{namespace}#"
+    _GufoWriter(output, base_iri, rdf_format == "turtle").write(project)
+
+
+def export_gufo_string(project: Project, base_iri: Optional[str] = None, rdf_format: str = "turtle") -> str:
+    """Export a project as a gUFO-based OWL ontology held in a string.
+
+    :param project: The project to be exported.
+    :type project: Project
+    :param base_iri: The namespace of the IRIs of the ontology, as in export_gufo.
+    :type base_iri: Optional[str]
+    :param rdf_format: The RDF syntax, "turtle" or "ntriples".
+    :type rdf_format: str
+    :return: The ontology.
+    :rtype: str
+    :raises OntoumlValueError: If the RDF syntax is not supported.
+    """
+    output = io.StringIO()
+    export_gufo(project, output, base_iri, rdf_format)
+    return output.getvalue()
+
+
+class _GufoWriter:
+    """Writer of the triples of a project, which mints and caches the IRIs of its elements."""
+
+    def __init__(self, output: TextIO, base_iri: str, is_turtle: bool) -> None:
+        """Initialize a new writer.
+
+        :param output: The text stream the triples are written to.
+        :type output: TextIO
+        :param base_iri: The namespace of the IRIs of the elements.
+        :type base_iri: str
+        :param is_turtle: Whether triples are written as Turtle, otherwise as N-Triples.
+        :type is_turtle: bool
+        """
+        self._write = output.write
+        self._base_iri = base_iri
+        self._is_turtle = is_turtle
+        self._namespaces = {**_PREFIXES, "": base_iri} if is_turtle else {}
+        # Terms of the elements, by their identity, and local names already minted
+        self._terms: dict[int, str] = {}
+        self._local_names: set[str] = set()
+        self._type = self._term(_RDF + "type")
+        self._label = self._term(_RDFS + "label")
+        self._comment = self._term(_RDFS + "comment")
+        self._sub_class_of = self._term(_RDFS + "subClassOf")
+        self._sub_property_of = self._term(_RDFS + "subPropertyOf")
+        self._domain = self._term(_RDFS + "domain")
+        self._range = self._term(_RDFS + "range")
+        self._owl_class = self._term(_OWL + "Class")
+        self._datatype = self._term(_RDFS + "Datatype")
+        self._named_individual = self._term(_OWL + "NamedIndividual")
+        self._object_property = self._term(_OWL + "ObjectProperty")
+        self._datatype_property = self._term(_OWL + "DatatypeProperty")
+        self._string = self._term(_XSD + "string")
+
+    def write(self, project: Project) -> None:
+        """Write the triples of a project.
+
+        :param project: The project.
+        :type project: Project
+        """
+        if self._is_turtle:
+            self._write("".join(f"@prefix {prefix}: <{iri}> .\n" for prefix, iri in self._namespaces.items()))
+            self._write("\n")
+        ontology = self._term(self._base_iri.rstrip("#"))
+        self._write_subject(
+            ontology,
+            [
+                (self._type, [self._term(_OWL + "Ontology")]),
+                (self._term(_OWL + "imports"), [self._term(GUFO)]),
+                *self._annotations(project),
+            ],
+        )
+
+        classes = sorted(project.get_classes(), key=_by_id)
+        relations = sorted(project.get_binary_relations(), key=_by_id)
+        # Terms are minted in a fixed order, classes first, so that clashing names are resolved alike in every export
+        for class_ in classes:
+            self._mint(class_, True)
+        for relation in relations:
+            self._mint(relation, False)
+        for class_ in classes:
+            self._write_class(class_)
+        for relation in relations:
+            self._write_relation(relation)
+        for generalization in sorted(project.get_generalizations(), key=_by_id):
+            general, specific = generalization.general, generalization.specific
+            if isinstance(general, Class) and isinstance(specific, Class):
+                self._write_subject(self._terms[id(specific)], [(self._sub_class_of, [self._terms[id(general)]])])
+            elif isinstance(general, BinaryRelation) and isinstance(specific, BinaryRelation):
+                self._write_subject(self._terms[id(specific)], [(self._sub_property_of, [self._terms[id(general)]])])
+
+    def _write_class(self, class_: Class) -> None:
+        """Write the triples of a class, of its attributes and of its literals.
+
+        :param class_: The class.
+        :type class_: Class
+        """
+        subject = self._terms[id(class_)]
+        stereotype = class_.stereotype
+        if stereotype == ClassStereotype.DATATYPE:
+            self._write_subject(subject, [(self._type, [self._datatype]), *self._annotations(class_)])
+        else:
+            types = [self._owl_class]
+            if stereotype in _CLASS_TYPES:
+                types.append(self._gufo(_CLASS_TYPES[stereotype]))
+            superclasses = []
+            if len(class_.restricted_to) == 1 and stereotype not in _DATATYPE_STEREOTYPES:
+                superclasses.append(self._gufo(_NATURE_SUPERCLASSES[next(iter(class_.restricted_to))]))
+            elif stereotype in _STEREOTYPE_SUPERCLASSES:
+                superclasses.append(self._gufo(_STEREOTYPE_SUPERCLASSES[stereotype]))
+            predicates = [(self._type, types)]
+            if superclasses:
+                predicates.append((self._sub_class_of, superclasses))
+            self._write_subject(subject, [*predicates, *self._annotations(class_)])
+
+        for literal in sorted(class_.literals, key=_by_id):
+            literal_types = [self._named_individual, subject]
+            self._write_subject(self._mint(literal, False), [(self._type, literal_types), *self._annotations(literal)])
+        for attribute in class_.properties:
+            self._write_attribute(subject, attribute)
+
+    def _write_attribute(self, domain: str, attribute: Property) -> None:
+        """Write the triples of an attribute of a class.
+
+        :param domain: The term of the class.
+        :type domain: str
+        :param attribute: The attribute.
+        :type attribute: Property
+        """
+        attribute_type = attribute.property_type
+        is_datatype = attribute_type is None or getattr(attribute_type, "stereotype", None) == ClassStereotype.DATATYPE
+        predicates = [
+            (self._type, [self._datatype_property if is_datatype else self._object_property]),
+            (self._domain, [domain]),
+        ]
+        if attribute_type is None:
+            predicates.append((self._range, [self._string]))
+        elif id(attribute_type) in self._terms:
+            predicates.append((self._range, [self._terms[id(attribute_type)]]))
+        self._write_subject(self._mint(attribute, False), [*predicates, *self._annotations(attribute)])
+
+    def _write_relation(self, relation: BinaryRelation) -> None:
+        """Write the triples of a binary relation, unless it is a derivation.
+
+        :param relation: The relation.
+        :type relation: BinaryRelation
+        """
+        if relation.stereotype == RelationStereotype.DERIVATION:
+            return
+        predicates = [(self._type, [self._object_property])]
+        if relation.stereotype in _RELATION_SUPERPROPERTIES:
+            predicates.append((self._sub_property_of, [self._gufo(_RELATION_SUPERPROPERTIES[relation.stereotype])]))
+        ends = [end.property_type for end in relation.properties]
+        for predicate, end in zip((self._domain, self._range), ends):
+            if id(end) in self._terms:
+                predicates.append((predicate, [self._terms[id(end)]]))
+        self._write_subject(self._terms[id(relation)], [*predicates, *self._annotations(relation)])
+
+    def _annotations(self, element: NamedElement) -> list[tuple[str, list[str]]]:
+        """Get the labels and comment of an element.
+
+        :param element: The element.
+        :type element: NamedElement
+        :return: The predicates and objects of the annotations.
+        :rtype: list[tuple[str, list[str]]]
+        """
+        annotations = []
+        if element.names:
+            annotations.append((self._label, [_literal(name) for name in _sorted_names(element.names)]))
+        if element.description is not None:
+            annotations.append((self._comment, [_literal(element.description)]))
+        return annotations
+
+    def _write_subject(self, subject: str, predicates: list[tuple[str, list[str]]]) -> None:
+        """Write the triples of a subject, grouped in a single Turtle statement.
+
+        :param subject: The term of the subject.
+        :type subject: str
+        :param predicates: The terms of the predicates, each with the terms of its objects.
+        :type predicates: list[tuple[str, list[str]]]
+        """
+        if self._is_turtle:
+            pairs = " ;\n    ".join(f"{predicate} {', '.join(objects)}" for predicate, objects in predicates)
+            self._write(f"{subject} {pairs} .\n")
+        else:
+            self._write(
+                "".join(f"{subject} {predicate} {obj} .\n" for predicate, objects in predicates for obj in objects)
+            )
+
+    def _mint(self, element: NamedElement, is_type: bool) -> str:
+        """Mint the term of an element, from its name or from its ID, and cache it.
+
+        :param element: The element.
+        :type element: NamedElement
+        :param is_type: Whether the local name is capitalized, as for classes, or not, as for properties.
+        :type is_type: bool
+        :return: The term.
+        :rtype: str
+        """
+        local_name = None
+        if element.names:
+            words = _WORD.findall(next(iter(_sorted_names(element.names))).text)
+            if words:
+                first = words[0][0].upper() if is_type else words[0][0].lower()
+                local_name = first + words[0][1:] + "".join(word[0].upper() + word[1:] for word in words[1:])
+        if local_name is None or local_name in self._local_names:
+            local_name = quote(element.id, safe="")
+        self._local_names.add(local_name)
+        self._terms[id(element)] = self._term(self._base_iri + local_name)
+        return self._terms[id(element)]
+
+    def _gufo(self, local_name: str) -> str:
+        return self._term(GUFO + local_name)
+
+    def _term(self, iri: str) -> str:
+        """Get the term of an IRI, abbreviated with a prefix in Turtle when possible.
+
+        :param iri: The IRI.
+        :type iri: str
+        :return: The prefixed name or the IRI between angle brackets.
+        :rtype: str
+        """
+        for prefix, namespace in self._namespaces.items():
+            if iri.startswith(namespace) and _LOCAL_NAME.fullmatch(iri, len(namespace)):
+                return f"{prefix}:{iri[len(namespace):]}"
+        return f"<{iri}>"
+
+
+def _sorted_names(names: set[LangString]) -> list[LangString]:
+    """Sort names with English ones first, then by language and text, so that the same name is picked first.
+
+    :param names: The names.
+    :type names: set[LangString]
+    :return: The sorted names.
+    :rtype: list[LangString]
+    """
+    return sorted(names, key=lambda name: (name.lang != "en", name.lang or "", name.text))
+
+
+def _literal(text: LangString) -> str:
+    """Format a language-tagged text as a string literal.
+
+    :param text: The text.
+    :type text: LangString
+    :return: The literal, quoted and escaped, with its language tag, if any.
+    :rtype: str
+    """
+    literal = f'"{text.text.translate(_STRING_ESCAPES)}"'
+    return f"{literal}@{text.lang}" if text.lang else literal
@@ -0,0 +1,279 @@
+"""This module exports OntoUML projects to the OntoUML JSON schema of ontouml-js, writing to a file-like object.
+
+The document is written in a streaming fashion: packages are written content by content and each other element
+(e.g., a class with its properties and literals) is encoded on its own and written right away. Memory use is thus
+bounded by the largest single element, not by the size of the project, unlike building the whole document as nested
+dictionaries before encoding it.
+
+Contents of each package are written sorted by type and ID, so that exporting the same project twice gives the same
+document. Packageable elements that are not inside any package are written in the project's root package (the
+'model' of the document), which is created in the document if the project does not have one.
+"""
+import io
+import json
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import chain
+from operator import attrgetter
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.generalization import Generalization
+from ontouml_py.model.generalizationset import GeneralizationSet
+from ontouml_py.model.modelelement import ModelElement
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.package import Package
+from ontouml_py.model.project import Project
+from ontouml_py.model.property import Property
+from ontouml_py.model.relation import Relation
+from ontouml_py.serialization.json_index import _IndexBuilder
+from ontouml_py.serialization.ontouml_schema import AGGREGATION_KIND_NAMES
+from ontouml_py.serialization.ontouml_schema import format_cardinality
+from ontouml_py.serialization.ontouml_schema import format_names
+from ontouml_py.serialization.ontouml_schema import format_property_assignments
+from ontouml_py.serialization.ontouml_schema import format_text
+from ontouml_py.serialization.ontouml_schema import NATURE_NAMES
+from ontouml_py.serialization.ontouml_schema import PACKAGE_CONTENT_TYPES
+from ontouml_py.serialization.ontouml_schema import SCHEMA_TYPES
+from ontouml_py.utils.errors import OntoumlTypeError
+
+# Encoder of single elements. Values that are not JSON types (e.g., in custom properties) are written as strings.
+_encode: Callable[[Any], str] = json.JSONEncoder(ensure_ascii=False, default=str).encode
+
+
+def export_json(project: Project, output: TextIO, index: Optional[TextIO] = None) -> None:
+    """Write a project to a text stream as an OntoUML JSON document.
+
+    :param project: The project to be exported.
+    :type project: Project
+    :param output: The text stream the document is written to (e.g., a file opened in text mode, or by open_compressed).
+    :type output: TextIO
+    :param index: The text stream the index of the document is written to, if any (see json_index). The document must
+                  then be written uncompressed, as UTF-8 and from the start of its stream.
+    :type index: Optional[TextIO]
+    """
+    builder = None if index is None else _IndexBuilder(output.write)
+    write = output.write if builder is None else builder.write
+    header = _named_element_fields(project, "Project")
+    write(_encode(header)[:-1])
+    write(',"model":')
+    root_package = project.root_package
+    orphans = _get_orphans(project)
+    if root_package is None:
+        model = {"id": f"{project.id}-model", "name": header["name"], "description": None, "type": "Package"}
+        model["propertyAssignments"] = None
+        _write_package_body(write, model, (), orphans, builder)
+    else:
+        _write_package(write, root_package, orphans, builder)
+    write(',"diagrams":null}')
+    if builder is not None:
+        builder.save(index)
+
+
+def export_json_string(project: Project) -> str:
+    """Export a project as an OntoUML JSON document held in a string.
+
+    :param project: The project to be exported.
+    :type project: Project
+    :return: The JSON document.
+    :rtype: str
+    """
+    output = io.StringIO()
+    export_json(project, output)
+    return output.getvalue()
+
+
+def element_to_dict(element: ModelElement) -> dict[str, Any]:
+    """Convert a single element that is not a package into its OntoUML JSON object.
+
+    :param element: A class, relation, property, literal, generalization or generalization set.
+    :type element: ModelElement
+    :raises OntoumlTypeError: If the element is a package or has no counterpart in the schema.
+    :return: The JSON object of the element, including its properties and literals, if any.
+    :rtype: dict[str, Any]
+    """
+    element_type = type(element).__name__
+    if element_type not in SCHEMA_TYPES or isinstance(element, Package):
+        raise OntoumlTypeError(
+            "unsupported_json_element",
+            description="Invalid element for an OntoUML JSON object.",
+            cause="{element_type} elements cannot be converted to OntoUML JSON objects.",
+            solution="Export packages with export_json, and only convert elements with a counterpart in the schema.",
+            element=element,
+            element_type=element_type,
+        )
+    fields = _named_element_fields(element, SCHEMA_TYPES[element_type])
+    fields["propertyAssignments"] = format_property_assignments(element.custom_properties)
+
+    if isinstance(element, Class):
+        fields["stereotype"] = _enum_value(element.stereotype)
+        fields["isAbstract"] = element.is_abstract
+        fields["isDerived"] = element.is_derived
+        fields["properties"] = [element_to_dict(attribute) for attribute in element.properties] or None
+        fields["isExtensional"] = None
+        fields["isPowertype"] = element.is_powertype
+        fields["order"] = str(element.order)
+        fields["literals"] = [element_to_dict(literal) for literal in _sorted(element.literals)] or None
+        fields["restrictedTo"] = sorted(NATURE_NAMES[nature] for nature in element.restricted_to) or None
+    elif isinstance(element, Relation):
+        fields["stereotype"] = _enum_value(element.stereotype)
+        fields["isAbstract"] = element.is_abstract
+        fields["isDerived"] = element.is_derived
+        fields["properties"] = [element_to_dict(end) for end in element.properties] or None
+    elif isinstance(element, Property):
+        fields["stereotype"] = _enum_value(element.stereotype)
+        fields["isDerived"] = element.is_derived
+        fields["isReadOnly"] = element.is_read_only
+        fields["isOrdered"] = element.cardinality.is_ordered
+        fields["cardinality"] = format_cardinality(element.cardinality)
+        fields["propertyType"] = _reference(element.property_type)
+        fields["subsettedProperties"] = [_reference(other) for other in _sorted(element.subsets)] or None
+        fields["redefinedProperties"] = [_reference(other) for other in _sorted(element.redefines)] or None
+        fields["aggregationKind"] = AGGREGATION_KIND_NAMES[element.aggregation_kind]
+    elif isinstance(element, Generalization):
+        fields["general"] = _reference(element.general)
+        fields["specific"] = _reference(element.specific)
+    elif isinstance(element, GeneralizationSet):
+        fields["isDisjoint"] = element.is_disjoint
+        fields["isComplete"] = element.is_complete
+        fields["categorizer"] = _reference(element.categorizer)
+        fields["generalizations"] = [_reference(other) for other in _sorted(element.generalizations)] or None
+    return fields
+
+
+def _write_package(
+    write: Callable[[str], Any],
+    package: Package,
+    extra_contents: Iterable[ModelElement] = (),
+    builder: Optional[_IndexBuilder] = None,
+    package_id: Optional[str] = None,
+) -> None:
+    """Write a package, followed by its contents, one at a time.
+
+    :param write: The write method of the output stream.
+    :type write: Callable[[str], Any]
+    :param package: The package to be written.
+    :type package: Package
+    :param extra_contents: Elements to be written as contents of the package in addition to its own.
+    :type extra_contents: Iterable[ModelElement]
+    :param builder: The builder of the document's index, if it is indexed.
+    :type builder: Optional[_IndexBuilder]
+    :param package_id: The ID of the package the package is written in, if any.
+    :type package_id: Optional[str]
+    """
+    fields = _named_element_fields(package, "Package")
+    fields["propertyAssignments"] = format_property_assignments(package.custom_properties)
+    contents = package.get_contents()
+    own_contents = (content for content_type in PACKAGE_CONTENT_TYPES for content in _sorted(contents[content_type]))
+    _write_package_body(write, fields, own_contents, extra_contents, builder, package_id)
+
+
+def _write_package_body(
+    write: Callable[[str], Any],
+    fields: dict[str, Any],
+    contents: Iterable[ModelElement],
+    extra_contents: Iterable[ModelElement],
+    builder: Optional[_IndexBuilder] = None,
+    package_id: Optional[str] = None,
+) -> None:
+    """Write the fields of a package and then stream its contents.
+
+    :param write: The write method of the output stream.
+    :type write: Callable[[str], Any]
+    :param fields: The fields of the package, except its contents.
+    :type fields: dict[str, Any]
+    :param contents: The package's own contents.
+    :type contents: Iterable[ModelElement]
+    :param extra_contents: Further elements to be written as contents of the package.
+    :type extra_contents: Iterable[ModelElement]
+    :param builder: The builder of the document's index, if it is indexed.
+    :type builder: Optional[_IndexBuilder]
+    :param package_id: The ID of the package the package is written in, if any.
+    :type package_id: Optional[str]
+    """
+    if builder is None:
+        write(_encode(fields)[:-1])
+    else:
+        builder.write_object(fields, _encode(fields)[:-1], package_id)
+    separator = ',"contents":['
+    for content in chain(contents, extra_contents):
+        write(separator)
+        separator = ","
+        if isinstance(content, Package):
+            _write_package(write, content, (), builder, fields["id"])
+        elif builder is None:
+            write(_encode(element_to_dict(content)))
+        else:
+            json_object = element_to_dict(content)
+            builder.write_object(json_object, _encode(json_object), fields["id"])
+    write(',"contents":null}' if separator == ',"contents":[' else "]}")
+
+
+def _get_orphans(project: Project) -> Iterator[ModelElement]:
+    """Get the packageable elements of the project that are not inside any package, except its root package.
+
+    :param project: The exported project.
+    :type project: Project
+    :return: The elements, sorted by type and ID.
+    :rtype: Iterator[ModelElement]
+    """
+    elements = project.get_elements()
+    for content_type in PACKAGE_CONTENT_TYPES:
+        for element in _sorted(elements[content_type]):
+            if element.package is None and element is not project.root_package:
+                yield element
+
+
+def _named_element_fields(element: OntoumlElement, schema_type: str) -> dict[str, Any]:
+    """Get the fields shared by all elements of the schema.
+
+    :param element: A named element.
+    :type element: OntoumlElement
+    :param schema_type: The type of the element in the schema.
+    :type schema_type: str
+    :return: The element's 'id', 'name', 'description' and 'type'.
+    :rtype: dict[str, Any]
+    """
+    return {
+        "id": element.id,
+        "name": format_names(element.names),
+        "description": format_text(element.description),
+        "type": schema_type,
+    }
+
+
+def _reference(element: Optional[object]) -> Optional[dict[str, str]]:
+    """Get the schema reference to an element.
+
+    :param element: The referenced element.
+    :type element: Optional[object]
+    :return: The 'id' and 'type' of the element, or None if it is not a serializable element.
+    :rtype: Optional[dict[str, str]]
+    """
+    schema_type = SCHEMA_TYPES.get(type(element).__name__)
+    return None if schema_type is None else {"id": element.id, "type": schema_type}
+
+
+def _enum_value(value: Optional[object]) -> Optional[str]:
+    """Get the value of a stereotype, which may also be a custom string.
+
+    :param value: An enumeration member, a string or None.
+    :type value: Optional[object]
+    :return: The value of the member, the string itself, or None.
+    :rtype: Optional[str]
+    """
+    return getattr(value, "value", value)
+
+
+def _sorted(elements: Iterable[OntoumlElement]) -> list[OntoumlElement]:
+    """Sort elements by ID, so that exported documents are deterministic.
+
+    :param elements: The elements to be sorted.
+    :type elements: Iterable[OntoumlElement]
+    :return: The sorted elements.
+    :rtype: list[OntoumlElement]
+    """
+    return sorted(elements, key=attrgetter("id"))
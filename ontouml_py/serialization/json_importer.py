@@ -0,0 +1,663 @@
+"""This module imports OntoUML projects from OntoUML JSON documents (the schema of ontouml-js) in file-like objects.
+
+Documents are read incrementally, without building the tree of the whole document first. The nesting of the document
+(the project, its model and the contents of each package) is read token by token, and each other element (e.g., a class
+with its properties and literals) is decoded on its own and created right away, so memory use stays close to the size of
+the created elements.
+
+References between elements (e.g., property types and the ends of generalizations) may point to elements that come
+later in the document. They are recorded while reading and linked in a second pass, through a table of the created
+elements by ID. Generalizations, which cannot exist without their ends, are created in this pass.
+"""
+import io
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from enum import Enum
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+from ontouml_py.model.binaryrelation import BinaryRelation
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.classifier import Classifier
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.propertystereotype import PropertyStereotype
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.generalization import Generalization
+from ontouml_py.model.generalizationset import GeneralizationSet
+from ontouml_py.model.naryrelation import NaryRelation
+from ontouml_py.model.ontoumlelement import _untracked_changes
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.ontoumlelement import shared_timestamp
+from ontouml_py.model.package import Package
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.property import Property
+from ontouml_py.serialization.compressed_io import open_compressed
+from ontouml_py.serialization.ontouml_schema import AGGREGATION_KINDS_BY_NAME
+from ontouml_py.serialization.ontouml_schema import NATURES_BY_NAME
+from ontouml_py.serialization.ontouml_schema import parse_cardinality
+from ontouml_py.serialization.ontouml_schema import parse_names
+from ontouml_py.serialization.ontouml_schema import parse_property_assignments
+from ontouml_py.serialization.ontouml_schema import parse_text
+from ontouml_py.utils.errors import OntoumlValueError
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Run of characters other than brackets, including complete strings, which may contain brackets
+_NON_BRACKETS = re.compile(r'[^"\[\]{}]*(?:"(?:[^"\\]|\\.)*"[^"\[\]{}]*)*')
+
+# Names of the package methods that add contents of each type
+_ADD_METHODS: dict[str, str] = {
+    "BinaryRelation": "add_binary_relation",
+    "Class": "add_class",
+    "Generalization": "add_generalization",
+    "GeneralizationSet": "add_generalization_set",
+    "NaryRelation": "add_nary_relation",
+    "Package": "add_package",
+}
+
+# Schema fields copied as they are, when present, to the fields of the same meaning in each type
+_CLASS_FIELDS: dict[str, str] = {
+    "isAbstract": "is_abstract",
+    "isDerived": "is_derived",
+    "isPowertype": "is_powertype",
+}
+_RELATION_FIELDS: dict[str, str] = {"isAbstract": "is_abstract", "isDerived": "is_derived"}
+_PROPERTY_FIELDS: dict[str, str] = {"isDerived": "is_derived", "isReadOnly": "is_read_only"}
+_GENERALIZATION_SET_FIELDS: dict[str, str] = {"isComplete": "is_complete", "isDisjoint": "is_disjoint"}
+
+
+def import_json(source: Union[TextIO, BinaryIO], chunk_size: int = 1 << 16) -> Project:
+    """Read a project from a stream holding an OntoUML JSON document.
+
+    Binary streams are decoded as UTF-8, after being decompressed on the fly if their data is compressed (see
+    compressed_io). The elements share the same 'created' timestamp (see shared_timestamp). Loading them is not a
+    change: they are not given a 'modified' timestamp, nor recorded as changed (see Project.get_changed).
+
+    :param source: The stream the document is read from (e.g., a file opened in text or binary mode).
+    :type source: Union[TextIO, BinaryIO]
+    :param chunk_size: Number of characters read from the stream at a time.
+    :type chunk_size: int
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    :raises OntoumlValueError: If the document refers to elements it does not contain, repeats IDs, or has elements
+                               of unknown types.
+    :return: The project, with its root package holding the model of the document.
+    :rtype: Project
+    """
+    # All elements are created at the same time, reading the clock once
+    with shared_timestamp(), _untracked_changes():
+        if isinstance(source, io.TextIOBase):
+            return _ProjectLoader(_JsonReader(source, chunk_size)).load()
+        with open_compressed(source, "rt") as text_source:
+            return _ProjectLoader(_JsonReader(text_source, chunk_size)).load()
+
+
+def import_json_string(document: str) -> Project:
+    """Import a project from an OntoUML JSON document held in a string.
+
+    :param document: The JSON document.
+    :type document: str
+    :return: The project.
+    :rtype: Project
+    """
+    return import_json(io.StringIO(document))
+
+
+class _JsonReader:
+    """Incremental reader of JSON documents, which reads the stream in chunks as tokens are requested.
+
+    Objects and arrays can be read token by token, through iter_object and iter_array, or decoded whole, through
+    read_value, with the json module's decoder. The text of a value can also be kept undecoded, by marking where it
+    starts and reading the marked text once it has been consumed.
+    """
+
+    def __init__(self, source: TextIO, chunk_size: int) -> None:
+        self._source = source
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._end_of_stream = False
+        # Start of the marked text, which is kept in the buffer until it is read
+        self._mark: Optional[int] = None
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character, without consuming it.
+
+        :return: The next character, or an empty string at the end of the stream.
+        :rtype: str
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def read_value(self) -> Any:
+        """Decode the next value whole.
+
+        :raises json.JSONDecodeError: If the next value is not valid JSON.
+        :return: The decoded value.
+        :rtype: Any
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._position)
+                # A value ending with the buffer may be a number or literal cut by the chunk boundary
+                if end < len(self._buffer) or self._end_of_stream:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._end_of_stream:
+                    raise
+            self._fill()
+
+    def skip_value(self) -> None:
+        """Consume the next value, reading its arrays and objects token by token, so that it is never held whole."""
+        next_character = self.peek()
+        if next_character == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        elif next_character == "[":
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+    def mark(self) -> None:
+        """Mark the start of the next value, whose text is kept until read_marked is called."""
+        self.peek()
+        self._mark = self._position
+
+    def read_marked(self) -> str:
+        """Get the text consumed since the mark, without decoding it, and remove the mark.
+
+        :return: The marked text.
+        :rtype: str
+        """
+        mark, self._mark = self._mark, None
+        return self._buffer[mark : self._position]
+
+    def skip_to_object_end(self) -> None:
+        """Consume the rest of the object being read by iter_object, scanning its brackets without decoding it.
+
+        The iteration over the object's keys must not be resumed afterward.
+
+        :raises json.JSONDecodeError: If the stream ends before the object does.
+        """
+        depth = 1
+        while True:
+            self._position = _NON_BRACKETS.match(self._buffer, self._position).end()
+            if self._position == len(self._buffer) or self._buffer[self._position] == '"':
+                # The buffer ends within the run or within a string
+                if not self._fill():
+                    self._raise("Unterminated object")
+                continue
+            depth += 1 if self._buffer[self._position] in "[{" else -1
+            self._position += 1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Read the next object member by member.
+
+        The caller must consume the value of each key (e.g., with read_value) before requesting the next one.
+
+        :raises json.JSONDecodeError: If the next value is not a valid object.
+        :return: The keys of the object's members.
+        :rtype: Iterator[str]
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self._raise("Expecting property name enclosed in double quotes")
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            if self._read_separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """Read the next array item by item.
+
+        The caller must consume each item before requesting the next one.
+
+        :raises json.JSONDecodeError: If the next value is not a valid array.
+        :return: None before each item.
+        :rtype: Iterator[None]
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield None
+            if self._read_separator("]"):
+                return
+
+    def _fill(self) -> bool:
+        """Append the next chunk of the stream to the buffer, discarding what was consumed, except marked text.
+
+        Chunks grow with the part of the buffer not consumed yet, so that large values are decoded in few attempts.
+
+        :return: False if the stream has no more characters.
+        :rtype: bool
+        """
+        chunk = self._source.read(max(self._chunk_size, len(self._buffer) - self._position))
+        if not chunk:
+            self._end_of_stream = True
+            return False
+        start = self._position if self._mark is None else self._mark
+        self._buffer = self._buffer[start:] + chunk
+        self._position -= start
+        if self._mark is not None:
+            self._mark = 0
+        return True
+
+    def _expect(self, character: str) -> None:
+        if self.peek() != character:
+            self._raise(f"Expecting '{character}'")
+        self._position += 1
+
+    def _read_separator(self, closing_character: str) -> bool:
+        """Consume the separator after a member or item.
+
+        :param closing_character: The character closing the object or array.
+        :type closing_character: str
+        :return: True if the separator closes the object or array, False if it is a comma.
+        :rtype: bool
+        """
+        next_character = self.peek()
+        if next_character != "," and next_character != closing_character:
+            self._raise(f"Expecting ',' or '{closing_character}'")
+        self._position += 1
+        return next_character == closing_character
+
+    def _raise(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._position)
+
+
+class _ProjectLoader:
+    """Creator of the elements of a project as its document is read, and linker of their references."""
+
+    def __init__(self, reader: Optional[_JsonReader], project: Optional[Project] = None) -> None:
+        """Initialize a new loader.
+
+        :param reader: The reader of the document, or None if elements are created from already decoded fields.
+        :type reader: Optional[_JsonReader]
+        :param project: The project of the created elements, or None to create it from the document.
+        :type project: Optional[Project]
+        """
+        self._reader = reader
+        self._project = project
+        # Created elements by ID
+        self._elements: dict[str, ProjectElement] = {}
+        # Unresolved references, as (element, field name, reference or list of references)
+        self._references: list[tuple[ProjectElement, str, Any]] = []
+        # Generalizations to be created once their ends are, as (package, arguments, general, specific)
+        self._generalizations: list[tuple[Optional[Package], dict[str, Any], Any, Any]] = []
+
+    def load(self) -> Project:
+        """Read the project and link the references between its elements.
+
+        :return: The project.
+        :rtype: Project
+        """
+        reader = self._reader
+        fields: dict[str, Any] = {}
+        for key in reader.iter_object():
+            if key == "model":
+                # Elements need their project, which is created with the fields read so far
+                if self._project is None:
+                    self._project = Project(**_get_named_element_arguments(fields))
+                    fields = {}
+                if reader.peek() == "n":
+                    reader.read_value()
+                    continue
+                model = self._read_element(None)
+                if not isinstance(model, Package):
+                    raise OntoumlValueError(
+                        "invalid_model",
+                        description="Invalid model of the project.",
+                        cause="The model of the project must be a package, but it is the {element_type} with ID "
+                        "{element.id}.",
+                        solution="Ensure the 'model' field of the document holds a package.",
+                        element=model,
+                        element_type=type(model).__name__,
+                    )
+                self._project.root_package = model
+            elif key in ("id", "name", "description"):
+                fields[key] = reader.read_value()
+            else:
+                reader.skip_value()
+
+        if self._project is None:
+            self._project = Project(**_get_named_element_arguments(fields))
+        else:
+            _set_fields(self._project, _get_named_element_arguments(fields))
+        self._link()
+        return self._project
+
+    def _read_element(self, package: Optional[Package]) -> Optional[ProjectElement]:
+        """Read the next element of the document and create it, streaming the contents of packages.
+
+        :param package: The package that contains the element, if any.
+        :type package: Optional[Package]
+        :return: The created element, or None for generalizations, which are only created when linking.
+        :rtype: Optional[ProjectElement]
+        """
+        return self._read_members(package, self._reader.iter_object(), {})
+
+    def _read_members(
+        self, package: Optional[Package], keys: Iterator[str], fields: dict[str, Any]
+    ) -> Optional[ProjectElement]:
+        """Read the remaining members of an element and create it, streaming the contents of packages.
+
+        :param package: The package that contains the element, if any.
+        :type package: Optional[Package]
+        :param keys: The keys of the element's members not read yet, from iter_object.
+        :type keys: Iterator[str]
+        :param fields: The fields of the element already read.
+        :type fields: dict[str, Any]
+        :return: The created element, or None for generalizations, which are only created when linking.
+        :rtype: Optional[ProjectElement]
+        """
+        reader = self._reader
+        created_package = None
+        for key in keys:
+            if key != "contents":
+                fields[key] = reader.read_value()
+                continue
+            # Only packages have contents. The package is created with the fields read so far, which in documents
+            # written by ontouml-js and ontouml-py are all but the contents.
+            if created_package is None:
+                created_package = self._create_package(package, fields)
+                fields = {}
+            if reader.peek() == "n":
+                reader.read_value()
+                continue
+            for _ in reader.iter_array():
+                self._read_element(created_package)
+
+        if created_package is None:
+            return self._create_element(package, fields)
+        _set_fields(created_package, _get_model_element_arguments(fields))
+        return created_package
+
+    def _create_element(self, package: Optional[Package], fields: dict[str, Any]) -> Optional[ProjectElement]:
+        """Create an element from its fields in the document and add it to its package.
+
+        :param package: The package that contains the element, if any.
+        :type package: Optional[Package]
+        :param fields: The fields of the element in the document.
+        :type fields: dict[str, Any]
+        :raises OntoumlValueError: If the type of the element is unknown.
+        :return: The created element, or None for generalizations, which are only created when linking.
+        :rtype: Optional[ProjectElement]
+        """
+        element_type = fields.get("type")
+        if element_type == "Package":
+            return self._create_package(package, fields)
+        if element_type == "Generalization":
+            arguments = _get_model_element_arguments(fields)
+            self._generalizations.append((package, arguments, fields.get("general"), fields.get("specific")))
+            return None
+
+        if element_type == "Class":
+            element = self._create_class(fields)
+        elif element_type == "Relation":
+            element = self._create_relation(fields)
+        elif element_type == "GeneralizationSet":
+            element = self._create_generalization_set(fields)
+        else:
+            raise OntoumlValueError(
+                "unknown_element_type",
+                description="Unknown element type '{element_type}'.",
+                cause="The element with ID {element_id} has a type that is not a content type of the OntoUML JSON "
+                "schema.",
+                solution="Ensure packages only contain packages, classes, relations, generalizations and "
+                "generalization sets.",
+                element_type=element_type,
+                element_id=fields.get("id"),
+            )
+        _add_to_package(package, element)
+        return element
+
+    def _create_package(self, package: Optional[Package], fields: dict[str, Any]) -> Package:
+        created = Package(self._project, **_get_model_element_arguments(fields))
+        self._register(created)
+        _add_to_package(package, created)
+        return created
+
+    def _create_class(self, fields: dict[str, Any]) -> Class:
+        arguments = _get_model_element_arguments(fields)
+        _copy_fields(arguments, fields, _CLASS_FIELDS)
+        arguments["stereotype"] = _get_member(ClassStereotype, fields.get("stereotype"))
+        if fields.get("order") is not None:
+            order = fields["order"]
+            arguments["order"] = int(order) if isinstance(order, str) and order.isdecimal() else order
+        if fields.get("restrictedTo"):
+            arguments["restricted_to"] = {
+                _get_value(NATURES_BY_NAME, nature, "restrictedTo", fields) for nature in fields["restrictedTo"]
+            }
+
+        created = Class(self._project, **arguments)
+        self._register(created)
+        self._create_properties(created, fields.get("properties"))
+        for literal_fields in fields.get("literals") or ():
+            self._register(created.create_literal(**_get_model_element_arguments(literal_fields)))
+        return created
+
+    def _create_relation(self, fields: dict[str, Any]) -> ProjectElement:
+        arguments = _get_model_element_arguments(fields)
+        _copy_fields(arguments, fields, _RELATION_FIELDS)
+        arguments["stereotype"] = _get_member(RelationStereotype, fields.get("stereotype"))
+
+        # The schema has a single type of relation, told apart by the number of ends
+        ends = fields.get("properties") or ()
+        relation_type = BinaryRelation if len(ends) == 2 else NaryRelation
+        created = relation_type(self._project, **arguments)
+        self._register(created)
+        self._create_properties(created, ends)
+        return created
+
+    def _create_properties(self, classifier: Classifier, properties: Optional[list[dict[str, Any]]]) -> None:
+        for fields in properties or ():
+            arguments = _get_model_element_arguments(fields)
+            _copy_fields(arguments, fields, _PROPERTY_FIELDS)
+            arguments["stereotype"] = _get_member(PropertyStereotype, fields.get("stereotype"))
+            arguments["cardinality"] = parse_cardinality(fields.get("cardinality"), bool(fields.get("isOrdered")))
+            if fields.get("aggregationKind") is not None:
+                arguments["aggregation_kind"] = _get_value(
+                    AGGREGATION_KINDS_BY_NAME, fields["aggregationKind"], "aggregationKind", fields
+                )
+
+            created = classifier.create_property(**arguments)
+            self._register(created)
+            self._add_reference(created, "property_type", fields.get("propertyType"))
+            self._add_reference(created, "subsets", fields.get("subsettedProperties"))
+            self._add_reference(created, "redefines", fields.get("redefinedProperties"))
+
+    def _create_generalization_set(self, fields: dict[str, Any]) -> GeneralizationSet:
+        arguments = _get_model_element_arguments(fields)
+        _copy_fields(arguments, fields, _GENERALIZATION_SET_FIELDS)
+        created = GeneralizationSet(self._project, **arguments)
+        self._register(created)
+        self._add_reference(created, "categorizer", fields.get("categorizer"))
+        self._add_reference(created, "generalizations", fields.get("generalizations"))
+        return created
+
+    def _register(self, element: ProjectElement) -> None:
+        """Add a created element to the table of elements by ID.
+
+        :param element: The created element.
+        :type element: ProjectElement
+        :raises OntoumlValueError: If another element has the same ID.
+        """
+        if element.id in self._elements:
+            raise OntoumlValueError(
+                "duplicate_id",
+                description="Duplicate element ID {element.id}.",
+                cause="The document has more than one element with the ID {element.id}.",
+                solution="Ensure every element of the document has a unique ID.",
+                element=element,
+            )
+        self._elements[element.id] = element
+
+    def _add_reference(self, element: ProjectElement, field_name: str, reference: Any) -> None:
+        if reference:
+            self._references.append((element, field_name, reference))
+
+    def _link(self) -> None:
+        """Create the generalizations and set the references recorded while reading, once all elements exist."""
+        project = self._project
+        for package, arguments, general, specific in self._generalizations:
+            created = Generalization(
+                project,
+                general=self._resolve(general, arguments),
+                specific=self._resolve(specific, arguments),
+                **arguments,
+            )
+            self._register(created)
+            _add_to_package(package, created)
+        self._generalizations.clear()
+
+        # Subsetting and redefinition are set through their inverses, each of which is assigned once
+        inverses: dict[str, defaultdict[Property, set[Property]]] = {
+            "subsetted_by": defaultdict(set),
+            "redefined_by": defaultdict(set),
+        }
+        for element, field_name, reference in self._references:
+            if field_name == "subsets" or field_name == "redefines":
+                inverse = inverses["subsetted_by" if field_name == "subsets" else "redefined_by"]
+                for other in reference:
+                    inverse[self._resolve(other, element)].add(element)
+            elif isinstance(reference, list):
+                setattr(element, field_name, {self._resolve(other, element) for other in reference})
+            else:
+                setattr(element, field_name, self._resolve(reference, element))
+        self._references.clear()
+        for field_name, inverse in inverses.items():
+            for element, others in inverse.items():
+                setattr(element, field_name, getattr(element, field_name) | others)
+
+    def _resolve(self, reference: Optional[dict[str, Any]], source: Any) -> Optional[ProjectElement]:
+        """Get the element a reference points to.
+
+        :param reference: The reference, an object with the 'id' of the element, or None.
+        :type reference: Optional[dict[str, Any]]
+        :param source: The element holding the reference, or the arguments of the generalization holding it.
+        :type source: Any
+        :raises OntoumlValueError: If the document has no element with the referenced ID.
+        :return: The referenced element, or None if there is no reference.
+        :rtype: Optional[ProjectElement]
+        """
+        if reference is None:
+            return None
+        element = self._elements.get(reference.get("id"))
+        if element is None:
+            source_id = source.id if isinstance(source, OntoumlElement) else source.get("id")
+            raise OntoumlValueError(
+                "unresolved_reference",
+                description="Unresolved reference to the element with ID {reference_id}.",
+                cause="The element with ID {source_id} refers to an element that is not in the document.",
+                solution="Ensure the document contains every element referred to by its elements.",
+                reference_id=reference.get("id"),
+                source_id=source_id,
+            )
+        return element
+
+
+def _get_named_element_arguments(fields: dict[str, Any]) -> dict[str, Any]:
+    """Get the arguments of a named element from the fields present in its document.
+
+    :param fields: The fields of the element in the document.
+    :type fields: dict[str, Any]
+    :return: The element's 'id', 'names' and 'description', for those present in the document.
+    :rtype: dict[str, Any]
+    """
+    arguments = {}
+    if fields.get("id") is not None:
+        arguments["id"] = fields["id"]
+    if fields.get("name") is not None:
+        arguments["names"] = parse_names(fields["name"])
+    if fields.get("description") is not None:
+        arguments["description"] = parse_text(fields["description"])
+    return arguments
+
+
+def _get_model_element_arguments(fields: dict[str, Any]) -> dict[str, Any]:
+    arguments = _get_named_element_arguments(fields)
+    if fields.get("propertyAssignments"):
+        arguments["custom_properties"] = parse_property_assignments(fields["propertyAssignments"])
+    return arguments
+
+
+def _copy_fields(arguments: dict[str, Any], fields: dict[str, Any], field_names: dict[str, str]) -> None:
+    for schema_name, field_name in field_names.items():
+        if fields.get(schema_name) is not None:
+            arguments[field_name] = fields[schema_name]
+
+
+def _set_fields(element: OntoumlElement, arguments: dict[str, Any]) -> None:
+    for field_name, value in arguments.items():
+        setattr(element, field_name, value)
+
+
+def _add_to_package(package: Optional[Package], element: ProjectElement) -> None:
+    if package is not None:
+        getattr(package, _ADD_METHODS[type(element).__name__])(element)
+
+
+def _get_member(enumeration: type[Enum], value: Optional[str]) -> Any:
+    """Get the member of an enumeration with a value, keeping values that are not members (e.g., custom stereotypes).
+
+    :param enumeration: The enumeration.
+    :type enumeration: type[Enum]
+    :param value: The value in the document.
+    :type value: Optional[str]
+    :return: The member, or the value itself if no member has it.
+    :rtype: Any
+    """
+    try:
+        return enumeration(value)
+    except ValueError:
+        return value
+
+
+def _get_value(values: dict[str, Any], name: Any, schema_name: str, fields: dict[str, Any]) -> Any:
+    """Get the value of an enumerated field of the schema.
+
+    :param values: The values by name.
+    :type values: dict[str, Any]
+    :param name: The name in the document.
+    :type name: Any
+    :param schema_name: The name of the field in the schema.
+    :type schema_name: str
+    :param fields: The fields of the element in the document.
+    :type fields: dict[str, Any]
+    :raises OntoumlValueError: If the name is not one of the field's.
+    :return: The value.
+    :rtype: Any
+    """
+    if name not in values:
+        raise OntoumlValueError(
+            "invalid_field_value",
+            description="Invalid value '{name}' of the field '{schema_name}'.",
+            cause="The element with ID {element_id} has a value that is not one of {names}.",
+            solution="Ensure the document uses the values of the OntoUML JSON schema.",
+            name=name,
+            schema_name=schema_name,
+            element_id=fields.get("id"),
+            names=sorted(values),
+        )
+    return values[name]
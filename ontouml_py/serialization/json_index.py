@@ -0,0 +1,260 @@
+"""This module indexes OntoUML JSON documents by element ID, so that single elements are read without parsing the rest.
+
+The index is a sidecar file written by export_json, given a stream for it, together with the document. It maps the ID
+of each element to the position of its JSON object in the document, as a byte offset and length, and to the IDs of
+its owner and package. Properties and literals, which are written inside their classifiers, are mapped to the object
+of their owner. Packages, which are written followed by their contents, are mapped to their fields only.
+
+The index is a text file, with a header line holding the magic word 'OUMLJIDX', the format version, the number of
+entries and the size of the indexed document, followed by one line per element, sorted by ID:
+
+    <id> TAB <type> TAB <offset> TAB <length> TAB <owner id> TAB <package id>
+
+IDs are written as JSON strings (e.g., "1a2b"), so that they hold no tabs or line breaks, and missing IDs as empty
+fields. IndexedDocument maps the index into memory and finds lines by binary search over their byte positions, so that
+the index is not loaded either. It then seeks to the object of the element in the document and decodes it alone.
+Documents must be indexed uncompressed, as compressed streams cannot be read from arbitrary offsets.
+"""
+import json
+import mmap
+from collections.abc import Callable
+from collections.abc import Iterator
+from os import PathLike
+from os import fspath
+from typing import Any
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+from ontouml_py.utils.errors import OntoumlValueError
+
+MAGIC = "OUMLJIDX"
+FORMAT_VERSION = 1
+# Suffix added to the path of a document to get the path of its index, by default
+INDEX_SUFFIX = ".idx"
+
+_encode_id: Callable[[str], str] = json.JSONEncoder().encode
+
+
+class _IndexBuilder:
+    """Writer that counts the bytes written to a document and records the positions of its elements."""
+
+    def __init__(self, write: Callable[[str], Any]) -> None:
+        """Initialize a new builder.
+
+        :param write: The write method of the document's stream, which must encode text as UTF-8.
+        :type write: Callable[[str], Any]
+        """
+        self._write = write
+        self._position = 0
+        self._lines: list[str] = []
+
+    def write(self, text: str) -> None:
+        """Write text to the document.
+
+        :param text: The text to be written.
+        :type text: str
+        """
+        self._write(text)
+        self._position += len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+
+    def write_object(self, json_object: dict[str, Any], text: str, package_id: Optional[str]) -> None:
+        """Write the object of an element to the document, recording its position and those of its members.
+
+        :param json_object: The object of the element, with its properties and literals, if any.
+        :type json_object: dict[str, Any]
+        :param text: The encoded object, or, for packages, their encoded fields without the closing brace.
+        :type text: str
+        :param package_id: The ID of the package the element is written in, if any.
+        :type package_id: Optional[str]
+        """
+        offset = self._position
+        self.write(text)
+        location = f"\t{offset}\t{self._position - offset}\t"
+        package = "" if package_id is None else _encode_id(package_id)
+        element_id = _encode_id(json_object["id"])
+        self._lines.append(f"{element_id}\t{json_object['type']}{location}\t{package}\n")
+        for member in _get_members(json_object):
+            self._lines.append(f"{_encode_id(member['id'])}\t{member['type']}{location}{element_id}\t{package}\n")
+
+    def save(self, output: TextIO) -> None:
+        """Write the index of the document written so far.
+
+        :param output: The text stream the index is written to.
+        :type output: TextIO
+        """
+        self._lines.sort()
+        output.write(f"{MAGIC} {FORMAT_VERSION} {len(self._lines)} {self._position}\n")
+        output.writelines(self._lines)
+
+
+def _get_members(json_object: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Get the objects written inside the object of an element, i.e., its properties and literals.
+
+    :param json_object: The object of an element.
+    :type json_object: dict[str, Any]
+    :return: The objects of the properties and literals of the element.
+    :rtype: Iterator[dict[str, Any]]
+    """
+    yield from json_object.get("properties") or ()
+    yield from json_object.get("literals") or ()
+
+
+class IndexedDocument:
+    """OntoUML JSON document whose elements are read one at a time through its index.
+
+    The document and its index are kept open until the document is closed, which is done by close or by using the
+    document as a context manager.
+    """
+
+    def __init__(self, path: Union[str, PathLike], index_path: Optional[Union[str, PathLike]] = None) -> None:
+        """Open an indexed document.
+
+        :param path: The path of the document, which must not be compressed.
+        :type path: Union[str, PathLike]
+        :param index_path: The path of the index. Defaults to the path of the document followed by INDEX_SUFFIX.
+        :type index_path: Optional[Union[str, PathLike]]
+        :raises OntoumlValueError: If the index is not valid, was written with another version of the format, or
+                                   does not match the size of the document.
+        """
+        if index_path is None:
+            index_path = fspath(path) + INDEX_SUFFIX
+        with open(index_path, "rb") as index_file:
+            header = index_file.readline().split()
+            if len(header) != 4 or header[0] != MAGIC.encode() or not all(part.isdigit() for part in header[1:]):
+                raise _invalid_index("Its header is not that of an index of OntoUML JSON documents.")
+            if int(header[1]) != FORMAT_VERSION:
+                raise _invalid_index(f"It was written with version {int(header[1])} of the format.")
+            self._start = index_file.tell()
+            self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._length = int(header[2])
+        self._document = open(path, "rb")
+        document_size = self._document.seek(0, 2)
+        if document_size != int(header[3]):
+            self.close()
+            raise _invalid_index(f"It indexes a document of {int(header[3])} bytes, not {document_size}.")
+
+    def __enter__(self) -> "IndexedDocument":
+        return self
+
+    def __exit__(self, *_exception_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, element_id: str) -> bool:
+        return self._find(element_id) is not None
+
+    def close(self) -> None:
+        """Close the document and its index."""
+        self._document.close()
+        self._index.close()
+
+    def get(self, element_id: str) -> Optional[dict[str, Any]]:
+        """Read the JSON object of an element.
+
+        :param element_id: The ID of the element.
+        :type element_id: str
+        :return: The object of the element, as in the document, except for packages, which do not include their
+                 contents, or None if the document has no element with the ID.
+        :rtype: Optional[dict[str, Any]]
+        """
+        entry = self._find(element_id)
+        if entry is None:
+            return None
+        element_type, offset, length, owner_id = entry[1], int(entry[2]), int(entry[3]), entry[4]
+        self._document.seek(offset)
+        text = self._document.read(length)
+        if element_type == b"Package":
+            return json.loads(text + b"}")
+        json_object = json.loads(text)
+        if not owner_id:
+            return json_object
+        return next(member for member in _get_members(json_object) if member["id"] == element_id)
+
+    def get_package_id(self, element_id: str) -> Optional[str]:
+        """Get the ID of the package an element is written in.
+
+        :param element_id: The ID of the element.
+        :type element_id: str
+        :return: The ID of the package, or None if the element is not in a package or not in the document.
+        :rtype: Optional[str]
+        """
+        entry = self._find(element_id)
+        return None if entry is None or not entry[5] else json.loads(entry[5])
+
+    def get_related(self, element_id: str) -> dict[str, dict[str, Any]]:
+        """Read the JSON object of an element and those of the elements it refers to and of its owner, if any.
+
+        :param element_id: The ID of the element.
+        :type element_id: str
+        :return: The objects of the related elements found in the document, by ID, starting with the element's.
+        :rtype: dict[str, dict[str, Any]]
+        """
+        json_object = self.get(element_id)
+        if json_object is None:
+            return {}
+        related = {element_id: json_object}
+        entry = self._find(element_id)
+        related_ids = [json.loads(entry[4])] if entry[4] else []
+        related_ids.extend(reference["id"] for reference in _get_references(json_object))
+        for related_id in related_ids:
+            if related_id not in related:
+                related_object = self.get(related_id)
+                if related_object is not None:
+                    related[related_id] = related_object
+        return related
+
+    def _find(self, element_id: str) -> Optional[list[bytes]]:
+        """Find the line of an element in the index, by binary search over the positions of the lines.
+
+        :param element_id: The ID of the element.
+        :type element_id: str
+        :return: The fields of the line, or None if the index has no line for the ID.
+        :rtype: Optional[list[bytes]]
+        """
+        key = _encode_id(element_id).encode("ascii")
+        index = self._index
+        low, high = self._start, len(index)
+        while low < high:
+            middle = (low + high) // 2
+            # Start of the line holding the middle position, the header's line break being right before self._start
+            start = index.rfind(b"\n", self._start - 1, middle) + 1
+            end = index.find(b"\n", start)
+            line_key = index[start : index.find(b"\t", start)]
+            if line_key < key:
+                low = end + 1
+            elif line_key > key:
+                high = start
+            else:
+                return index[start:end].split(b"\t")
+        return None
+
+
+def _get_references(value: Any) -> Iterator[dict[str, str]]:
+    """Get the references held by a JSON value, i.e., the objects with only an 'id' and a 'type'.
+
+    :param value: The value, e.g., the object of an element.
+    :type value: Any
+    :return: The references, in the order they are found.
+    :rtype: Iterator[dict[str, str]]
+    """
+    if isinstance(value, dict):
+        if value.keys() == {"id", "type"}:
+            yield value
+            return
+        for item in value.values():
+            yield from _get_references(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _get_references(item)
+
+
+def _invalid_index(cause: str) -> OntoumlValueError:
+    return OntoumlValueError(
+        "invalid_json_index",
+        description="Invalid index of an OntoUML JSON document.",
+        cause=cause,
+        solution="Export the document again, writing its index.",
+    )
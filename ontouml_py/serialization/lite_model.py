@@ -0,0 +1,395 @@
+"""This module converts OntoUML projects to and from lite elements, compact read-only copies meant for analytics.
+
+Each concrete element type has a lite type (e.g., LiteClass for Class), given by LITE_TYPES, whose instances hold the
+fields of an element in __slots__, without the per-instance dictionaries, sets of explicitly set fields and private
+attributes of pydantic models. Fields are read as attributes, as on elements, and so are the project and package of an
+element, the classifier of a property, the enumeration of a literal, the properties of a classifier and the literals
+of a class, which, as in model stores, are exposed under the names of the properties of the elements.
+
+Elements referred to are lite elements, sets are frozensets and lists are tuples. All empty sets are the same
+frozenset, and the sets of explicitly set fields of elements are shared among those with the same ones. Other values
+(e.g., language strings, timestamps and cardinalities) are shared with the project they were converted from, so they
+must not be changed through the lite elements.
+
+Converting lite elements back to a project (LiteProject.to_project) rebuilds the elements without validating them
+again, as loading binary snapshots does, with the same owners, packages and explicitly set fields.
+"""
+import gc
+from collections.abc import Callable
+from typing import Any
+from typing import cast
+from typing import ClassVar
+from typing import Optional
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.classifier import Classifier
+from ontouml_py.model.ontoumlelement import _construct_elements
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.package import Package
+from ontouml_py.model.packageable import Packageable
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import _register_elements
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.serialization.binary_snapshot import _check_no_pending
+from ontouml_py.serialization.binary_snapshot import _get_private
+from ontouml_py.serialization.binary_snapshot import _get_sections
+from ontouml_py.serialization.binary_snapshot import _new
+from ontouml_py.serialization.binary_snapshot import _rebuild_indexes
+from ontouml_py.serialization.binary_snapshot import _SECTION_TYPES
+from ontouml_py.utils.errors import OntoumlValueError
+
+_EMPTY: frozenset[Any] = frozenset()
+_CONTENT_TYPES: tuple[str, ...] = tuple(Package.__private_attributes__["_contents"].get_default())
+
+
+class LiteElement:
+    """Read-only lite copy of an element, the base of the lite type of each concrete element type."""
+
+    __slots__ = ()
+
+    element_type: ClassVar[type[OntoumlElement]]
+    # Names of the slots holding fields, in the order given by _get_field_names, followed by the other slots
+    field_names: ClassVar[tuple[str, ...]]
+    slot_names: ClassVar[tuple[str, ...]]
+    # Slots of all lite types, created by _make_lite_type
+    id: str
+    _fields_set: frozenset[str]
+
+    def __setattr__(self, _name: str, _value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __delattr__(self, _name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LiteElement):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+class LitePackage(LiteElement):
+    """Read-only lite copy of a package."""
+
+    __slots__ = ()
+
+    _contents: dict[str, frozenset[LiteElement]]
+
+    def get_contents(self) -> dict[str, frozenset[LiteElement]]:
+        return self._contents
+
+    def get_content_by_id(self, content_type: str, content_id: str) -> Optional[LiteElement]:
+        for content in self._contents[content_type]:
+            if content.id == content_id:
+                return content
+        return None
+
+
+class LiteProject(LiteElement):
+    """Read-only lite copy of a project, through which its lite elements are looked up."""
+
+    __slots__ = ()
+
+    _elements: dict[str, frozenset[LiteElement]]
+
+    def get_elements(self) -> dict[str, frozenset[LiteElement]]:
+        return self._elements
+
+    def get_element_by_id(self, element_type: str, element_id: str) -> Optional[LiteElement]:
+        for element in self._elements[element_type]:
+            if element.id == element_id:
+                return element
+        return None
+
+    def to_project(self) -> Project:
+        """Convert the lite project back to a project, whose elements are rebuilt without being validated again.
+
+        The garbage collector is paused meanwhile, as none of the objects created are garbage.
+
+        :return: A new project, with the fields, owners, packages and explicitly set fields of the lite elements.
+        :rtype: Project
+        """
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return _ProjectBuilder().build(self)
+        finally:
+            if collecting:
+                gc.enable()
+
+
+def _make_lite_type(element_type: type[OntoumlElement]) -> type[LiteElement]:
+    """Create the lite type of a concrete element type, with a slot per field and per owner or owned element.
+
+    :param element_type: The concrete element type.
+    :type element_type: type[OntoumlElement]
+    :return: The lite type, named after the element type.
+    :rtype: type[LiteElement]
+    """
+    field_names = _get_field_names(element_type)
+    extra_names = ["_fields_set"]
+    if issubclass(element_type, ProjectElement):
+        extra_names.append("project")
+    if issubclass(element_type, Packageable):
+        extra_names.append("package")
+    if issubclass(element_type, Classifier):
+        extra_names.append("properties")
+    extra_names.extend(_OWNER_SLOTS.get(element_type.__name__, ()))
+    extra_names.extend(_OWNED_SLOTS.get(element_type.__name__, ()))
+    base = {"Project": LiteProject, "Package": LitePackage}.get(element_type.__name__, LiteElement)
+    slot_names = (*field_names, *extra_names)
+    namespace = {
+        "__slots__": slot_names,
+        "__module__": __name__,
+        "__doc__": f"Read-only lite copy of an element of type {element_type.__name__}.",
+        "element_type": element_type,
+        "field_names": field_names,
+        "slot_names": slot_names,
+    }
+    return type(f"Lite{element_type.__name__}", (base,), namespace)
+
+
+# Slots of the owners of elements, and of the elements owned by classes, packages and projects, in addition to the
+# properties of classifiers
+_OWNER_SLOTS = {"Property": ("classifier",), "Literal": ("enumeration",)}
+_OWNED_SLOTS = {"Class": ("literals",), "Package": ("_contents",), "Project": ("_elements",)}
+
+LITE_TYPES: dict[str, type[LiteElement]] = {
+    element_type.__name__: _make_lite_type(element_type) for element_type in _SECTION_TYPES
+}
+
+
+def to_lite(project: Project) -> LiteProject:
+    """Convert a project and its elements to lite elements.
+
+    The garbage collector is paused meanwhile, as none of the objects created are garbage.
+
+    :param project: The project to be converted.
+    :type project: Project
+    :return: The lite copy of the project, holding those of its elements.
+    :rtype: LiteProject
+    :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                               pending validation under the deferred validation policy.
+    """
+    _check_no_pending(project)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _to_lite(project)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _to_lite(project: Project) -> LiteProject:
+    sections = _get_sections(project)
+    element: OntoumlElement
+    lites: dict[int, LiteElement] = {}
+    for type_name, elements in sections.items():
+        lite_type = LITE_TYPES[type_name]
+        # IDs are set first, as lite elements are hashed by them when put in sets
+        set_id = _get_setter(lite_type, "id")
+        for element in elements:
+            lite = lites[id(element)] = _new(lite_type)
+            set_id(lite, element.id)
+    lite_project = cast(LiteProject, lites[id(project)])
+
+    fields_sets: dict[frozenset[str], frozenset[str]] = {}
+    contents: dict[LiteElement, dict[str, list[LiteElement]]] = {}
+    for type_name, elements in sections.items():
+        lite_type = LITE_TYPES[type_name]
+        setters = _get_setters(lite_type)
+        field_count = len(lite_type.field_names)
+        field_setters = list(zip(lite_type.field_names, setters[:field_count]))
+        extra_setters = list(zip(lite_type.slot_names[field_count:], setters[field_count:]))
+        owner_name = _OWNER_SLOTS.get(type_name, (None,))[0]
+        for element in elements:
+            lite = lites[id(element)]
+            values = element.__dict__
+            for name, setter in field_setters:
+                value = values[name]
+                if isinstance(value, (set, ProjectElement)):
+                    value = _to_lite_value(value, lites, element)
+                setter(lite, value)
+            fields_set = frozenset(element.__pydantic_fields_set__)
+            extras = {"_fields_set": fields_sets.setdefault(fields_set, fields_set), "project": lite_project}
+            private = _get_private(element)
+            if isinstance(element, Packageable):
+                package = _to_lite_value(values.get("_package"), lites, element)
+                extras["package"] = package
+                if package is not None:
+                    contents.setdefault(package, {}).setdefault(type_name, []).append(lite)
+            if isinstance(element, Classifier):
+                extras["properties"] = tuple([lites[id(owned)] for owned in private["_properties"]])
+            if isinstance(element, Class):
+                extras["literals"] = _to_lite_value(private["_literals"], lites, element)
+            if owner_name is not None:
+                extras[owner_name] = _to_lite_value(private[f"_{owner_name}"], lites, element)
+            for name, setter in extra_setters:
+                if name in extras:
+                    setter(lite, extras[name])
+
+    for package in (lites[id(element)] for element in sections["Package"]):
+        package_contents = contents.get(package, {})
+        frozen = {type_name: frozenset(package_contents.get(type_name, ())) or _EMPTY for type_name in _CONTENT_TYPES}
+        _get_setter(type(package), "_contents")(package, frozen)
+    project_elements = _get_private(project)["_elements"]
+    elements_by_type = {
+        type_name: frozenset([lites[id(element)] for element in elements]) or _EMPTY
+        for type_name, elements in project_elements.items()
+    }
+    _get_setter(LITE_TYPES["Project"], "_elements")(lite_project, elements_by_type)
+    return lite_project
+
+
+def _to_lite_value(value: Any, lites: dict[int, LiteElement], element: OntoumlElement) -> Any:
+    """Convert the value of a field to the value of the field of a lite element.
+
+    :param value: The value of the field.
+    :type value: Any
+    :param lites: The lite elements, by the identity of the elements they are copies of.
+    :type lites: dict[int, LiteElement]
+    :param element: The element holding the value.
+    :type element: OntoumlElement
+    :return: The value, with elements replaced by their lite copies and sets by frozensets.
+    :rtype: Any
+    :raises OntoumlValueError: If the value is or holds an element that is not in the project.
+    """
+    try:
+        if isinstance(value, ProjectElement):
+            return lites[id(value)]
+        if isinstance(value, set):
+            if not value:
+                return _EMPTY
+            return frozenset([lites[id(item)] if isinstance(item, ProjectElement) else item for item in value])
+    except KeyError:
+        raise OntoumlValueError(
+            "unknown_lite_reference",
+            description="Invalid reference for conversion to lite elements.",
+            cause="The {element_type} with ID {element.id} refers to an element that is not in its project.",
+            solution="Add the referred elements to the project, or remove the references, before converting it.",
+            element=element,
+            element_type=type(element).__name__,
+        ) from None
+    return value
+
+
+def _get_setter(lite_type: type[LiteElement], name: str) -> Callable[[LiteElement, Any], None]:
+    # Slots are set through their descriptors, bypassing the read-only __setattr__
+    return cast(Callable[[LiteElement, Any], None], getattr(lite_type, name).__set__)
+
+
+def _get_setters(lite_type: type[LiteElement]) -> list[Callable[[LiteElement, Any], None]]:
+    return [_get_setter(lite_type, name) for name in lite_type.slot_names]
+
+
+class _ProjectBuilder:
+    """Builder of a project from lite elements, which resolves references once all elements are built."""
+
+    def __init__(self) -> None:
+        # Built elements, by the identity of their lite copies
+        self._elements: dict[int, OntoumlElement] = {}
+
+    def build(self, lite_project: LiteProject) -> Project:
+        """Build the project and its elements.
+
+        :param lite_project: The lite copy of the project.
+        :type lite_project: LiteProject
+        :return: The project.
+        :rtype: Project
+        """
+        references: list[tuple[LiteElement, str, Any]] = []
+        project = cast(Project, self._build_section(Project, [lite_project], references)[0])
+        for element_type in _SECTION_TYPES[1:]:
+            type_name = element_type.__name__
+            elements = self._build_section(element_type, list(lite_project._elements[type_name]), references)
+            _register_elements(project, type_name, elements)
+
+        for lite, name, value in references:
+            self._elements[id(lite)].__dict__[name] = self._resolve(value)
+        self._link(lite_project)
+        _rebuild_indexes(project)
+        return project
+
+    def _build_section(
+        self,
+        element_type: type[OntoumlElement],
+        lites: list[LiteElement],
+        references: list[tuple[LiteElement, str, Any]],
+    ) -> list[OntoumlElement]:
+        """Build the elements of a type, leaving their reference fields to be resolved once all elements are built.
+
+        :param element_type: The concrete type of the elements.
+        :type element_type: type[OntoumlElement]
+        :param lites: The lite copies of the elements.
+        :type lites: list[LiteElement]
+        :param references: The reference fields of the lite elements, as (lite element, field name, value), to which
+                           those of the elements are appended.
+        :type references: list[tuple[LiteElement, str, Any]]
+        :return: The elements, in the order of their lite copies.
+        :rtype: list[OntoumlElement]
+        """
+        rows = []
+        for lite in lites:
+            row = []
+            for name in lite.field_names:
+                value = getattr(lite, name)
+                if isinstance(value, LiteElement) or value and isinstance(value, frozenset) and _is_lite_set(value):
+                    references.append((lite, name, value))
+                    value = None
+                elif isinstance(value, frozenset):
+                    value = set(value)
+                row.append(value)
+            rows.append(row)
+        elements = _construct_elements(element_type, rows, (lite._fields_set for lite in lites))
+        for lite, element in zip(lites, elements):
+            self._elements[id(lite)] = element
+        return elements
+
+    def _resolve(self, value: Any) -> Any:
+        """Get the value of a reference field of a built element from that of its lite copy.
+
+        :param value: A lite element or a frozenset of lite elements.
+        :type value: Any
+        :return: The built element, or a set of them.
+        :rtype: Any
+        """
+        if isinstance(value, LiteElement):
+            return self._elements[id(value)]
+        return {self._elements[id(item)] for item in value}
+
+    def _link(self, lite_project: LiteProject) -> None:
+        """Set the packages and owners of the built elements, and the properties and literals of their owners.
+
+        :param lite_project: The lite copy of the project.
+        :type lite_project: LiteProject
+        """
+        built = self._elements
+        for type_name, lites in lite_project._elements.items():
+            for lite in lites:
+                element = built[id(lite)]
+                private = _get_private(element)
+                package = getattr(lite, "package", None)
+                if package is not None:
+                    element.__dict__["_package"] = built[id(package)]
+                    _get_private(built[id(package)])["_contents"][type_name].add(element)
+                properties = getattr(lite, "properties", ())
+                if properties:
+                    private["_properties"] = [built[id(owned)] for owned in properties]
+                    for owned in properties:
+                        _get_private(built[id(owned)])["_classifier"] = element
+                literals = getattr(lite, "literals", ())
+                if literals:
+                    private["_literals"] = {built[id(owned)] for owned in literals}
+                    for owned in literals:
+                        _get_private(built[id(owned)])["_enumeration"] = element
+
+
+def _is_lite_set(value: frozenset[Any]) -> bool:
+    return isinstance(next(iter(value)), LiteElement)
@@ -0,0 +1,853 @@
+"""This module saves OntoUML projects as memory-mapped model stores, read through lightweight read-only proxies.
+
+Model stores are meant for read-only analysis of many archived projects, where building every element of each project
+would take too long and too much memory. Opening a store maps its file into memory and reads a fixed-size header and
+the descriptors of its sections, regardless of the size of the project. Elements are then accessed through proxies,
+created when an element is first looked up or reached from another one, whose fields are decoded from the mapped file
+each time they are read. Memory use therefore grows with the part of the project that is actually touched, while the
+operating system pages in only the parts of the file that are read.
+
+A store is laid out as follows, with all integers in little-endian order and all regions aligned to 8 bytes:
+
+- header: the magic bytes b"OUMLSTOR", the format version, the numbers of sections, strings, values and elements, and
+  the offsets of the regions below;
+- strings: the byte offsets of the strings, followed by their UTF-8 text;
+- values: the offsets of the entries of the distinct values of the fields, and the entries, encoded as in binary
+  snapshots (see ontouml_py.serialization.binary_snapshot), which refer to values by their codes, starting at 1;
+- pool: the items of the sets and lists of all elements, as 32-bit integers;
+- ID index: pairs of the code of an element's ID and of its position, sorted by ID, searched by bisection;
+- sections: one descriptor per element type, with the position of its first element, its number of elements, the
+  number of 32-bit slots of the record of each of its elements, the offset of its records, and the name, kind and
+  first slot of each of its columns;
+- records: one fixed-size record per element, holding, for each column, a value code, the position of a referred
+  element (0 standing for None), the codes of the text and language of a language string, or the start in the pool
+  and the number of items of a set or list.
+
+Elements are positioned in the order of binary snapshots, starting at 1. Besides the fields and owners of elements,
+records hold the ordered properties of classifiers, the literals of classes and the contents of packages, so that
+they are read without scanning other sections.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from datetime import timezone
+from itertools import accumulate
+from itertools import chain
+from itertools import groupby
+from operator import attrgetter
+from os import PathLike
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+from typing import Union
+
+from langstring import LangString
+
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.package import Package
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.binary_snapshot import _AWARE_DATETIME
+from ontouml_py.serialization.binary_snapshot import _BIG_INT
+from ontouml_py.serialization.binary_snapshot import _CARDINALITY
+from ontouml_py.serialization.binary_snapshot import _check_no_pending
+from ontouml_py.serialization.binary_snapshot import _DATETIME
+from ontouml_py.serialization.binary_snapshot import _encode_column
+from ontouml_py.serialization.binary_snapshot import _ENUM
+from ontouml_py.serialization.binary_snapshot import _FLOAT
+from ontouml_py.serialization.binary_snapshot import _FLOAT_BITS
+from ontouml_py.serialization.binary_snapshot import _get_column_kind
+from ontouml_py.serialization.binary_snapshot import _get_columns
+from ontouml_py.serialization.binary_snapshot import _get_defaults
+from ontouml_py.serialization.binary_snapshot import _get_enum_types
+from ontouml_py.serialization.binary_snapshot import _get_sections
+from ontouml_py.serialization.binary_snapshot import _INT
+from ontouml_py.serialization.binary_snapshot import _INT_BITS
+from ontouml_py.serialization.binary_snapshot import _INT64
+from ontouml_py.serialization.binary_snapshot import _LANGSTRING_SETS
+from ontouml_py.serialization.binary_snapshot import _LANGSTRINGS
+from ontouml_py.serialization.binary_snapshot import _MICROSECOND
+from ontouml_py.serialization.binary_snapshot import _MIN_DATETIME
+from ontouml_py.serialization.binary_snapshot import _new
+from ontouml_py.serialization.binary_snapshot import _REFERENCE_SETS
+from ontouml_py.serialization.binary_snapshot import _REFERENCES
+from ontouml_py.serialization.binary_snapshot import _SECTION_TYPES
+from ontouml_py.serialization.binary_snapshot import _STR
+from ontouml_py.serialization.binary_snapshot import _TRUE
+from ontouml_py.serialization.binary_snapshot import _TUPLE
+from ontouml_py.serialization.binary_snapshot import _TYPES_BY_NAME
+from ontouml_py.serialization.binary_snapshot import _UINT32
+from ontouml_py.serialization.binary_snapshot import _VALUE_SETS
+from ontouml_py.serialization.binary_snapshot import _ValueTable
+from ontouml_py.serialization.binary_snapshot import _VALUES
+from ontouml_py.utils.errors import OntoumlValueError
+
+MAGIC: bytes = b"OUMLSTOR"
+FORMAT_VERSION: int = 1
+
+# Kind of the columns holding ordered lists of elements, besides the kinds of binary snapshots
+_REFERENCE_LISTS = 6
+_SET_KINDS = frozenset((_VALUE_SETS, _REFERENCE_SETS, _LANGSTRING_SETS, _REFERENCE_LISTS))
+
+# Columns holding the elements owned by the elements of each type, which are the inverses of their owner columns, and
+# their kinds. Contents are ordered, so that they are grouped by type.
+_OWNED_COLUMNS: dict[str, tuple[tuple[str, int], ...]] = {
+    "Package": (("_contents", _REFERENCE_LISTS),),
+    "Class": (("_properties", _REFERENCE_LISTS), ("_literals", _REFERENCE_SETS)),
+    "BinaryRelation": (("_properties", _REFERENCE_LISTS),),
+    "NaryRelation": (("_properties", _REFERENCE_LISTS),),
+}
+
+# Names under which proxies expose the columns that are not fields, as the properties of the elements do
+_ALIASES = {
+    "package": "_package",
+    "classifier": "_classifier",
+    "enumeration": "_enumeration",
+    "properties": "_properties",
+    "literals": "_literals",
+}
+
+_CONTENT_TYPES: tuple[str, ...] = tuple(Package.__private_attributes__["_contents"].default)
+
+# Header: magic, version, numbers of sections, strings, values and elements, and offsets of the string offsets, string
+# data, value offsets, value entries, pool, ID index, section descriptors and records
+_HEADER = struct.Struct("<8sHHIII8Q")
+_UINT64 = struct.Struct("<Q")
+_ENTRY = struct.Struct("<q")
+_ENTRY_START = struct.Struct("<2q")
+_STRING_BOUNDS = struct.Struct("<2Q")
+_INDEX_ENTRY = struct.Struct("<2I")
+_SECTION = struct.Struct("<6Q")
+_COLUMN = struct.Struct("<3Q")
+_ALIGNMENT = 8
+
+
+def save_store(project: Project, path: Union[str, PathLike]) -> None:
+    """Save a project to a file as a model store.
+
+    :param project: The project to be saved.
+    :type project: Project
+    :param path: The path of the file, which is overwritten if it exists.
+    :type path: Union[str, PathLike]
+    :raises OntoumlTypeError: If a field holds a value that stores cannot hold.
+    :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                               pending validation under the deferred validation policy.
+    """
+    with open(path, "wb") as output:
+        write_store(project, output)
+
+
+def write_store(project: Project, output: BinaryIO) -> None:
+    """Write a project to a binary stream as a model store.
+
+    :param project: The project to be written.
+    :type project: Project
+    :param output: The binary stream the store is written to (e.g., a file opened in binary mode).
+    :type output: BinaryIO
+    :raises OntoumlTypeError: If a field holds a value that stores cannot hold.
+    :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                               pending validation under the deferred validation policy.
+    """
+    _check_no_pending(project)
+    sections = _get_sections(project)
+    elements = list(chain.from_iterable(sections.values()))
+    positions = {id(element): position for position, element in enumerate(elements, 1)}
+    table = _ValueTable()
+    pool = array(_UINT32)
+    descriptors = array(_INT64)
+    records = []
+    first_position = 1
+    for element_type in _SECTION_TYPES:
+        section = sections[element_type.__name__]
+        columns, encoded_records = _encode_records(element_type, section, positions, table, pool)
+        stride = sum(2 if kind in _SET_KINDS or kind == _LANGSTRINGS else 1 for _, kind in columns)
+        descriptors.extend((table.add_string(element_type.__name__), first_position, len(section), stride))
+        descriptors.extend((sum(map(len, records)) * 4, len(columns)))
+        slot = 0
+        for name, kind in columns:
+            descriptors.extend((table.add_string(name), kind, slot))
+            slot += 2 if kind in _SET_KINDS or kind == _LANGSTRINGS else 1
+        records.append(encoded_records)
+        first_position += len(section)
+
+    by_id = sorted(elements, key=lambda element: element.__dict__["id"])
+    id_index = array(_UINT32, chain.from_iterable((table.add(element.id), positions[id(element)]) for element in by_id))
+    encoded_strings = [string.encode("utf-8", "surrogatepass") for string in table.strings]
+    string_offsets = array(_INT64, accumulate(map(len, encoded_strings), initial=0))
+
+    regions = (
+        _to_bytes(string_offsets),
+        b"".join(encoded_strings),
+        _to_bytes(table.offsets),
+        _to_bytes(table.entries),
+        _to_bytes(pool),
+        _to_bytes(id_index),
+        _to_bytes(descriptors),
+        b"".join(map(_to_bytes, records)),
+    )
+    offsets = []
+    end = _HEADER.size
+    for region in regions:
+        end += -end % _ALIGNMENT
+        offsets.append(end)
+        end += len(region)
+    counts = (len(_SECTION_TYPES), len(table.strings), len(table.offsets), len(elements))
+    output.write(_HEADER.pack(MAGIC, FORMAT_VERSION, *counts, *offsets))
+    end = _HEADER.size
+    for offset, region in zip(offsets, regions):
+        output.write(bytes(offset - end))
+        output.write(region)
+        end = offset + len(region)
+
+
+def open_store(path: Union[str, PathLike]) -> "StoredProject":
+    """Open a model store, without decoding any of its elements.
+
+    The file is mapped into memory until the store is closed, which is done by StoredProject.close or by using the
+    store as a context manager.
+
+    :param path: The path of the file.
+    :type path: Union[str, PathLike]
+    :return: The project of the store, through which its elements are looked up.
+    :rtype: StoredProject
+    :raises OntoumlValueError: If the file is not a valid store or was saved with another version of the format.
+    """
+    with open(path, "rb") as source:
+        try:
+            data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            raise _invalid_store("It is too short.") from None
+    try:
+        store = _ModelStore(data)
+    except BaseException:
+        data.close()
+        raise
+    return store.get_element(1)
+
+
+def _encode_records(
+    element_type: type[OntoumlElement],
+    elements: list[OntoumlElement],
+    positions: dict[int, int],
+    table: _ValueTable,
+    pool: array,
+) -> tuple[list[tuple[str, int]], array]:
+    """Encode the records of the elements of a section.
+
+    :param element_type: The type of the elements of the section.
+    :type element_type: type[OntoumlElement]
+    :param elements: The elements of the section, all of the same type.
+    :type elements: list[OntoumlElement]
+    :param positions: Positions of the elements in the store, by their identity.
+    :type positions: dict[int, int]
+    :param table: The value table, to which the values of the elements are added.
+    :type table: _ValueTable
+    :param pool: The pool, to which the items of the sets and lists of the elements are added.
+    :type pool: array
+    :return: The name and kind of each column, and the records of the elements, one after the other.
+    :rtype: tuple[list[tuple[str, int]], array]
+    """
+    columns = [(name, values, _get_column_kind(values)) for name, values in _get_columns(element_type, elements)]
+    for name, kind in _OWNED_COLUMNS.get(element_type.__name__, ()):
+        columns.append((name, [_get_owned(element, name, positions) for element in elements], kind))
+
+    encoded_columns = []
+    for name, values, kind in columns:
+        encoded_kind = _REFERENCE_SETS if kind == _REFERENCE_LISTS else kind
+        encoded = _encode_column(elements, name, encoded_kind, values, positions, table)
+        if kind in _SET_KINDS:
+            counts, items = encoded
+            width = 2 if kind == _LANGSTRING_SETS else 1
+            starts = array(_UINT32, (len(pool) + start * width for start in accumulate(counts, initial=0)))
+            encoded_columns.extend((starts[:-1], counts))
+            pool.extend(items)
+        elif kind == _LANGSTRINGS:
+            encoded_columns.extend((encoded[0][0::2], encoded[0][1::2]))
+        else:
+            encoded_columns.append(encoded[0])
+
+    stride = len(encoded_columns)
+    records = array(_UINT32, bytes(4 * stride * len(elements)))
+    for slot, encoded_column in enumerate(encoded_columns):
+        records[slot::stride] = encoded_column
+    return [(name, kind) for name, _, kind in columns], records
+
+
+def _get_owned(element: OntoumlElement, name: str, positions: dict[int, int]) -> list[OntoumlElement]:
+    """Get the elements owned by an element, in the order they are stored.
+
+    :param element: The owner.
+    :type element: OntoumlElement
+    :param name: The name of the column of the owned elements.
+    :type name: str
+    :param positions: Positions of the elements in the store, by their identity.
+    :type positions: dict[int, int]
+    :return: The owned elements.
+    :rtype: list[OntoumlElement]
+    """
+    owned = element.__pydantic_private__[name]
+    if name == "_properties":
+        return owned
+    if name == "_contents":
+        owned = chain.from_iterable(owned.values())
+    return sorted(owned, key=lambda item: positions.get(id(item), 0))
+
+
+def _to_bytes(data: array) -> bytes:
+    if sys.byteorder == "big":
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+class _Section:
+    """Descriptor of the section of the elements of a type in a store."""
+
+    __slots__ = ("element_type", "first_position", "count", "record", "records_offset", "columns")
+
+    def __init__(
+        self,
+        element_type: type[OntoumlElement],
+        first_position: int,
+        count: int,
+        record: struct.Struct,
+        records_offset: int,
+        columns: dict[str, tuple[int, int]],
+    ) -> None:
+        """Initialize a new descriptor.
+
+        :param element_type: The type of the elements.
+        :type element_type: type[OntoumlElement]
+        :param first_position: The position of the first element.
+        :type first_position: int
+        :param count: The number of elements.
+        :type count: int
+        :param record: The layout of the record of an element.
+        :type record: struct.Struct
+        :param records_offset: The offset of the records of the elements in the store.
+        :type records_offset: int
+        :param columns: The kind and first slot of each column, by name.
+        :type columns: dict[str, tuple[int, int]]
+        """
+        self.element_type = element_type
+        self.first_position = first_position
+        self.count = count
+        self.record = record
+        self.records_offset = records_offset
+        self.columns = columns
+
+
+class _ModelStore:
+    """Memory-mapped content of a store, which decodes strings, values and records on demand and caches proxies."""
+
+    def __init__(self, data: mmap.mmap) -> None:
+        """Read the header and the section descriptors of a store.
+
+        :param data: The content of the store.
+        :type data: mmap.mmap
+        :raises OntoumlValueError: If the store is invalid or was saved with another version of the format.
+        """
+        self.data = data
+        if len(data) < _HEADER.size:
+            raise _invalid_store("It is too short.")
+        magic, version, section_count, _, _, self.element_count, *offsets = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise _invalid_store("It does not start with the magic bytes {magic!r}.", magic=MAGIC)
+        if version != FORMAT_VERSION:
+            raise OntoumlValueError(
+                "unsupported_store_version",
+                description="Unsupported model store version.",
+                cause="The store was saved with version {version} of the format, expected {expected}.",
+                solution="Save the project again as a model store with this version of the library.",
+                version=version,
+                expected=FORMAT_VERSION,
+            )
+        if any(offset > len(data) for offset in offsets):
+            raise _invalid_store("It ends unexpectedly.")
+        (
+            self._string_offsets,
+            self._string_data,
+            self._value_offsets,
+            self._value_entries,
+            self._pool,
+            self._id_index,
+            sections_offset,
+            self._records,
+        ) = offsets
+        self._strings: dict[int, str] = {}
+        # Values are immutable, so that they are shared by all the proxies reading them
+        self._values: dict[int, Any] = {0: None}
+        self._proxies: dict[int, StoredElement] = {}
+        self._enum_types: Optional[dict[str, Any]] = None
+        self.sections: list[_Section] = []
+        try:
+            for _ in range(section_count):
+                sections_offset = self._read_section(sections_offset)
+        except (struct.error, KeyError) as error:
+            raise _invalid_store("It has an invalid section descriptor.") from error
+        if not self.sections or self.sections[0].element_type is not Project or self.sections[0].count != 1:
+            raise _invalid_store("It does not start with a section holding its project alone.")
+        self._first_positions = [section.first_position for section in self.sections]
+        self.sections_by_type = {section.element_type.__name__: section for section in self.sections}
+
+    def _read_section(self, offset: int) -> int:
+        """Read the descriptor of a section.
+
+        :param offset: The offset of the descriptor.
+        :type offset: int
+        :return: The offset of the next descriptor.
+        :rtype: int
+        """
+        type_name, first_position, count, stride, records_offset, column_count = _SECTION.unpack_from(self.data, offset)
+        offset += _SECTION.size
+        columns = {}
+        for _ in range(column_count):
+            name, kind, slot = _COLUMN.unpack_from(self.data, offset)
+            columns[self.get_string(name)] = (kind, slot)
+            offset += _COLUMN.size
+        record = struct.Struct(f"<{stride}I")
+        section = _Section(
+            _TYPES_BY_NAME[self.get_string(type_name)],
+            first_position,
+            count,
+            record,
+            self._records + records_offset,
+            columns,
+        )
+        self.sections.append(section)
+        return offset
+
+    def get_string(self, index: int) -> str:
+        """Get a string of the string table.
+
+        :param index: The position of the string in the string table.
+        :type index: int
+        :return: The string.
+        :rtype: str
+        """
+        string = self._strings.get(index)
+        if string is not None:
+            return string
+        start, end = _STRING_BOUNDS.unpack_from(self.data, self._string_offsets + 8 * index)
+        text = self.data[self._string_data + start : self._string_data + end]
+        self._strings[index] = text.decode("utf-8", "surrogatepass")
+        return self._strings[index]
+
+    def get_value(self, code: int) -> Any:
+        """Get a value of the value table, decoding it on first access.
+
+        :param code: The code of the value, 0 for None.
+        :type code: int
+        :return: The value.
+        :rtype: Any
+        """
+        try:
+            return self._values[code]
+        except KeyError:
+            pass
+        data = self.data
+        index = self._value_entries + 8 * _UINT64.unpack_from(data, self._value_offsets + 8 * (code - 1))[0]
+        # Entries are followed by other regions, so that their first two integers can always be read
+        tag, first = _ENTRY_START.unpack_from(data, index)
+        if tag == _STR:
+            value = self.get_string(first)
+        elif tag == _DATETIME:
+            value = _MIN_DATETIME + _MICROSECOND * first
+        elif tag == _ENUM:
+            if self._enum_types is None:
+                self._enum_types = _get_enum_types()
+            member = _ENTRY.unpack_from(data, index + 16)[0]
+            value = self._enum_types[self.get_string(first)][self.get_string(member)]
+        elif tag == _CARDINALITY:
+            upper, is_ordered, is_unique = struct.unpack_from("<3q", data, index + 16)
+            value = Cardinality.of(self.get_value(first), self.get_value(upper), bool(is_ordered), bool(is_unique))
+        elif tag == _INT:
+            value = first
+        elif tag == _TUPLE:
+            codes = struct.unpack_from(f"<{first}q", data, index + 16)
+            value = tuple([self.get_value(item) for item in codes])
+        elif tag == _AWARE_DATETIME:
+            offset = timezone(_MICROSECOND * _ENTRY.unpack_from(data, index + 16)[0])
+            value = (_MIN_DATETIME + _MICROSECOND * first).replace(tzinfo=offset)
+        elif tag == _FLOAT:
+            value = _FLOAT_BITS.unpack(_INT_BITS.pack(first))[0]
+        elif tag == _BIG_INT:
+            value = int(self.get_string(first))
+        else:
+            value = tag == _TRUE
+        self._values[code] = value
+        return value
+
+    def get_element(self, position: int) -> Optional["StoredElement"]:
+        """Get the proxy of an element, creating it on first access.
+
+        :param position: The position of the element, 0 for None.
+        :type position: int
+        :return: The proxy, the same on every access, or None.
+        :rtype: Optional[StoredElement]
+        :raises OntoumlValueError: If the position is out of the store.
+        """
+        proxy = self._proxies.get(position)
+        if proxy is not None or not position:
+            return proxy
+        if not 0 < position <= self.element_count:
+            raise _invalid_store("It refers to the unknown element at position {position}.", position=position)
+        section = self.sections[bisect_right(self._first_positions, position) - 1]
+        proxy_type = _PROXY_TYPES.get(section.element_type.__name__, StoredElement)
+        self._proxies[position] = proxy_type(self, position, section)
+        return self._proxies[position]
+
+    def get_elements(self, section: _Section) -> frozenset["StoredElement"]:
+        """Get the proxies of all elements of a section.
+
+        :param section: The section.
+        :type section: _Section
+        :return: The proxies.
+        :rtype: frozenset[StoredElement]
+        """
+        first_position = section.first_position
+        return frozenset(map(self.get_element, range(first_position, first_position + section.count)))
+
+    def read_record(self, section: _Section, position: int) -> tuple[int, ...]:
+        """Read the record of an element.
+
+        :param section: The section of the element.
+        :type section: _Section
+        :param position: The position of the element.
+        :type position: int
+        :return: The slots of the record.
+        :rtype: tuple[int, ...]
+        """
+        record = section.record
+        return record.unpack_from(self.data, section.records_offset + record.size * (position - section.first_position))
+
+    def decode(self, record: tuple[int, ...], kind: int, slot: int) -> Any:
+        """Decode the value of a column from the record of an element.
+
+        Sets are decoded as frozensets and lists as tuples, as proxies are read-only. Language strings are created
+        anew on each access, as they are mutable.
+
+        :param record: The record of the element.
+        :type record: tuple[int, ...]
+        :param kind: The kind of the column.
+        :type kind: int
+        :param slot: The first slot of the column in the record.
+        :type slot: int
+        :return: The value.
+        :rtype: Any
+        """
+        if kind == _VALUES:
+            return self.get_value(record[slot])
+        if kind == _REFERENCES:
+            return self.get_element(record[slot])
+        if kind == _LANGSTRINGS:
+            return self._get_langstring(record[slot], record[slot + 1])
+        start, count = record[slot], record[slot + 1]
+        if kind == _LANGSTRING_SETS:
+            codes = self._read_pool(start, 2 * count)
+            return frozenset(self._get_langstring(codes[index], codes[index + 1]) for index in range(0, len(codes), 2))
+        items = self._read_pool(start, count)
+        if kind == _VALUE_SETS:
+            return frozenset(map(self.get_value, items))
+        if kind == _REFERENCE_SETS:
+            return frozenset(map(self.get_element, items))
+        return tuple(map(self.get_element, items))
+
+    def _get_langstring(self, text: int, lang: int) -> Optional[LangString]:
+        if not text:
+            return None
+        # As in binary_snapshot._new_langstring, without validating the text and language again
+        langstring = _new(LangString)
+        langstring.text = self.get_value(text)
+        langstring.lang = self.get_value(lang)
+        return langstring
+
+    def _read_pool(self, start: int, count: int) -> tuple[int, ...]:
+        return struct.unpack_from(f"<{count}I", self.data, self._pool + 4 * start)
+
+    def find(self, element_id: str) -> Iterator[int]:
+        """Find the positions of the elements with an ID, by bisecting the ID index.
+
+        :param element_id: The ID.
+        :type element_id: str
+        :return: The positions of the elements with the ID, usually one.
+        :rtype: Iterator[int]
+        """
+        low, high = 0, self.element_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_indexed(middle)[0] < element_id:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self.element_count:
+            indexed_id, position = self._get_indexed(low)
+            if indexed_id != element_id:
+                break
+            yield position
+            low += 1
+
+    def _get_indexed(self, index: int) -> tuple[str, int]:
+        code, position = _INDEX_ENTRY.unpack_from(self.data, self._id_index + _INDEX_ENTRY.size * index)
+        return self.get_value(code), position
+
+    def close(self) -> None:
+        """Close the store, unmapping its file."""
+        self._proxies.clear()
+        self.data.close()
+
+
+class StoredElement:
+    """Read-only proxy of an element of a model store, whose fields are decoded from the store when read.
+
+    Fields are read as attributes, as on elements, and so are the package of an element, the classifier of a
+    property, the enumeration of a literal, the properties of a classifier and the literals of a class. Elements
+    referred to are returned as proxies, sets as frozensets, and lists as tuples. Fields that were added to the type of
+    an element after the store was saved have their defaults.
+    """
+
+    __slots__ = ("_store", "_position", "_section", "_record")
+
+    def __init__(self, store: _ModelStore, position: int, section: _Section) -> None:
+        """Initialize a new proxy, which is done by the store only.
+
+        :param store: The store of the element.
+        :type store: _ModelStore
+        :param position: The position of the element in the store.
+        :type position: int
+        :param section: The section of the element.
+        :type section: _Section
+        """
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_position", position)
+        object.__setattr__(self, "_section", section)
+        object.__setattr__(self, "_record", store.read_record(section, position))
+
+    def __getattr__(self, name: str) -> Any:
+        section = self._section
+        column = section.columns.get(_ALIASES.get(name, name))
+        if column is not None:
+            return self._store.decode(self._record, *column)
+        field = section.element_type.__pydantic_fields__.get(name)
+        if field is None:
+            raise AttributeError(f"{type(self).__name__} of {section.element_type.__name__} has no attribute '{name}'.")
+        default = _get_defaults(section.element_type, name, 1)[0]
+        return frozenset(default) if isinstance(default, set) else default
+
+    def __setattr__(self, _name: str, _value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.element_type.__name__}, id={self.id!r})"
+
+    @property
+    def element_type(self) -> type[OntoumlElement]:
+        """Get the type of the element.
+
+        :return: The type of the element.
+        :rtype: type[OntoumlElement]
+        """
+        return self._section.element_type
+
+    @property
+    def project(self) -> "StoredProject":
+        """Get the project of the element.
+
+        :return: The project.
+        :rtype: StoredProject
+        """
+        return self._store.get_element(1)
+
+
+class StoredPackage(StoredElement):
+    """Read-only proxy of a package of a model store."""
+
+    __slots__ = ()
+
+    def get_contents(self) -> dict[str, frozenset[StoredElement]]:
+        contents = dict.fromkeys(_CONTENT_TYPES, frozenset())
+        for type_name, elements in groupby(self._get_contents(), attrgetter("element_type.__name__")):
+            contents[type_name] = frozenset(elements)
+        return contents
+
+    def get_content_by_id(self, content_type: str, content_id: str) -> Optional[StoredElement]:
+        for content in self._get_contents():
+            if content.element_type.__name__ == content_type and content.id == content_id:
+                return content
+        return None
+
+    def get_anchors(self) -> frozenset[StoredElement]:
+        return self.get_contents()["Anchor"]
+
+    def get_binary_relations(self) -> frozenset[StoredElement]:
+        return self.get_contents()["BinaryRelation"]
+
+    def get_classes(self) -> frozenset[StoredElement]:
+        return self.get_contents()["Class"]
+
+    def get_generalizations(self) -> frozenset[StoredElement]:
+        return self.get_contents()["Generalization"]
+
+    def get_generalization_sets(self) -> frozenset[StoredElement]:
+        return self.get_contents()["GeneralizationSet"]
+
+    def get_nary_relations(self) -> frozenset[StoredElement]:
+        return self.get_contents()["NaryRelation"]
+
+    def get_notes(self) -> frozenset[StoredElement]:
+        return self.get_contents()["Note"]
+
+    def get_packages(self) -> frozenset[StoredElement]:
+        return self.get_contents()["Package"]
+
+    def get_anchor_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("Anchor", content_id)
+
+    def get_binary_relation_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("BinaryRelation", content_id)
+
+    def get_class_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("Class", content_id)
+
+    def get_generalization_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("Generalization", content_id)
+
+    def get_generalization_set_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("GeneralizationSet", content_id)
+
+    def get_nary_relation_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("NaryRelation", content_id)
+
+    def get_note_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("Note", content_id)
+
+    def get_package_by_id(self, content_id: str) -> Optional[StoredElement]:
+        return self.get_content_by_id("Package", content_id)
+
+    def _get_contents(self) -> tuple[StoredElement, ...]:
+        # Contents are stored in the order of their positions, hence grouped by type
+        return self._store.decode(self._record, *self._section.columns["_contents"])
+
+
+class StoredProject(StoredElement):
+    """Read-only proxy of the project of a model store, through which its elements are looked up.
+
+    Elements are looked up by ID in the ID index of the store, in logarithmic time, without decoding other elements.
+    Getting all elements of a type creates the proxies of all of them.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "StoredProject":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the store, after which its proxies can no longer be read."""
+        self._store.close()
+
+    def get_elements(self) -> dict[str, frozenset[StoredElement]]:
+        store = self._store
+        return {
+            type_name: store.get_elements(section)
+            for type_name, section in store.sections_by_type.items()
+            if type_name != "Project"
+        }
+
+    def get_element_by_id(self, element_type: str, element_id: str) -> Optional[StoredElement]:
+        store = self._store
+        for position in store.find(element_id):
+            element = store.get_element(position)
+            if element.element_type.__name__ == element_type:
+                return element
+        return None
+
+    def get_anchors(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Anchor")
+
+    def get_binary_relations(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("BinaryRelation")
+
+    def get_classes(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Class")
+
+    def get_diagrams(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Diagram")
+
+    def get_generalizations(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Generalization")
+
+    def get_generalization_sets(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("GeneralizationSet")
+
+    def get_literals(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Literal")
+
+    def get_nary_relations(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("NaryRelation")
+
+    def get_notes(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Note")
+
+    def get_packages(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Package")
+
+    def get_properties(self) -> frozenset[StoredElement]:
+        return self._get_section_elements("Property")
+
+    def get_anchor_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Anchor", element_id)
+
+    def get_binary_relation_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("BinaryRelation", element_id)
+
+    def get_class_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Class", element_id)
+
+    def get_diagram_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Diagram", element_id)
+
+    def get_generalization_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Generalization", element_id)
+
+    def get_generalization_set_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("GeneralizationSet", element_id)
+
+    def get_literal_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Literal", element_id)
+
+    def get_nary_relation_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("NaryRelation", element_id)
+
+    def get_note_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Note", element_id)
+
+    def get_package_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Package", element_id)
+
+    def get_property_by_id(self, element_id: str) -> Optional[StoredElement]:
+        return self.get_element_by_id("Property", element_id)
+
+    def _get_section_elements(self, element_type: str) -> frozenset[StoredElement]:
+        store = self._store
+        section = store.sections_by_type.get(element_type)
+        return frozenset() if section is None else store.get_elements(section)
+
+
+_PROXY_TYPES: dict[str, type[StoredElement]] = {"Project": StoredProject, "Package": StoredPackage}
+
+
+def _invalid_store(cause: str, **arguments: Any) -> OntoumlValueError:
+    return OntoumlValueError(
+        "invalid_store",
+        description="Invalid model store.",
+        cause=cause,
+        solution="Ensure the store was written by write_store or save_store and is complete.",
+        **arguments,
+    )
@@ -0,0 +1,191 @@
+"""This module maps the elements of ontouml-py to and from the OntoUML JSON schema used by ontouml-js and its tools.
+
+In the schema, a project holds its root package in the 'model' field, and packages hold their contents in nested
+'contents' arrays. Classes hold their attributes ('properties') and literals, relations hold their ends ('properties'),
+and references between elements are objects with the 'id' and 'type' of the referenced element. Binary and n-ary
+relations share the schema type 'Relation', told apart by their number of ends.
+
+Fields of ontouml-py without a counterpart in the schema (e.g., alternative names or creation timestamps) are not
+serialized. Custom properties are serialized as the element's 'propertyAssignments'.
+"""
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from langstring import LangString
+
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.enumerations.aggregationkind import AggregationKind
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+
+# Schema type of each concrete ontouml-py type that can be serialized
+SCHEMA_TYPES: dict[str, str] = {
+    "BinaryRelation": "Relation",
+    "Class": "Class",
+    "Generalization": "Generalization",
+    "GeneralizationSet": "GeneralizationSet",
+    "Literal": "Literal",
+    "NaryRelation": "Relation",
+    "Package": "Package",
+    "Project": "Project",
+    "Property": "Property",
+}
+
+# Concrete types of the elements a package may contain in the schema, in the order they are serialized
+PACKAGE_CONTENT_TYPES: tuple[str, ...] = (
+    "Package",
+    "Class",
+    "BinaryRelation",
+    "NaryRelation",
+    "Generalization",
+    "GeneralizationSet",
+)
+
+NATURE_NAMES: dict[OntologicalNature, str] = {
+    OntologicalNature.ABSTRACT_NATURE: "abstract",
+    OntologicalNature.COLLECTIVE_NATURE: "collective",
+    OntologicalNature.EVENT_NATURE: "event",
+    OntologicalNature.EXTRINSIC_MODE_NATURE: "extrinsic-mode",
+    OntologicalNature.FUNCTIONAL_COMPLEX_NATURE: "functional-complex",
+    OntologicalNature.INTRINSIC_MODE_NATURE: "intrinsic-mode",
+    OntologicalNature.QUALITY_NATURE: "quality",
+    OntologicalNature.QUANTITY_NATURE: "quantity",
+    OntologicalNature.RELATOR_NATURE: "relator",
+    OntologicalNature.SITUATION_NATURE: "situation",
+    OntologicalNature.TYPE_NATURE: "type",
+}
+
+AGGREGATION_KIND_NAMES: dict[AggregationKind, str] = {
+    AggregationKind.NONE: "NONE",
+    AggregationKind.COMPOSITE: "COMPOSITE",
+    AggregationKind.SHARED: "SHARED",
+}
+
+NATURES_BY_NAME: dict[str, OntologicalNature] = {name: nature for nature, name in NATURE_NAMES.items()}
+AGGREGATION_KINDS_BY_NAME: dict[str, AggregationKind] = {name: kind for kind, name in AGGREGATION_KIND_NAMES.items()}
+
+
+def format_cardinality(cardinality: Cardinality) -> str:
+    """Format a cardinality as its bounds separated by '..' (e.g., '1..*').
+
+    :param cardinality: The cardinality to be formatted.
+    :type cardinality: Cardinality
+    :return: The cardinality, with missing bounds as '0' (lower) and '*' (upper).
+    :rtype: str
+    """
+    lower_bound = "0" if cardinality.lower_bound is None else cardinality.lower_bound
+    upper_bound = "*" if cardinality.upper_bound is None else cardinality.upper_bound
+    return f"{lower_bound}..{upper_bound}"
+
+
+def parse_cardinality(text: Optional[str], is_ordered: bool = False) -> Cardinality:
+    """Parse a cardinality formatted as its bounds separated by '..' (e.g., '1..*') or as a single bound (e.g., '1').
+
+    :param text: The formatted cardinality, or None for the default one.
+    :type text: Optional[str]
+    :param is_ordered: Whether the values of the property are ordered, which the schema keeps apart.
+    :type is_ordered: bool
+    :return: The shared instance of the cardinality. Numeric bounds are parsed as integers and other bounds (e.g., '*')
+             are kept as strings. A single '*' stands for '0..*'.
+    :rtype: Cardinality
+    """
+    if text is None:
+        return Cardinality.of(is_ordered=is_ordered)
+    lower_bound, separator, upper_bound = text.partition("..")
+    if not separator:
+        lower_bound, upper_bound = ("0", "*") if text.strip() == "*" else (text, text)
+    return Cardinality.of(_parse_bound(lower_bound), _parse_bound(upper_bound), is_ordered=is_ordered)
+
+
+def format_text(text: Optional[LangString]) -> Optional[Union[str, dict[str, str]]]:
+    """Format a language-tagged text as a multilingual text of the schema.
+
+    :param text: The text to be formatted.
+    :type text: Optional[LangString]
+    :return: A plain string for texts without language, an object mapping the language to the text otherwise, or
+             None if there is no text.
+    :rtype: Optional[Union[str, dict[str, str]]]
+    """
+    if text is None:
+        return None
+    return {text.lang: text.text} if text.lang else text.text
+
+
+def parse_text(text: Optional[Union[str, dict[str, str]]]) -> Optional[LangString]:
+    """Parse a multilingual text of the schema as a language-tagged text.
+
+    :param text: A plain string, an object mapping languages to texts, or None.
+    :type text: Optional[Union[str, dict[str, str]]]
+    :return: The text, in the first language given if there are several, or None if there is no text.
+    :rtype: Optional[LangString]
+    """
+    if isinstance(text, dict):
+        return next((LangString(value, lang or None) for lang, value in text.items()), None)
+    return None if text is None else LangString(text)
+
+
+def format_names(names: set[LangString]) -> Optional[Union[str, dict[str, str]]]:
+    """Format a set of names in different languages as a multilingual text of the schema.
+
+    :param names: The names to be formatted.
+    :type names: set[LangString]
+    :return: A plain string for a single name without language, an object mapping each language to its name
+             otherwise (names without language under the empty key), or None if there are no names.
+    :rtype: Optional[Union[str, dict[str, str]]]
+    """
+    if not names:
+        return None
+    if len(names) == 1:
+        return format_text(next(iter(names)))
+    return {name.lang or "": name.text for name in sorted(names, key=lambda name: (name.lang or "", name.text))}
+
+
+def parse_names(names: Optional[Union[str, dict[str, str]]]) -> set[LangString]:
+    """Parse a multilingual text of the schema as a set of names in different languages.
+
+    :param names: A plain string, an object mapping languages to names (names without language under the empty key),
+                  or None.
+    :type names: Optional[Union[str, dict[str, str]]]
+    :return: The names.
+    :rtype: set[LangString]
+    """
+    if isinstance(names, dict):
+        return {LangString(value, lang or None) for lang, value in names.items()}
+    return set() if names is None else {LangString(names)}
+
+
+def format_property_assignments(custom_properties: set[tuple[str, Any]]) -> Optional[dict[str, Any]]:
+    """Format the custom properties of an element as the schema's property assignments.
+
+    :param custom_properties: Pairs of property name and value.
+    :type custom_properties: set[tuple[str, Any]]
+    :return: An object mapping each name to its value, or None if there are no custom properties.
+    :rtype: Optional[dict[str, Any]]
+    """
+    return dict(sorted(custom_properties, key=lambda pair: pair[0])) if custom_properties else None
+
+
+def parse_property_assignments(property_assignments: Optional[dict[str, Any]]) -> set[tuple[str, Any]]:
+    """Parse the property assignments of an element as its custom properties.
+
+    :param property_assignments: An object mapping each property name to its value, or None.
+    :type property_assignments: Optional[dict[str, Any]]
+    :return: Pairs of property name and value. Arrays and objects are converted into tuples, so that they are hashable.
+    :rtype: set[tuple[str, Any]]
+    """
+    if not property_assignments:
+        return set()
+    return {(name, _freeze(value)) for name, value in property_assignments.items()}
+
+
+def _parse_bound(bound: str) -> Union[str, int]:
+    bound = bound.strip()
+    return int(bound) if bound.isdecimal() else bound
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    return value
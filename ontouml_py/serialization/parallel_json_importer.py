@@ -0,0 +1,330 @@
+"""This module imports OntoUML JSON documents with a pool of worker processes decoding and validating their elements.
+
+The parent process reads the nesting of the document (the project, its model and the packages in it) as the sequential
+importer does, creating packages as they are read. The other contents of each package are not decoded: their text is
+split into chunks of up to chunk_size elements of the same package, which are decoded and validated in a
+ProcessPoolExecutor. Workers create the elements of each chunk in a scratch project, with all the validation of their
+constructors, and send back compact records holding the validated values of their fields, together with their
+unresolved references.
+
+The parent rebuilds the elements from the records without validating them again, registers them in the project and in
+their packages, and links the references of the whole document once all chunks are done. As the decoding and
+validation of elements, which take most of the time of an import, run in the workers, throughput grows with the number
+of workers until rebuilding elements in the parent becomes the bottleneck.
+
+To bound memory use, at most two chunks per worker are in flight, and the elements of a chunk are built as soon as it
+is done, in the order chunks were read. The garbage collector is paused while the parent builds elements, as the
+objects created by an import are not garbage and collections would otherwise traverse the growing project repeatedly.
+"""
+import gc
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any
+from typing import BinaryIO
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+from ontouml_py.model.binaryrelation import BinaryRelation
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.classifier import Classifier
+from ontouml_py.model.generalizationset import GeneralizationSet
+from ontouml_py.model.literal import Literal
+from ontouml_py.model.modelelement import ModelElement
+from ontouml_py.model.naryrelation import NaryRelation
+from ontouml_py.model.ontoumlelement import _construct_element
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.ontoumlelement import _untracked_changes
+from ontouml_py.model.ontoumlelement import shared_timestamp
+from ontouml_py.model.package import Package
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import _register_elements
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.property import Property
+from ontouml_py.serialization.compressed_io import open_compressed
+from ontouml_py.serialization.json_importer import _JsonReader
+from ontouml_py.serialization.json_importer import _ProjectLoader
+from ontouml_py.utils.errors import OntoumlValueError
+
+# Record of an element: its type name, the values of its fields, the names of the fields explicitly set, and the
+# records of its properties and literals
+_Record = tuple[str, tuple[Any, ...], tuple[str, ...], tuple["_Record", ...], tuple["_Record", ...]]
+# Arguments, general and specific references of a generalization to be created once its ends are
+_GeneralizationRecord = tuple[dict[str, Any], Any, Any]
+# Reference of an element, as (element ID, field name, reference)
+_ReferenceRecord = tuple[str, str, Any]
+# Result of a worker for a chunk: the records of its elements, its generalizations and its unresolved references
+_ChunkResult = tuple[list[_Record], list[_GeneralizationRecord], list[_ReferenceRecord]]
+
+_RECORD_TYPES: dict[str, type[ModelElement]] = {
+    element_type.__name__: element_type
+    for element_type in (BinaryRelation, Class, GeneralizationSet, Literal, NaryRelation, Property)
+}
+# Position of the cardinality in the values of the records of properties
+_CARDINALITY_INDEX: int = _get_field_names(Property).index("cardinality")
+
+
+def import_json_parallel(
+    source: Union[TextIO, BinaryIO],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 500,
+    buffer_size: int = 1 << 16,
+) -> Project:
+    """Read a project from a text stream holding an OntoUML JSON document, using a pool of worker processes.
+
+    The imported project is the same as the one given by import_json, which also describes how binary streams are
+    read.
+
+    :param source: The stream the document is read from (e.g., a file opened in text or binary mode).
+    :type source: Union[TextIO, BinaryIO]
+    :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+    :type max_workers: Optional[int]
+    :param chunk_size: Maximum number of elements sent to a worker at a time.
+    :type chunk_size: int
+    :param buffer_size: Number of characters read from the stream at a time.
+    :type buffer_size: int
+    :raises OntoumlValueError: If max_workers, chunk_size or buffer_size is lower than one, or if the document refers to
+                               elements it does not contain, repeats IDs, or has elements of unknown types.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    :return: The project, with its root package holding the model of the document.
+    :rtype: Project
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    for name, value in (("max_workers", max_workers), ("chunk_size", chunk_size), ("buffer_size", buffer_size)):
+        if value < 1:
+            raise OntoumlValueError(
+                "invalid_import_parameter",
+                description="Invalid {name} for import.",
+                cause="Expected a positive integer, got {value}.",
+                solution="Set {name} to 1 or more.",
+                name=name,
+                value=value,
+            )
+    if not isinstance(source, io.TextIOBase):
+        with open_compressed(source, "rt") as text_source:
+            return import_json_parallel(text_source, max_workers, chunk_size, buffer_size)
+    # As in import_json, the elements created by each process share a timestamp, and loading them is not a change
+    with ProcessPoolExecutor(max_workers) as executor, shared_timestamp(), _untracked_changes():
+        loader = _ParallelProjectLoader(_JsonReader(source, buffer_size), executor, 2 * max_workers, chunk_size)
+        return loader.load()
+
+
+class _ParallelProjectLoader(_ProjectLoader):
+    """Loader that sends the text of the elements in packages to worker processes and builds them from their records."""
+
+    _reader: _JsonReader
+    # Created by load before any element is built
+    _project: Project
+
+    def __init__(self, reader: _JsonReader, executor: ProcessPoolExecutor, max_in_flight: int, chunk_size: int) -> None:
+        """Initialize a new loader.
+
+        :param reader: The reader of the document.
+        :type reader: _JsonReader
+        :param executor: The pool of worker processes.
+        :type executor: ProcessPoolExecutor
+        :param max_in_flight: Maximum number of chunks sent to workers and not built yet.
+        :type max_in_flight: int
+        :param chunk_size: Maximum number of elements in each chunk.
+        :type chunk_size: int
+        """
+        super().__init__(reader)
+        self._executor = executor
+        self._max_in_flight = max_in_flight
+        self._chunk_size = chunk_size
+        # Package of the chunk being read and the texts of its elements
+        self._chunk_package: Optional[Package] = None
+        self._chunk: list[str] = []
+        # Chunks sent to workers, in the order they were read
+        self._in_flight: deque[tuple[Package, Future[_ChunkResult]]] = deque()
+
+    def load(self) -> Project:
+        """Read the project, building its elements as workers finish them, and link the references between them.
+
+        :return: The project.
+        :rtype: Project
+        """
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return super().load()
+        finally:
+            if collecting:
+                gc.enable()
+
+    def _read_element(self, package: Optional[Package]) -> Optional[ProjectElement]:
+        """Read the next element, creating it if it is a package and adding its text to a chunk otherwise.
+
+        Members are read until the element's type (or its contents, which only packages have) tells whether it is a
+        package. The text of other elements is then consumed without being decoded.
+
+        :param package: The package that contains the element, if any.
+        :type package: Optional[Package]
+        :return: The created package, or None for other elements, which are built later.
+        :rtype: Optional[ProjectElement]
+        """
+        if package is None:
+            return super()._read_element(package)
+
+        reader = self._reader
+        reader.mark()
+        keys = reader.iter_object()
+        fields: dict[str, Any] = {}
+        for key in keys:
+            if key == "contents":
+                reader.read_marked()
+                return self._read_members(package, chain((key,), keys), fields)
+            fields[key] = reader.read_value()
+            if key == "type":
+                if fields[key] == "Package":
+                    reader.read_marked()
+                    return self._read_members(package, keys, fields)
+                reader.skip_to_object_end()
+                break
+        self._add_to_chunk(package, reader.read_marked())
+        return None
+
+    def _add_to_chunk(self, package: Package, text: str) -> None:
+        if package is not self._chunk_package or len(self._chunk) == self._chunk_size:
+            self._send_chunk()
+            self._chunk_package = package
+        self._chunk.append(text)
+
+    def _send_chunk(self) -> None:
+        """Send the chunk being read to a worker, first building chunks already sent if too many are in flight."""
+        package = self._chunk_package
+        if not self._chunk or package is None:
+            return
+        while len(self._in_flight) >= self._max_in_flight:
+            self._build_chunk(*self._in_flight.popleft())
+        text = "[" + ",".join(self._chunk) + "]"
+        self._in_flight.append((package, self._executor.submit(_parse_chunk, text)))
+        self._chunk = []
+
+    def _build_chunk(self, package: Package, future: Future[_ChunkResult]) -> None:
+        """Build the elements of a chunk from the records sent by its worker.
+
+        :param package: The package that contains the elements of the chunk.
+        :type package: Package
+        :param future: The result of the worker: the records of the elements, the generalizations to be created and
+                       the unresolved references.
+        :type future: Future[_ChunkResult]
+        """
+        records, generalizations, references = future.result()
+        # Storages are accessed directly, bypassing the slower BaseModel.__getattr__, as in the rest of _build
+        package_private: Any = package.__pydantic_private__
+        contents = package_private["_contents"]
+        for record in records:
+            element = self._build(record, None)
+            element.__dict__["_package"] = package
+            contents[record[0]].add(element)
+        for arguments, general, specific in generalizations:
+            self._generalizations.append((package, arguments, general, specific))
+        elements = self._elements
+        for element_id, field_name, reference in references:
+            self._references.append((elements[element_id], field_name, reference))
+
+    def _build(self, record: _Record, owner: Optional[ModelElement]) -> ModelElement:
+        """Build an element from its record, repeating what its type's constructor does besides validating its fields.
+
+        :param record: The record of the element.
+        :type record: _Record
+        :param owner: The classifier that owns the element, if it is a property, or the class, if it is a literal.
+        :type owner: Optional[ModelElement]
+        :return: The element, registered in the project and in its owner.
+        :rtype: ModelElement
+        """
+        type_name, values, fields_set, properties, literals = record
+        if type_name == "Property":
+            values = _intern_cardinality(values)
+        element = _construct_element(_RECORD_TYPES[type_name], values, fields_set)
+        _register_elements(self._project, type_name, (element,))
+        if isinstance(element, Classifier):
+            self._project._add_classifier_to_taxonomy(element)
+        elif owner is not None:
+            # Always dictionaries, as both types have private attributes
+            element_private: Any = element.__pydantic_private__
+            owner_private: Any = owner.__pydantic_private__
+            if type_name == "Property":
+                element_private["_classifier"] = owner
+                owner_private["_properties"].append(element)
+            else:
+                element_private["_enumeration"] = owner
+                owner_private["_literals"].add(element)
+        self._register(element)
+        for child_record in chain(properties, literals):
+            self._build(child_record, element)
+        return element
+
+    def _link(self) -> None:
+        """Build the chunks still in flight and then link the references of the whole document."""
+        self._send_chunk()
+        while self._in_flight:
+            self._build_chunk(*self._in_flight.popleft())
+        super()._link()
+
+
+def _parse_chunk(text: str) -> _ChunkResult:
+    """Decode and validate a chunk of elements in a worker process.
+
+    :param text: A JSON array with the elements of the chunk, which are not packages.
+    :type text: str
+    :return: The records of the elements, the arguments and ends of the generalizations to be created, and the
+             unresolved references of the elements, as (element ID, field name, reference).
+    :rtype: _ChunkResult
+    """
+    loader = _ProjectLoader(None, Project())
+    records: list[_Record] = []
+    with shared_timestamp(), _untracked_changes():
+        for fields in json.loads(text):
+            element = loader._create_element(None, fields)
+            # Generalizations, which are created when linking, give None
+            if isinstance(element, ModelElement):
+                records.append(_to_record(element))
+    generalizations = [(arguments, general, specific) for _, arguments, general, specific in loader._generalizations]
+    references = [
+        (element.__dict__["id"], field_name, reference) for element, field_name, reference in loader._references
+    ]
+    return records, generalizations, references
+
+
+def _intern_cardinality(values: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Replace the cardinality in the values of a property record with its shared instance.
+
+    Records are unpickled with copies of the cardinalities interned in the workers, one per chunk, which would
+    otherwise be kept by the imported properties.
+
+    :param values: The values of the fields of a property.
+    :type values: tuple[Any, ...]
+    :return: The values, with the cardinality interned, unless it is of a subtype of Cardinality.
+    :rtype: tuple[Any, ...]
+    """
+    cardinality = values[_CARDINALITY_INDEX]
+    if type(cardinality) is not Cardinality:
+        return values
+    interned = Cardinality.of(
+        cardinality.lower_bound, cardinality.upper_bound, cardinality.is_ordered, cardinality.is_unique
+    )
+    return (*values[:_CARDINALITY_INDEX], interned, *values[_CARDINALITY_INDEX + 1 :])
+
+
+def _to_record(element: ModelElement) -> _Record:
+    """Get the record of a validated element, including the records of its properties and literals.
+
+    :param element: The element.
+    :type element: ModelElement
+    :return: The record.
+    :rtype: _Record
+    """
+    element_dict = element.__dict__
+    values = tuple(element_dict[name] for name in _get_field_names(type(element)))
+    properties = tuple(_to_record(owned) for owned in element.properties) if isinstance(element, Classifier) else ()
+    literals = tuple(_to_record(owned) for owned in element.literals) if isinstance(element, Class) else ()
+    return type(element).__name__, values, tuple(element.__pydantic_fields_set__), properties, literals
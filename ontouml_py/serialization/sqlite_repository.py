@@ -0,0 +1,673 @@
+"""This module persists OntoUML projects in SQLite databases, which hold many projects queried without loading them.
+
+A repository is a SQLite database with one table per element type, the project included, in which each element is a
+row. Besides the encoded values of its fields, each row has indexed columns for the IDs of its project, of itself and
+of its package, and for its stereotype. The texts of the names of elements are kept in a separate indexed table.
+
+Queries by stereotype, package and name are translated into SQL, so that they run in the database, across all of its
+projects, and return ElementRecord objects, which load the project of their element only when the element is
+accessed. Projects are loaded as binary snapshots are (see ontouml_py.serialization.binary_snapshot): elements are
+rebuilt from values that were already validated when saved, without validating them again.
+
+The rows of a project are kept in memory once it is loaded or saved, so that saving it again only writes the rows of
+the elements that changed meanwhile, including those whose sets were changed in place, without an assignment, and
+deletes the rows of the elements removed from it.
+"""
+import gc
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from enum import Enum
+from itertools import chain
+from os import PathLike
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from langstring import LangString
+
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.enumerations.ontouml_enum import OntoumlEnum
+from ontouml_py.model.ontoumlelement import _construct_elements
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import _register_elements
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.serialization.binary_snapshot import _check_no_pending
+from ontouml_py.serialization.binary_snapshot import _get_defaults
+from ontouml_py.serialization.binary_snapshot import _get_enum_types
+from ontouml_py.serialization.binary_snapshot import _new
+from ontouml_py.serialization.binary_snapshot import _rebuild_indexes
+from ontouml_py.serialization.binary_snapshot import _SECTION_TYPES
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+
+SCHEMA_VERSION: int = 1
+
+# Tables of the element types, in the order elements are loaded, so that owners are built before what they own
+_TABLES: dict[str, str] = {
+    "Project": "project",
+    "Package": "package",
+    "Class": "class",
+    "BinaryRelation": "binary_relation",
+    "NaryRelation": "nary_relation",
+    "Property": "property",
+    "Literal": "literal",
+    "Generalization": "generalization",
+    "GeneralizationSet": "generalization_set",
+    "Note": "note",
+    "Anchor": "anchor",
+    "Diagram": "diagram",
+}
+
+# Columns of the rows of elements, in the order of the tuples of rows kept in memory
+_COLUMNS = "project_id, id, package_id, owner_type, owner_id, owner_index, stereotype, fields_set, data, refs"
+
+# Type names and IDs of elements, identifying their rows within a project
+_Key = tuple[str, str]
+_Row = tuple[Any, ...]
+
+_JSON_SEPARATORS = (",", ":")
+
+
+class SqliteRepository:
+    """Repository of OntoUML projects stored in a SQLite database.
+
+    Projects loaded from or saved to a repository are cached by it, so that loading a project again returns the same
+    object, and so that saving it again writes only what changed. Queries run on the database, so they do not see
+    changes to loaded projects that have not been saved yet.
+    """
+
+    def __init__(self, path: Union[str, PathLike]) -> None:
+        """Open a repository, creating its database and tables if they do not exist.
+
+        :param path: The path of the database file, or ":memory:" for a repository in memory.
+        :type path: Union[str, PathLike]
+        :raises OntoumlValueError: If the database was created with another version of the schema.
+        """
+        self._connection = sqlite3.connect(path)
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._connection.close()
+            raise OntoumlValueError(
+                "unsupported_repository_version",
+                description="Unsupported SQLite repository version.",
+                cause="The repository was created with version {version} of the schema, expected {expected}.",
+                solution="Open the repository with the version of the library that created it, and save its projects "
+                "to a new repository with this one.",
+                version=version,
+                expected=SCHEMA_VERSION,
+            )
+        with self._connection:
+            for table in _TABLES.values():
+                self._connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table}" (project_id TEXT NOT NULL, id TEXT NOT NULL, '
+                    "package_id TEXT, owner_type TEXT, owner_id TEXT, owner_index INTEGER, stereotype TEXT, "
+                    "fields_set TEXT NOT NULL, data TEXT NOT NULL, refs TEXT NOT NULL, PRIMARY KEY (project_id, id))"
+                )
+                self._connection.execute(f'CREATE INDEX IF NOT EXISTS "{table}_id" ON "{table}" (id)')
+                self._connection.execute(f'CREATE INDEX IF NOT EXISTS "{table}_stereotype" ON "{table}" (stereotype)')
+                self._connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{table}_package" ON "{table}" (project_id, package_id)'
+                )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS "name" (project_id TEXT NOT NULL, element_type TEXT NOT NULL, '
+                "element_id TEXT NOT NULL, text TEXT NOT NULL, lang TEXT)"
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS "name_text" ON "name" (text)')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS "name_element" ON "name" (project_id, element_type, element_id)'
+            )
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._projects: dict[str, Project] = {}
+        # Rows of the elements of each cached project, as last loaded or saved
+        self._rows: dict[str, dict[_Key, _Row]] = {}
+
+    def __enter__(self) -> "SqliteRepository":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database of the repository. Unsaved changes to loaded projects are not written."""
+        self._connection.close()
+
+    def get_project_ids(self) -> list[str]:
+        """Get the IDs of the projects in the repository.
+
+        :return: The IDs, sorted.
+        :rtype: list[str]
+        """
+        return [row[0] for row in self._connection.execute('SELECT id FROM "project" ORDER BY id')]
+
+    def save_project(self, project: Project) -> int:
+        """Save a project, writing only the rows of its elements that changed since it was last loaded or saved.
+
+        :param project: The project to be saved, replacing the saved project with the same ID, if any.
+        :type project: Project
+        :return: The number of rows of elements written or deleted.
+        :rtype: int
+        :raises OntoumlTypeError: If a field holds a value that repositories cannot store.
+        :raises OntoumlValueError: If an element refers to an element that is not in the project, or if assignments are
+                                   pending validation under the deferred validation policy.
+        """
+        _check_no_pending(project)
+        project_id = project.id
+        saved = self._rows.get(project_id)
+        if saved is None or self._projects.get(project_id) is not project:
+            saved = self._read_rows(project_id)
+        rows, elements = _encode_project(project)
+        changed = [key for key, row in rows.items() if saved.get(key) != row]
+        removed = [key for key in saved if key not in rows]
+
+        with self._connection:
+            for type_name, element_id in removed:
+                self._connection.execute(
+                    f'DELETE FROM "{_TABLES[type_name]}" WHERE project_id = ? AND id = ?', (project_id, element_id)
+                )
+            for key in changed:
+                self._connection.execute(
+                    f'INSERT OR REPLACE INTO "{_TABLES[key[0]]}" ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    rows[key],
+                )
+            for type_name, element_id in chain(removed, changed):
+                self._connection.execute(
+                    'DELETE FROM "name" WHERE project_id = ? AND element_type = ? AND element_id = ?',
+                    (project_id, type_name, element_id),
+                )
+            self._connection.executemany(
+                'INSERT INTO "name" (project_id, element_type, element_id, text, lang) VALUES (?, ?, ?, ?, ?)',
+                (
+                    (project_id, *key, name.text, name.lang)
+                    for key in changed
+                    for name in elements[key].__dict__.get("names") or ()
+                ),
+            )
+        self._projects[project_id] = project
+        self._rows[project_id] = rows
+        return len(changed) + len(removed)
+
+    def load_project(self, project_id: str) -> Project:
+        """Load a project, unless it was already loaded or saved, in which case the same project is returned.
+
+        Elements are rebuilt without validating their fields again. The garbage collector is paused meanwhile, as
+        none of the objects created are garbage.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :return: The project.
+        :rtype: Project
+        :raises OntoumlValueError: If the repository has no project with the ID or holds an invalid one.
+        """
+        project = self._projects.get(project_id)
+        if project is None:
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                project = self._read_project(project_id)
+            finally:
+                if collecting:
+                    gc.enable()
+        return project
+
+    def delete_project(self, project_id: str) -> None:
+        """Delete a project and its elements from the repository.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        """
+        with self._connection:
+            for table in (*_TABLES.values(), "name"):
+                self._connection.execute(f'DELETE FROM "{table}" WHERE project_id = ?', (project_id,))
+        self._projects.pop(project_id, None)
+        self._rows.pop(project_id, None)
+
+    def find(
+        self,
+        element_type: str,
+        project_id: Optional[str] = None,
+        stereotype: Optional[Union[Enum, str]] = None,
+        package_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> list["ElementRecord"]:
+        """Find the saved elements of a type that match all the given criteria, in the database.
+
+        :param element_type: The name of the type of the elements (e.g., "Class").
+        :type element_type: str
+        :param project_id: If provided, only elements of the project with this ID are found.
+        :type project_id: Optional[str]
+        :param stereotype: If provided, only elements with this stereotype are found.
+        :type stereotype: Optional[Union[Enum, str]]
+        :param package_id: If provided, only elements directly in the package with this ID are found.
+        :type package_id: Optional[str]
+        :param name: If provided, only elements with a name with this text, in any language, are found.
+        :type name: Optional[str]
+        :return: The records of the elements found, sorted by project ID and element ID.
+        :rtype: list[ElementRecord]
+        :raises OntoumlValueError: If element_type is not the name of a type of element.
+        """
+        table = _TABLES.get(element_type)
+        if table is None:
+            raise OntoumlValueError(
+                "unknown_element_type",
+                description="Invalid element type for a query.",
+                cause="Expected the name of a type of element, one of {types}, got {element_type!r}.",
+                solution="Use the name of the type of the elements to be found.",
+                types=", ".join(_TABLES),
+                element_type=element_type,
+            )
+        conditions = []
+        parameters: list[Any] = []
+        if project_id is not None:
+            conditions.append("e.project_id = ?")
+            parameters.append(project_id)
+        if stereotype is not None:
+            conditions.append("e.stereotype = ?")
+            parameters.append(_get_stereotype_key(stereotype))
+        if package_id is not None:
+            conditions.append("e.package_id = ?")
+            parameters.append(package_id)
+        if name is not None:
+            conditions.append(
+                'EXISTS (SELECT 1 FROM "name" n WHERE n.project_id = e.project_id AND n.element_type = ? '
+                "AND n.element_id = e.id AND n.text = ?)"
+            )
+            parameters.extend((element_type, name))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f'SELECT e.project_id, e.id FROM "{table}" e{where} ORDER BY e.project_id, e.id'
+        return [
+            ElementRecord(self, found_project_id, element_type, element_id)
+            for found_project_id, element_id in self._connection.execute(query, parameters)
+        ]
+
+    def _read_rows(self, project_id: str) -> dict[_Key, _Row]:
+        """Read the rows of the elements of a saved project.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :return: The rows, by type name and ID of their elements, empty if the project was not saved.
+        :rtype: dict[_Key, _Row]
+        """
+        rows = {}
+        for type_name, table in _TABLES.items():
+            query = f'SELECT {_COLUMNS} FROM "{table}" WHERE project_id = ? ORDER BY owner_index, id'
+            for row in self._connection.execute(query, (project_id,)):
+                rows[type_name, row[1]] = row
+        return rows
+
+    def _read_project(self, project_id: str) -> Project:
+        """Read a project, building its elements and registering them in it and in their owners.
+
+        :param project_id: The ID of the project.
+        :type project_id: str
+        :return: The project.
+        :rtype: Project
+        :raises OntoumlValueError: If the repository has no project with the ID or holds an invalid one.
+        """
+        rows = self._read_rows(project_id)
+        rows_by_type: dict[str, list[_Row]] = defaultdict(list)
+        for (type_name, _), row in rows.items():
+            rows_by_type[type_name].append(row)
+        if ("Project", project_id) not in rows:
+            raise OntoumlValueError(
+                "project_not_found",
+                description="Invalid project ID.",
+                cause="The repository has no project with ID {project_id}.",
+                solution="Use one of the IDs given by get_project_ids.",
+                project_id=project_id,
+            )
+        decoder = _ValueDecoder()
+        by_key: dict[_Key, OntoumlElement] = {}
+        references: list[tuple[OntoumlElement, dict[str, Any]]] = []
+        owned: list[tuple[OntoumlElement, _Row]] = []
+        project = None
+        try:
+            for element_type in _SECTION_TYPES:
+                type_name = element_type.__name__
+                type_rows = rows_by_type[type_name]
+                field_names = _get_field_names(element_type)
+                values = []
+                fields_sets = []
+                type_references = []
+                for row in type_rows:
+                    data = decoder.decode(row[8])
+                    refs = json.loads(row[9])
+                    values.append(
+                        tuple(
+                            data[name] if name in data else None if name in refs else _get_default(element_type, name)
+                            for name in field_names
+                        )
+                    )
+                    fields_sets.append(json.loads(row[7]))
+                    type_references.append(refs)
+                elements = _construct_elements(element_type, values, fields_sets)
+                if element_type is Project:
+                    project = elements[0]
+                else:
+                    _register_elements(project, type_name, elements)
+                for element, row, refs in zip(elements, type_rows, type_references):
+                    by_key[type_name, row[1]] = element
+                    if refs:
+                        references.append((element, refs))
+                    if row[2] is not None or row[4] is not None:
+                        owned.append((element, row))
+            _link(by_key, references, owned)
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            if isinstance(error, OntoumlValueError):
+                raise
+            raise OntoumlValueError(
+                "invalid_repository",
+                description="Invalid project in SQLite repository.",
+                cause="The project with ID {project_id} has an invalid row: {error}.",
+                solution="Ensure the repository is only written by SqliteRepository.",
+                project_id=project_id,
+                error=error,
+            ) from error
+        _rebuild_indexes(project)
+        self._projects[project_id] = project
+        self._rows[project_id] = rows
+        return project
+
+
+class ElementRecord:
+    """Element found by a query on a repository, whose project is loaded when the element is accessed."""
+
+    __slots__ = ("repository", "project_id", "element_type", "id")
+
+    def __init__(self, repository: SqliteRepository, project_id: str, element_type: str, element_id: str) -> None:
+        """Initialize a new record.
+
+        :param repository: The repository of the element.
+        :type repository: SqliteRepository
+        :param project_id: The ID of the project of the element.
+        :type project_id: str
+        :param element_type: The name of the type of the element.
+        :type element_type: str
+        :param element_id: The ID of the element.
+        :type element_id: str
+        """
+        self.repository = repository
+        self.project_id = project_id
+        self.element_type = element_type
+        self.id = element_id
+
+    def __repr__(self) -> str:
+        return f"ElementRecord({self.element_type}, project_id={self.project_id!r}, id={self.id!r})"
+
+    def load(self) -> Optional[OntoumlElement]:
+        """Get the element, loading its project unless it is already loaded.
+
+        :return: The element, or None if it was removed from its loaded project.
+        :rtype: Optional[OntoumlElement]
+        """
+        project = self.repository.load_project(self.project_id)
+        if self.element_type == "Project":
+            return project
+        return project.get_element_by_id(self.element_type, self.id)
+
+
+def _encode_project(project: Project) -> tuple[dict[_Key, _Row], dict[_Key, OntoumlElement]]:
+    """Encode the rows of a project and of its elements.
+
+    :param project: The project.
+    :type project: Project
+    :return: The rows and the elements, by the type name and ID of the elements.
+    :rtype: tuple[dict[_Key, _Row], dict[_Key, OntoumlElement]]
+    :raises OntoumlTypeError: If a field holds a value that repositories cannot store.
+    :raises OntoumlValueError: If an element refers to an element that is not in the project.
+    """
+    project_elements = project.get_elements()
+    known = {id(project)}
+    known.update(id(element) for elements in project_elements.values() for element in elements)
+    # Owners of properties and literals, with the index of each property in its classifier's
+    owners: dict[int, tuple[OntoumlElement, Optional[int]]] = {}
+    for type_name in ("Class", "BinaryRelation", "NaryRelation"):
+        for classifier in project_elements[type_name]:
+            for index, owned in enumerate(classifier.__pydantic_private__["_properties"]):
+                owners[id(owned)] = classifier, index
+    for class_ in project_elements["Class"]:
+        for owned in class_.__pydantic_private__["_literals"]:
+            owners[id(owned)] = class_, None
+
+    rows: dict[_Key, _Row] = {}
+    elements: dict[_Key, OntoumlElement] = {}
+    for element in (project, *(element for elements in project_elements.values() for element in elements)):
+        key = type(element).__name__, element.id
+        owner, owner_index = owners.get(id(element), (None, None))
+        rows[key] = _encode_row(project.id, element, owner, owner_index, known)
+        elements[key] = element
+    return rows, elements
+
+
+def _encode_row(
+    project_id: str,
+    element: OntoumlElement,
+    owner: Optional[OntoumlElement],
+    owner_index: Optional[int],
+    known: set[int],
+) -> _Row:
+    """Encode the row of an element.
+
+    :param project_id: The ID of the project of the element.
+    :type project_id: str
+    :param element: The element.
+    :type element: OntoumlElement
+    :param owner: The classifier of a property or the enumeration of a literal, otherwise None.
+    :type owner: Optional[OntoumlElement]
+    :param owner_index: The index of a property in the properties of its classifier, otherwise None.
+    :type owner_index: Optional[int]
+    :param known: The identities of the elements of the project.
+    :type known: set[int]
+    :return: The row.
+    :rtype: _Row
+    :raises OntoumlTypeError: If a field holds a value that repositories cannot store.
+    :raises OntoumlValueError: If the element refers to an element that is not in the project.
+    """
+    data = {}
+    refs: dict[str, Any] = {}
+    for name in _get_field_names(type(element)):
+        value = element.__dict__[name]
+        try:
+            if isinstance(value, ProjectElement):
+                refs[name] = _encode_reference(value, known)
+            elif isinstance(value, set) and value and isinstance(next(iter(value)), ProjectElement):
+                refs[name] = sorted(_encode_reference(item, known) for item in value)
+            else:
+                data[name] = _encode_value(value)
+        except KeyError:
+            raise OntoumlValueError(
+                "unknown_repository_reference",
+                description="Invalid reference in field '{name}' of {element_type} with ID {element.id}.",
+                cause="The field refers to an element that is not in the project: {value!r}.",
+                solution="Add the referred element to the project, or remove the reference.",
+                element=element,
+                element_type=type(element).__name__,
+                name=name,
+                value=value,
+            ) from None
+        except OntoumlTypeError as error:
+            raise OntoumlTypeError(
+                "unsupported_repository_value",
+                description="Invalid value of field '{name}' of {element_type} with ID {element.id} for a SQLite "
+                "repository.",
+                cause="Repositories store elements, language strings, sets of them, and None, booleans, numbers, "
+                "strings, enumeration members, timestamps, cardinalities and tuples of them, got {value!r}.",
+                solution="Replace the value with one that can be stored.",
+                element=element,
+                element_type=type(element).__name__,
+                name=name,
+                value=value,
+            ) from error
+
+    package = element.__dict__.get("_package")
+    return (
+        project_id,
+        element.id,
+        None if package is None else package.id,
+        None if owner is None else type(owner).__name__,
+        None if owner is None else owner.id,
+        owner_index,
+        _get_stereotype_key(element.__dict__.get("stereotype")),
+        json.dumps(sorted(element.__pydantic_fields_set__), separators=_JSON_SEPARATORS),
+        _dumps(data),
+        _dumps(refs),
+    )
+
+
+def _encode_reference(element: Any, known: set[int]) -> list[str]:
+    if not isinstance(element, ProjectElement):
+        raise OntoumlTypeError(
+            "unsupported_repository_reference",
+            description="Invalid reference for a SQLite repository.",
+            cause="Expected an element, got {element_type}.",
+            solution="Refer to elements of the project only.",
+            element_type=type(element).__name__,
+        )
+    if id(element) not in known:
+        raise KeyError(element)
+    return [type(element).__name__, element.id]
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a value that does not refer to elements as JSON, tagging the values that JSON cannot tell apart.
+
+    Sets are sorted, so that equal sets are encoded the same, however their items were added.
+
+    :param value: The value.
+    :type value: Any
+    :return: The value, as accepted by json.dumps.
+    :rtype: Any
+    :raises OntoumlTypeError: If the value cannot be stored.
+    """
+    value_type = type(value)
+    if value is None or value_type is str or value_type is bool or value_type is int or value_type is float:
+        return value
+    if value_type is LangString:
+        return {"$l": [value.text, value.lang]}
+    if isinstance(value, (set, frozenset)):
+        return {"$s": sorted(map(_encode_value, value), key=_dumps)}
+    if value_type is tuple:
+        return {"$t": [_encode_value(item) for item in value]}
+    if value_type is datetime:
+        return {"$d": value.isoformat()}
+    if isinstance(value, OntoumlEnum):
+        return {"$e": [value_type.__name__, value.name]}
+    if value_type is Cardinality:
+        return {
+            "$c": [
+                _encode_value(value.lower_bound),
+                _encode_value(value.upper_bound),
+                value.is_ordered,
+                value.is_unique,
+            ]
+        }
+    raise OntoumlTypeError(
+        "unsupported_repository_type",
+        description="Invalid value for a SQLite repository.",
+        cause="Values of type {value_type} cannot be stored.",
+        solution="Replace the value with one that can be stored.",
+        value_type=value_type.__name__,
+    )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=_JSON_SEPARATORS)
+
+
+def _get_stereotype_key(stereotype: Optional[Union[Enum, str]]) -> Optional[str]:
+    return stereotype.value if isinstance(stereotype, Enum) else stereotype
+
+
+def _get_default(element_type: type[OntoumlElement], name: str) -> Any:
+    # Fields added to the element type after the project was saved
+    return _get_defaults(element_type, name, 1)[0]
+
+
+class _ValueDecoder:
+    """Decoder of the values encoded by _encode_value."""
+
+    def __init__(self) -> None:
+        """Initialize a new decoder."""
+        self._enum_types = _get_enum_types()
+
+    def decode(self, text: str) -> Any:
+        """Decode a JSON document of encoded values.
+
+        :param text: The document.
+        :type text: str
+        :return: The decoded values.
+        :rtype: Any
+        """
+        return json.loads(text, object_hook=self._decode_tagged)
+
+    def _decode_tagged(self, tagged: dict[str, Any]) -> Any:
+        """Decode a tagged value, whose content is already decoded, as json.loads decodes objects bottom-up.
+
+        :param tagged: The JSON object of the value, or the object of the fields of an element.
+        :type tagged: dict[str, Any]
+        :return: The value.
+        :rtype: Any
+        """
+        if len(tagged) != 1:
+            return tagged
+        ((tag, content),) = tagged.items()
+        if tag == "$l":
+            # Created as in binary_snapshot._new_langstring, without validating the text and language again
+            langstring = _new(LangString)
+            langstring.text = content[0]
+            langstring.lang = content[1]
+            return langstring
+        if tag == "$s":
+            return set(content)
+        if tag == "$e":
+            return self._enum_types[content[0]][content[1]]
+        if tag == "$t":
+            return tuple(content)
+        if tag == "$d":
+            return datetime.fromisoformat(content)
+        if tag == "$c":
+            return Cardinality.of(*content)
+        return tagged
+
+
+def _link(
+    by_key: dict[_Key, OntoumlElement],
+    references: list[tuple[OntoumlElement, dict[str, Any]]],
+    owned: list[tuple[OntoumlElement, _Row]],
+) -> None:
+    """Resolve the references between the elements of a project being loaded, and set the owners of elements.
+
+    :param by_key: The elements, by their type name and ID.
+    :type by_key: dict[_Key, OntoumlElement]
+    :param references: The elements referring to others, with their references, by field name.
+    :type references: list[tuple[OntoumlElement, dict[str, Any]]]
+    :param owned: The elements with a package or another owner, with their rows, properties in the order of their
+                  indexes in their classifiers.
+    :type owned: list[tuple[OntoumlElement, _Row]]
+    :raises KeyError: If a reference or owner is not in the project.
+    """
+    for element, refs in references:
+        for name, reference in refs.items():
+            if isinstance(reference[0], list):
+                element.__dict__[name] = {by_key[tuple(item)] for item in reference}
+            else:
+                element.__dict__[name] = by_key[tuple(reference)]
+
+    for element, row in owned:
+        package_id, owner_type, owner_id = row[2:5]
+        type_name = type(element).__name__
+        if package_id is not None:
+            package = by_key["Package", package_id]
+            element.__dict__["_package"] = package
+            package.__pydantic_private__["_contents"][type_name].add(element)
+        if owner_id is not None:
+            owner = by_key[owner_type, owner_id]
+            if type_name == "Property":
+                element.__pydantic_private__["_classifier"] = owner
+                owner.__pydantic_private__["_properties"].append(element)
+            else:
+                element.__pydantic_private__["_enumeration"] = owner
+                owner.__pydantic_private__["_literals"].add(element)
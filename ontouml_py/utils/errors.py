@@ -0,0 +1,144 @@
+"""This module defines structured exceptions, whose messages are only formatted when they are rendered.
+
+Structured exceptions carry a code identifying the error, a reference to the element involved, if any, and the
+description, cause and solution of the error as templates in str.format syntax, filled with their arguments and passed
+to `format_error_message` only when the exception is converted to a string. Raising them is therefore cheap even when
+the message would include large values (e.g., the contents of a package), which matters for bulk operations that catch
+errors and continue.
+
+Classes:
+    OntoumlError: Base class of the structured exceptions.
+    OntoumlValueError: Structured exception for invalid values, a subclass of ValueError.
+    OntoumlTypeError: Structured exception for values of invalid types, a subclass of TypeError.
+
+Example:
+    raise OntoumlValueError(
+        "literal_not_found",
+        description="Literal not found in Class with ID {element.id}.",
+        cause="The literal {literal} to be removed does not exist in the class.",
+        solution="Ensure the literal exists in the class before attempting to remove it.",
+        element=enumeration,
+        literal=old_literal,
+    )
+"""
+from typing import Any
+from typing import Optional
+
+from ontouml_py.utils.error_message import format_error_message
+
+
+def fill_template(template: str, arguments: dict[str, Any]) -> str:
+    """Fill the replacement fields of a message template.
+
+    :param template: The template, in str.format syntax.
+    :type template: str
+    :param arguments: The values of the replacement fields.
+    :type arguments: dict[str, Any]
+    :return: The filled template, or the template itself if there are no arguments.
+    :rtype: str
+    """
+    return template.format_map(arguments) if arguments else template
+
+
+class OntoumlError(Exception):
+    """Base class of the structured exceptions of the library.
+
+    :ivar code: Identifier of the error, stable across releases, for programmatic handling.
+    :vartype code: str
+    :ivar element: The element involved in the error, if any. It is available to the templates as 'element'.
+    :vartype element: Optional[object]
+    :ivar description: Template of what the error is.
+    :vartype description: str
+    :ivar cause: Template of why the error occurred.
+    :vartype cause: str
+    :ivar solution: Template of how the error can be fixed.
+    :vartype solution: str
+    :ivar arguments: Values of the replacement fields of the templates, including the element.
+    :vartype arguments: dict[str, Any]
+    """
+
+    def __init__(
+        self,
+        code: str,
+        description: str = "undefined",
+        cause: str = "undefined",
+        solution: str = "undefined",
+        element: Optional[object] = None,
+        **arguments: Any,
+    ) -> None:
+        """Initialize a new structured exception without formatting its message.
+
+        :param code: Identifier of the error.
+        :type code: str
+        :param description: Template of what the error is.
+        :type description: str
+        :param cause: Template of why the error occurred.
+        :type cause: str
+        :param solution: Template of how the error can be fixed.
+        :type solution: str
+        :param element: The element involved in the error, if any.
+        :type element: Optional[object]
+        :param arguments: Values of the other replacement fields of the templates.
+        :type arguments: Any
+        """
+        super().__init__(code)
+        self.code = code
+        self.element = element
+        self.description = description
+        self.cause = cause
+        self.solution = solution
+        self.arguments = {"element": element, **arguments}
+        self._message: Optional[str] = None
+
+    def get_description(self) -> str:
+        """Render what the error is.
+
+        :return: The description template filled with the arguments.
+        :rtype: str
+        """
+        return fill_template(self.description, self.arguments)
+
+    def get_cause(self) -> str:
+        """Render why the error occurred.
+
+        :return: The cause template filled with the arguments.
+        :rtype: str
+        """
+        return fill_template(self.cause, self.arguments)
+
+    def get_solution(self) -> str:
+        """Render how the error can be fixed.
+
+        :return: The solution template filled with the arguments.
+        :rtype: str
+        """
+        return fill_template(self.solution, self.arguments)
+
+    def __str__(self) -> str:
+        """Format the message of the exception on first request.
+
+        :return: The message formatted by format_error_message.
+        :rtype: str
+        """
+        if self._message is None:
+            self._message = format_error_message(
+                description=self.get_description(), cause=self.get_cause(), solution=self.get_solution()
+            )
+        return self._message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Provide the pickling protocol, keeping the templates and arguments instead of the formatted message.
+
+        :return: The exception's type, its positional arguments, and the rest of its state.
+        :rtype: tuple[Any, ...]
+        """
+        positional = (self.code, self.description, self.cause, self.solution, self.element)
+        return type(self), positional, {"arguments": self.arguments, "_message": None}
+
+
+class OntoumlValueError(OntoumlError, ValueError):
+    """Structured exception raised when an operation receives an invalid value."""
+
+
+class OntoumlTypeError(OntoumlError, TypeError):
+    """Structured exception raised when an operation receives a value of an invalid type."""
@@ -0,0 +1,6 @@
+"""This subpackage contains the verification of OntoUML syntax constraints over a Project.
+
+Verification is rule-based: each rule declares the types of project elements it inspects and produces structured
+diagnostics for the elements that violate it. The `Verifier` runs a set of rules over a project, optionally in a thread
+or process pool over partitions of the project's elements, and streams the diagnostics back as they are produced.
+"""
@@ -0,0 +1,138 @@
+"""This module checks the stereotypes, natures and orders of many classes at once using a precomputed table.
+
+The stereotypes, orders and natures of the classes are extracted into integer arrays (columns), with the natures a
+class is restricted to encoded as a bitmask. Adding the columns gives each class a key combining its stereotype, the
+kind of its order (first-order, higher-order or invalid) and its natures. A byte table, built once from
+ALLOWED_NATURES, SINGLE_NATURE and HIGHER_ORDER, maps every possible key to whether it is inconsistent, so checking a
+class is a single lookup. Columns, keys and lookups are computed with chains of map and itertools.compress, which run
+in C, instead of evaluating set operations class by class.
+
+The check is equivalent to the one of ClassNatureRule, which reports why each class is inconsistent. Use
+find_inconsistent_classes to check large projects quickly (e.g., after loading them from files) and the rule to explain
+the classes found.
+"""
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import compress
+from itertools import repeat
+from operator import add
+from operator import attrgetter
+from typing import Union
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.verification.stereotype_groups import ALLOWED_NATURES
+from ontouml_py.verification.stereotype_groups import HIGHER_ORDER
+from ontouml_py.verification.stereotype_groups import SINGLE_NATURE
+
+# Kinds of class orders
+FIRST_ORDER: int = 0
+HIGHER_ORDER_KIND: int = 1
+INVALID_ORDER: int = 2
+
+_NATURE_BITS: dict[OntologicalNature, int] = {nature: 1 << index for index, nature in enumerate(OntologicalNature)}
+_NATURE_COUNT: int = len(_NATURE_BITS)
+# Offsets of stereotypes and order kinds in the table. Code 0 is reserved for classes without an OntoUML stereotype,
+# which are not checked.
+_STEREOTYPE_CODES: dict[ClassStereotype, int] = {
+    stereotype: code for code, stereotype in enumerate(ClassStereotype, start=1)
+}
+
+
+class _StereotypeOffsets(dict):
+    """Table offset of each stereotype, zero for None and custom stereotypes."""
+
+    def __missing__(self, _stereotype: object) -> int:
+        return 0
+
+
+class _OrderOffsets(dict):
+    """Table offset of each class order, computed and kept on first request."""
+
+    def __missing__(self, order: Union[str, int]) -> int:
+        offset = get_order_kind(order) << _NATURE_COUNT
+        self[order] = offset
+        return offset
+
+
+_STEREOTYPE_OFFSETS = _StereotypeOffsets(
+    {stereotype: code * 3 << _NATURE_COUNT for stereotype, code in _STEREOTYPE_CODES.items()}
+)
+_ORDER_OFFSETS = _OrderOffsets()
+
+
+def get_order_kind(order: Union[str, int]) -> int:
+    """Classify the order of a class.
+
+    :param order: The order of a class, an integer or a string with an integer or '*'.
+    :type order: Union[str, int]
+    :return: FIRST_ORDER for 1, HIGHER_ORDER_KIND for integers greater than 1 and '*', and INVALID_ORDER otherwise.
+    :rtype: int
+    """
+    if isinstance(order, str):
+        if order == "*":
+            return HIGHER_ORDER_KIND
+        if not order.isdecimal():
+            return INVALID_ORDER
+        order = int(order)
+    if order == 1:
+        return FIRST_ORDER
+    return HIGHER_ORDER_KIND if order > 1 else INVALID_ORDER
+
+
+def get_expected_order_kind(stereotype: ClassStereotype) -> int:
+    """Get the kind of order implied by a stereotype.
+
+    :param stereotype: The stereotype of a class.
+    :type stereotype: ClassStereotype
+    :return: HIGHER_ORDER_KIND for stereotypes in HIGHER_ORDER, FIRST_ORDER otherwise.
+    :rtype: int
+    """
+    return HIGHER_ORDER_KIND if stereotype in HIGHER_ORDER else FIRST_ORDER
+
+
+def find_inconsistent_classes(classes: Iterable[Class]) -> list[Class]:
+    """Find the classes whose natures or order are inconsistent with their stereotypes.
+
+    A class is inconsistent if it is restricted to a nature not allowed by its stereotype, if its stereotype implies a
+    single nature and it is not restricted to exactly one, or if its order does not match the one implied by its
+    stereotype. Classes without a stereotype or with custom (non-OntoUML) stereotypes are not checked.
+
+    :param classes: The classes to be checked.
+    :type classes: Iterable[Class]
+    :return: The inconsistent classes, in the order they were given.
+    :rtype: list[Class]
+    """
+    classes = list(classes)
+    # Columns are computed with chains of map, so that there is no Python-level loop over the classes
+    stereotypes = array("L", map(_STEREOTYPE_OFFSETS.__getitem__, map(attrgetter("stereotype"), classes)))
+    orders = array("L", map(_ORDER_OFFSETS.__getitem__, map(attrgetter("order"), classes)))
+    natures = array(
+        "L", map(sum, map(map, repeat(_NATURE_BITS.__getitem__), map(attrgetter("restricted_to"), classes)))
+    )
+    keys = map(add, map(add, stereotypes, orders), natures)
+    return list(compress(classes, map(_get_table().__getitem__, keys)))
+
+
+@lru_cache(maxsize=None)
+def _get_table() -> bytes:
+    """Build the table mapping each class key to whether the class is inconsistent.
+
+    :return: A byte per key, 1 if the stereotype, order kind and natures encoded in the key are inconsistent.
+    :rtype: bytes
+    """
+    masks = range(1 << _NATURE_COUNT)
+    table = bytearray((len(_STEREOTYPE_CODES) + 1) * 3 << _NATURE_COUNT)
+    for stereotype, code in _STEREOTYPE_CODES.items():
+        allowed = sum(_NATURE_BITS[nature] for nature in ALLOWED_NATURES[stereotype])
+        single = stereotype in SINGLE_NATURE
+        expected_order_kind = get_expected_order_kind(stereotype)
+        for order_kind in (FIRST_ORDER, HIGHER_ORDER_KIND, INVALID_ORDER):
+            base = (code * 3 + order_kind) << _NATURE_COUNT
+            for mask in masks:
+                table[base | mask] = (
+                    order_kind != expected_order_kind or mask & ~allowed != 0 or (single and bin(mask).count("1") != 1)
+                )
+    return bytes(table)
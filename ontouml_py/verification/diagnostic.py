@@ -0,0 +1,101 @@
+"""Module for the Diagnostic class, the structured result of the verification of OntoUML models.
+
+A diagnostic identifies the violated rule and the offending element by code and ID, instead of holding references to
+model objects, so diagnostics are cheap to keep, compare, and transfer between processes. Their messages are only
+formatted when rendered, as most diagnostics of large or broken models are counted or filtered but never displayed.
+"""
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from ontouml_py.utils.error_message import format_error_message
+from ontouml_py.utils.errors import fill_template
+from ontouml_py.verification.severity import Severity
+
+
+class Diagnostic(BaseModel):
+    """Immutable report of a rule violation by a project element.
+
+    The description, cause and solution are templates in str.format syntax, whose replacement fields are filled with
+    the arguments when the diagnostic is rendered (by str or by the get_description, get_cause and get_solution
+    methods). Templates of diagnostics without arguments are used as they are.
+
+    :ivar rule_code: The code of the violated rule.
+    :vartype rule_code: str
+    :ivar severity: The severity of the violation.
+    :vartype severity: Severity
+    :ivar element_id: The ID of the offending element.
+    :vartype element_id: str
+    :ivar element_type: The name of the concrete type of the offending element (e.g., 'Class').
+    :vartype element_type: str
+    :ivar description: What is wrong with the element.
+    :vartype description: str
+    :ivar cause: Why the element violates the rule.
+    :vartype cause: str
+    :ivar solution: How the violation can be fixed.
+    :vartype solution: str
+    :ivar arguments: Values of the replacement fields of the templates.
+    :vartype arguments: dict[str, Any]
+    """
+
+    rule_code: str = Field(min_length=1)
+    severity: Severity = Field(default=Severity.ERROR)
+    element_id: str = Field(min_length=1)
+    element_type: str = Field(min_length=1)
+    description: str = Field(default="undefined")
+    cause: str = Field(default="undefined")
+    solution: str = Field(default="undefined")
+    arguments: dict[str, Any] = Field(default_factory=dict)
+
+    model_config = {
+        "extra": "forbid",
+        "frozen": True,
+        "str_strip_whitespace": True,
+        "validate_default": True,
+    }
+
+    def get_description(self) -> str:
+        """Render what is wrong with the element.
+
+        :return: The description template filled with the arguments.
+        :rtype: str
+        """
+        return self._render(self.description)
+
+    def get_cause(self) -> str:
+        """Render why the element violates the rule.
+
+        :return: The cause template filled with the arguments.
+        :rtype: str
+        """
+        return self._render(self.cause)
+
+    def get_solution(self) -> str:
+        """Render how the violation can be fixed.
+
+        :return: The solution template filled with the arguments.
+        :rtype: str
+        """
+        return self._render(self.solution)
+
+    def _render(self, template: str) -> str:
+        """Fill a template of the diagnostic with its arguments.
+
+        :param template: One of the message templates of the diagnostic.
+        :type template: str
+        :return: The filled template, or the template itself if the diagnostic has no arguments.
+        :rtype: str
+        """
+        return fill_template(template, self.arguments)
+
+    def __str__(self) -> str:
+        """Render the diagnostic as a formatted error message.
+
+        :return: The formatted message, prefixed with the severity and the rule code.
+        :rtype: str
+        """
+        message = format_error_message(
+            description=self.get_description(), cause=self.get_cause(), solution=self.get_solution()
+        )
+        return f"[{self.severity.value}] {self.rule_code} ({self.element_type} {self.element_id}): {message}"
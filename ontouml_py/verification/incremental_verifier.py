@@ -0,0 +1,210 @@
+"""Module for the IncrementalVerifier class, which re-checks only the elements affected by changes to a project.
+
+After a full verification, the verifier keeps the diagnostics of each rule instance (a rule checking one element)
+together with the elements the result depended on, as declared by the rule. Given the elements changed since the last
+run, only the rule instances depending on them are checked again, so that editors can keep diagnostics up to date
+after small edits to large projects.
+
+Changed elements are expanded to the elements they connect before looking up the affected rule instances: a
+generalization to its general and specific classifiers, a property to the classifier that owns it, and a relation to
+the classifiers at its ends. For instance, creating a generalization re-checks its specific classifier and all
+classifiers that specialize it.
+"""
+from collections.abc import Iterable
+from typing import Optional
+
+from ontouml_py.model.generalization import Generalization
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.model.property import Property
+from ontouml_py.model.relation import Relation
+from ontouml_py.utils.errors import OntoumlValueError
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+from ontouml_py.verification.verifier import _taxonomy_cycle_diagnostic
+from ontouml_py.verification.verifier import Verifier
+
+# A rule instance: the index of a rule in the verifier's rules and the element it checks
+_RuleInstance = tuple[int, ProjectElement]
+
+
+class IncrementalVerifier(Verifier):
+    """Verifier that keeps the results of its last run and updates them for the elements that changed.
+
+    Elements removed from the project are not tracked; after removals, run verify_all again.
+
+    :ivar _project: The project verified by the last full run.
+    :vartype _project: Optional[Project]
+    :ivar _results: Diagnostics of each rule instance checked.
+    :vartype _results: dict[tuple[int, ProjectElement], list[Diagnostic]]
+    :ivar _dependencies: Elements the result of each rule instance depended on.
+    :vartype _dependencies: dict[tuple[int, ProjectElement], set[ProjectElement]]
+    :ivar _dependents: Rule instances whose results depended on each element, the inverse of _dependencies.
+    :vartype _dependents: dict[ProjectElement, set[tuple[int, ProjectElement]]]
+    :ivar _cyclic: Whether the project's taxonomy was cyclic in the last run.
+    :vartype _cyclic: bool
+    :ivar _last_checked: Number of rule instances checked by the last run.
+    :vartype _last_checked: int
+    """
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None) -> None:
+        """Initialize a new IncrementalVerifier.
+
+        :param rules: The rules to be checked. If not provided, DEFAULT_RULES are used.
+        :type rules: Optional[Iterable[Rule]]
+        """
+        super().__init__(rules)
+        self._project: Optional[Project] = None
+        self._results: dict[_RuleInstance, list[Diagnostic]] = {}
+        self._dependencies: dict[_RuleInstance, set[ProjectElement]] = {}
+        self._dependents: dict[ProjectElement, set[_RuleInstance]] = {}
+        self._cyclic: bool = False
+        self._last_checked: int = 0
+
+    @property
+    def last_checked(self) -> int:
+        """Get the number of rule instances checked by the last run.
+
+        :return: The number of (rule, element) pairs checked by the last call to verify_all or verify_changes.
+        :rtype: int
+        """
+        return self._last_checked
+
+    def verify_all(self, project: Project) -> list[Diagnostic]:
+        """Verify the whole project, discarding the results of previous runs.
+
+        :param project: The project to be verified.
+        :type project: Project
+        :return: The diagnostics of all violations found.
+        :rtype: list[Diagnostic]
+        """
+        self._project = project
+        self._results.clear()
+        self._dependencies.clear()
+        self._dependents.clear()
+        self._cyclic = self._is_taxonomy_cyclic()
+        self._last_checked = 0
+
+        project_elements = project.get_elements()
+        for rule_index, rule in enumerate(self._rules):
+            if rule.requires_taxonomy and self._cyclic:
+                continue
+            for element_type in rule.element_types:
+                for element in project_elements.get(element_type, ()):
+                    self._check(rule_index, element)
+        return self.get_diagnostics()
+
+    def verify_changes(self, changed: Iterable[ProjectElement]) -> list[Diagnostic]:
+        """Update the results of the last run, re-checking only the rule instances affected by the changed elements.
+
+        Changed elements include elements created since the last run, which are checked for the first time. If the
+        taxonomy became cyclic, or stopped being so, the whole project is verified again.
+
+        :param changed: The elements created or modified since the last run.
+        :type changed: Iterable[ProjectElement]
+        :return: The diagnostics of all violations found in the project, updated.
+        :rtype: list[Diagnostic]
+        :raises OntoumlValueError: If the project was never verified with verify_all.
+        """
+        project = self._get_project()
+        if self._is_taxonomy_cyclic() != self._cyclic:
+            return self.verify_all(project)
+
+        affected: set[_RuleInstance] = set()
+        for element in _expand_changes(changed):
+            affected.update(self._dependents.get(element, ()))
+            element_type = type(element).__name__
+            for rule_index, rule in enumerate(self._rules):
+                if element_type in rule.element_types and not (rule.requires_taxonomy and self._cyclic):
+                    affected.add((rule_index, element))
+
+        self._last_checked = 0
+        for rule_index, element in affected:
+            self._check(rule_index, element)
+        return self.get_diagnostics()
+
+    def get_diagnostics(self) -> list[Diagnostic]:
+        """Get the diagnostics currently known, as of the last run.
+
+        :return: The diagnostics of all violations found.
+        :rtype: list[Diagnostic]
+        """
+        diagnostics = [diagnostic for results in self._results.values() for diagnostic in results]
+        if self._cyclic:
+            diagnostics.insert(0, _taxonomy_cycle_diagnostic(self._get_project()))
+        return diagnostics
+
+    def _get_project(self) -> Project:
+        """Get the project verified by the last full run.
+
+        :return: The project.
+        :rtype: Project
+        :raises OntoumlValueError: If the project was never verified with verify_all.
+        """
+        if self._project is None:
+            raise OntoumlValueError(
+                "missing_verification_results",
+                description="Invalid incremental verification.",
+                cause="There are no previous results to be updated.",
+                solution="Call verify_all before verify_changes.",
+            )
+        return self._project
+
+    def _check(self, rule_index: int, element: ProjectElement) -> None:
+        """Check a rule instance, replacing its previous results and dependencies.
+
+        :param rule_index: The index of the rule to be checked.
+        :type rule_index: int
+        :param element: The element to be checked.
+        :type element: ProjectElement
+        """
+        instance = (rule_index, element)
+        for dependency in self._dependencies.pop(instance, ()):
+            self._dependents[dependency].discard(instance)
+
+        rule = self._rules[rule_index]
+        diagnostics = list(rule.check(element))
+        if diagnostics:
+            self._results[instance] = diagnostics
+        else:
+            self._results.pop(instance, None)
+
+        dependencies = rule.dependencies(element)
+        self._dependencies[instance] = dependencies
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, set()).add(instance)
+        self._last_checked += 1
+
+    def _is_taxonomy_cyclic(self) -> bool:
+        """Check whether the taxonomy of the verified project is cyclic, if any rule requires it.
+
+        :return: True if a rule requires the taxonomy and the project's generalizations form a cycle.
+        :rtype: bool
+        """
+        if not any(rule.requires_taxonomy for rule in self._rules):
+            return False
+        try:
+            self._get_project().get_taxonomy()
+        except ValueError:
+            return True
+        return False
+
+
+def _expand_changes(changed: Iterable[ProjectElement]) -> set[ProjectElement]:
+    """Add to the changed elements the classifiers they connect.
+
+    :param changed: The elements created or modified.
+    :type changed: Iterable[ProjectElement]
+    :return: The changed elements and the classifiers whose results may be affected through them.
+    :rtype: set[ProjectElement]
+    """
+    expanded = set(changed)
+    for element in list(expanded):
+        if isinstance(element, Generalization):
+            expanded.update((element.general, element.specific))
+        elif isinstance(element, Property) and element.classifier is not None:
+            element = element.classifier
+            expanded.add(element)
+        if isinstance(element, Relation):
+            expanded.update(member for member in element.members if member is not None)
+    return expanded
@@ -0,0 +1,94 @@
+"""Module for the abstract Rule class, the extension point of the verification of OntoUML models.
+
+New constraints are added to the verifier by subclassing Rule, declaring the element types the rule inspects and
+implementing its check. Rules must be stateless, as the same instance may check elements concurrently, and defined at
+module level, as they are sent to worker processes when verification runs in a process pool.
+"""
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterator
+from typing import Any
+from typing import ClassVar
+
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.severity import Severity
+
+
+class Rule(ABC):
+    """Abstract base class of the rules checked by the verifier.
+
+    :cvar code: Unique code identifying the rule in diagnostics.
+    :vartype code: str
+    :cvar element_types: Names of the concrete ProjectElement types inspected by the rule (keys of the project's
+                         elements dictionary, e.g., 'Class').
+    :vartype element_types: tuple[str, ...]
+    :cvar severity: Severity of the diagnostics produced by the rule.
+    :vartype severity: Severity
+    :cvar requires_taxonomy: Whether the rule queries the project's taxonomy, which is built before checking starts.
+    :vartype requires_taxonomy: bool
+    """
+
+    code: ClassVar[str]
+    element_types: ClassVar[tuple[str, ...]]
+    severity: ClassVar[Severity] = Severity.ERROR
+    requires_taxonomy: ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        if type(self) is Rule:
+            raise TypeError(f"{type(self).__name__} is an abstract class and cannot be directly instantiated.")
+
+    @abstractmethod
+    def check(self, element: ProjectElement) -> Iterator[Diagnostic]:  # noqa:U100
+        """Check a single element, yielding a diagnostic for each violation found.
+
+        :param element: An element of one of the types declared in element_types.
+        :type element: ProjectElement
+        :return: The diagnostics of the violations found, if any.
+        :rtype: Iterator[Diagnostic]
+        """
+
+    def dependencies(self, element: ProjectElement) -> set[ProjectElement]:
+        """Get the elements whose changes may alter the result of checking the given element.
+
+        Incremental verification re-checks an element when any of its dependencies changes. By default, the result
+        only depends on the element itself; rules that inspect other elements must override this method.
+
+        :param element: An element of one of the types declared in element_types.
+        :type element: ProjectElement
+        :return: The elements the result of the check depends on, including the element itself.
+        :rtype: set[ProjectElement]
+        """
+        return {element}
+
+    def _diagnostic(
+        self, element: ProjectElement, description: str, cause: str, solution: str, **arguments: Any
+    ) -> Diagnostic:
+        """Create a diagnostic of this rule for the given element.
+
+        Templates are filled with the arguments only when the diagnostic is rendered. As all values come from the rule
+        and from an already validated element, the diagnostic is created without validation.
+
+        :param element: The offending element.
+        :type element: ProjectElement
+        :param description: Template of what is wrong with the element.
+        :type description: str
+        :param cause: Template of why the element violates the rule.
+        :type cause: str
+        :param solution: Template of how the violation can be fixed.
+        :type solution: str
+        :param arguments: Values of the replacement fields of the templates.
+        :type arguments: Any
+        :return: The new diagnostic.
+        :rtype: Diagnostic
+        """
+        return Diagnostic.model_construct(
+            rule_code=self.code,
+            severity=self.severity,
+            element_id=element.id,
+            element_type=type(element).__name__,
+            description=description,
+            cause=cause,
+            solution=solution,
+            arguments=arguments,
+        )
@@ -0,0 +1,5 @@
+"""This subpackage contains the OntoUML syntax rules used by the verifier.
+
+Each module defines a single concrete `Rule`, covering one constraint of the OntoUML language (e.g., sortality,
+rigidity, or relator mediation). The `DEFAULT_RULES` of the verifier are composed of instances of these classes.
+"""
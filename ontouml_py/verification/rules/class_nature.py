@@ -0,0 +1,62 @@
+"""Module for the rule that checks the ontological natures and the order of a class against its stereotype."""
+from collections.abc import Iterator
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.verification.class_table import get_expected_order_kind
+from ontouml_py.verification.class_table import get_order_kind
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+from ontouml_py.verification.stereotype_groups import ALLOWED_NATURES
+from ontouml_py.verification.stereotype_groups import HIGHER_ORDER
+from ontouml_py.verification.stereotype_groups import SINGLE_NATURE
+
+
+class ClassNatureRule(Rule):
+    """Check that the restricted_to set and the order of a stereotyped class are consistent with its stereotype.
+
+    Classes whose stereotypes imply a single nature (e.g., kinds or relators) must be restricted to exactly one nature.
+    Classes with stereotype 'type' must be higher-order (order greater than 1 or '*'), and all others first-order.
+    Classes without a stereotype or with custom (non-OntoUML) stereotypes are not checked.
+    """
+
+    code = "class_nature"
+    element_types = ("Class",)
+
+    def check(self, element: Class) -> Iterator[Diagnostic]:
+        stereotype = element.stereotype
+        if not isinstance(stereotype, ClassStereotype):
+            return
+
+        forbidden = element.restricted_to - ALLOWED_NATURES[stereotype]
+        if forbidden:
+            yield self._diagnostic(
+                element,
+                description="Invalid ontological nature for a class with stereotype '{stereotype}'.",
+                cause="The class is restricted to {forbidden}, which are not allowed for its stereotype.",
+                solution="Restrict the class to natures among {allowed}.",
+                stereotype=stereotype.value,
+                forbidden=sorted(nature.value for nature in forbidden),
+                allowed=sorted(nature.value for nature in ALLOWED_NATURES[stereotype]),
+            )
+        elif stereotype in SINGLE_NATURE and len(element.restricted_to) != 1:
+            yield self._diagnostic(
+                element,
+                description="Invalid number of ontological natures for a class with stereotype '{stereotype}'.",
+                cause="The class is restricted to {count} natures, but its stereotype implies a single one.",
+                solution="Restrict the class to exactly one of the natures allowed for its stereotype.",
+                stereotype=stereotype.value,
+                count=len(element.restricted_to),
+            )
+
+        if get_order_kind(element.order) != get_expected_order_kind(stereotype):
+            expected = "greater than 1 or '*'" if stereotype in HIGHER_ORDER else "1"
+            yield self._diagnostic(
+                element,
+                description="Invalid order for a class with stereotype '{stereotype}'.",
+                cause="The class has order '{order}', but its stereotype implies an order {expected}.",
+                solution="Set the order of the class to {expected}.",
+                stereotype=stereotype.value,
+                order=element.order,
+                expected=expected,
+            )
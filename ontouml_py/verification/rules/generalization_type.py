@@ -0,0 +1,33 @@
+"""Module for the rule that checks the types of the classifiers related by a generalization."""
+from collections.abc import Iterator
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.generalization import Generalization
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+
+
+class GeneralizationTypeRule(Rule):
+    """Check that a generalization relates two distinct classifiers of the same kind (two classes or two relations)."""
+
+    code = "generalization_type"
+    element_types = ("Generalization",)
+
+    def check(self, element: Generalization) -> Iterator[Diagnostic]:
+        if element.general == element.specific:
+            yield self._diagnostic(
+                element,
+                description="Generalization of a classifier to itself.",
+                cause="Both ends of the generalization are the classifier with ID {classifier}.",
+                solution="Set different classifiers as the general and the specific ends.",
+                classifier=element.general.id,
+            )
+        elif isinstance(element.general, Class) != isinstance(element.specific, Class):
+            yield self._diagnostic(
+                element,
+                description="Generalization between a class and a relation.",
+                cause="The general end is a {general} and the specific end is a {specific}.",
+                solution="Only relate classes to classes and relations to relations through generalizations.",
+                general=type(element.general).__name__,
+                specific=type(element.specific).__name__,
+            )
@@ -0,0 +1,42 @@
+"""Module for the rule that requires relators to be connected to mediation relations."""
+from collections.abc import Iterator
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+
+
+class RelatorMediationRule(Rule):
+    """Check that every relator, directly or through one of its supertypes, is an end of a mediation relation."""
+
+    code = "relator_mediation"
+    element_types = ("Class",)
+    requires_taxonomy = True
+
+    def dependencies(self, element: Class) -> set[ProjectElement]:
+        classifiers = {element} | element.project.get_taxonomy().get_supertypes(element)
+        mediations = {
+            mediation
+            for classifier in classifiers
+            for mediation in classifier.relations(stereotype=RelationStereotype.MEDIATION)
+        }
+        return classifiers | mediations
+
+    def check(self, element: Class) -> Iterator[Diagnostic]:
+        if element.stereotype != ClassStereotype.RELATOR:
+            return
+        if element.relations(stereotype=RelationStereotype.MEDIATION):
+            return
+        for supertype in element.project.get_taxonomy().get_supertypes(element):
+            if supertype.relations(stereotype=RelationStereotype.MEDIATION):
+                return
+
+        yield self._diagnostic(
+            element,
+            description="Relator without mediation.",
+            cause="Neither the relator nor any of its supertypes is an end of a relation with stereotype 'mediation'.",
+            solution="Connect the relator to the entities it mediates through mediation relations.",
+        )
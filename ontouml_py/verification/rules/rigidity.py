@@ -0,0 +1,44 @@
+"""Module for the rule that forbids rigid and semi-rigid classes from specializing anti-rigid classes."""
+from collections.abc import Iterator
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+from ontouml_py.verification.stereotype_groups import ANTI_RIGID
+from ontouml_py.verification.stereotype_groups import RIGID
+from ontouml_py.verification.stereotype_groups import SEMI_RIGID
+
+
+class RigidityRule(Rule):
+    """Check that rigid (e.g., kinds) and semi-rigid (mixins) classes do not specialize anti-rigid ones (e.g., roles).
+
+    Instances of a rigid type always instantiate it, so they cannot be required to instantiate a type they may cease
+    to instantiate.
+    """
+
+    code = "rigidity"
+    element_types = ("Class",)
+    requires_taxonomy = True
+
+    def dependencies(self, element: Class) -> set[ProjectElement]:
+        return {element} | element.project.get_taxonomy().get_supertypes(element)
+
+    def check(self, element: Class) -> Iterator[Diagnostic]:
+        stereotype = element.stereotype
+        if stereotype not in RIGID and stereotype not in SEMI_RIGID:
+            return
+
+        supertypes = element.project.get_taxonomy().get_supertypes(element)
+        anti_rigid = sorted(
+            supertype.id for supertype in supertypes if getattr(supertype, "stereotype", None) in ANTI_RIGID
+        )
+        if anti_rigid:
+            yield self._diagnostic(
+                element,
+                description="Class with stereotype '{stereotype}' specializes an anti-rigid class.",
+                cause="The class specializes the anti-rigid classes with IDs {anti_rigid}.",
+                solution="Remove the generalizations to anti-rigid classes or change the stereotype of the class.",
+                stereotype=stereotype.value,
+                anti_rigid=anti_rigid,
+            )
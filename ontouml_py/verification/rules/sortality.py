@@ -0,0 +1,71 @@
+"""Module for the rule that checks the specializations of sortal and non-sortal classes."""
+from collections.abc import Iterator
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+from ontouml_py.verification.stereotype_groups import BASE_SORTALS
+from ontouml_py.verification.stereotype_groups import NON_SORTALS
+from ontouml_py.verification.stereotype_groups import SORTALS
+from ontouml_py.verification.stereotype_groups import ULTIMATE_SORTALS
+
+
+class SortalityRule(Rule):
+    """Check the identity principle of classes through their supertypes.
+
+    Ultimate sortals (e.g., kinds) must not specialize other ultimate sortals, base sortals (e.g., roles) must
+    specialize exactly one ultimate sortal, and non-sortals (e.g., categories) must not specialize sortals.
+    """
+
+    code = "sortality"
+    element_types = ("Class",)
+    requires_taxonomy = True
+
+    def dependencies(self, element: Class) -> set[ProjectElement]:
+        return {element} | element.project.get_taxonomy().get_supertypes(element)
+
+    def check(self, element: Class) -> Iterator[Diagnostic]:
+        stereotype = element.stereotype
+        if stereotype not in SORTALS and stereotype not in NON_SORTALS:
+            return
+
+        supertypes = element.project.get_taxonomy().get_supertypes(element)
+        ultimate_sortals = sorted(
+            supertype.id for supertype in supertypes if getattr(supertype, "stereotype", None) in ULTIMATE_SORTALS
+        )
+
+        if stereotype in ULTIMATE_SORTALS and ultimate_sortals:
+            yield self._diagnostic(
+                element,
+                description="Class with stereotype '{stereotype}' specializes an ultimate sortal.",
+                cause="An ultimate sortal provides the identity principle of its instances, but the class specializes "
+                "the ultimate sortals with IDs {ultimate_sortals}.",
+                solution="Remove the generalizations to the ultimate sortals or change the stereotype of the class.",
+                stereotype=stereotype.value,
+                ultimate_sortals=ultimate_sortals,
+            )
+        elif stereotype in BASE_SORTALS and len(ultimate_sortals) != 1:
+            yield self._diagnostic(
+                element,
+                description="Class with stereotype '{stereotype}' must specialize exactly one ultimate sortal.",
+                cause="The class specializes {count} ultimate sortals {ultimate_sortals}.",
+                solution="Ensure the class specializes, directly or indirectly, a single kind (or other ultimate "
+                "sortal).",
+                stereotype=stereotype.value,
+                count=len(ultimate_sortals),
+                ultimate_sortals=ultimate_sortals,
+            )
+        elif stereotype in NON_SORTALS:
+            sortals = sorted(
+                supertype.id for supertype in supertypes if getattr(supertype, "stereotype", None) in SORTALS
+            )
+            if sortals:
+                yield self._diagnostic(
+                    element,
+                    description="Non-sortal class with stereotype '{stereotype}' specializes a sortal.",
+                    cause="The class specializes the sortals with IDs {sortals}.",
+                    solution="Remove the generalizations to sortals or change the stereotype of the class.",
+                    stereotype=stereotype.value,
+                    sortals=sortals,
+                )
@@ -0,0 +1,15 @@
+"""This module defines the Severity enumeration, a subclass of OntoumlEnum, representing the severity of diagnostics \
+produced by the verification of OntoUML models."""
+from ontouml_py.model.enumerations.ontouml_enum import OntoumlEnum
+
+
+class Severity(OntoumlEnum):
+    """An enumeration representing the severity of a verification diagnostic.
+
+    Members:
+        ERROR: The element violates an OntoUML constraint and the model is syntactically invalid.
+        WARNING: The element is valid but likely to be a modeling mistake.
+    """
+
+    ERROR = "error"
+    WARNING = "warning"
@@ -0,0 +1,97 @@
+"""This module groups class stereotypes according to the OntoUML meta-properties used by the verification rules.
+
+The groups follow the classification of types in the Unified Foundational Ontology (UFO): sortality (whether the
+instances of a type share a single identity principle) and rigidity (whether a type applies to its instances in every
+situation they exist). It also defines which ontological natures each stereotype allows in a class' restricted_to set,
+mirroring the values used by the class creation methods of the project.
+"""
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+
+# Sortals that provide the identity principle of their instances
+ULTIMATE_SORTALS: frozenset[ClassStereotype] = frozenset(
+    {
+        ClassStereotype.KIND,
+        ClassStereotype.COLLECTIVE,
+        ClassStereotype.QUANTITY,
+        ClassStereotype.RELATOR,
+        ClassStereotype.MODE,
+        ClassStereotype.QUALITY,
+    }
+)
+
+# Sortals that inherit the identity principle of their instances from exactly one ultimate sortal
+BASE_SORTALS: frozenset[ClassStereotype] = frozenset(
+    {ClassStereotype.SUBKIND, ClassStereotype.ROLE, ClassStereotype.PHASE, ClassStereotype.HISTORICAL_ROLE}
+)
+
+SORTALS: frozenset[ClassStereotype] = ULTIMATE_SORTALS | BASE_SORTALS
+
+NON_SORTALS: frozenset[ClassStereotype] = frozenset(
+    {
+        ClassStereotype.CATEGORY,
+        ClassStereotype.MIXIN,
+        ClassStereotype.ROLE_MIXIN,
+        ClassStereotype.PHASE_MIXIN,
+        ClassStereotype.HISTORICAL_ROLE_MIXIN,
+    }
+)
+
+RIGID: frozenset[ClassStereotype] = ULTIMATE_SORTALS | {ClassStereotype.SUBKIND, ClassStereotype.CATEGORY}
+
+SEMI_RIGID: frozenset[ClassStereotype] = frozenset({ClassStereotype.MIXIN})
+
+ANTI_RIGID: frozenset[ClassStereotype] = frozenset(
+    {
+        ClassStereotype.ROLE,
+        ClassStereotype.PHASE,
+        ClassStereotype.HISTORICAL_ROLE,
+        ClassStereotype.ROLE_MIXIN,
+        ClassStereotype.PHASE_MIXIN,
+        ClassStereotype.HISTORICAL_ROLE_MIXIN,
+    }
+)
+
+# Stereotypes of higher-order classes, whose instances are types. Classes of all other stereotypes are first-order.
+HIGHER_ORDER: frozenset[ClassStereotype] = frozenset({ClassStereotype.TYPE})
+
+ENDURANT_NATURES: frozenset[OntologicalNature] = frozenset(
+    {
+        OntologicalNature.FUNCTIONAL_COMPLEX_NATURE,
+        OntologicalNature.COLLECTIVE_NATURE,
+        OntologicalNature.QUANTITY_NATURE,
+        OntologicalNature.RELATOR_NATURE,
+        OntologicalNature.INTRINSIC_MODE_NATURE,
+        OntologicalNature.EXTRINSIC_MODE_NATURE,
+        OntologicalNature.QUALITY_NATURE,
+    }
+)
+
+# Natures a class of each stereotype may be restricted to
+ALLOWED_NATURES: dict[ClassStereotype, frozenset[OntologicalNature]] = {
+    ClassStereotype.ABSTRACT: frozenset({OntologicalNature.ABSTRACT_NATURE}),
+    ClassStereotype.CATEGORY: ENDURANT_NATURES,
+    ClassStereotype.COLLECTIVE: frozenset({OntologicalNature.COLLECTIVE_NATURE}),
+    ClassStereotype.DATATYPE: frozenset({OntologicalNature.ABSTRACT_NATURE}),
+    ClassStereotype.ENUMERATION: frozenset({OntologicalNature.ABSTRACT_NATURE}),
+    ClassStereotype.EVENT: frozenset({OntologicalNature.EVENT_NATURE}),
+    ClassStereotype.HISTORICAL_ROLE: ENDURANT_NATURES,
+    ClassStereotype.HISTORICAL_ROLE_MIXIN: ENDURANT_NATURES,
+    ClassStereotype.KIND: frozenset({OntologicalNature.FUNCTIONAL_COMPLEX_NATURE}),
+    ClassStereotype.MIXIN: ENDURANT_NATURES,
+    ClassStereotype.MODE: frozenset({OntologicalNature.INTRINSIC_MODE_NATURE, OntologicalNature.EXTRINSIC_MODE_NATURE}),
+    ClassStereotype.PHASE: ENDURANT_NATURES,
+    ClassStereotype.PHASE_MIXIN: ENDURANT_NATURES,
+    ClassStereotype.QUALITY: frozenset({OntologicalNature.QUALITY_NATURE}),
+    ClassStereotype.QUANTITY: frozenset({OntologicalNature.QUANTITY_NATURE}),
+    ClassStereotype.RELATOR: frozenset({OntologicalNature.RELATOR_NATURE}),
+    ClassStereotype.ROLE: ENDURANT_NATURES,
+    ClassStereotype.ROLE_MIXIN: ENDURANT_NATURES,
+    ClassStereotype.SITUATION: frozenset({OntologicalNature.SITUATION_NATURE}),
+    ClassStereotype.SUBKIND: ENDURANT_NATURES,
+    ClassStereotype.TYPE: frozenset({OntologicalNature.TYPE_NATURE}),
+}
+
+# Stereotypes whose classes must be restricted to exactly one nature. Base sortals may leave it empty, as they inherit
+# the nature of their ultimate sortal, and non-sortals may aggregate instances of several natures.
+SINGLE_NATURE: frozenset[ClassStereotype] = frozenset(ALLOWED_NATURES) - BASE_SORTALS - NON_SORTALS
@@ -0,0 +1,260 @@
+"""Module for the Verifier class, which checks the OntoUML syntax rules over the elements of a project.
+
+The elements inspected by each rule are split into partitions (chunks) that are checked sequentially or in a thread or
+process pool. Diagnostics are streamed back as each element (or, in a pool, each partition) is checked, so callers can
+start consuming them before the whole project has been verified and can stop early, e.g., after a maximum number of
+errors.
+
+When a process pool is used, the project is sent once to each worker process, and partitions are sent as lists of
+element IDs. Rules must therefore be picklable (i.e., instances of classes defined at module level).
+"""
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import as_completed
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from ontouml_py.model.project import Project
+from ontouml_py.model.projectelement import ProjectElement
+from ontouml_py.utils.errors import OntoumlValueError
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.rule import Rule
+from ontouml_py.verification.rules.class_nature import ClassNatureRule
+from ontouml_py.verification.rules.generalization_type import GeneralizationTypeRule
+from ontouml_py.verification.rules.relator_mediation import RelatorMediationRule
+from ontouml_py.verification.rules.rigidity import RigidityRule
+from ontouml_py.verification.rules.sortality import SortalityRule
+from ontouml_py.verification.severity import Severity
+
+DEFAULT_RULES: tuple[Rule, ...] = (
+    ClassNatureRule(),
+    SortalityRule(),
+    RigidityRule(),
+    RelatorMediationRule(),
+    GeneralizationTypeRule(),
+)
+
+
+class Verifier:
+    """Run a set of verification rules over the elements of a project.
+
+    :ivar _rules: The rules checked by the verifier.
+    :vartype _rules: tuple[Rule, ...]
+    """
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None) -> None:
+        """Initialize a new Verifier.
+
+        :param rules: The rules to be checked. If not provided, DEFAULT_RULES are used.
+        :type rules: Optional[Iterable[Rule]]
+        """
+        self._rules: tuple[Rule, ...] = DEFAULT_RULES if rules is None else tuple(rules)
+
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        """Get the rules checked by the verifier.
+
+        :return: The verifier's rules.
+        :rtype: tuple[Rule, ...]
+        """
+        return self._rules
+
+    def verify(
+        self,
+        project: Project,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        chunk_size: int = 1000,
+        max_errors: Optional[int] = None,
+        fail_fast: bool = False,
+    ) -> Iterator[Diagnostic]:
+        """Verify the project, yielding diagnostics as they are produced.
+
+        If the project's generalizations form a cycle, a single 'acyclic_taxonomy' diagnostic is reported for the
+        project and the rules that require the taxonomy are skipped. When running in a pool, diagnostics are yielded
+        in the order partitions finish. Stopping the iteration early, or reaching max_errors, cancels the checks not
+        yet started.
+
+        :param project: The project to be verified.
+        :type project: Project
+        :param max_workers: Number of workers checking partitions. With 1, rules are checked in the calling thread,
+                            one element at a time.
+        :type max_workers: int
+        :param use_processes: Whether workers are processes instead of threads.
+        :type use_processes: bool
+        :param chunk_size: Maximum number of elements in each partition.
+        :type chunk_size: int
+        :param max_errors: Maximum number of diagnostics with severity error to be yielded. Diagnostics with other
+                           severities do not count. If None, all diagnostics are yielded.
+        :type max_errors: Optional[int]
+        :param fail_fast: Whether to stop after the first diagnostic with severity error, as with max_errors set to 1.
+        :type fail_fast: bool
+        :return: The diagnostics of the violations found.
+        :rtype: Iterator[Diagnostic]
+        :raises OntoumlValueError: If max_workers, chunk_size or max_errors is lower than one.
+        """
+        for name, value in (("max_workers", max_workers), ("chunk_size", chunk_size), ("max_errors", max_errors)):
+            if value is not None and value < 1:
+                raise OntoumlValueError(
+                    "invalid_verification_parameter",
+                    description="Invalid {name} for verification.",
+                    cause="Expected a positive integer, got {value}.",
+                    solution="Set {name} to 1 or more.",
+                    name=name,
+                    value=value,
+                )
+
+        diagnostics = self._verify(project, max_workers, use_processes, chunk_size)
+        if fail_fast:
+            max_errors = 1
+        if max_errors is None:
+            yield from diagnostics
+            return
+
+        errors = 0
+        try:
+            for diagnostic in diagnostics:
+                yield diagnostic
+                if diagnostic.severity == Severity.ERROR:
+                    errors += 1
+                    if errors == max_errors:
+                        return
+        finally:
+            diagnostics.close()
+
+    def _verify(
+        self, project: Project, max_workers: int, use_processes: bool, chunk_size: int
+    ) -> Generator[Diagnostic, None, None]:
+        """Verify the project with validated parameters, yielding all diagnostics.
+
+        :param project: The project to be verified.
+        :type project: Project
+        :param max_workers: Number of workers checking partitions.
+        :type max_workers: int
+        :param use_processes: Whether workers are processes instead of threads.
+        :type use_processes: bool
+        :param chunk_size: Maximum number of elements in each partition.
+        :type chunk_size: int
+        :return: The diagnostics of all violations found.
+        :rtype: Generator[Diagnostic, None, None]
+        """
+        rules = self._rules
+        if any(rule.requires_taxonomy for rule in rules):
+            try:
+                project.get_taxonomy()
+            except ValueError:
+                yield _taxonomy_cycle_diagnostic(project)
+                rules = tuple(rule for rule in rules if not rule.requires_taxonomy)
+
+        if max_workers == 1:
+            for rule_index, elements in _partition(project, rules, chunk_size):
+                for element in elements:
+                    yield from rules[rule_index].check(element)
+            return
+
+        partitions = list(_partition(project, rules, chunk_size))
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(project, rules))
+            futures = [
+                executor.submit(_check_element_ids, rule_index, [element.id for element in elements])
+                for rule_index, elements in partitions
+            ]
+        else:
+            executor = ThreadPoolExecutor(max_workers)
+            futures = [
+                executor.submit(_check_elements, rules[rule_index], elements) for rule_index, elements in partitions
+            ]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _partition(
+    project: Project, rules: tuple[Rule, ...], chunk_size: int
+) -> Iterator[tuple[int, list[ProjectElement]]]:
+    """Split the elements inspected by each rule into chunks.
+
+    :param project: The project being verified.
+    :type project: Project
+    :param rules: The rules being checked.
+    :type rules: tuple[Rule, ...]
+    :param chunk_size: Maximum number of elements in each chunk.
+    :type chunk_size: int
+    :return: Pairs of rule index and elements to be checked by the rule.
+    :rtype: Iterator[tuple[int, list[ProjectElement]]]
+    """
+    project_elements = project.get_elements()
+    for rule_index, rule in enumerate(rules):
+        for element_type in rule.element_types:
+            elements = list(project_elements.get(element_type, ()))
+            for start in range(0, len(elements), chunk_size):
+                yield rule_index, elements[start : start + chunk_size]
+
+
+def _check_elements(rule: Rule, elements: Iterable[ProjectElement]) -> list[Diagnostic]:
+    """Check a chunk of elements against a rule.
+
+    :param rule: The rule to be checked.
+    :type rule: Rule
+    :param elements: The elements to be checked.
+    :type elements: Iterable[ProjectElement]
+    :return: The diagnostics produced for the chunk.
+    :rtype: list[Diagnostic]
+    """
+    return [diagnostic for element in elements for diagnostic in rule.check(element)]
+
+
+def _taxonomy_cycle_diagnostic(project: Project) -> Diagnostic:
+    """Create the diagnostic reported when the project's generalizations form a cycle.
+
+    :param project: The project being verified.
+    :type project: Project
+    :return: The diagnostic for the project.
+    :rtype: Diagnostic
+    """
+    return Diagnostic(
+        rule_code="acyclic_taxonomy",
+        element_id=project.id,
+        element_type=type(project).__name__,
+        description="Cyclic generalizations.",
+        cause="The generalizations of the project form a cycle, so the rules that depend on the taxonomy were not "
+        "checked.",
+        solution="Remove or reassign the generalizations so that no classifier is its own supertype.",
+    )
+
+
+# State of worker processes, set once per process by _init_worker
+_worker_rules: tuple[Rule, ...] = ()
+_worker_elements: dict[str, ProjectElement] = {}
+
+
+def _init_worker(project: Project, rules: tuple[Rule, ...]) -> None:
+    """Initialize a worker process with its copy of the project and of the rules.
+
+    :param project: The project being verified.
+    :type project: Project
+    :param rules: The rules being checked.
+    :type rules: tuple[Rule, ...]
+    """
+    global _worker_rules, _worker_elements
+    _worker_rules = rules
+    _worker_elements = {element.id: element for elements in project.get_elements().values() for element in elements}
+
+
+def _check_element_ids(rule_index: int, element_ids: list[str]) -> list[Diagnostic]:
+    """Check a chunk of elements, identified by their IDs, in a worker process.
+
+    :param rule_index: The index of the rule to be checked.
+    :type rule_index: int
+    :param element_ids: The IDs of the elements to be checked.
+    :type element_ids: list[str]
+    :return: The diagnostics produced for the chunk.
+    :rtype: list[Diagnostic]
+    """
+    return _check_elements(_worker_rules[rule_index], (_worker_elements[element_id] for element_id in element_ids))
@@ -1,9 +1,17 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
 import pytest
+from langstring import LangString
 
 from ontouml_py.model.anchor import Anchor
 from ontouml_py.model.binaryrelation import BinaryRelation
 from ontouml_py.model.cardinality import Cardinality
 from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.aggregationkind import AggregationKind
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
 from ontouml_py.model.generalization import Generalization
 from ontouml_py.model.generalizationset import GeneralizationSet
 from ontouml_py.model.literal import Literal
@@ -14,6 +22,15 @@ from ontouml_py.model.project import Project
 from ontouml_py.model.property import Property
 
 
+def get_state(value: object) -> object:
+    """Get a comparable state of a field value, with elements replaced by their IDs."""
+    if isinstance(value, (set, frozenset, list)):
+        return sorted((get_state(item) for item in value), key=repr)
+    if isinstance(value, LangString):
+        return "LangString", value.text, value.lang
+    return getattr(value, "id", value)
+
+
 @pytest.fixture
 def valid_project():
     return Project()
@@ -79,6 +96,49 @@ def valid_property(valid_class):
     return Property(valid_class)
 
 
+@pytest.fixture
+def project() -> Project:
+    """Project with elements of all types and fields of all kinds of values."""
+    project = Project(
+        names={LangString("Project", "en"), LangString("Projeto", "pt")},
+        keywords={"a", "b"},
+        created=datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=-3))),
+    )
+    project.root_package = project.create_package()
+    nested = project.create_package(description=LangString("Nested"))
+    project.root_package.add_package(nested)
+    person = project.create_class(
+        stereotype=ClassStereotype.KIND,
+        custom_properties={("weight", 1.5), ("big", 2**70), ("tags", ("x", None, True))},
+        order="*",
+    )
+    employee = project.create_class(stereotype="custom", restricted_to={OntologicalNature.FUNCTIONAL_COMPLEX_NATURE})
+    enumeration = project.create_class_enumeration()
+    enumeration.create_literal(names={LangString("A")})
+    enumeration.create_literal()
+    for class_ in (person, employee, enumeration):
+        nested.add_class(class_)
+    general = person.create_property(property_type=enumeration, cardinality=Cardinality.of(0, "*", is_ordered=True))
+    specific = person.create_property(property_type=employee, aggregation_kind=AggregationKind.SHARED)
+    general.subsetted_by = {specific}
+    general.redefined_by = {specific}
+    relation = project.create_binary_relation()
+    relation.create_property(property_type=person)
+    relation.create_property(property_type=employee)
+    nested.add_binary_relation(relation)
+    nary = project.create_nary_relation()
+    for end in (person, employee, enumeration):
+        nary.create_property(property_type=end)
+    generalization = project.create_generalization(general=person, specific=employee)
+    project.root_package.add_generalization(generalization)
+    project.create_generalization_set(generalizations={generalization}, categorizer=enumeration, is_complete=True)
+    note = project.create_note(text=LangString("Note", "en"))
+    project.root_package.add_note(note)
+    project.create_anchor(note=note, target=person)
+    project.create_diagram()
+    return project
+
+
 def test_fixtures_instantiations(
     valid_project,
     valid_note,
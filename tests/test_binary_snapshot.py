@@ -0,0 +1,124 @@
+import io
+from datetime import timedelta
+
+import pytest
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.project import Project
+from ontouml_py.model.sharedemptyset import EMPTY_SET
+from ontouml_py.serialization.binary_snapshot import FORMAT_VERSION
+from ontouml_py.serialization.binary_snapshot import MAGIC
+from ontouml_py.serialization.binary_snapshot import read_binary
+from ontouml_py.serialization.binary_snapshot import write_binary
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+from tests.conftest import get_state
+
+
+def save_and_load(project: Project) -> Project:
+    output = io.BytesIO()
+    write_binary(project, output)
+    return read_binary(io.BytesIO(output.getvalue()))
+
+
+def test_binary_snapshot_round_trip(project: Project) -> None:
+    """Test that loading a snapshot gives back the fields, fields set and owners of all elements."""
+    loaded = save_and_load(project)
+    loaded_elements = loaded.get_elements()
+    assert get_state(loaded.__dict__) == get_state(project.__dict__)
+    for element_type, elements in project.get_elements().items():
+        loaded_by_id = {element.id: element for element in loaded_elements[element_type]}
+        assert loaded_by_id.keys() == {element.id for element in elements}
+        for element in elements:
+            loaded_element = loaded_by_id[element.id]
+            assert type(loaded_element) is type(element)
+            for name in _get_field_names(type(element)):
+                assert get_state(loaded_element.__dict__[name]) == get_state(element.__dict__[name]), name
+            assert loaded_element.__pydantic_fields_set__ == element.__pydantic_fields_set__
+            assert loaded_element.project is loaded
+            assert get_state(getattr(loaded_element, "package", None)) == get_state(getattr(element, "package", None))
+    assert loaded.created == project.created
+    assert loaded.created.utcoffset() == timedelta(hours=-3)
+    assert export_json_string(loaded) == export_json_string(project)
+
+
+def test_binary_snapshot_rebuilds_indexes(project: Project) -> None:
+    """Test that the indexes derived from the fields of elements are rebuilt when loading."""
+    loaded = save_and_load(project)
+    person = next(class_ for class_ in loaded.get_classes() if class_.stereotype == ClassStereotype.KIND)
+    general, specific = person.properties
+    assert general.classifier is person
+    assert specific.subsets == {general} and specific.redefines == {general}
+    assert general.get_all_subsetted_by() == {specific}
+    assert len(person.relations()) == 2
+    enumeration = general.property_type
+    assert {literal.enumeration for literal in enumeration.literals} == {enumeration}
+    assert person.package.get_classes() == {person, specific.property_type, enumeration}
+    assert loaded.get_taxonomy().get_supertypes(specific.property_type) == {person}
+    # Empty sets are shared again
+    assert person.__dict__["contributors"] is EMPTY_SET
+
+    # Loaded elements are validated again when assigned
+    person.is_abstract = True
+    with pytest.raises(ValueError):
+        person.is_abstract = "x"
+
+
+def test_project_save_and_load_binary(project: Project, tmp_path) -> None:
+    """Test saving and loading snapshots through the project's methods."""
+    path = tmp_path / "project.snapshot"
+    project.save_binary(path)
+    assert path.read_bytes().startswith(MAGIC)
+    assert export_json_string(Project.load_binary(path)) == export_json_string(project)
+
+
+def test_binary_snapshot_unsupported_value(project: Project) -> None:
+    """Test that values that snapshots cannot store are reported with their element and field."""
+    person = project.create_class(custom_properties={("values", frozenset({1}))})
+    with pytest.raises(OntoumlTypeError) as error:
+        write_binary(project, io.BytesIO())
+    assert error.value.code == "unsupported_snapshot_value"
+    assert error.value.element is person
+
+
+def test_binary_snapshot_unknown_reference(project: Project) -> None:
+    """Test that references to elements of other projects are rejected."""
+    foreign = Project().create_class()
+    next(iter(project.get_properties())).property_type = foreign
+    with pytest.raises(OntoumlValueError) as error:
+        write_binary(project, io.BytesIO())
+    assert error.value.code == "unknown_snapshot_reference"
+
+
+def test_binary_snapshot_pending_assignments(project: Project) -> None:
+    """Test that projects with assignments pending validation are not saved."""
+    project.set_validation_policy(ValidationPolicy.DEFERRED)
+    next(iter(project.get_classes())).is_abstract = True
+    with pytest.raises(OntoumlValueError) as error:
+        write_binary(project, io.BytesIO())
+    assert error.value.code == "pending_assignments"
+
+
+@pytest.mark.parametrize(
+    "change, code",
+    [
+        (lambda data: b"NOTASNAP" + data[8:], "invalid_snapshot"),
+        (
+            lambda data: data[:8] + (FORMAT_VERSION + 1).to_bytes(2, "little") + data[10:],
+            "unsupported_snapshot_version",
+        ),
+        (lambda data: data[:-3], "invalid_snapshot"),
+        (lambda data: data + b"\0", "invalid_snapshot"),
+        (lambda data: data[:4], "invalid_snapshot"),
+    ],
+)
+def test_binary_snapshot_invalid(project: Project, change, code: str) -> None:
+    """Test that invalid, truncated and other version snapshots are rejected."""
+    output = io.BytesIO()
+    write_binary(project, output)
+    with pytest.raises(OntoumlValueError) as error:
+        read_binary(io.BytesIO(change(output.getvalue())))
+    assert error.value.code == code
@@ -1,7 +1,12 @@
+import copy
+
 import pytest
 from pydantic import ValidationError
 
+from ontouml_py.model.cardinality import _intern
+from ontouml_py.model.cardinality import _INTERNED_MAXSIZE
 from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.cardinality import UNBOUNDED
 
 
 # Assuming the necessary imports are already in place
@@ -79,14 +84,83 @@ def test_cardinality_invalid_attribute_post_init(invalid_value):
         c.is_unique = invalid_value
 
 
-def test_cardinality_attribute_assignment():
-    """Test attribute assignment for a Cardinality instance."""
+def test_cardinality_is_immutable():
+    """Test that the attributes of a Cardinality instance cannot be reassigned."""
     cardinality = Cardinality()
-    cardinality.lower_bound = 1
-    cardinality.upper_bound = "5"
-    cardinality.is_ordered = True
-    cardinality.is_unique = False
-    assert cardinality.lower_bound == 1, "Cardinality attribute 'lower_bound' should be assignable"
-    assert cardinality.upper_bound == "5", "Cardinality attribute 'upper_bound' should be assignable"
-    assert cardinality.is_ordered, "Cardinality attribute 'is_ordered' should be assignable"
-    assert not cardinality.is_unique, "Cardinality attribute 'is_unique' should be assignable"
+    with pytest.raises(ValidationError, match="Instance is frozen"):
+        cardinality.lower_bound = 0
+    with pytest.raises(ValidationError, match="Instance is frozen"):
+        cardinality.upper_bound = "5"
+    assert cardinality.lower_bound == 1 and cardinality.upper_bound == 1, "Cardinality bounds should be unchanged"
+
+
+@pytest.mark.parametrize(
+    "lower_bound, upper_bound, lower, upper",
+    [(1, 1, 1, 1), ("0", "*", 0, UNBOUNDED), (2, "5", 2, 5), (None, -1, None, None), ("valid", "many", None, None)],
+)
+def test_cardinality_normalized_bounds(lower_bound, upper_bound, lower, upper):
+    """Test the normalization of bounds into integers.
+
+    :param lower_bound: Lower bound as provided.
+    :param upper_bound: Upper bound as provided.
+    :param lower: Expected normalized lower bound.
+    :param upper: Expected normalized upper bound.
+    """
+    cardinality = Cardinality(lower_bound=lower_bound, upper_bound=upper_bound)
+    assert cardinality.lower == lower and cardinality.upper == upper
+    assert cardinality.lower_bound == lower_bound, "The provided bound should be kept unchanged"
+
+
+@pytest.mark.parametrize(
+    "lower_bound, upper_bound, is_optional, is_many, is_unbounded",
+    [
+        (1, 1, False, False, False),
+        (0, 1, True, False, False),
+        (0, "*", True, True, True),
+        ("1", "3", False, True, False),
+    ],
+)
+def test_cardinality_predicates(lower_bound, upper_bound, is_optional, is_many, is_unbounded):
+    """Test the optional, many and unbounded predicates of Cardinality.
+
+    :param lower_bound: Lower bound of the cardinality.
+    :param upper_bound: Upper bound of the cardinality.
+    :param is_optional: Expected value of is_optional.
+    :param is_many: Expected value of is_many.
+    :param is_unbounded: Expected value of is_unbounded.
+    """
+    cardinality = Cardinality(lower_bound=lower_bound, upper_bound=upper_bound)
+    assert cardinality.is_optional is is_optional
+    assert cardinality.is_many is is_many
+    assert cardinality.is_unbounded is is_unbounded
+
+
+def test_cardinality_contains():
+    """Test the containment of a cardinality range in another."""
+    assert Cardinality.of(0, "*").contains(Cardinality.of(1, 1))
+    assert Cardinality.of(1, "*").contains(Cardinality.of(2, "5"))
+    assert not Cardinality.of(1, 1).contains(Cardinality.of(0, 1))
+    assert not Cardinality.of(0, "*").contains(Cardinality(lower_bound="valid"))
+
+
+def test_cardinality_interning(valid_class):
+    """Test that cardinalities obtained through `of` and property defaults are shared instances.
+
+    :param valid_class: A valid Class instance used to create properties.
+    """
+    assert Cardinality.of(0, "*") is Cardinality.of(0, "*")
+    assert Cardinality.of(1, 1) is not Cardinality.of("1", "1"), "Bounds of different types should not be merged"
+    assert Cardinality.of(1, 1) == Cardinality(), "Interned cardinalities should equal newly created ones"
+    first = valid_class.create_property()
+    second = valid_class.create_property()
+    assert first.cardinality is second.cardinality is Cardinality.of()
+    assert copy.deepcopy(first.cardinality) is first.cardinality
+
+
+def test_cardinality_interning_is_bounded():
+    """Test that `of` keeps a bounded number of shared instances, still sharing the recently requested ones."""
+    for upper_bound in range(2 * _INTERNED_MAXSIZE):
+        Cardinality.of(0, upper_bound)
+    assert _intern.cache_info().currsize == _INTERNED_MAXSIZE
+    assert Cardinality.of(0, 2 * _INTERNED_MAXSIZE - 1) is Cardinality.of(0, 2 * _INTERNED_MAXSIZE - 1)
+    assert Cardinality.of(1, True) is not Cardinality.of(1, 1), "Bounds of different types should not be merged"
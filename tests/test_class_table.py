@@ -0,0 +1,71 @@
+import itertools
+
+import pytest
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.project import Project
+from ontouml_py.verification.class_table import FIRST_ORDER
+from ontouml_py.verification.class_table import find_inconsistent_classes
+from ontouml_py.verification.class_table import get_order_kind
+from ontouml_py.verification.class_table import HIGHER_ORDER_KIND
+from ontouml_py.verification.class_table import INVALID_ORDER
+from ontouml_py.verification.rules.class_nature import ClassNatureRule
+
+
+@pytest.mark.parametrize(
+    "order, expected",
+    [(1, FIRST_ORDER), ("1", FIRST_ORDER), (2, HIGHER_ORDER_KIND), ("*", HIGHER_ORDER_KIND), (0, INVALID_ORDER)]
+    + [("many", INVALID_ORDER), (-1, INVALID_ORDER)],
+)
+def test_get_order_kind(order: object, expected: int) -> None:
+    """Test the classification of class orders.
+
+    :param order: The order of a class.
+    :param expected: The expected kind of order.
+    """
+    assert get_order_kind(order) == expected
+
+
+def test_find_inconsistent_classes_matches_rule(valid_project: Project) -> None:
+    """Test that the table-driven check finds exactly the classes reported by ClassNatureRule.
+
+    Every stereotype is combined with several nature sets and orders, including classes without stereotype.
+
+    :param valid_project: A valid Project instance.
+    """
+    nature_sets = [set(), {OntologicalNature.FUNCTIONAL_COMPLEX_NATURE}, {OntologicalNature.TYPE_NATURE}]
+    nature_sets.append({OntologicalNature.INTRINSIC_MODE_NATURE, OntologicalNature.EXTRINSIC_MODE_NATURE})
+    stereotypes = [None, "customStereotype", *ClassStereotype]
+    classes = [
+        valid_project.create_class(stereotype=stereotype, restricted_to=set(natures), order=order)
+        for stereotype, natures, order in itertools.product(stereotypes, nature_sets, [1, 2, "*", "x"])
+    ]
+
+    rule = ClassNatureRule()
+    expected = [class_ for class_ in classes if list(rule.check(class_))]
+    assert expected, "The combinations should include inconsistent classes"
+    assert find_inconsistent_classes(classes) == expected
+
+
+def test_find_inconsistent_classes_of_factories(valid_project: Project) -> None:
+    """Test that the classes created by the project's factories are consistent.
+
+    :param valid_project: A valid Project instance.
+    """
+    for stereotype in ClassStereotype:
+        getattr(valid_project, f"create_class_{stereotype.name.lower()}")()
+    assert find_inconsistent_classes(valid_project.get_classes()) == []
+    assert find_inconsistent_classes([]) == []
+
+
+def test_find_inconsistent_classes_accepts_any_iterable(valid_project: Project) -> None:
+    """Test that classes can be given as a generator.
+
+    :param valid_project: A valid Project instance.
+    """
+    offender = valid_project.create_class(stereotype=ClassStereotype.KIND)
+    valid_project.create_class_kind()
+    classes = (class_ for class_ in valid_project.get_classes() if isinstance(class_, Class))
+    assert find_inconsistent_classes(classes) == [offender]
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.compressed_io import COMPRESSIONS
+from ontouml_py.serialization.compressed_io import detect_compression
+from ontouml_py.serialization.compressed_io import open_compressed
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.json_importer import import_json
+from ontouml_py.serialization.json_importer import import_json_string
+from ontouml_py.utils.errors import OntoumlValueError
+from tests.conftest import get_state
+
+
+def reexport(project: Project) -> str:
+    """Export a project after a round trip through an uncompressed document, which may reorder its elements."""
+    return export_json_string(import_json_string(export_json_string(project)))
+
+
+@pytest.mark.parametrize("compression", [None, *COMPRESSIONS])
+def test_json_round_trip_through_streams(project: Project, compression: str) -> None:
+    stream = io.BytesIO()
+    with open_compressed(stream, "wt", compression) as output:
+        export_json(project, output)
+    assert not stream.closed
+    data = stream.getvalue()
+    assert detect_compression(data) == compression
+
+    stream.seek(0)
+    imported = import_json(stream, chunk_size=64)
+    assert not stream.closed
+    assert export_json_string(imported) == reexport(project)
+
+
+def test_compression_inferred_from_suffix(project: Project, tmp_path) -> None:
+    path = tmp_path / "project.json.xz"
+    with open_compressed(path, "wt") as output:
+        export_json(project, output)
+    with open(path, "rb") as source:
+        assert detect_compression(source.read(6)) == "lzma"
+        source.seek(0)
+        assert export_json_string(import_json(source)) == reexport(project)
+    with open_compressed(path, "rt") as source:
+        assert export_json_string(import_json(source)) == reexport(project)
+
+
+def test_compressed_binary_snapshot(project: Project, tmp_path) -> None:
+    path = tmp_path / "project.snap.gz"
+    project.save_binary(path)
+    with open(path, "rb") as source:
+        assert detect_compression(source.read(6)) == "gzip"
+    assert get_state(Project.load_binary(path)) == get_state(project)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(OntoumlValueError, match="Unsupported compression 'rar'"):
+        open_compressed(io.BytesIO(), "wb", "rar")
+    with pytest.raises(OntoumlValueError, match="Invalid mode"):
+        open_compressed(io.BytesIO(), "a")
@@ -0,0 +1,111 @@
+import json
+from datetime import datetime
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.ontoumlelement import _untracked_changes
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.delta_exporter import export_delta_string
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.json_importer import import_json_string
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+@pytest.fixture
+def delta_project() -> Project:
+    """Project with a package holding a class with an attribute, a role and a generalization between them."""
+    project = Project()
+    package = project.create_package(id="package")
+    person = project.create_class_kind(id="person", names={LangString("Person")})
+    person.create_property(id="name")
+    student = project.create_class_role(id="student")
+    generalization = project.create_generalization(id="generalization", general=person, specific=student)
+    package.add_class(person)
+    package.add_class(student)
+    package.add_generalization(generalization)
+    return project
+
+
+def get_ids(document: dict, name: str) -> list[str]:
+    return [element["id"] for element in document[name]]
+
+
+def test_changes_are_recorded(delta_project: Project) -> None:
+    person = delta_project.get_class_by_id("person")
+    assert person.modified is not None
+    assert not delta_project.get_changed()
+
+    export_delta_string(delta_project)
+    assert not delta_project.get_changed()
+    person.is_abstract = True
+    assert delta_project.get_changed() == {person}
+    assert person.modified >= person.created
+
+    with pytest.raises(ValueError):
+        person.is_abstract = "not a boolean"
+    assert person.is_abstract is True
+
+    adult = delta_project.create_class_phase(id="adult")
+    assert delta_project.get_changed() == {person, adult}
+
+
+def test_imports_are_not_changes(delta_project: Project) -> None:
+    imported = import_json_string(export_json_string(delta_project))
+    export_delta_string(imported)
+    assert all(element.modified is None for element in imported.get_elements()["Class"])
+
+    with _untracked_changes():
+        imported.get_class_by_id("person").is_abstract = True
+    assert not imported.get_changed() and imported.get_class_by_id("person").modified is None
+
+
+def test_explicit_modified_is_kept(delta_project: Project) -> None:
+    export_delta_string(delta_project)
+    person = delta_project.get_class_by_id("person")
+    person.modified = datetime(2030, 1, 1)
+    assert person.modified == datetime(2030, 1, 1)
+    assert person in delta_project.get_changed()
+
+
+def test_delta_since_last_checkpoint(delta_project: Project) -> None:
+    text, checkpoint = export_delta_string(delta_project)
+    document = json.loads(text)
+    assert document["since"] is None
+    assert get_ids(document, "created") == ["person", "student", "generalization", "package"]
+    assert not document["modified"] and not document["deleted"]
+    assert document["created"][0]["properties"][0]["id"] == "name"
+    assert document["created"][0]["package"] == {"id": "package", "type": "Package"}
+
+    text, checkpoint = export_delta_string(delta_project, checkpoint)
+    assert json.loads(text)["created"] == []
+
+    person = delta_project.get_class_by_id("person")
+    delta_project.get_property_by_id("name").is_read_only = True
+    delta_project.create_class_phase(id="adult")
+    student = delta_project.get_class_by_id("student")
+    delta_project.get_elements()["Class"].remove(student)
+    document = json.loads(export_delta_string(delta_project, checkpoint)[0])
+    assert document["since"] == checkpoint.time.isoformat()
+    assert get_ids(document, "created") == ["adult"]
+    assert get_ids(document, "modified") == ["person"]
+    assert document["modified"][0]["properties"][0]["isReadOnly"] is True
+    assert document["deleted"] == [{"id": "student", "type": "Class"}]
+
+
+def test_delta_since_older_checkpoint(delta_project: Project) -> None:
+    _, old_checkpoint = export_delta_string(delta_project)
+    delta_project.get_class_by_id("student").is_derived = True
+    _, checkpoint = export_delta_string(delta_project, old_checkpoint)
+    delta_project.get_generalization_by_id("generalization").names = {LangString("is a")}
+
+    document = json.loads(export_delta_string(delta_project, old_checkpoint)[0])
+    assert get_ids(document, "modified") == ["student", "generalization"]
+    document = json.loads(export_delta_string(delta_project, checkpoint)[0])
+    assert get_ids(document, "modified") == ["generalization"]
+
+
+def test_checkpoint_of_another_project(delta_project: Project) -> None:
+    _, checkpoint = export_delta_string(Project())
+    with pytest.raises(OntoumlValueError, match="Invalid checkpoint"):
+        export_delta_string(delta_project, checkpoint)
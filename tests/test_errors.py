@@ -0,0 +1,80 @@
+import pickle
+
+import pytest
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.utils.errors import fill_template
+from ontouml_py.utils.errors import OntoumlError
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+class CountingRepr:
+    """Object that counts how many times it is rendered."""
+
+    renders = 0
+
+    def __repr__(self) -> str:
+        CountingRepr.renders += 1
+        return "<counting>"
+
+    __str__ = __repr__
+
+
+def test_error_message_is_formatted_lazily() -> None:
+    """Test that the message of a structured exception is only formatted when rendered, and only once."""
+    CountingRepr.renders = 0
+    error = OntoumlValueError(
+        "code", description="Value {value}.", cause="Cause.", solution="Solution.", value=CountingRepr()
+    )
+    assert CountingRepr.renders == 0, "Raising the exception should not render its arguments"
+    message = str(error)
+    assert "* Description: Value <counting>." in message
+    assert "* Cause: Cause." in message
+    assert str(error) is message
+    assert CountingRepr.renders == 1
+
+
+@pytest.mark.parametrize("error_type, builtin_type", [(OntoumlValueError, ValueError), (OntoumlTypeError, TypeError)])
+def test_error_types(error_type: type[OntoumlError], builtin_type: type[Exception]) -> None:
+    """Test that structured exceptions can be caught as the corresponding built-in exceptions.
+
+    :param error_type: A structured exception type.
+    :param builtin_type: The built-in exception type it specializes.
+    """
+    with pytest.raises(builtin_type, match="Description: Invalid x") as error:
+        raise error_type("invalid_x", description="Invalid {name}.", name="x")
+    assert error.value.code == "invalid_x"
+    assert error.value.get_description() == "Invalid x."
+    assert error.value.get_cause() == "undefined"
+
+
+def test_error_pickling() -> None:
+    """Test that structured exceptions keep their templates and arguments when pickled."""
+    error = OntoumlValueError("code", description="Invalid {value}.", element="element", value=1)
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is OntoumlValueError
+    assert restored.code == "code"
+    assert restored.element == "element"
+    assert restored.get_description() == "Invalid 1."
+    assert str(restored) == str(error)
+
+
+def test_fill_template() -> None:
+    """Test that templates are filled with their arguments and used as they are without arguments."""
+    assert fill_template("{a} and {b.real}", {"a": "x", "b": 2}) == "x and 2"
+    assert fill_template("Literal {braces}", {}) == "Literal {braces}"
+
+
+def test_delete_missing_literal_error(valid_class: Class, another_valid_class: Class) -> None:
+    """Test that removing a literal not in a class raises a structured error referencing both elements.
+
+    :param valid_class: A valid Class instance.
+    :param another_valid_class: Another valid Class instance.
+    """
+    literal = another_valid_class.create_literal()
+    with pytest.raises(ValueError, match=f"Literal not found in Class with ID {valid_class.id}") as error:
+        valid_class.delete_literal(literal)
+    assert error.value.code == "literal_not_found"
+    assert error.value.element is valid_class
+    assert error.value.arguments["literal"] is literal
@@ -0,0 +1,92 @@
+import io
+import re
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.gufo_exporter import export_gufo
+from ontouml_py.serialization.gufo_exporter import export_gufo_string
+from ontouml_py.utils.errors import OntoumlValueError
+
+BASE = "https://example.org/model#"
+N_TRIPLE = re.compile(r'<[^<>"]+> <[^<>"]+> (<[^<>"]+>|"([^"\\]|\\.)*"(@[\w-]+)?) \.')
+
+
+@pytest.fixture
+def gufo_project() -> Project:
+    project = Project(namespace="https://example.org/model")
+    person = project.create_class(id="a", stereotype=ClassStereotype.KIND, names={LangString("Person", "en")})
+    student = project.create_class(stereotype=ClassStereotype.ROLE, names={LangString("student", "en")})
+    enrollment = project.create_class(
+        stereotype=ClassStereotype.RELATOR,
+        names={LangString("Enrollment", "en"), LangString("Matrícula", "pt")},
+        description=LangString('The "enrollment"\nof a student'),
+    )
+    # Minted after the class with the same name, as its ID comes after
+    project.create_class(
+        id="b",
+        stereotype=ClassStereotype.MODE,
+        names={LangString("Person", "pt")},
+        restricted_to={OntologicalNature.EXTRINSIC_MODE_NATURE},
+    )
+    string = project.create_class(stereotype=ClassStereotype.DATATYPE, names={LangString("String")})
+    person.create_property(property_type=string, names={LangString("full name")})
+    project.create_generalization(general=person, specific=student)
+    relation = project.create_binary_relation(stereotype=RelationStereotype.MEDIATION, names={LangString("involves")})
+    relation.create_property(property_type=enrollment)
+    relation.create_property(property_type=student)
+    return project
+
+
+def test_export_gufo_turtle(gufo_project: Project) -> None:
+    """Test the mapping of classes, attributes, generalizations and relations to gUFO in Turtle."""
+    turtle = export_gufo_string(gufo_project)
+    assert f"@prefix : <{BASE}> .\n" in turtle and "@prefix gufo: <http://purl.org/nemo/gufo#> .\n" in turtle
+    assert (
+        "<https://example.org/model> rdf:type owl:Ontology ;\n    owl:imports <http://purl.org/nemo/gufo#> ." in turtle
+    )
+    assert ":Person rdf:type owl:Class, gufo:Kind ;\n    rdfs:subClassOf gufo:FunctionalComplex ;\n" in turtle
+    assert ":Student rdf:type owl:Class, gufo:Role ;" in turtle
+    assert ":Enrollment rdf:type owl:Class, gufo:Kind ;\n    rdfs:subClassOf gufo:Relator ;\n" in turtle
+    assert (
+        'rdfs:label "Enrollment"@en, "Matrícula"@pt ;\n    rdfs:comment "The \\"enrollment\\"\\nof a student" .'
+        in turtle
+    )
+    # Names that clash are minted from IDs, and single natures take precedence over stereotypes
+    assert ":b rdf:type owl:Class, gufo:Kind ;\n    rdfs:subClassOf gufo:ExtrinsicMode ;" in turtle
+    assert ':String rdf:type rdfs:Datatype ;\n    rdfs:label "String" .' in turtle
+    assert ":fullName rdf:type owl:DatatypeProperty ;\n    rdfs:domain :Person ;\n    rdfs:range :String ;" in turtle
+    assert ":Student rdfs:subClassOf :Person .\n" in turtle
+    assert (
+        ":involves rdf:type owl:ObjectProperty ;\n    rdfs:subPropertyOf gufo:mediates ;\n"
+        "    rdfs:domain :Enrollment ;\n    rdfs:range :Student ;" in turtle
+    )
+
+
+def test_export_gufo_ntriples(gufo_project: Project) -> None:
+    """Test that N-Triples output has a single triple per line, with full IRIs."""
+    output = io.StringIO()
+    export_gufo(gufo_project, output, base_iri="urn:example:", rdf_format="ntriples")
+    lines = output.getvalue().splitlines()
+    assert all(N_TRIPLE.fullmatch(line) for line in lines)
+    assert "<urn:example:Student> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <urn:example:Person> ." in lines
+    assert len(lines) == len(set(lines)) == 31
+
+
+def test_export_gufo_default_namespace() -> None:
+    """Test that projects without namespace get IRIs made of their IDs."""
+    project = Project()
+    class_ = project.create_class()
+    turtle = export_gufo_string(project)
+    assert f"@prefix : <urn:ontouml:{project.id}#> .\n" in turtle
+    assert f":{class_.id} rdf:type owl:Class .\n" in turtle
+
+
+def test_export_gufo_unsupported_format(gufo_project: Project) -> None:
+    with pytest.raises(OntoumlValueError) as error:
+        export_gufo_string(gufo_project, rdf_format="rdfxml")
+    assert error.value.code == "unsupported_rdf_format"
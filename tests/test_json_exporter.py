@@ -0,0 +1,170 @@
+import io
+import json
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.enumerations.aggregationkind import AggregationKind
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import element_to_dict
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.utils.errors import OntoumlTypeError
+
+
+@pytest.fixture
+def exported_project() -> Project:
+    """Project with a root package, a nested package, and elements both inside and outside packages."""
+    project = Project(names={LangString("Project", "en")})
+    root = project.create_package(names={LangString("Root")})
+    project.root_package = root
+    nested = project.create_package()
+    root.add_package(nested)
+    person = project.create_class_kind(names={LangString("Person", "en"), LangString("Pessoa", "pt")})
+    root.add_class(person)
+    student = project.create_class_role()
+    nested.add_class(student)
+    generalization = project.create_generalization(general=person, specific=student)
+    nested.add_generalization(generalization)
+    project.create_class_relator()  # Not in any package
+    return project
+
+
+def find_content(package: dict, element_id: str) -> dict:
+    """Find an element in a package of an exported document, searching nested packages."""
+    for content in package["contents"] or []:
+        if content["id"] == element_id:
+            return content
+        if content["type"] == "Package":
+            try:
+                return find_content(content, element_id)
+            except KeyError:
+                pass
+    raise KeyError(element_id)
+
+
+def test_export_json_writes_document(exported_project: Project) -> None:
+    """Test that the exported document follows the structure of the schema, with contents nested in packages."""
+    output = io.StringIO()
+    export_json(exported_project, output)
+    document = json.loads(output.getvalue())
+
+    assert document["type"] == "Project"
+    assert document["id"] == exported_project.id
+    assert document["name"] == {"en": "Project"}
+    assert document["diagrams"] is None
+    model = document["model"]
+    assert model["id"] == exported_project.root_package.id
+    assert model["name"] == "Root"
+    assert [content["type"] for content in model["contents"]] == ["Package", "Class", "Class"]
+
+    person = next(class_ for class_ in exported_project.get_classes() if class_.names)
+    assert find_content(model, person.id)["name"] == {"en": "Person", "pt": "Pessoa"}
+    generalization = next(iter(exported_project.get_generalizations()))
+    exported_generalization = find_content(model["contents"][0], generalization.id)
+    assert exported_generalization["general"] == {"id": person.id, "type": "Class"}
+
+
+def test_export_json_writes_orphans_in_model(exported_project: Project) -> None:
+    """Test that elements outside any package are written as contents of the model."""
+    document = json.loads(export_json_string(exported_project))
+    relator = next(class_ for class_ in exported_project.get_classes() if class_.package is None)
+    assert find_content(document["model"], relator.id)["stereotype"] == "relator"
+
+
+def test_export_json_creates_model_without_root_package(valid_project: Project, valid_class) -> None:
+    """Test that a model package is created in the document when the project has no root package."""
+    document = json.loads(export_json_string(valid_project))
+    assert document["model"]["type"] == "Package"
+    assert document["model"]["id"] == f"{valid_project.id}-model"
+    assert [content["id"] for content in document["model"]["contents"]] == [valid_class.id]
+
+
+def test_export_json_empty_project(valid_project: Project) -> None:
+    """Test that a project without elements is exported with an empty model."""
+    document = json.loads(export_json_string(valid_project))
+    assert document["model"]["contents"] is None
+
+
+def test_export_json_is_deterministic(exported_project: Project) -> None:
+    """Test that exporting the same project twice gives the same document."""
+    assert export_json_string(exported_project) == export_json_string(exported_project)
+
+
+def test_element_to_dict_class(valid_project: Project) -> None:
+    """Test the conversion of a class with an attribute and a literal."""
+    enumeration = valid_project.create_class_enumeration()
+    literal = enumeration.create_literal()
+    attribute = enumeration.create_property(cardinality=Cardinality.of(1, None, is_ordered=True))
+    exported = element_to_dict(enumeration)
+    assert exported["stereotype"] == "enumeration"
+    assert exported["restrictedTo"] == ["abstract"]
+    assert exported["order"] == "1"
+    assert exported["literals"] == [
+        {"id": literal.id, "name": None, "description": None, "type": "Literal", "propertyAssignments": None}
+    ]
+    assert exported["properties"][0]["id"] == attribute.id
+    assert exported["properties"][0]["cardinality"] == "1..*"
+    assert exported["properties"][0]["isOrdered"] is True
+
+
+def test_element_to_dict_relation(valid_project: Project, valid_class, another_valid_class) -> None:
+    """Test that binary relations are converted to schema relations with their ends."""
+    relation = valid_project.create_binary_relation()
+    source = relation.create_property(property_type=valid_class, aggregation_kind=AggregationKind.COMPOSITE)
+    relation.create_property(property_type=another_valid_class)
+    exported = element_to_dict(relation)
+    assert exported["type"] == "Relation"
+    assert [end["propertyType"] for end in exported["properties"]] == [
+        {"id": valid_class.id, "type": "Class"},
+        {"id": another_valid_class.id, "type": "Class"},
+    ]
+    assert exported["properties"][0]["id"] == source.id
+    assert exported["properties"][0]["aggregationKind"] == "COMPOSITE"
+
+
+def test_element_to_dict_property_references(valid_class) -> None:
+    """Test that subsetted and redefined properties are written as references."""
+    general = valid_class.create_property()
+    specific = valid_class.create_property()
+    general.subsetted_by = {specific}
+    exported = element_to_dict(specific)
+    assert exported["subsettedProperties"] == [{"id": general.id, "type": "Property"}]
+    assert exported["redefinedProperties"] is None
+
+
+def test_element_to_dict_generalization_set(valid_project: Project, valid_generalization, valid_class) -> None:
+    """Test the conversion of a generalization set."""
+    generalization_set = valid_project.create_generalization_set(
+        generalizations={valid_generalization}, is_disjoint=True, categorizer=valid_class
+    )
+    exported = element_to_dict(generalization_set)
+    assert exported["isDisjoint"] is True
+    assert exported["isComplete"] is False
+    assert exported["categorizer"] == {"id": valid_class.id, "type": "Class"}
+    assert exported["generalizations"] == [{"id": valid_generalization.id, "type": "Generalization"}]
+
+
+def test_element_to_dict_custom_properties_and_natures(valid_project: Project) -> None:
+    """Test the conversion of custom properties and restricted natures."""
+    category = valid_project.create_class(
+        stereotype=ClassStereotype.CATEGORY,
+        restricted_to={OntologicalNature.RELATOR_NATURE, OntologicalNature.FUNCTIONAL_COMPLEX_NATURE},
+        custom_properties={("b", 2), ("a", "value")},
+    )
+    exported = element_to_dict(category)
+    assert exported["restrictedTo"] == ["functional-complex", "relator"]
+    assert exported["propertyAssignments"] == {"a": "value", "b": 2}
+
+
+def test_element_to_dict_invalid_type(valid_note, valid_package) -> None:
+    """Test that packages and elements without a counterpart in the schema cannot be converted."""
+    with pytest.raises(OntoumlTypeError) as error:
+        element_to_dict(valid_note)
+    assert error.value.code == "unsupported_json_element"
+    assert "Note elements cannot be converted" in str(error.value)
+    with pytest.raises(TypeError):
+        element_to_dict(valid_package)
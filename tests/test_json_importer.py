@@ -0,0 +1,205 @@
+import io
+import json
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.binaryrelation import BinaryRelation
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.enumerations.aggregationkind import AggregationKind
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.naryrelation import NaryRelation
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.json_importer import import_json
+from ontouml_py.serialization.json_importer import import_json_string
+from ontouml_py.serialization.ontouml_schema import parse_cardinality
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+def reference(element_id: str, element_type: str) -> dict:
+    return {"id": element_id, "type": element_type}
+
+
+@pytest.fixture
+def document() -> dict:
+    """Document whose references point both backward and forward, with the project's fields after its model."""
+    person = {
+        "id": "person",
+        "name": {"en": "Person", "pt": "Pessoa"},
+        "type": "Class",
+        "stereotype": "kind",
+        "restrictedTo": ["functional-complex"],
+        "order": "1",
+        "properties": [
+            {"id": "age", "type": "Property", "cardinality": "1", "propertyType": reference("number", "Class")}
+        ],
+        "propertyAssignments": {"tags": ["a", "b"]},
+    }
+    employment = {
+        "id": "employment",
+        "type": "Relation",
+        "stereotype": "mediation",
+        "properties": [
+            {"id": "source", "type": "Property", "propertyType": reference("person", "Class")},
+            {
+                "id": "target",
+                "type": "Property",
+                "cardinality": "0..*",
+                "isOrdered": True,
+                "aggregationKind": "COMPOSITE",
+                "propertyType": reference("employee", "Class"),
+            },
+        ],
+    }
+    nested = {
+        "id": "nested",
+        "type": "Package",
+        "contents": [
+            {"id": "employee", "type": "Class", "stereotype": "role", "restrictedTo": ["functional-complex"]},
+            {
+                "id": "generalization",
+                "type": "Generalization",
+                "general": reference("person", "Class"),
+                "specific": reference("employee", "Class"),
+            },
+            {
+                "id": "set",
+                "type": "GeneralizationSet",
+                "isDisjoint": True,
+                "generalizations": [reference("generalization", "Generalization")],
+            },
+        ],
+        "name": "Nested",
+    }
+    number = {"id": "number", "type": "Class", "stereotype": "datatype", "literals": None}
+    return {
+        "type": "Project",
+        "model": {"id": "model", "type": "Package", "contents": [person, employment, nested, number]},
+        "diagrams": [{"id": "diagram", "type": "Diagram", "contents": [{"id": "view"}]}],
+        "id": "project",
+        "name": "Project",
+    }
+
+
+def test_import_json_creates_elements(document: dict) -> None:
+    """Test that the elements of the document are created in their packages with their fields."""
+    project = import_json(io.StringIO(json.dumps(document)), chunk_size=16)
+
+    assert project.id == "project"
+    assert project.names == {LangString("Project")}
+    model = project.root_package
+    assert model.id == "model"
+    assert {content.id for content in model.get_classes()} == {"person", "number"}
+    nested = model.get_package_by_id("nested")
+    assert nested.names == {LangString("Nested")}
+    assert nested.package is model
+
+    person = project.get_class_by_id("person")
+    assert person.stereotype == ClassStereotype.KIND
+    assert person.restricted_to == {OntologicalNature.FUNCTIONAL_COMPLEX_NATURE}
+    assert person.order == 1
+    assert person.names == {LangString("Person", "en"), LangString("Pessoa", "pt")}
+    assert person.custom_properties == {("tags", ("a", "b"))}
+    assert person.package is model
+
+
+def test_import_json_links_references(document: dict) -> None:
+    """Test that references to elements read before and after the referring element are linked."""
+    project = import_json_string(json.dumps(document))
+    person = project.get_class_by_id("person")
+    employee = project.get_class_by_id("employee")
+    number = project.get_class_by_id("number")
+
+    assert person.properties[0].property_type is number
+    relation = project.get_binary_relation_by_id("employment")
+    assert isinstance(relation, BinaryRelation)
+    assert relation.stereotype == RelationStereotype.MEDIATION
+    assert relation.members == [person, employee]
+    assert relation.properties[1].cardinality == Cardinality.of(0, "*", is_ordered=True)
+    assert relation.properties[1].aggregation_kind == AggregationKind.COMPOSITE
+
+    generalization = project.get_generalization_by_id("generalization")
+    assert (generalization.general, generalization.specific) == (person, employee)
+    assert generalization.package is project.get_package_by_id("nested")
+    generalization_set = project.get_generalization_set_by_id("set")
+    assert generalization_set.is_disjoint is True
+    assert generalization_set.generalizations == {generalization}
+    assert project.get_taxonomy().get_supertypes(employee) == {person}
+
+
+def test_import_json_links_subsetting() -> None:
+    """Test that subsetted and redefined properties are linked through their inverses."""
+    project = Project()
+    class_ = project.create_class()
+    general = class_.create_property()
+    specific = class_.create_property()
+    general.subsetted_by = {specific}
+    general.redefined_by = {specific}
+
+    imported = import_json_string(export_json_string(project))
+    imported_general = imported.get_property_by_id(general.id)
+    imported_specific = imported.get_property_by_id(specific.id)
+    assert imported_general.subsetted_by == {imported_specific}
+    assert imported_specific.subsets == {imported_general}
+    assert imported_general.redefined_by == {imported_specific}
+
+
+def test_import_json_nary_relation() -> None:
+    """Test that relations with other than two ends are created as n-ary relations."""
+    document = {
+        "id": "project",
+        "model": {"id": "model", "type": "Package", "contents": [{"id": "relation", "type": "Relation"}]},
+    }
+    project = import_json_string(json.dumps(document))
+    assert isinstance(project.get_nary_relation_by_id("relation"), NaryRelation)
+
+
+def test_import_json_round_trip(document: dict) -> None:
+    """Test that an imported document is exported unchanged, apart from fields the importer fills in."""
+    exported = export_json_string(import_json_string(json.dumps(document)))
+    assert export_json_string(import_json(io.StringIO(exported), chunk_size=5)) == exported
+
+
+@pytest.mark.parametrize(
+    "contents, code",
+    [
+        (
+            [{"id": "g", "type": "Generalization", "general": reference("missing", "Class"), "specific": None}],
+            "unresolved_reference",
+        ),
+        ([{"id": "a", "type": "Class"}, {"id": "a", "type": "Class"}], "duplicate_id"),
+        ([{"id": "a", "type": "Diagram"}], "unknown_element_type"),
+        ([{"id": "a", "type": "Class", "restrictedTo": ["unknown"]}], "invalid_field_value"),
+    ],
+)
+def test_import_json_invalid_documents(contents: list, code: str) -> None:
+    """Test that documents with invalid elements or references raise structured errors."""
+    document = {"id": "project", "model": {"id": "model", "type": "Package", "contents": contents}}
+    with pytest.raises(OntoumlValueError) as error:
+        import_json_string(json.dumps(document))
+    assert error.value.code == code
+
+
+@pytest.mark.parametrize("text", ['{"id": "project", "model": }', '{"id": "project"', '["project"]'])
+def test_import_json_invalid_json(text: str) -> None:
+    """Test that malformed documents raise JSON decoding errors."""
+    with pytest.raises(json.JSONDecodeError):
+        import_json(io.StringIO(text), chunk_size=4)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1..*", Cardinality.of(1, "*")),
+        ("0..1", Cardinality.of(0, 1)),
+        ("1", Cardinality.of(1, 1)),
+        ("*", Cardinality.of(0, "*")),
+        (None, Cardinality.of()),
+    ],
+)
+def test_parse_cardinality(text: str, expected: Cardinality) -> None:
+    """Test the parsing of cardinalities of the schema."""
+    assert parse_cardinality(text) == expected
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import export_json
+from ontouml_py.serialization.json_index import IndexedDocument
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+@pytest.fixture
+def document_path(project: Project, tmp_path) -> str:
+    """Path of the exported fixture project, with a class whose name is not ASCII, indexed in the default path."""
+    project.create_class(id="ação", names={LangString("Ação ✓", "pt")})
+    path = str(tmp_path / "project.json")
+    with open(path, "w", encoding="utf-8") as output, open(path + ".idx", "w", encoding="utf-8") as index:
+        export_json(project, output, index)
+    return path
+
+
+def find_objects(value, found: dict) -> dict:
+    """Find all objects with an ID in a document, with packages without their contents."""
+    if isinstance(value, dict):
+        if "id" in value and len(value) > 2:
+            found[value["id"]] = {key: item for key, item in value.items() if key != "contents"}
+        for item in value.values():
+            find_objects(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            find_objects(item, found)
+    return found
+
+
+def test_get_every_element(project: Project, document_path: str) -> None:
+    with open(document_path, encoding="utf-8") as source:
+        expected = find_objects(json.load(source)["model"], {})
+    with IndexedDocument(document_path) as document:
+        assert len(document) == len(expected)
+        for element_id, json_object in expected.items():
+            actual = document.get(element_id)
+            assert {key: item for key, item in actual.items() if key != "contents"} == json_object
+        assert document.get("ação")["name"] == {"pt": "Ação ✓"}
+        assert document.get("missing") is None
+        assert "missing" not in document
+
+
+def test_get_related(project: Project, document_path: str) -> None:
+    generalization = next(iter(project.get_generalizations()))
+    with IndexedDocument(document_path) as document:
+        related = document.get_related(generalization.id)
+        assert list(related) == [generalization.id, generalization.general.id, generalization.specific.id]
+        assert document.get_package_id(generalization.id) == project.root_package.id
+
+        end = generalization.general.properties[0]
+        related = document.get_related(end.id)
+        assert set(related) == {end.id, end.classifier.id, end.property_type.id}
+        assert document.get_package_id(end.id) == generalization.general.package.id
+
+
+def test_invalid_index(document_path: str) -> None:
+    with open(document_path, "a", encoding="utf-8") as output:
+        output.write(" ")
+    with pytest.raises(OntoumlValueError, match="indexes a document"):
+        IndexedDocument(document_path)
+    with open(document_path + ".idx", "w", encoding="utf-8") as index:
+        index.write("not an index\n")
+    with pytest.raises(OntoumlValueError, match="Invalid index"):
+        IndexedDocument(document_path)
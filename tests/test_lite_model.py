@@ -0,0 +1,71 @@
+import pytest
+
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.lite_model import LITE_TYPES
+from ontouml_py.serialization.lite_model import to_lite
+from ontouml_py.utils.errors import OntoumlValueError
+from tests.conftest import get_state
+
+
+def test_lite_elements_hold_the_fields_and_owners(project: Project) -> None:
+    lite_project = to_lite(project)
+    assert get_state(lite_project.keywords) == get_state(project.keywords)
+    assert lite_project._fields_set == project.__pydantic_fields_set__
+    lite_elements = lite_project.get_elements()
+    for element_type, elements in project.get_elements().items():
+        lite_by_id = {lite.id: lite for lite in lite_elements[element_type]}
+        assert lite_by_id.keys() == {element.id for element in elements}
+        for element in elements:
+            lite = lite_by_id[element.id]
+            assert type(lite) is LITE_TYPES[element_type]
+            assert not hasattr(lite, "__dict__")
+            assert lite.project is lite_project
+            for name in _get_field_names(type(element)):
+                assert get_state(getattr(lite, name)) == get_state(element.__dict__[name]), name
+            for name in ("package", "classifier", "enumeration", "properties", "literals"):
+                if hasattr(element, name):
+                    lite_value = getattr(lite, name)
+                    lite_value = list(lite_value) if isinstance(lite_value, tuple) else lite_value
+                    assert get_state(lite_value) == get_state(getattr(element, name)), name
+
+    person = next(lite for lite in lite_elements["Class"] if lite.properties)
+    assert isinstance(person.properties, tuple) and all(end.classifier is person for end in person.properties)
+    assert isinstance(person.alt_names, frozenset)
+    nested = person.package
+    assert person in nested.get_contents()["Class"]
+    assert nested.get_content_by_id("Class", person.id) is person
+    assert lite_project.get_element_by_id("Class", person.id) is person
+
+
+def test_lite_elements_are_read_only(project: Project) -> None:
+    lite_class = next(iter(to_lite(project).get_elements()["Class"]))
+    with pytest.raises(AttributeError, match="read-only"):
+        lite_class.is_abstract = True
+
+
+def test_lite_round_trip(project: Project) -> None:
+    converted = to_lite(project).to_project()
+    converted_elements = converted.get_elements()
+    for element_type, elements in project.get_elements().items():
+        converted_by_id = {element.id: element for element in converted_elements[element_type]}
+        for element in elements:
+            converted_element = converted_by_id[element.id]
+            assert type(converted_element) is type(element)
+            for name in _get_field_names(type(element)):
+                assert get_state(converted_element.__dict__[name]) == get_state(element.__dict__[name]), name
+            assert converted_element.__pydantic_fields_set__ == element.__pydantic_fields_set__
+            assert converted_element.project is converted
+    assert export_json_string(converted) == export_json_string(project)
+    person = next(element for element in converted.get_classes() if element.properties)
+    assert person.properties[0].classifier is person
+    assert person.relations()
+
+
+def test_pending_assignments_are_rejected(project: Project) -> None:
+    project.set_validation_policy(ValidationPolicy.DEFERRED)
+    next(iter(project.get_classes())).is_abstract = True
+    with pytest.raises(OntoumlValueError, match="pending validation"):
+        to_lite(project)
@@ -0,0 +1,98 @@
+import io
+
+import pytest
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.ontoumlelement import _get_field_names
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.model_store import FORMAT_VERSION
+from ontouml_py.serialization.model_store import open_store
+from ontouml_py.serialization.model_store import StoredPackage
+from ontouml_py.serialization.model_store import write_store
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+from tests.conftest import get_state
+
+
+@pytest.fixture
+def store_path(project: Project, tmp_path):
+    path = tmp_path / "project.store"
+    project.save_store(path)
+    return path
+
+
+def test_model_store_fields(project: Project, store_path) -> None:
+    """Test that proxies read the fields of all elements as they were saved."""
+    with open_store(store_path) as stored:
+        assert get_state(stored.names) == get_state(project.names)
+        assert stored.created == project.created
+        for element_type, elements in project.get_elements().items():
+            assert {element.id for element in stored.get_elements()[element_type]} == {
+                element.id for element in elements
+            }
+            for element in elements:
+                proxy = stored.get_element_by_id(element_type, element.id)
+                assert proxy.element_type is type(element) and proxy.project is stored
+                for name in _get_field_names(type(element)):
+                    assert get_state(getattr(proxy, name)) == get_state(getattr(element, name)), name
+                assert get_state(getattr(proxy, "package", None)) == get_state(getattr(element, "package", None))
+
+
+def test_model_store_navigation(project: Project, store_path) -> None:
+    """Test traversing packages, owners and references through proxies."""
+    person = next(class_ for class_ in project.get_classes() if class_.stereotype == ClassStereotype.KIND)
+    with open_store(store_path) as stored:
+        root = stored.root_package
+        assert isinstance(root, StoredPackage) and root.id == project.root_package.id
+        nested = next(iter(root.get_packages()))
+        stored_person = nested.get_class_by_id(person.id)
+        assert stored_person is stored.get_class_by_id(person.id)
+        assert stored_person.package is nested
+        assert [owned.id for owned in stored_person.properties] == [owned.id for owned in person.properties]
+        general, specific = stored_person.properties
+        assert general.classifier is stored_person and general.subsetted_by == {specific}
+        enumeration = general.property_type
+        assert {literal.enumeration for literal in enumeration.literals} == {enumeration}
+        assert {type_name for type_name, contents in root.get_contents().items() if contents} == {
+            "Generalization",
+            "Note",
+            "Package",
+        }
+        assert stored.get_class_by_id("unknown") is None
+        assert stored.get_package_by_id(person.id) is None
+
+
+def test_model_store_is_lazy(store_path) -> None:
+    """Test that opening a store decodes nothing but the project, and that proxies are read-only."""
+    with open_store(store_path) as stored:
+        store = stored._store
+        assert list(store._proxies) == [1] and len(store._values) == 1
+        stored.get_class_by_id(next(iter(stored.get_classes())).id)
+        with pytest.raises(AttributeError):
+            stored.namespace = "x"
+        with pytest.raises(AttributeError):
+            stored.unknown
+
+
+def test_model_store_unsupported_value(project: Project) -> None:
+    """Test that values that stores cannot hold are reported as in snapshots."""
+    project.create_class(custom_properties={("values", frozenset({1}))})
+    with pytest.raises(OntoumlTypeError):
+        write_store(project, io.BytesIO())
+
+
+@pytest.mark.parametrize(
+    "change, code",
+    [
+        (lambda data: b"NOTASTOR" + data[8:], "invalid_store"),
+        (lambda data: data[:8] + (FORMAT_VERSION + 1).to_bytes(2, "little") + data[10:], "unsupported_store_version"),
+        (lambda data: data[:100], "invalid_store"),
+        (lambda data: b"", "invalid_store"),
+    ],
+)
+def test_model_store_invalid(store_path, change, code: str) -> None:
+    """Test that invalid, truncated and other version stores are rejected."""
+    store_path.write_bytes(change(store_path.read_bytes()))
+    with pytest.raises(OntoumlValueError) as error:
+        open_store(store_path)
+    assert error.value.code == code
@@ -1,3 +1,4 @@
+import copy
 from typing import Any
 
 import pytest
@@ -5,6 +6,7 @@ from langstring import LangString
 from pydantic import ValidationError
 
 from ontouml_py.model.namedelement import NamedElement
+from ontouml_py.model.sharedemptyset import EMPTY_SET
 
 
 # Concrete subclass for testing
@@ -601,3 +603,47 @@ def test_namedelement_with_alternating_case_descriptions() -> None:
     assert (
         element.description == alt_case_description
     ), "NamedElement should correctly handle descriptions with alternating case."
+
+
+def test_namedelement_empty_sets_are_shared(valid_langstring: LangString) -> None:
+    """Test that empty set fields share EMPTY_SET until items are added to them through their elements.
+
+    :param valid_langstring: A valid LangString object.
+    :raises AssertionError: If empty sets are not shared, or if adding to them is not transparent.
+    """
+    first, second = Project(), Project(alt_names=set())
+    for name in ("names", "alt_names", "editorial_notes", "creators", "contributors"):
+        assert first.__dict__[name] is EMPTY_SET and second.__dict__[name] is EMPTY_SET, name
+    assert first.names == set() and isinstance(first.names, set)
+
+    names = first.names
+    names.add(valid_langstring)
+    names.add(LangString("Other"))
+    assert first.names is names and first.names == {valid_langstring, LangString("Other")}
+    assert second.names == set() and EMPTY_SET == set()
+    first.alt_names |= {valid_langstring}
+    assert first.alt_names == {valid_langstring}
+    assert copy.deepcopy(first).names == first.names and type(copy.copy(first.names)) is set
+
+    with pytest.raises(TypeError, match="immutable"):
+        EMPTY_SET.add(valid_langstring)
+
+
+def test_namedelement_empty_set_aliases(valid_langstring: LangString) -> None:
+    """Test that items added through several sets read from an empty set field are all kept by the element.
+
+    :param valid_langstring: A valid LangString object.
+    :raises AssertionError: If items added through a set read from the field are lost, or if sets are misrepresented.
+    """
+    project = Project()
+    first, second = project.alt_names, project.alt_names
+    assert repr(first) == "set()"
+    first.add(valid_langstring)
+    second.add(LangString("Other"))
+    assert project.alt_names == {valid_langstring, LangString("Other")} and second == project.alt_names
+    assert repr(first) == repr(project.alt_names) and "CopyOnWrite" not in repr(second)
+
+    third = project.names
+    project.names = {LangString("Assigned")}
+    third.add(valid_langstring)
+    assert project.names == {LangString("Assigned")}
@@ -1,3 +1,4 @@
+import pickle
 import uuid
 from datetime import datetime
 from datetime import timedelta
@@ -6,6 +7,7 @@ import pytest
 from pydantic import ValidationError
 
 from ontouml_py.model.ontoumlelement import OntoumlElement
+from ontouml_py.model.ontoumlelement import shared_timestamp
 from ontouml_py.model.project import Project
 
 
@@ -442,3 +444,39 @@ def test_ontoumlelement_hash_collision() -> None:
     element1 = Project()
     element2 = Project()
     assert hash(element1) != hash(element2), "Different OntoumlElement instances should have different hash values."
+
+
+def test_pickle_elements_with_cyclic_references() -> None:
+    """Test that a project whose elements reference each other through sets can be pickled and unpickled."""
+    project = Project()
+    source = project.create_class()
+    target = project.create_class()
+    relation = project.create_binary_relation()
+    relation.create_property(property_type=source)
+    relation.create_property(property_type=target)
+
+    restored = pickle.loads(pickle.dumps(project))
+    restored_source = restored.get_class_by_id(source.id)
+    assert restored_source == source and restored_source is not source
+    assert [restored_relation.id for restored_relation in restored_source.relations()] == [relation.id]
+    assert next(iter(restored_source.relations())).source is restored_source
+
+
+def test_shared_timestamp() -> None:
+    """Test that elements created and modified inside shared_timestamp blocks get the timestamp of the block."""
+    timestamp = datetime(2030, 1, 2, 3, 4, 5)
+    with shared_timestamp(timestamp) as block_timestamp:
+        project = Project()
+        person = project.create_class()
+        person.is_abstract = True
+        with shared_timestamp() as nested_timestamp:
+            assert nested_timestamp != timestamp
+            assert project.create_class().created == nested_timestamp
+    assert block_timestamp == timestamp
+    assert project.created == person.created == person.modified == timestamp
+
+    student = project.create_class()
+    assert type(student.created) is datetime and student.created != timestamp
+    student.is_abstract = True
+    assert student.modified >= student.created
+    assert Project(created=timestamp).created == timestamp
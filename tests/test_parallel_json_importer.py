@@ -0,0 +1,122 @@
+import io
+import json
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.cardinality import Cardinality
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.delta_exporter import export_delta_string
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.json_importer import import_json_string
+from ontouml_py.serialization.parallel_json_importer import import_json_parallel
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+@pytest.fixture
+def document() -> str:
+    """Document with nested packages, references across packages, and names holding JSON delimiters."""
+    project = Project()
+    project.root_package = project.create_package()
+    nested = project.create_package()
+    project.root_package.add_package(nested)
+    previous = None
+    for index in range(10):
+        class_ = project.create_class_kind(names={LangString(f'C{index} {{"[\\', "en")})
+        class_.create_property(property_type=previous)
+        (nested if index % 2 else project.root_package).add_class(class_)
+        if previous is not None:
+            project.root_package.add_generalization(project.create_generalization(general=previous, specific=class_))
+            relation = project.create_binary_relation()
+            relation.create_property(property_type=previous)
+            relation.create_property(property_type=class_)
+            nested.add_binary_relation(relation)
+        previous = class_
+    enumeration = project.create_class_enumeration()
+    enumeration.create_literal(names={LangString("}]")})
+    nested.add_class(enumeration)
+    project.create_generalization_set(generalizations=set(project.get_generalizations()), categorizer=previous)
+    return export_json_string(project)
+
+
+def test_import_json_parallel_equals_sequential(document: str) -> None:
+    """Test that the parallel import creates the same project as the sequential one."""
+    project = import_json_parallel(io.StringIO(document), max_workers=2, chunk_size=3, buffer_size=7)
+    assert export_json_string(project) == export_json_string(import_json_string(document))
+    sequential = import_json_string(document)
+    for element_type, elements in project.get_elements().items():
+        assert {element.id for element in elements} == {
+            element.id for element in sequential.get_elements()[element_type]
+        }
+
+
+def test_import_json_parallel_tracks_changes_as_sequential(document: str) -> None:
+    """Test that the parallel import leaves the same timestamps and changes as the sequential one."""
+    parallel = import_json_parallel(io.StringIO(document), max_workers=2, chunk_size=3)
+    sequential = import_json_string(document)
+    assert parallel.get_changed() == sequential.get_changed() == set()
+    assert parallel.modified == sequential.modified
+    for element_type, elements in parallel.get_elements().items():
+        modified = {element.id: element.modified for element in sequential.get_elements()[element_type]}
+        assert {element.id: element.modified for element in elements} == modified
+
+    for project in (parallel, sequential):
+        export_delta_string(project)
+        project.create_class_kind(id="created")
+        project.get_class_by_id(min(class_.id for class_ in project.get_classes())).is_abstract = True
+    assert {element.id for element in parallel.get_changed()} == {element.id for element in sequential.get_changed()}
+    assert len(parallel.get_changed()) == 2
+
+
+def test_import_json_parallel_registers_elements(document: str) -> None:
+    """Test that the elements built from the workers' records are registered in their project and owners."""
+    project = import_json_parallel(io.StringIO(document), max_workers=1, chunk_size=4)
+    for class_ in project.get_classes():
+        assert class_.project is project
+        assert class_.package is not None
+        assert class_ in class_.package.get_classes()
+        for attribute in class_.properties:
+            assert attribute.classifier is class_
+            assert attribute in project.get_properties()
+    literal = next(iter(project.get_literals()))
+    assert literal in literal.enumeration.literals
+    relation = next(iter(project.get_binary_relations()))
+    assert relation in relation.source.relations()
+    assert len(project.get_taxonomy().get_order()) == len(project.get_classes()) + len(project.get_binary_relations())
+
+
+def test_import_json_parallel_interns_cardinalities(document: str) -> None:
+    """Test that the properties built from the workers' records share interned cardinalities, as sequential ones do."""
+    parallel = import_json_parallel(io.StringIO(document), max_workers=2, chunk_size=3)
+    sequential = import_json_string(document)
+    parallel_cardinalities = {id(attribute.cardinality) for attribute in parallel.get_properties()}
+    sequential_cardinalities = {id(attribute.cardinality) for attribute in sequential.get_properties()}
+    assert len(parallel_cardinalities) == len(sequential_cardinalities)
+    assert all(attribute.cardinality is Cardinality.of() for attribute in parallel.get_properties())
+
+
+def test_import_json_parallel_validates_in_workers() -> None:
+    """Test that errors raised while validating elements in workers are raised by the import."""
+    document = {
+        "id": "project",
+        "model": {"id": "model", "type": "Package", "contents": [{"id": "a", "type": "Class", "isAbstract": "x"}]},
+    }
+    with pytest.raises(ValueError):
+        import_json_parallel(io.StringIO(json.dumps(document)), max_workers=1)
+
+
+def test_import_json_parallel_detects_duplicates_across_chunks() -> None:
+    """Test that IDs repeated in different chunks are detected when building the elements."""
+    contents = [{"id": "a", "type": "Class"}, {"id": "b", "type": "Class"}, {"id": "a", "type": "Class"}]
+    document = {"id": "project", "model": {"id": "model", "type": "Package", "contents": contents}}
+    with pytest.raises(OntoumlValueError) as error:
+        import_json_parallel(io.StringIO(json.dumps(document)), max_workers=1, chunk_size=2)
+    assert error.value.code == "duplicate_id"
+
+
+@pytest.mark.parametrize("parameter", ["max_workers", "chunk_size", "buffer_size"])
+def test_import_json_parallel_invalid_parameters(parameter: str) -> None:
+    """Test that non-positive parameters are rejected."""
+    with pytest.raises(OntoumlValueError) as error:
+        import_json_parallel(io.StringIO("{}"), **{parameter: 0})
+    assert error.value.code == "invalid_import_parameter"
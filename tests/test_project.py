@@ -4,6 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from ontouml_py.model.enumerations.ontologyrepresentationstyle import OntologyRepresentationStyle
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
 from ontouml_py.model.project import Project
 
 
@@ -207,3 +208,117 @@ def test_project_invalid_landing_pages_type() -> None:
     """Test the Project initialization with an invalid landing pages type."""
     with pytest.raises(ValidationError, match="Input should be a valid set"):
         Project(landing_pages="invalid_type")  # Landing pages should be a set
+
+
+def test_validation_policy_immediate(valid_project: Project) -> None:
+    """Test that assignments are validated immediately by default.
+
+    :param valid_project: A valid Project instance.
+    """
+    valid_class = valid_project.create_class()
+    assert valid_project.validation_policy == ValidationPolicy.IMMEDIATE
+    with pytest.raises(ValidationError):
+        valid_class.is_abstract = "not a boolean"
+    assert valid_project.get_pending() == {}
+
+
+def test_validation_policy_deferred(valid_project: Project) -> None:
+    """Test that deferred assignments are recorded and validated in a batch.
+
+    :param valid_project: A valid Project instance.
+    """
+    valid_class = valid_project.create_class()
+    valid_project.set_validation_policy(ValidationPolicy.DEFERRED)
+    valid_class.is_abstract = "yes"
+    valid_class.order = 2
+    valid_class.is_powertype = "not a boolean"
+    assert valid_class.is_abstract == "yes", "Deferred assignments are stored as given"
+    assert valid_project.get_pending() == {valid_class: {"is_abstract", "order", "is_powertype"}}
+
+    with pytest.raises(ValueError, match="1 pending assignments are invalid") as error:
+        valid_project.validate_pending()
+    assert "is_powertype" in str(error.value)
+    assert valid_class.is_abstract is True, "Valid values are coerced when validated"
+    assert valid_project.get_pending() == {valid_class: {"is_powertype"}}
+
+    valid_class.is_powertype = False
+    valid_project.set_validation_policy(ValidationPolicy.IMMEDIATE)
+    assert valid_project.get_pending() == {}
+    assert valid_class.is_powertype is False
+
+
+def test_validation_policy_deferred_indexes(valid_project: Project) -> None:
+    """Test that unvalidated assignments to indexed fields keep the indexes consistent until they are validated.
+
+    :param valid_project: A valid Project instance.
+    """
+    valid_class = valid_project.create_class()
+    subsetted, subsetting = valid_class.create_property(), valid_class.create_property()
+    general, specific = valid_project.create_class(), valid_project.create_class()
+    generalization = valid_project.create_generalization(general=general, specific=specific)
+    valid_project.set_validation_policy(ValidationPolicy.DEFERRED)
+
+    subsetted.subsetted_by = [subsetting]
+    assert subsetting.subsets == {subsetted} and subsetted.get_all_subsetted_by() == {subsetting}
+    generalization.general = "not a classifier"
+    assert not valid_project.get_taxonomy().is_supertype_of(general, specific)
+
+    with pytest.raises(ValueError, match="1 pending assignments are invalid"):
+        valid_project.validate_pending()
+    assert subsetted.subsetted_by == {subsetting}, "Valid values are coerced when validated"
+    subsetted.subsetted_by = set()
+    generalization.general = general
+    valid_project.validate_pending()
+    assert not subsetting.subsets and valid_project.get_taxonomy().is_supertype_of(general, specific)
+
+
+def test_validation_policy_off(valid_project: Project) -> None:
+    """Test that assignments are neither validated nor recorded when validation is off.
+
+    :param valid_project: A valid Project instance.
+    """
+    valid_class = valid_project.create_class()
+    valid_project.set_validation_policy(ValidationPolicy.DEFERRED)
+    valid_class.order = "2"
+    valid_project.set_validation_policy(ValidationPolicy.OFF)
+    assert valid_project.get_pending() == {}, "Pending assignments are discarded when validation is turned off"
+    valid_class.is_abstract = "not a boolean"
+    assert valid_class.is_abstract == "not a boolean"
+    assert valid_project.get_pending() == {}
+    with pytest.raises(ValueError, match="Object has no attribute"):
+        valid_class.unknown_field = 1
+
+
+def test_set_validation_policy_invalid_type(valid_project: Project) -> None:
+    """Test that only ValidationPolicy members are accepted as validation policies.
+
+    :param valid_project: A valid Project instance.
+    """
+    with pytest.raises(TypeError, match="Invalid validation policy"):
+        valid_project.set_validation_policy("deferred")
+
+
+def test_get_element_by_id_index(valid_project: Project) -> None:
+    """Test that lookups by ID follow the creation, removal and reidentification of elements after indexing them.
+
+    :param valid_project: A valid Project instance.
+    """
+    first = valid_project.create_class(id="first")
+    assert valid_project.get_class_by_id("first") is first
+    assert valid_project.get_class_by_id("missing") is None
+
+    second = valid_project.create_class(id="second")
+    duplicate = valid_project.create_class(id="first")
+    assert valid_project.get_class_by_id("second") is second
+    assert valid_project.get_class_by_id("first") is first and duplicate is not first
+
+    valid_project.get_elements()["Class"].remove(first)
+    assert valid_project.get_class_by_id("first") is None
+    valid_project.get_elements()["Class"].remove(second)
+    second.id = "renamed"
+    valid_project.get_elements()["Class"].add(second)
+    assert valid_project.get_class_by_id("renamed") is second and valid_project.get_class_by_id("second") is None
+
+    package = valid_project.create_package()
+    package.add_class(second)
+    assert package.get_class_by_id("renamed") is second and package.get_class_by_id("first") is None
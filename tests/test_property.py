@@ -5,6 +5,7 @@ from pytest_lazyfixture import lazy_fixture
 from ontouml_py.model.cardinality import Cardinality
 from ontouml_py.model.enumerations.aggregationkind import AggregationKind
 from ontouml_py.model.enumerations.propertystereotype import PropertyStereotype
+from ontouml_py.model.enumerations.validationpolicy import ValidationPolicy
 from ontouml_py.model.property import Property
 
 
@@ -125,3 +126,93 @@ def test_property_invalid_aggregation_kind_assignment(valid_property):
     """
     with pytest.raises(ValidationError, match="Input should be 'none', 'composite' or 'shared'"):
         valid_property.aggregation_kind = "invalid_kind"
+
+
+def test_property_subsetting_inverse_and_closure(valid_class):
+    """Test that subsetted_by assignments maintain the subsets inverse and the transitive closures.
+
+    :param valid_class: A valid Class instance used as the classifier of the properties.
+    """
+    top = valid_class.create_property()
+    middle = valid_class.create_property()
+    bottom = valid_class.create_property(subsetted_by=set())
+    top.subsetted_by = {middle}
+    middle.subsetted_by = {bottom}
+
+    assert middle.subsets == {top}
+    assert bottom.subsets == {middle}
+    assert top.get_all_subsetted_by() == {middle, bottom}
+    assert bottom.get_all_subsets() == {middle, top}
+
+    middle.subsetted_by = set()
+    assert bottom.subsets == set(), "Removing a property from subsetted_by should update its inverse"
+    assert top.get_all_subsetted_by() == {middle}, "Closures should be recomputed after an assignment"
+    assert bottom.get_all_subsets() == frozenset()
+
+
+def test_property_redefinition_inverse_and_closure(valid_class):
+    """Test that redefined_by values given at creation and by assignment maintain the redefines inverse.
+
+    :param valid_class: A valid Class instance used as the classifier of the properties.
+    """
+    redefining = valid_class.create_property()
+    redefined = valid_class.create_property(redefined_by={redefining})
+    assert redefining.redefines == {redefined}
+
+    base = valid_class.create_property()
+    base.redefined_by = {redefined}
+    assert redefining.get_all_redefines() == {redefined, base}
+    assert base.get_all_redefined_by() == {redefined, redefining}
+    assert base.get_all_subsetted_by() == frozenset()
+
+
+def test_property_closures_discarded_selectively(valid_class):
+    """Test that assignments discard only the memoized closures reaching the properties whose relations changed.
+
+    :param valid_class: A valid Class instance used as the classifier of the properties.
+    """
+    top = valid_class.create_property()
+    middle = valid_class.create_property()
+    bottom = valid_class.create_property()
+    unrelated = valid_class.create_property()
+    other = valid_class.create_property()
+    top.subsetted_by = {middle}
+    unrelated.subsetted_by = {other}
+    memo = valid_class.project._property_closures
+    assert top.get_all_subsetted_by() == {middle} and unrelated.get_all_subsetted_by() == {other}
+
+    middle.subsetted_by = {bottom}
+    assert ("subsetted_by", unrelated) in memo, "Closures not reaching the changed properties should be kept"
+    assert ("subsetted_by", top) not in memo
+    assert top.get_all_subsetted_by() == {middle, bottom}
+    assert bottom.get_all_subsets() == {middle, top}
+
+    created = valid_class.create_property(subsetted_by={top})
+    assert ("subsetted_by", unrelated) in memo
+    assert bottom.get_all_subsets() == {middle, top, created}
+
+
+def test_property_subsetting_consistency(valid_class):
+    """Test that subsetting cycles and upper bounds exceeding those of subsetted properties are inconsistent.
+
+    :param valid_class: A valid Class instance used as the classifier of the properties.
+    """
+    general = valid_class.create_property(cardinality=Cardinality.of(0, "*"))
+    specific = valid_class.create_property(cardinality=Cardinality.of(0, 1))
+    general.subsetted_by = {specific}
+    assert general.is_subsetting_consistent() and specific.is_subsetting_consistent()
+
+    general.cardinality = Cardinality.of(0, 1)
+    specific.cardinality = Cardinality.of(0, "*")
+    assert not specific.is_subsetting_consistent(), "An upper bound may not exceed that of a subsetted property"
+
+    # Validation rejects cycles, which can only be assigned under the deferred validation policy
+    specific.cardinality = Cardinality.of(0, 1)
+    valid_class.project.set_validation_policy(ValidationPolicy.DEFERRED)
+    specific.subsetted_by = {general}
+    assert not general.is_subsetting_consistent(), "A property may not indirectly subset itself"
+    assert not specific.is_subsetting_consistent()
+    specific.subsetted_by = set()
+    assert general.is_subsetting_consistent()
+    general.redefined_by = {general}
+    assert not general.is_subsetting_consistent(), "A property may not redefine itself"
@@ -34,3 +34,52 @@ def test_stereotype_attribute_in_relation_subclass(relation_fixture, stereotype_
     """
     relation_fixture.stereotype = stereotype_value
     assert relation_fixture.stereotype == stereotype_value
+
+
+def test_relation_members_follow_property_types(valid_project, valid_class, another_valid_class):
+    """Test that relation ends are derived from the property types of the relation's properties.
+
+    :param valid_project: A fixture for a valid Project instance.
+    :param valid_class: A fixture for a valid Class instance.
+    :param another_valid_class: Another fixture for a valid Class instance.
+    """
+    relation = valid_project.create_binary_relation()
+    assert relation.source is None and relation.target is None
+    relation.create_property(property_type=valid_class)
+    end = relation.create_property()
+    assert relation.members == [valid_class, None]
+    end.property_type = another_valid_class
+    assert relation.source == valid_class
+    assert relation.target == another_valid_class
+
+    nary_relation = valid_project.create_nary_relation()
+    for _ in range(3):
+        nary_relation.create_property(property_type=valid_class)
+    assert nary_relation.members == [valid_class, valid_class, valid_class]
+
+
+def test_classifier_relations_index(valid_project, valid_class, another_valid_class):
+    """Test that classifiers keep track of the relations connected to them, filterable by stereotype.
+
+    :param valid_project: A fixture for a valid Project instance.
+    :param valid_class: A fixture for a valid Class instance.
+    :param another_valid_class: Another fixture for a valid Class instance.
+    """
+    mediation = valid_project.create_binary_relation(stereotype=RelationStereotype.MEDIATION)
+    mediation.create_property(property_type=valid_class)
+    mediation_target = mediation.create_property(property_type=another_valid_class)
+    material = valid_project.create_binary_relation(stereotype=RelationStereotype.MATERIAL)
+    material.create_property(property_type=valid_class)
+    material.create_property(property_type=valid_class)
+
+    assert valid_class.relations() == {mediation, material}
+    assert valid_class.relations(stereotype=RelationStereotype.MEDIATION) == {mediation}
+    assert another_valid_class.relations() == {mediation}
+
+    mediation_target.property_type = valid_class
+    assert another_valid_class.relations() == set(), "Relations should be removed from classifiers no longer ends"
+    assert valid_class.relations(stereotype=RelationStereotype.MEDIATION) == {mediation}
+
+    mediation_target.property_type = "not_a_classifier"
+    assert mediation.members == [valid_class, "not_a_classifier"]
+    assert valid_class.relations(stereotype=RelationStereotype.MEDIATION) == {mediation}
@@ -0,0 +1,115 @@
+import sqlite3
+
+import pytest
+from langstring import LangString
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.project import Project
+from ontouml_py.serialization.json_exporter import export_json_string
+from ontouml_py.serialization.sqlite_repository import SCHEMA_VERSION
+from ontouml_py.serialization.sqlite_repository import SqliteRepository
+from ontouml_py.utils.errors import OntoumlTypeError
+from ontouml_py.utils.errors import OntoumlValueError
+
+
+def get_person(project: Project):
+    return next(class_ for class_ in project.get_classes() if class_.stereotype == ClassStereotype.KIND)
+
+
+def test_sqlite_repository_round_trip(project: Project, tmp_path) -> None:
+    """Test that a project loaded in another session is the saved one, with its indexes rebuilt."""
+    path = tmp_path / "repository.db"
+    with SqliteRepository(path) as repository:
+        repository.save_project(project)
+    with SqliteRepository(path) as repository:
+        assert repository.get_project_ids() == [project.id]
+        loaded = repository.load_project(project.id)
+        assert repository.load_project(project.id) is loaded
+    assert export_json_string(loaded) == export_json_string(project)
+    person = get_person(loaded)
+    assert [owned.id for owned in person.properties] == [owned.id for owned in get_person(project).properties]
+    general, specific = person.properties
+    assert general.classifier is person and specific.subsets == {general}
+    assert len(person.relations()) == 2
+    assert person.package.get_classes() == {person, specific.property_type, general.property_type}
+
+
+def test_sqlite_repository_writes_changes_only(project: Project) -> None:
+    """Test that saving a project again writes only the elements that changed."""
+    with SqliteRepository(":memory:") as repository:
+        element_count = 1 + sum(map(len, project.get_elements().values()))
+        assert repository.save_project(project) == element_count
+        assert repository.save_project(project) == 0
+        person = get_person(project)
+        person.is_abstract = True
+        assert repository.save_project(project) == 1
+        # Changes to sets in place are found too
+        person.names.add(LangString("Person", "en"))
+        project.create_class()
+        assert repository.save_project(project) == 2
+        assert repository.find("Class", name="Person")[0].id == person.id
+
+
+def test_sqlite_repository_find(project: Project) -> None:
+    """Test queries by stereotype, package and name across projects, and loading the elements found."""
+    other = Project()
+    other.create_class(stereotype=ClassStereotype.KIND, names={LangString("Person", "en")})
+    with SqliteRepository(":memory:") as repository:
+        repository.save_project(project)
+        repository.save_project(other)
+        person = get_person(project)
+        person.names = {LangString("Person", "pt")}
+        repository.save_project(project)
+
+        found = repository.find("Class", stereotype=ClassStereotype.KIND)
+        assert sorted(record.project_id for record in found) == sorted((project.id, other.id))
+        assert [record.id for record in repository.find("Class", project_id=project.id, name="Person")] == [person.id]
+        assert len(repository.find("Class", name="Person")) == 2
+        assert repository.find("Class", stereotype="custom")[0].load().stereotype == "custom"
+        assert {record.load() for record in repository.find("Class", package_id=person.package.id)} == set(
+            person.package.get_classes()
+        )
+        assert repository.find("Class", package_id=project.root_package.id) == []
+        assert repository.find("Project", project_id=other.id)[0].load() is other
+
+        with pytest.raises(OntoumlValueError) as error:
+            repository.find("Unknown")
+        assert error.value.code == "unknown_element_type"
+
+
+def test_sqlite_repository_lazy_loading(project: Project, tmp_path) -> None:
+    """Test that projects are loaded when their elements are first accessed."""
+    path = tmp_path / "repository.db"
+    with SqliteRepository(path) as repository:
+        repository.save_project(project)
+    with SqliteRepository(path) as repository:
+        (record,) = repository.find("Class", stereotype=ClassStereotype.KIND)
+        assert not repository._projects
+        person = record.load()
+        assert person.id == get_person(project).id and person.project is repository.load_project(project.id)
+        repository.delete_project(project.id)
+        assert repository.get_project_ids() == [] and repository.find("Class") == []
+        with pytest.raises(OntoumlValueError) as error:
+            repository.load_project(project.id)
+        assert error.value.code == "project_not_found"
+
+
+def test_sqlite_repository_unsupported_value(project: Project) -> None:
+    """Test that values that repositories cannot store are reported with their element and field."""
+    person = project.create_class(custom_properties={("values", object())})
+    with SqliteRepository(":memory:") as repository:
+        with pytest.raises(OntoumlTypeError) as error:
+            repository.save_project(project)
+    assert error.value.code == "unsupported_repository_value"
+    assert error.value.element is person
+
+
+def test_sqlite_repository_version(tmp_path) -> None:
+    """Test that repositories created with other versions of the schema are rejected."""
+    path = tmp_path / "repository.db"
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    connection.close()
+    with pytest.raises(OntoumlValueError) as error:
+        SqliteRepository(path)
+    assert error.value.code == "unsupported_repository_version"
@@ -0,0 +1,145 @@
+import pytest
+
+from ontouml_py.model.class_ontouml import Class
+from ontouml_py.model.project import Project
+
+
+@pytest.fixture
+def diamond_project() -> Project:
+    """Create a project whose taxonomy contains a diamond and an unrelated class.
+
+    Agent <- Person <- Student, Person <- Employee, Student <- Intern, Employee <- Intern, and Thing isolated.
+    """
+    project = Project()
+    for name in ("agent", "person", "student", "employee", "intern", "thing"):
+        project.create_class(custom_properties={("name", name)})
+    return project
+
+
+def get_class(project: Project, name: str) -> Class:
+    """Return the class of the project that has the given name in its custom properties."""
+    return next(cls for cls in project.get_classes() if ("name", name) in cls.custom_properties)
+
+
+def specialize(project: Project, general: str, specific: str) -> None:
+    """Create a generalization between two named classes of the project."""
+    project.create_generalization(general=get_class(project, general), specific=get_class(project, specific))
+
+
+@pytest.fixture
+def diamond(diamond_project: Project) -> Project:
+    specialize(diamond_project, "agent", "person")
+    specialize(diamond_project, "person", "student")
+    specialize(diamond_project, "person", "employee")
+    specialize(diamond_project, "student", "intern")
+    specialize(diamond_project, "employee", "intern")
+    return diamond_project
+
+
+def test_common_supertypes_of_siblings(diamond: Project) -> None:
+    """Test that the lowest common supertype of two siblings is their shared parent."""
+    result = diamond.common_supertypes([get_class(diamond, "student"), get_class(diamond, "employee")])
+    assert result == {get_class(diamond, "person")}, "Siblings should have their parent as lowest common supertype"
+
+
+def test_common_supertypes_includes_self(diamond: Project) -> None:
+    """Test that a classifier is considered a supertype of itself and of its subtypes."""
+    student = get_class(diamond, "student")
+    assert diamond.common_supertypes([student]) == {student}
+    assert diamond.common_supertypes([student, get_class(diamond, "intern")]) == {student}
+
+
+def test_common_supertypes_with_multiple_results(diamond: Project) -> None:
+    """Test that more than one lowest common supertype is returned when the taxonomy is not a tree."""
+    intern = get_class(diamond, "intern")
+    second_intern = diamond.create_class()
+    diamond.create_generalization(general=get_class(diamond, "student"), specific=second_intern)
+    diamond.create_generalization(general=get_class(diamond, "employee"), specific=second_intern)
+    result = diamond.common_supertypes([intern, second_intern])
+    assert result == {get_class(diamond, "student"), get_class(diamond, "employee")}
+
+
+def test_common_supertypes_of_unrelated_classes(diamond: Project) -> None:
+    """Test that unrelated classes have no common supertype."""
+    assert diamond.common_supertypes([get_class(diamond, "thing"), get_class(diamond, "person")]) == set()
+    assert diamond.common_supertypes([]) == set()
+
+
+def test_taxonomy_supertypes_queries(diamond: Project) -> None:
+    """Test the supertypes and subsumption queries of the taxonomy index."""
+    taxonomy = diamond.get_taxonomy()
+    intern = get_class(diamond, "intern")
+    expected = {get_class(diamond, name) for name in ("agent", "person", "student", "employee")}
+    assert taxonomy.get_supertypes(intern) == expected
+    assert taxonomy.is_supertype_of(get_class(diamond, "agent"), intern)
+    assert not taxonomy.is_supertype_of(intern, intern)
+    assert not taxonomy.is_supertype_of(get_class(diamond, "thing"), intern)
+
+
+def test_taxonomy_is_cached_and_invalidated(diamond: Project) -> None:
+    """Test that the index is reused until the taxonomy changes and reflects reassigned generalization ends."""
+    taxonomy = diamond.get_taxonomy()
+    assert diamond.get_taxonomy() is taxonomy, "The taxonomy index should be reused while the taxonomy is unchanged"
+
+    generalization = next(
+        gen for gen in diamond.get_generalizations() if gen.specific == get_class(diamond, "employee")
+    )
+    generalization.general = get_class(diamond, "thing")
+    assert diamond.get_taxonomy() is not taxonomy, "Reassigning a generalization end should invalidate the index"
+    result = diamond.common_supertypes([get_class(diamond, "student"), get_class(diamond, "employee")])
+    assert result == set()
+
+
+def test_taxonomy_with_unknown_classifier(diamond: Project) -> None:
+    """Test that querying a classifier from another project raises a ValueError."""
+    with pytest.raises(ValueError, match="not part of the project's taxonomy"):
+        diamond.get_taxonomy().get_supertypes(Project().create_class())
+
+
+def test_taxonomy_with_cycle(diamond: Project) -> None:
+    """Test that cyclic generalizations are reported when the taxonomy is built."""
+    specialize(diamond, "intern", "agent")
+    with pytest.raises(ValueError, match="form a cycle"):
+        diamond.common_supertypes([get_class(diamond, "person")])
+
+
+def test_taxonomy_order_layers(diamond: Project) -> None:
+    """Test that the taxonomy order lists supertypes first and assigns longest-path layers."""
+    order = diamond.taxonomy_order()
+    layers = {cls: layer for cls, layer in order}
+    expected = {"agent": 0, "thing": 0, "person": 1, "student": 2, "employee": 2, "intern": 3}
+    assert {name: layers[get_class(diamond, name)] for name in expected} == expected
+    assert [layer for _, layer in order] == sorted(layer for _, layer in order), "Order should be sorted by layer"
+    positions = {cls: pos for pos, (cls, _) in enumerate(order)}
+    for generalization in diamond.get_generalizations():
+        assert positions[generalization.general] < positions[generalization.specific]
+
+
+def test_taxonomy_order_is_deterministic(diamond: Project) -> None:
+    """Test that classifiers in the same layer are ordered by ID and that the order is cached."""
+    order = diamond.taxonomy_order()
+    assert order is diamond.taxonomy_order(), "The order should be cached while the taxonomy is unchanged"
+    for layer in {layer for _, layer in order}:
+        ids = [cls.id for cls, cls_layer in order if cls_layer == layer]
+        assert ids == sorted(ids), "Classifiers in the same layer should be sorted by ID"
+
+
+def test_taxonomy_incremental_update(diamond: Project) -> None:
+    """Test that creating classifiers and generalizations updates the existing index instead of rebuilding it."""
+    taxonomy = diamond.get_taxonomy()
+    new_class = diamond.create_class()
+    diamond.create_generalization(general=get_class(diamond, "intern"), specific=new_class)
+    diamond.create_generalization(general=get_class(diamond, "thing"), specific=new_class)
+    assert diamond.get_taxonomy() is taxonomy, "Generalizations following the existing order should be incremental"
+    assert taxonomy.get_layer(new_class) == 4
+    assert get_class(diamond, "thing") in taxonomy.get_supertypes(new_class)
+    assert (new_class, 4) in diamond.taxonomy_order()
+
+
+def test_taxonomy_rebuild_on_out_of_order_generalization(diamond: Project) -> None:
+    """Test that a generalization against the current order triggers a rebuild with the correct layers."""
+    diamond.get_taxonomy()
+    new_root = diamond.create_class()
+    diamond.create_generalization(general=new_root, specific=get_class(diamond, "agent"))
+    assert diamond.get_taxonomy().get_layer(get_class(diamond, "intern")) == 4
+    assert diamond.get_taxonomy().get_layer(new_root) == 0
@@ -0,0 +1,113 @@
+import pytest
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.ontologicalnature import OntologicalNature
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.project import Project
+from ontouml_py.verification.rules.class_nature import ClassNatureRule
+from ontouml_py.verification.rules.generalization_type import GeneralizationTypeRule
+from ontouml_py.verification.rules.relator_mediation import RelatorMediationRule
+from ontouml_py.verification.rules.rigidity import RigidityRule
+from ontouml_py.verification.rules.sortality import SortalityRule
+
+
+def test_class_nature_rule(valid_project: Project) -> None:
+    """Test that the natures a class is restricted to are checked against its stereotype.
+
+    :param valid_project: A valid Project instance.
+    """
+    rule = ClassNatureRule()
+    assert list(rule.check(valid_project.create_class_kind())) == []
+    assert list(rule.check(valid_project.create_class_role())) == [], "Base sortals may inherit their nature"
+    assert list(rule.check(valid_project.create_class())) == [], "Classes without stereotype are not checked"
+
+    wrong_nature = valid_project.create_class(
+        stereotype=ClassStereotype.KIND, restricted_to={OntologicalNature.EVENT_NATURE}
+    )
+    assert [diagnostic.element_id for diagnostic in rule.check(wrong_nature)] == [wrong_nature.id]
+    missing_nature = valid_project.create_class(stereotype=ClassStereotype.RELATOR)
+    assert len(list(rule.check(missing_nature))) == 1
+
+    unbounded_order = valid_project.create_class(
+        stereotype=ClassStereotype.TYPE, restricted_to={OntologicalNature.TYPE_NATURE}, order="*"
+    )
+    assert list(rule.check(unbounded_order)) == []
+    wrong_order = valid_project.create_class(
+        stereotype=ClassStereotype.KIND, restricted_to={OntologicalNature.FUNCTIONAL_COMPLEX_NATURE}, order=2
+    )
+    assert [diagnostic.get_description() for diagnostic in rule.check(wrong_order)] == [
+        "Invalid order for a class with stereotype 'kind'."
+    ]
+
+
+def test_sortality_rule(valid_project: Project) -> None:
+    """Test the sortality constraints over ultimate sortals, base sortals and non-sortals.
+
+    :param valid_project: A valid Project instance.
+    """
+    rule = SortalityRule()
+    kind = valid_project.create_class_kind()
+    role = valid_project.create_class_role()
+    orphan_subkind = valid_project.create_class_subkind()
+    other_kind = valid_project.create_class_kind()
+    category = valid_project.create_class_category()
+    valid_project.create_generalization(general=kind, specific=role)
+    valid_project.create_generalization(general=kind, specific=other_kind)
+    valid_project.create_generalization(general=role, specific=category)
+
+    assert list(rule.check(kind)) == []
+    assert list(rule.check(role)) == []
+    assert len(list(rule.check(orphan_subkind))) == 1, "A subkind must specialize an ultimate sortal"
+    assert len(list(rule.check(other_kind))) == 1, "A kind must not specialize another kind"
+    assert len(list(rule.check(category))) == 1, "A category must not specialize sortals"
+
+
+def test_rigidity_rule(valid_project: Project) -> None:
+    """Test that rigid classes cannot specialize anti-rigid classes.
+
+    :param valid_project: A valid Project instance.
+    """
+    rule = RigidityRule()
+    role_mixin = valid_project.create_class_role_mixin()
+    subkind = valid_project.create_class_subkind()
+    role = valid_project.create_class_role()
+    valid_project.create_generalization(general=role_mixin, specific=subkind)
+    valid_project.create_generalization(general=role_mixin, specific=role)
+
+    diagnostics = list(rule.check(subkind))
+    assert [diagnostic.rule_code for diagnostic in diagnostics] == ["rigidity"]
+    assert list(rule.check(role)) == [], "Anti-rigid classes may specialize anti-rigid classes"
+
+
+def test_relator_mediation_rule(valid_project: Project) -> None:
+    """Test that relators must be connected to a mediation, possibly inherited from a supertype.
+
+    :param valid_project: A valid Project instance.
+    """
+    rule = RelatorMediationRule()
+    relator = valid_project.create_class_relator()
+    sub_relator = valid_project.create_class_relator()
+    valid_project.create_generalization(general=relator, specific=sub_relator)
+    assert len(list(rule.check(relator))) == 1
+
+    mediation = valid_project.create_binary_relation(stereotype=RelationStereotype.MEDIATION)
+    mediation.create_property(property_type=relator)
+    mediation.create_property(property_type=valid_project.create_class_kind())
+    assert list(rule.check(relator)) == []
+    assert list(rule.check(sub_relator)) == [], "Mediations of supertypes should be considered"
+
+
+@pytest.mark.parametrize("relation_as_specific", [False, True])
+def test_generalization_type_rule(valid_project: Project, relation_as_specific: bool) -> None:
+    """Test that generalizations must relate distinct classifiers of the same kind.
+
+    :param valid_project: A valid Project instance.
+    :param relation_as_specific: Whether the specific end of the invalid generalization is a relation.
+    """
+    rule = GeneralizationTypeRule()
+    general = valid_project.create_class()
+    specific = valid_project.create_binary_relation() if relation_as_specific else general
+    invalid = valid_project.create_generalization(general=general, specific=specific)
+    valid = valid_project.create_generalization(general=general, specific=valid_project.create_class())
+    assert len(list(rule.check(invalid))) == 1
+    assert list(rule.check(valid)) == []
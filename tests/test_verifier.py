@@ -0,0 +1,208 @@
+import pytest
+
+from ontouml_py.model.enumerations.classstereotype import ClassStereotype
+from ontouml_py.model.enumerations.relationstereotype import RelationStereotype
+from ontouml_py.model.project import Project
+from ontouml_py.verification.diagnostic import Diagnostic
+from ontouml_py.verification.incremental_verifier import IncrementalVerifier
+from ontouml_py.verification.rules.class_nature import ClassNatureRule
+from ontouml_py.verification.severity import Severity
+from ontouml_py.verification.verifier import Verifier
+
+
+@pytest.fixture
+def invalid_project() -> Project:
+    """Create a project with several invalid classes and a valid taxonomy."""
+    project = Project()
+    kind = project.create_class_kind()
+    for _ in range(5):
+        project.create_class_subkind()  # Subkinds not specializing any kind
+    role = project.create_class_role()
+    category = project.create_class_category()
+    project.create_generalization(general=kind, specific=role)
+    project.create_generalization(general=role, specific=category)
+    return project
+
+
+def diagnostic_keys(diagnostics: list[Diagnostic]) -> list[tuple[str, str]]:
+    """Return the sorted rule codes and element IDs of the given diagnostics."""
+    return sorted((diagnostic.rule_code, diagnostic.element_id) for diagnostic in diagnostics)
+
+
+def test_verifier_reports_violations(invalid_project: Project) -> None:
+    """Test that the default rules report the violations of the project.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    diagnostics = list(Verifier().verify(invalid_project))
+    codes = [code for code, _ in diagnostic_keys(diagnostics)]
+    assert codes.count("sortality") == 6, "Orphan subkinds and the category specializing a role should be reported"
+    assert codes.count("rigidity") == 1, "The category specializing a role should be reported"
+    assert all(diagnostic.severity == Severity.ERROR for diagnostic in diagnostics)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_verifier_parallel_results_match_sequential(invalid_project: Project, use_processes: bool) -> None:
+    """Test that verifying partitions in a pool yields the same diagnostics as the sequential verification.
+
+    :param invalid_project: A project with invalid classes.
+    :param use_processes: Whether a process pool is used instead of a thread pool.
+    """
+    expected = diagnostic_keys(list(Verifier().verify(invalid_project)))
+    diagnostics = Verifier().verify(invalid_project, max_workers=2, use_processes=use_processes, chunk_size=2)
+    assert diagnostic_keys(list(diagnostics)) == expected
+
+
+def test_verifier_custom_rules(invalid_project: Project) -> None:
+    """Test that only the rules given to the verifier are checked.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    verifier = Verifier(rules=[ClassNatureRule()])
+    assert [type(rule) for rule in verifier.rules] == [ClassNatureRule]
+    assert list(verifier.verify(invalid_project)) == []
+
+
+def test_verifier_with_cyclic_taxonomy(valid_project: Project) -> None:
+    """Test that a cyclic taxonomy is reported instead of raised and that other rules are still checked.
+
+    :param valid_project: A valid Project instance.
+    """
+    kind = valid_project.create_class_kind()
+    valid_project.create_generalization(general=kind, specific=kind)
+    codes = [diagnostic.rule_code for diagnostic in Verifier().verify(valid_project)]
+    assert sorted(codes) == ["acyclic_taxonomy", "generalization_type"]
+
+
+@pytest.mark.parametrize("parameter", ["max_workers", "chunk_size"])
+def test_verifier_invalid_parameters(valid_project: Project, parameter: str) -> None:
+    """Test that non-positive numbers of workers and chunk sizes are rejected.
+
+    :param valid_project: A valid Project instance.
+    :param parameter: The name of the invalid parameter.
+    """
+    with pytest.raises(ValueError, match=f"Invalid {parameter}"):
+        list(Verifier().verify(valid_project, **{parameter: 0}))
+
+
+def test_diagnostic_rendering(invalid_project: Project) -> None:
+    """Test that diagnostics are rendered with their severity, rule code and formatted message.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    diagnostic = next(Verifier().verify(invalid_project))
+    message = str(diagnostic)
+    assert message.startswith(f"[error] {diagnostic.rule_code} (Class {diagnostic.element_id})")
+    assert f"* Description: {diagnostic.get_description()}" in message
+
+
+def test_incremental_verifier_matches_full_verification(invalid_project: Project) -> None:
+    """Test that the incremental verifier reports the same diagnostics as the verifier.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    verifier = IncrementalVerifier()
+    expected = diagnostic_keys(list(Verifier().verify(invalid_project)))
+    assert diagnostic_keys(verifier.verify_all(invalid_project)) == expected
+    assert diagnostic_keys(verifier.verify_changes([])) == expected
+    assert verifier.last_checked == 0
+
+
+def test_incremental_verifier_rechecks_only_affected_elements(invalid_project: Project) -> None:
+    """Test that a new generalization re-checks its specific class and the classes specializing it.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    verifier = IncrementalVerifier()
+    verifier.verify_all(invalid_project)
+    classes = {class_.stereotype: class_ for class_ in invalid_project.get_classes()}
+    role = classes[ClassStereotype.ROLE]
+    category = classes[ClassStereotype.CATEGORY]
+    mixin = invalid_project.create_class_mixin()
+    generalization = invalid_project.create_generalization(general=mixin, specific=role)
+
+    diagnostics = verifier.verify_changes([mixin, generalization])
+    assert diagnostic_keys(diagnostics) == diagnostic_keys(list(Verifier().verify(invalid_project)))
+    # The four class rules for the mixin and the role, the three rules depending on the taxonomy for the category
+    # (which specializes the role), and the generalization rule for the new generalization
+    assert verifier.last_checked == 4 + 4 + 3 + 1
+
+    category.stereotype = ClassStereotype.ROLE_MIXIN
+    diagnostics = verifier.verify_changes([category])
+    assert diagnostic_keys(diagnostics) == diagnostic_keys(list(Verifier().verify(invalid_project)))
+    assert verifier.last_checked == 4
+
+
+def test_incremental_verifier_rechecks_relation_ends(valid_project: Project) -> None:
+    """Test that a new mediation re-checks the relators at its ends.
+
+    :param valid_project: A valid Project instance.
+    """
+    verifier = IncrementalVerifier()
+    relator = valid_project.create_class_relator()
+    kind = valid_project.create_class_kind()
+    assert [diagnostic.rule_code for diagnostic in verifier.verify_all(valid_project)] == ["relator_mediation"]
+
+    mediation = valid_project.create_binary_relation(stereotype=RelationStereotype.MEDIATION)
+    source = mediation.create_property(property_type=relator)
+    target = mediation.create_property(property_type=kind)
+    assert verifier.verify_changes([mediation, source, target]) == []
+
+    source.property_type = kind
+    assert [diagnostic.rule_code for diagnostic in verifier.verify_changes([source])] == ["relator_mediation"]
+
+
+def test_incremental_verifier_with_cyclic_taxonomy(valid_project: Project) -> None:
+    """Test that the project is verified again when its taxonomy becomes cyclic.
+
+    :param valid_project: A valid Project instance.
+    """
+    verifier = IncrementalVerifier()
+    kind = valid_project.create_class_kind()
+    assert verifier.verify_all(valid_project) == []
+    generalization = valid_project.create_generalization(general=kind, specific=kind)
+    codes = [diagnostic.rule_code for diagnostic in verifier.verify_changes([generalization])]
+    assert sorted(codes) == ["acyclic_taxonomy", "generalization_type"]
+
+
+def test_incremental_verifier_requires_previous_run() -> None:
+    """Test that changes cannot be verified before a full verification."""
+    with pytest.raises(ValueError, match="Call verify_all before verify_changes"):
+        IncrementalVerifier().verify_changes([])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_verifier_max_errors(invalid_project: Project, max_workers: int) -> None:
+    """Test that verification stops once the maximum number of errors is yielded.
+
+    :param invalid_project: A project with invalid classes.
+    :param max_workers: Number of workers checking partitions.
+    """
+    diagnostics = list(Verifier().verify(invalid_project, max_workers=max_workers, chunk_size=1, max_errors=3))
+    assert len(diagnostics) == 3
+    diagnostics = list(Verifier().verify(invalid_project, max_workers=max_workers, fail_fast=True))
+    assert len(diagnostics) == 1
+    assert len(list(Verifier().verify(invalid_project, max_errors=100))) == 7
+
+
+def test_verifier_invalid_max_errors(valid_project: Project) -> None:
+    """Test that a non-positive maximum number of errors is rejected.
+
+    :param valid_project: A valid Project instance.
+    """
+    with pytest.raises(ValueError, match="Invalid max_errors"):
+        list(Verifier().verify(valid_project, max_errors=0))
+
+
+def test_diagnostic_lazy_rendering(invalid_project: Project) -> None:
+    """Test that diagnostics keep message templates and fill them only when rendered.
+
+    :param invalid_project: A project with invalid classes.
+    """
+    diagnostic = next(Verifier().verify(invalid_project, fail_fast=True))
+    assert "{stereotype}" in diagnostic.description
+    assert "{" not in diagnostic.get_description()
+    assert diagnostic.arguments["stereotype"] in diagnostic.get_description()
+
+    plain = Diagnostic(rule_code="custom", element_id="id", element_type="Class", description="Literal {braces}.")
+    assert plain.get_description() == "Literal {braces}."